@@ -0,0 +1,20 @@
+import random
+
+# Roughly the number of elves in a real puzzle input
+SIZE = 250
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate an inventory of `size` elves, each carrying between 1 and 15
+    food items
+    """
+    rng = random.Random(seed)
+
+    # At least three elves are needed for part 2
+    groups = []
+    for _ in range(max(size, 3)):
+        items = [str(rng.randint(1000, 60000)) for _ in range(rng.randint(1, 15))]
+        groups.append('\n'.join(items))
+
+    return '\n\n'.join(groups) + '\n'
@@ -1,34 +1,46 @@
 import heapq
+import itertools
+import multiprocessing
+import os
+import sys
+from typing import Iterator
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
-def part_one(input: str):
-    # Remove trailing whitespace from file, then split at each double new line
-    array = input.strip('\n').split('\n\n')
+from aoc.inputs import Input, chunks, records
 
+# `solve()` can be passed the memory-mapped input file
+MAPPED_INPUT = True
+
+# Inputs smaller than this are totalled in a single process, as starting the
+# worker processes takes longer than totalling them
+PARALLEL_SIZE = 1 << 25
+
+# The input being totalled by the worker processes
+_input: Input | None = None
+
+
+def part_one(input: Input):
     # `maximum` will hold the largest sub array total
     maximum = -1
 
-    for item in array:
+    # Each record is a set of numbers, separated by blank lines
+    for sub_arr in records(input):
         # For each set of numbers in the array, find the total (as integers, not strings)
-        sub_arr = item.split('\n')
         total = sum(int(i) for i in sub_arr)
 
         # if `total` is larger than the current `maximum`, then replace `maximum` with the new value
         maximum = max(maximum, total)
 
-    print(maximum)
+    return maximum
 
 
-def part_two(input: str):
-    # Remove trailing whitespace from file, then split at each double new line
-    array = input.strip('\n').split('\n\n')
-
+def part_two(input: Input):
     # `totals` will hold the total of each sub array totals
     totals: list[int] = []
 
-    for item in array:
+    for sub_arr in records(input):
         # For each set of numbers in the array, find the total (as integers, not strings)
-        sub_arr = item.split('\n')
         total = sum(int(i) for i in sub_arr)
 
         totals.append(total)
@@ -39,19 +51,15 @@ def part_two(input: str):
     # `result` is the sum of the first three items in the array
     result = sum(totals[:3])
 
-    print(result)
-
+    return result
 
-def part_two_heap(input: str):
-    # Remove trailing whitespace from file, then split at each double new line
-    array = input.strip('\n').split('\n\n')
 
+def part_two_heap(input: Input):
     # We can use `heap` to only hold the three largest subarrays
     heap: list[int] = []
 
-    for item in array:
+    for sub_arr in records(input):
         # For each set of numbers in the array, find the total (as integers, not strings)
-        sub_arr = item.split('\n')
         total = sum(int(i) for i in sub_arr)
 
         if len(heap) < 3:
@@ -64,12 +72,153 @@ def part_two_heap(input: str):
     # `heap` now holds the three largest items, therefore the sum is the result
     result = sum(heap)
 
-    print(result)
+    return result
+
+
+def totals(input: Input, start: int = 0, end: int | None = None) -> Iterator[int]:
+    """
+    The total of each set of numbers (in `input[start:end]`), reading the input
+    a chunk at a time
+
+    Each chunk ends at a line break, but a set of numbers can straddle two (or
+    more) chunks. So the total of the set at the end of a chunk is carried over,
+    as a line of its own at the start of the next chunk, which keeps adding to
+    it unless the next chunk starts with a blank line
+    """
+    carry = ''
+
+    for chunk in chunks(input, start, end):
+        sub_arrs = (carry + chunk).split('\n\n')
+
+        # The last set may carry on into the next chunk (or it is empty, if the
+        # chunk ends with a blank line)
+        last = sub_arrs.pop().split()
+        carry = f'{sum(map(int, last))}\n' if last else ''
+
+        for sub_arr in sub_arrs:
+            numbers = sub_arr.split()
+
+            # There can be more than one blank line between sets
+            if numbers:
+                yield sum(map(int, numbers))
+
+    if carry:
+        yield int(carry)
+
+
+def top(input: Input, k: int) -> list[int]:
+    """
+    The `k` largest totals, largest first. `heapq.nlargest()` only holds a heap
+    of `k` totals, and the totals are streamed, so the memory used doesn't
+    grow with the size of the input
+    """
+    return heapq.nlargest(k, totals(input))
+
+
+def split(input: Input, pieces: int) -> list[tuple[int, int]]:
+    """
+    Split the input into (up to) `pieces` ranges of about the same size, each
+    starting after a blank line, so no set of numbers is split between ranges
+    """
+    blank = '\n\n' if isinstance(input, str) else b'\n\n'
+    size = len(input)
+
+    bounds = [0]
+
+    for i in range(1, pieces):
+        index = input.find(blank, max(size * i // pieces, bounds[-1]))  # type: ignore[arg-type]
+
+        if index == -1:
+            break
+
+        bounds.append(index + 2)
+
+    bounds.append(size)
+
+    return [(start, end) for start, end in zip(bounds, bounds[1:]) if start < end]
+
+
+def _init(input: Input) -> None:
+    global _input
+
+    _input = input
+
+
+def _top_range(k: int, start: int, end: int) -> list[int]:
+    """The `k` largest totals in a range of the input, in a worker process"""
+    assert _input is not None
+
+    return heapq.nlargest(k, totals(_input, start, end))
+
+
+def top_parallel(input: Input, k: int, processes: int | None = None) -> list[int]:
+    """
+    The `k` largest totals, largest first, finding the `k` largest of each
+    range of the input in a pool of processes, then merging them
+
+    The workers are forked, so they share the text or the mapped file rather
+    than being sent a copy of their range. Small inputs, and inputs solved in
+    a worker process already (e.g. by `aoc.batch`), are totalled in this
+    process, as is every input where processes cannot be forked
+    """
+    processes = processes or os.cpu_count() or 1
+
+    if (
+        processes == 1
+        or len(input) < PARALLEL_SIZE
+        or multiprocessing.parent_process() is not None
+        or 'fork' not in multiprocessing.get_all_start_methods()
+    ):
+        return top(input, k)
+
+    # A few ranges for each process, so a process given a slow range doesn't
+    # hold up the others
+    ranges = split(input, processes * 4)
+
+    with multiprocessing.get_context('fork').Pool(processes, _init, (input,)) as pool:
+        partial = pool.starmap(_top_range, [(k, start, end) for start, end in ranges])
+
+    # The `k` largest totals are among the `k` largest of each range
+    return heapq.nlargest(k, itertools.chain.from_iterable(partial))
+
+
+def part_one_streaming(input: Input):
+    result = sum(top(input, 1))
+
+    return result
+
+
+def part_two_streaming(input: Input):
+    result = sum(top(input, 3))
+
+    return result
+
+
+def part_one_parallel(input: Input):
+    result = sum(top_parallel(input, 1))
+
+    return result
+
+
+def part_two_parallel(input: Input):
+    result = sum(top_parallel(input, 3))
+
+    return result
+
+
+def solve(part: int, input: Input):
+    if part == 1:
+        return part_one_parallel(input)
+    if part == 2:
+        return part_two_parallel(input)
+
+    raise ValueError(f'Invalid part: {part}')
 
 
-with open('input.txt') as f:
-    input = f.read()
+if __name__ == '__main__':
+    with open('input.txt') as f:
+        input = f.read()
 
-part_one(input)
-part_two(input)
-part_two_heap(input)
+    print(part_one(input))
+    print(part_two(input))
+    print(part_two_heap(input))
@@ -0,0 +1,13 @@
+import random
+
+# Roughly the number of rounds in a real puzzle input
+SIZE = 2500
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """Generate a strategy guide of `size` rounds"""
+    rng = random.Random(seed)
+
+    lines = [f'{rng.choice("ABC")} {rng.choice("XYZ")}' for _ in range(size)]
+
+    return '\n'.join(lines) + '\n'
@@ -1,4 +1,36 @@
-def part_one(input: str):
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from aoc.inputs import Input, chunks, lines
+
+# `solve()` can be passed the memory-mapped input file
+MAPPED_INPUT = True
+
+# Every possible round, which is the order of the counts and score tables
+ROUNDS = ('A X', 'A Y', 'A Z', 'B X', 'B Y', 'B Z', 'C X', 'C Y', 'C Z')
+
+# The shape played in each round for part 1, where X, Y and Z are rock, paper
+# and scissors (like A, B and C)
+PART_ONE_PLAYS = {round: 'ABC'['XYZ'.index(round[2])] for round in ROUNDS}
+
+# The shape played in each round for part 2, where X, Y and Z are the result
+# (loss, draw or win)
+PART_TWO_PLAYS = {
+    'A X': 'C',
+    'A Y': 'A',
+    'A Z': 'B',
+    'B X': 'A',
+    'B Y': 'B',
+    'B Z': 'C',
+    'C X': 'B',
+    'C Y': 'C',
+    'C Z': 'A'
+}
+
+
+def part_one(input: Input):
     """
     A, X - Rock
     B, Y - Paper
@@ -34,11 +66,9 @@ def part_one(input: str):
         'Z': 3
     }
 
-    array = input.splitlines()
-
     final_score = 0
 
-    for item in array:
+    for item in lines(input):
         you, me = item.split(' ')
 
         result = outcomes[you][me]
@@ -49,10 +79,10 @@ def part_one(input: str):
 
         final_score += score
 
-    print(final_score)
+    return final_score
 
 
-def part_two(input: str):
+def part_two(input: Input):
     """
     A - Rock
     B - Paper
@@ -91,11 +121,9 @@ def part_two(input: str):
         'C': 3
     }
 
-    array = input.splitlines()
-
     final_score = 0
 
-    for item in array:
+    for item in lines(input):
         you, result = item.split(' ')
 
         me = outcomes[you][result]
@@ -104,11 +132,78 @@ def part_two(input: str):
 
         final_score += score
 
-    print(final_score)
+    return final_score
+
+
+def round_score(you: str, me: str) -> int:
+    """The score of a round, where both shapes are 'A', 'B' or 'C'"""
+    shape = ord(me) - ord('A') + 1
+
+    # 0 if the round is a draw, 1 if `me` wins, and 2 if `me` loses
+    outcome = (ord(me) - ord(you)) % 3
+
+    return shape + (3, 6, 0)[outcome]
+
+
+def strategy_table(plays: dict[str, str]) -> list[int]:
+    """
+    The score of each round (in the order of `ROUNDS`) for a strategy, given the
+    shape played in each round, e.g. `{'A X': 'B', ...}`
+    """
+    return [round_score(round[0], plays[round]) for round in ROUNDS]
+
+
+def count_rounds(input: Input) -> list[int]:
+    """
+    The number of times each round (in the order of `ROUNDS`) is played
+
+    There are only 9 different lines, so rather than splitting each line,
+    count each of them in each chunk of the input. Each chunk ends at a line
+    break, and A, B and C only appear before the space, so a round can't be
+    counted twice, or counted across two lines
+    """
+    counts = [0] * len(ROUNDS)
+
+    for chunk in chunks(input):
+        for i, round in enumerate(ROUNDS):
+            counts[i] += chunk.count(round)
+
+    return counts
+
+
+def total_score(counts: list[int], table: list[int]) -> int:
+    """
+    The total score of a strategy, from the number of times each round is
+    played and the strategy's score table, so any number of strategies can be
+    scored from one count of the input
+    """
+    return sum(count * score for count, score in zip(counts, table))
+
+
+def part_one_counts(input: Input):
+    final_score = total_score(count_rounds(input), strategy_table(PART_ONE_PLAYS))
+
+    return final_score
+
+
+def part_two_counts(input: Input):
+    final_score = total_score(count_rounds(input), strategy_table(PART_TWO_PLAYS))
+
+    return final_score
+
+
+def solve(part: int, input: Input):
+    if part == 1:
+        return part_one_counts(input)
+    if part == 2:
+        return part_two_counts(input)
+
+    raise ValueError(f'Invalid part: {part}')
 
 
-with open('input.txt') as f:
-    input = f.read()
+if __name__ == '__main__':
+    with open('input.txt') as f:
+        input = f.read()
 
-part_one(input)
-part_two(input)
+    print(part_one(input))
+    print(part_two(input))
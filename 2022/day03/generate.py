@@ -0,0 +1,52 @@
+import random
+import string
+
+# Roughly the number of rucksacks in a real puzzle input
+SIZE = 300
+
+LETTERS = string.ascii_lowercase + string.ascii_uppercase
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate `size` rucksacks (rounded up to a multiple of 3)
+
+    Within each group of three, the elves only share the badge item, and the
+    two compartments of each rucksack only share a single item.
+    """
+    rng = random.Random(seed)
+
+    lines: list[str] = []
+
+    for _ in range(max(1, -(-size // 3))):
+        badge = rng.choice(LETTERS)
+
+        # Split the remaining letters between the three elves, so the badge is
+        # the only item they can all have in common
+        others = [letter for letter in LETTERS if letter != badge]
+        rng.shuffle(others)
+        pools = [others[0:17], others[17:34], others[34:51]]
+
+        for pool in pools:
+            # The item in both compartments
+            duplicate = rng.choice(pool + [badge])
+
+            # Everything else is split so it can only appear in one compartment
+            rest = [letter for letter in pool if letter != duplicate]
+            left_pool, right_pool = rest[: len(rest) // 2], rest[len(rest) // 2 :]
+
+            half = rng.randint(4, 16)
+            left = [rng.choice(left_pool) for _ in range(half - 1)] + [duplicate]
+            right = [rng.choice(right_pool) for _ in range(half - 1)] + [duplicate]
+
+            # The badge has to be carried by every elf in the group
+            # (but only in one compartment)
+            if duplicate != badge:
+                rng.choice((left, right))[0] = badge
+
+            rng.shuffle(left)
+            rng.shuffle(right)
+
+            lines.append(''.join(left) + ''.join(right))
+
+    return '\n'.join(lines) + '\n'
@@ -1,3 +1,19 @@
+import os
+import string
+import sys
+from functools import reduce
+from operator import and_, or_
+from typing import Any, Iterator
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from aoc import backend
+from aoc.inputs import Input, chunks, lines
+
+# `solve()` can be passed the memory-mapped input file
+MAPPED_INPUT = True
+
+
 def get_priority(letter: str) -> int:
     """
     Function to obtain priority of a letter
@@ -18,12 +34,20 @@ def get_priority(letter: str) -> int:
     return ord(letter) - 38
 
 
-def part_one(input: str):
-    array = input.splitlines()
+# The bit of each item, so bit `priority` is set in the bitmask of a rucksack
+# for each item in it
+BITS = {letter: 1 << get_priority(letter) for letter in string.ascii_letters}
 
+
+def bitmask(items: str) -> int:
+    """The bitmask of the items, with the bit of each item set"""
+    return reduce(or_, map(BITS.__getitem__, items), 0)
+
+
+def part_one(input: Input):
     total = 0
 
-    for line in array:
+    for line in lines(input):
         mid = len(line) // 2
 
         # Split each line into two halves
@@ -45,18 +69,17 @@ def part_one(input: str):
 
         total += get_priority(duplicate)
 
-    print(total)
+    return total
 
 
-def part_two(input: str):
-    array = input.splitlines()
-
+def part_two(input: Input):
     total = 0
 
-    # Iterate through the input in chunks of 3
-    for i in range(0, len(array), 3):
-        one, two, three = array[i], array[i + 1], array[i + 2]
+    # Iterate through the input in chunks of 3, taking three lines at a time
+    # from the same iterator
+    array = lines(input)
 
+    for one, two, three in zip(array, array, array):
         # Turn the second and third strings into sets, so characters can be found immediately
         set_two, set_three = set(two), set(three)
 
@@ -66,11 +89,161 @@ def part_two(input: str):
                 total += get_priority(char)
                 break
 
-    print(total)
+    return total
+
+
+def part_one_bitmask(input: Input):
+    """
+    The same as `part_one()`, with each compartment as a bitmask of its items,
+    so the duplicate is the bit set in both halves, and its priority is the
+    index of that bit
+    """
+    total = 0
+
+    for line in lines(input):
+        mid = len(line) // 2
+
+        duplicate = bitmask(line[:mid]) & bitmask(line[mid:])
+
+        if not duplicate:
+            raise Exception('Duplicate not found')
+
+        total += duplicate.bit_length() - 1
+
+    return total
+
+
+def badges(input: Input, size: int = 3):
+    """
+    The total priority of the badges of each group of `size` elves, where the
+    badge is the bit set in the bitmask of every rucksack in the group
+    """
+    total = 0
+
+    # Take `size` lines at a time from the same iterator
+    array = map(bitmask, lines(input))
+
+    for group in zip(*[array] * size):
+        # A group with no badge in common adds nothing, as 0 has no bits
+        total += max(reduce(and_, group).bit_length() - 1, 0)
+
+    return total
+
+
+def part_two_bitmask(input: Input):
+    """The same as `part_two()`, intersecting bitmasks of the rucksacks"""
+    return badges(input)
+
+
+def lines_numpy(input: Input) -> Iterator[tuple[Any, Any, Any]]:
+    """
+    The items of the rucksacks a chunk of the input at a time, as a NumPy
+    array of each item's bit (bit `priority` is set for each item), along with
+    the start and end of each line in the array
+    """
+    np = backend.numpy()
+
+    # The bit of each byte, which is 0 for anything which isn't an item (such
+    # as the line breaks)
+    table = np.zeros(256, dtype=np.uint64)
+
+    for letter, bit in BITS.items():
+        table[ord(letter)] = bit
+
+    for chunk in chunks(input):
+        data = np.frombuffer(chunk.encode(), dtype=np.uint8)
+
+        # Each line ends at a line break, apart from maybe the last line
+        ends = np.flatnonzero(data == ord('\n'))
+
+        if data[-1] != ord('\n'):
+            ends = np.append(ends, len(data))
+
+        starts = np.concatenate(([0], ends[:-1] + 1))
+
+        # Skip any blank lines
+        items = ends > starts
+
+        yield table[data], starts[items], ends[items]
+
+
+def priorities_numpy(common: Any) -> int:
+    """The total priority of the items, where each is a bitmask with one bit set"""
+    np = backend.numpy()
+
+    # The priority is the index of the bit, which is the exponent of the bitmask
+    # as a float (each is a power of 2, so is exact), minus 1
+    return int((np.frexp(common.astype(np.float64))[1] - 1).sum())
+
+
+def part_one_numpy(input: Input):
+    """
+    Each compartment is a bitmask of its items, so the duplicate is the bit set
+    in both the left and right bitmasks
+    """
+    np = backend.numpy()
+
+    total = 0
+
+    for bits, starts, ends in lines_numpy(input):
+        mids = starts + (ends - starts) // 2
+
+        # OR together the bits of each half of each line. Each right half runs
+        # up to the start of the next line, which only adds the line break
+        halves = np.bitwise_or.reduceat(bits, np.stack((starts, mids), axis=1).ravel())
+        duplicates = halves[0::2] & halves[1::2]
+
+        if not duplicates.all():
+            raise Exception('Duplicate not found')
+
+        total += priorities_numpy(duplicates)
+
+    return total
+
+
+def badges_numpy(input: Input, size: int = 3):
+    """
+    The total priority of the badges of each group of `size` elves, where the
+    badge is the bit set in the bitmask of every rucksack in the group
+    """
+    np = backend.numpy()
+
+    total = 0
+
+    # The rucksacks of a group which is split between two chunks
+    rest = np.zeros(0, dtype=np.uint64)
+
+    for bits, starts, _ in lines_numpy(input):
+        rucksacks = np.concatenate((rest, np.bitwise_or.reduceat(bits, starts)))
+
+        groups = len(rucksacks) // size
+        rest = rucksacks[groups * size:]
+
+        # AND together the bitmasks of the rucksacks in each group
+        badges = np.bitwise_and.reduce(rucksacks[:groups * size].reshape(groups, size), axis=1)
+
+        # A group with no badge in common doesn't add anything
+        total += priorities_numpy(badges[badges != 0])
+
+    return total
+
+
+def part_two_numpy(input: Input):
+    return badges_numpy(input)
+
+
+def solve(part: int, input: Input):
+    if part == 1:
+        return part_one_numpy(input) if backend.use_numpy() else part_one(input)
+    if part == 2:
+        return part_two_numpy(input) if backend.use_numpy() else part_two(input)
+
+    raise ValueError(f'Invalid part: {part}')
 
 
-with open('input.txt') as f:
-    input = f.read()
+if __name__ == '__main__':
+    with open('input.txt') as f:
+        input = f.read()
 
-part_one(input)
-part_two(input)
+    print(part_one(input))
+    print(part_two(input))
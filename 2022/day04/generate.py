@@ -0,0 +1,23 @@
+import random
+
+# Roughly the number of pairs in a real puzzle input
+SIZE = 1000
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """Generate `size` pairs of section assignments"""
+    rng = random.Random(seed)
+
+    lines: list[str] = []
+
+    for _ in range(size):
+        intervals: list[str] = []
+
+        for _ in range(2):
+            left = rng.randint(1, 99)
+            right = rng.randint(left, 99)
+            intervals.append(f'{left}-{right}')
+
+        lines.append(','.join(intervals))
+
+    return '\n'.join(lines) + '\n'
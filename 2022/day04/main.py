@@ -1,51 +1,193 @@
-def part_one(input: str):
-    array = input.splitlines()
+import operator
+import os
+import sys
+from array import array
+from typing import Any
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from aoc import backend
+from aoc.inputs import Input, chunks, lines
+from aoc.intervals import contains, count_overlapping, overlaps
+
+# `solve()` can be passed the memory-mapped input file
+MAPPED_INPUT = True
+
+
+def parse(line: str) -> tuple[tuple[int, int], tuple[int, int]]:
+    """
+    Parse the two intervals from a line, e.g. '2-4,6-8', as half-open intervals
+    (the end is not included, hence the + 1)
+    """
+    # Find the left and right values of each interval
+    left1, right1, left2, right2 = map(int, line.replace(',', '-').split('-'))
+
+    return (left1, right1 + 1), (left2, right2 + 1)
 
-    total = 0
 
-    for line in array:
-        # Find the two intervals
-        interval1, interval2 = line.split(',')
+def part_one(input: Input):
+    total = 0
 
-        # Find the left and right values of each interval
-        left1, right1 = interval1.split('-')
-        left2, right2 = interval2.split('-')
+    for line in lines(input):
+        interval1, interval2 = parse(line)
 
         # There are two scenarios to consider:
         #
         # 1  -----------           -----
         # 2    --------         -----------
-        if (int(left1) <= int(left2) <= int(right2) <= int(right1)) or (int(left2) <= int(left1) <= int(right1) <= int(right2)):
+        if contains(interval1, interval2) or contains(interval2, interval1):
             total += 1
 
-    print(total)
-
+    return total
 
-def part_two(input: str):
-    array = input.splitlines()
 
+def part_two(input: Input):
     total = 0
 
-    for line in array:
-        # Find the two intervals
-        interval1, interval2 = line.split(',')
-
-        # Find the left and right values of each interval
-        left1, right1 = interval1.split('-')
-        left2, right2 = interval2.split('-')
+    for line in lines(input):
+        interval1, interval2 = parse(line)
 
         # There are two scenarios to consider:
         #
         # 1  -----------                  -----
         # 2        --------       -----------
-        if (int(left1) <= int(left2) <= int(right1)) or (int(left2) <= int(left1) <= int(right2)):
+        if overlaps(interval1, interval2):
             total += 1
 
-    print(total)
+    return total
+
+
+# Replaces the separators with spaces, so every value can be split at once
+SEPARATORS = str.maketrans(',-', '  ')
+
+
+class Assignments:
+    """
+    The section assignments of every pair, parsed once into four columns of the
+    starts and ends of the first and second intervals. Unlike `parse()`, the
+    ends are included in the intervals, as they are in the input
+    """
+
+    __slots__ = ('start1', 'end1', 'start2', 'end2')
+
+    def __init__(self, input: Input) -> None:
+        # Every value in the input, four for each pair, parsed a chunk at a time
+        values = array('l')
+
+        for chunk in chunks(input):
+            values.extend(map(int, chunk.translate(SEPARATORS).split()))
+
+        self.start1 = values[0::4]
+        self.end1 = values[1::4]
+        self.start2 = values[2::4]
+        self.end2 = values[3::4]
+
+
+def count_contained(start1: Any, end1: Any, start2: Any, end2: Any) -> int:
+    """
+    The number of pairs where one interval contains the other, a column at a
+    time, so the loops are all in C
+    """
+    le, and_, or_ = operator.le, operator.and_, operator.or_
+
+    first = map(and_, map(le, start1, start2), map(le, end2, end1))
+    second = map(and_, map(le, start2, start1), map(le, end1, end2))
+
+    return sum(map(or_, first, second))
+
+
+def count_overlaps(start1: Any, end1: Any, start2: Any, end2: Any) -> int:
+    """The number of pairs where the intervals overlap, a column at a time"""
+    le = operator.le
+
+    return sum(map(operator.and_, map(le, start1, end2), map(le, start2, end1)))
+
+
+def part_one_columns(input: Input):
+    assignments = Assignments(input)
+
+    return count_contained(assignments.start1, assignments.end1, assignments.start2, assignments.end2)
+
+
+def part_two_columns(input: Input):
+    assignments = Assignments(input)
+
+    return count_overlaps(assignments.start1, assignments.end1, assignments.start2, assignments.end2)
+
+
+def columns_numpy(input: Input) -> Any:
+    """
+    The values of every pair as a NumPy array with a row for each pair, and the
+    columns of `Assignments`, parsed by NumPy a chunk at a time
+    """
+    np = backend.numpy()
+
+    values = [np.fromstring(chunk.translate(SEPARATORS), dtype=np.int64, sep=' ') for chunk in chunks(input)]
+
+    return np.concatenate(values or [np.zeros(0, dtype=np.int64)]).reshape(-1, 4)
+
+
+def part_one_numpy(input: Input):
+    start1, end1, start2, end2 = columns_numpy(input).T
+
+    contained = ((start1 <= start2) & (end2 <= end1)) | ((start2 <= start1) & (end1 <= end2))
+
+    return int(contained.sum())
+
+
+def part_two_numpy(input: Input):
+    start1, end1, start2, end2 = columns_numpy(input).T
+
+    return int(((start1 <= end2) & (start2 <= end1)).sum())
+
+
+def all_overlaps(input: Input):
+    """
+    The number of pairs of elves, out of every elf (not just the elves in each
+    pair), whose assignments overlap
+    """
+    assignments = Assignments(input)
+
+    starts = assignments.start1 + assignments.start2
+
+    # Half-open intervals, which `count_overlapping()` expects
+    ends = map((1).__add__, assignments.end1 + assignments.end2)
+
+    return count_overlapping(starts, ends)
+
+
+def all_overlaps_numpy(input: Input):
+    """
+    The same as `all_overlaps()`: for each interval, the intervals which end
+    before it starts are found with a binary search of the sorted ends, and
+    every other pair overlaps
+    """
+    np = backend.numpy()
+
+    values = columns_numpy(input)
+
+    starts = values[:, 0::2].ravel()
+    ends = np.sort(values[:, 1::2].ravel())
+
+    n = len(starts)
+    disjoint = int(np.searchsorted(ends, starts, side='left').sum())
+
+    return n * (n - 1) // 2 - disjoint
+
+
+def solve(part: int, input: Input):
+    if part == 1:
+        return part_one_numpy(input) if backend.use_numpy() else part_one_columns(input)
+    if part == 2:
+        return part_two_numpy(input) if backend.use_numpy() else part_two_columns(input)
+
+    raise ValueError(f'Invalid part: {part}')
 
 
-with open('input.txt') as f:
-    input = f.read()
+if __name__ == '__main__':
+    with open('input.txt') as f:
+        input = f.read()
 
-part_one(input)
-part_two(input)
+    print(part_one(input))
+    print(part_two(input))
+    print(all_overlaps(input))
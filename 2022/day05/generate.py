@@ -0,0 +1,57 @@
+import random
+import string
+
+# Roughly the number of moves in a real puzzle input
+SIZE = 500
+
+STACKS = 9
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate a drawing of nine stacks of crates followed by `size` moves, where
+    the first stack is the tallest
+
+    The moves are simulated while they are generated, so a move never takes
+    more crates than the stack holds, and no stack is ever left empty.
+    """
+    rng = random.Random(seed)
+
+    stacks = [
+        [rng.choice(string.ascii_uppercase) for _ in range(rng.randint(1, 8))]
+        for _ in range(STACKS)
+    ]
+
+    # The solution only reads the rows of the drawing which start with a crate,
+    # so the first stack must be (one of) the tallest
+    tallest = max(range(STACKS), key=lambda i: len(stacks[i]))
+    stacks[0], stacks[tallest] = stacks[tallest], stacks[0]
+
+    # Draw the stacks from the top down, padding each row to the full width
+    height = max(len(stack) for stack in stacks)
+    rows: list[str] = []
+
+    for level in range(height - 1, -1, -1):
+        cells = [f'[{stack[level]}]' if level < len(stack) else '   ' for stack in stacks]
+        rows.append(' '.join(cells))
+
+    rows.append(' '.join(f' {i + 1} ' for i in range(STACKS)))
+
+    moves: list[str] = []
+
+    while len(moves) < size:
+        from_index, to_index = rng.sample(range(STACKS), 2)
+        from_stack = stacks[from_index]
+
+        if len(from_stack) < 2:
+            continue
+
+        amount = rng.randint(1, len(from_stack) - 1)
+
+        crates = from_stack[-amount:]
+        del from_stack[-amount:]
+        stacks[to_index].extend(crates)
+
+        moves.append(f'move {amount} from {from_index + 1} to {to_index + 1}')
+
+    return '\n'.join(rows) + '\n\n' + '\n'.join(moves) + '\n'
@@ -1,4 +1,10 @@
+import os
 import re
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from aoc.model import model
 
 
 def get_stacks(diagram: str) -> list[list[str]]:
@@ -31,19 +37,34 @@ def get_stacks(diagram: str) -> list[list[str]]:
     return stacks
 
 
-def part_one(input: str):
+@model
+def parse(input: str) -> tuple[list[list[str]], list[tuple[int, int, int]]]:
+    """
+    Parse the input into the stacks of crates, and the (amount, from, to)
+    numbers of each move
+    """
     diagram, moves = input.strip('\n').split('\n\n')
 
-    moves_list = moves.splitlines()
+    moves_list: list[tuple[int, int, int]] = []
 
-    stacks = get_stacks(diagram)
-
-    for move in moves_list:
+    for move in moves.splitlines():
         # Parse the numbers as integers from the moves list
         matches = re.search(r'move (\d+) from (\d+) to (\d+)', move)
         assert matches is not None
         amount, from_index, to_index = map(int, matches.groups())
 
+        moves_list.append((amount, from_index, to_index))
+
+    return get_stacks(diagram), moves_list
+
+
+def part_one(input: str):
+    diagram_stacks, moves_list = parse(input)
+
+    # The model is shared with part two, so move the crates between copies of the stacks
+    stacks = [list(stack) for stack in diagram_stacks]
+
+    for amount, from_index, to_index in moves_list:
         # Moves list is 1-indexed, but `stacks` is 0-indexed
         from_stack, to_stack = stacks[from_index - 1], stacks[to_index - 1]
 
@@ -57,22 +78,15 @@ def part_one(input: str):
     for stack in stacks:
         result += stack[-1]
 
-    print(result)
+    return result
 
 
 def part_two(input: str):
-    diagram, moves = input.strip('\n').split('\n\n')
-
-    moves_list = moves.splitlines()
-
-    stacks = get_stacks(diagram)
+    diagram_stacks, moves_list = parse(input)
 
-    for move in moves_list:
-        # Parse the numbers as integers from the moves list
-        matches = re.search(r'move (\d+) from (\d+) to (\d+)', move)
-        assert matches is not None
-        amount, from_index, to_index = map(int, matches.groups())
+    stacks = [list(stack) for stack in diagram_stacks]
 
+    for amount, from_index, to_index in moves_list:
         # Moves list is 1-indexed, but `stacks` is 0-indexed
         from_stack, to_stack = stacks[from_index - 1], stacks[to_index - 1]
 
@@ -93,11 +107,21 @@ def part_two(input: str):
     for stack in stacks:
         result += stack[-1]
 
-    print(result)
+    return result
+
+
+def solve(part: int, input: str):
+    if part == 1:
+        return part_one(input)
+    if part == 2:
+        return part_two(input)
+
+    raise ValueError(f'Invalid part: {part}')
 
 
-with open('input.txt') as f:
-    input = f.read()
+if __name__ == '__main__':
+    with open('input.txt') as f:
+        input = f.read()
 
-part_one(input)
-part_two(input)
+    print(part_one(input))
+    print(part_two(input))
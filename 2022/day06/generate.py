@@ -0,0 +1,32 @@
+import random
+import string
+
+# Roughly the length of a real puzzle input
+SIZE = 4000
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate a datastream of `size` characters
+
+    The start-of-packet marker appears about halfway through, and the
+    start-of-message marker appears near the end, so both parts have to scan
+    most of the stream.
+    """
+    rng = random.Random(seed)
+
+    size = max(size, 40)
+    letters = list(string.ascii_lowercase)
+
+    # Three letters can never form a marker
+    head = [rng.choice(letters[:3]) for _ in range(size // 2)]
+
+    # Thirteen letters can form a start-of-packet marker, but not a
+    # start-of-message marker
+    middle = letters[:4] + [rng.choice(letters[:13]) for _ in range(size - len(head) - 40)]
+
+    # Fourteen different letters form the start-of-message marker
+    marker = rng.sample(letters, 14)
+    tail = [rng.choice(letters) for _ in range(size - len(head) - len(middle) - len(marker))]
+
+    return ''.join(head + middle + marker + tail) + '\n'
@@ -28,16 +28,26 @@ def find_marker(input: str, length: int) -> int:
 
 def part_one(input: str):
     result = find_marker(input, 4)
-    print(result)
+    return result
 
 
 def part_two(input: str):
     result = find_marker(input, 14)
-    print(result)
+    return result
+
+
+def solve(part: int, input: str):
+    if part == 1:
+        return part_one(input)
+    if part == 2:
+        return part_two(input)
+
+    raise ValueError(f'Invalid part: {part}')
 
 
-with open('input.txt') as f:
-    input = f.read()
+if __name__ == '__main__':
+    with open('input.txt') as f:
+        input = f.read()
 
-part_one(input)
-part_two(input)
+    print(part_one(input))
+    print(part_two(input))
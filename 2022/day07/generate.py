@@ -0,0 +1,80 @@
+import random
+import string
+
+# Roughly the number of files and directories in a real puzzle input
+SIZE = 500
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate a terminal session exploring a filesystem with `size` entries
+
+    About a fifth of the entries are directories. File sizes are scaled so the
+    disk is between 60% and 95% full, which leaves a directory worth deleting
+    for part 2.
+    """
+    rng = random.Random(seed)
+
+    # Each directory is a list of child directory ids, and a list of files
+    children: list[list[int]] = [[]]
+    files: list[list[int]] = [[]]
+
+    for _ in range(size):
+        parent = rng.randrange(len(children))
+
+        if rng.random() < 0.2:
+            children[parent].append(len(children))
+            children.append([])
+            files.append([])
+        else:
+            files[parent].append(rng.randint(1, 300000))
+
+    # Scale the file sizes so the total fits on the disk
+    total = sum(sum(sizes) for sizes in files) or 1
+    target = rng.randint(42000000, 66500000)
+    files = [[max(1, file * target // total) for file in sizes] for sizes in files]
+
+    lines = ['$ cd /']
+
+    # Depth-first traversal, using an explicit stack so deep trees are fine
+    # Each item is (directory id, whether we are entering or leaving it)
+    stack: list[tuple[int, bool]] = [(0, True)]
+    names: dict[int, str] = {}
+
+    while stack:
+        directory, entering = stack.pop()
+
+        if not entering:
+            lines.append('$ cd ..')
+            continue
+
+        if directory != 0:
+            lines.append(f'$ cd {names[directory]}')
+
+        lines.append('$ ls')
+
+        entries: list[str] = []
+
+        for i, child in enumerate(children[directory]):
+            names[child] = f'{random_name(rng)}{i}'
+            entries.append(f'dir {names[child]}')
+
+        for i, size in enumerate(files[directory]):
+            entries.append(f'{size} {random_name(rng)}{i}.{rng.choice(["txt", "dat", "log"])}')
+
+        rng.shuffle(entries)
+        lines.extend(entries)
+
+        for child in reversed(children[directory]):
+            stack.append((child, False))
+            stack.append((child, True))
+
+    # The session ends after the last listing, not on the way back up
+    while lines[-1] == '$ cd ..':
+        lines.pop()
+
+    return '\n'.join(lines) + '\n'
+
+
+def random_name(rng: random.Random) -> str:
+    return ''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(1, 8)))
@@ -1,13 +1,25 @@
+import os
+import sys
 from typing import Optional
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from aoc.model import model
+
 
 class File:
+    # A listing can hold a million entries, and slots take around half the memory
+    # of an instance dict
+    __slots__ = ('name', 'size')
+
     def __init__(self, name: str, size: int) -> None:
         self.name = name
         self.size = size
 
 
 class Directory:
+    __slots__ = ('name', 'parent', 'files', 'directories')
+
     root: 'Directory'
 
     def __init__(self, name: str = '/', parent: Optional['Directory'] = None) -> None:
@@ -85,41 +97,45 @@ def create_tree(commands: list[str]) -> Directory:
     return root
 
 
-def part_one(input: str):
-    # Obtain a list of commands by removing the first '$ ', then
-    # split at each '\n$ ' to obtain the full list
-    input = input[2:]
-    commands = input.split('\n$ ')
+def calculate_sizes(root: Directory) -> dict[Directory, int]:
+    """
+    Calculate the size of every directory from the size of its files and
+    sub-directories. The tree is walked with an explicit stack rather than
+    recursively, so a deeply nested filesystem doesn't hit the recursion limit
+    """
+    # Every directory, in the order they are found, so each directory comes
+    # before its sub-directories
+    order: list[Directory] = []
+    stack = [root]
 
-    # Root directory
-    root = create_tree(commands)
+    while stack:
+        dir = stack.pop()
+        order.append(dir)
+        stack.extend(dir.directories.values())
 
-    total = 0
-    LIMIT = 100000
+    sizes: dict[Directory, int] = {}
 
-    # Recursive function which calculates the size of a directory from the size of its
-    # files and sub-directories, and adds the size to `total` if it is smaller than `LIMIT`
-    def calculate_sizes(dir: Directory) -> int:
-        nonlocal total
+    # Work backwards, so the sizes of the sub-directories are already known
+    for dir in reversed(order):
         size = 0
 
         for file in dir.files.values():
             size += file.size
 
         for child_dir in dir.directories.values():
-            size += calculate_sizes(child_dir)
+            size += sizes[child_dir]
 
-        if size <= LIMIT:
-            total += size
+        sizes[dir] = size
 
-        return size
+    return sizes
 
-    calculate_sizes(root)
 
-    print(total)
-
-
-def part_two(input: str):
+@model
+def parse(input: str) -> tuple[int, list[int]]:
+    """
+    Parse the terminal output into the size of the root directory, and the size
+    of every directory (including the root)
+    """
     # Obtain a list of commands by removing the first '$ ', then
     # split at each '\n$ ' to obtain the full list
     input = input[2:]
@@ -128,47 +144,58 @@ def part_two(input: str):
     # Root directory
     root = create_tree(commands)
 
-    TOTAL_SPACE = 70000000
-    REQUIRED_SPACE = 30000000
+    # dict of the size of each directory
+    sizes = calculate_sizes(root)
 
-    # list to keep track of the sizes of each directory
-    sizes: list[int] = []
+    return sizes[root], list(sizes.values())
 
-    # Recursive function which calculates the size of a directory from the size of its
-    # files and sub-directories, and adds the size to the `sizes` list
-    def calculate_sizes(dir: Directory) -> int:
-        size = 0
 
-        for file in dir.files.values():
-            size += file.size
+def part_one(input: str):
+    _, sizes = parse(input)
 
-        for child_dir in dir.directories.values():
-            size += calculate_sizes(child_dir)
+    total = 0
+    LIMIT = 100000
 
-        sizes.append(size)
+    # Add the size of each directory to `total` if it is smaller than `LIMIT`
+    for size in sizes:
+        if size <= LIMIT:
+            total += size
 
-        return size
+    return total
 
-    root_size = calculate_sizes(root)
 
-    free_space = TOTAL_SPACE - root_size
+def part_two(input: str):
+    root_size, sizes = parse(input)
 
-    # Sort the directory sizes, smallest first
-    sizes.sort()
+    TOTAL_SPACE = 70000000
+    REQUIRED_SPACE = 30000000
+
+    free_space = TOTAL_SPACE - root_size
 
     result = -1
 
-    for dir_size in sizes:
+    # Go through the directory sizes, smallest first
+    for dir_size in sorted(sizes):
         if free_space + dir_size >= REQUIRED_SPACE:
             # Deleting this directory will gives us enough free space
             result = dir_size
             break
 
-    print(result)
+    return result
+
+
+def solve(part: int, input: str):
+    if part == 1:
+        return part_one(input)
+    if part == 2:
+        return part_two(input)
+
+    raise ValueError(f'Invalid part: {part}')
 
 
-with open('input.txt') as f:
-    input = f.read()
+if __name__ == '__main__':
+    with open('input.txt') as f:
+        input = f.read()
 
-part_one(input)
-part_two(input)
+    print(part_one(input))
+    print(part_two(input))
@@ -0,0 +1,14 @@
+import random
+
+# The side length of a real puzzle input
+SIZE = 99
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """Generate a `size` x `size` grid of tree heights"""
+    rng = random.Random(seed)
+
+    size = max(size, 3)
+    rows = [''.join(rng.choice('0123456789') for _ in range(size)) for _ in range(size)]
+
+    return '\n'.join(rows) + '\n'
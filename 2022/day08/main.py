@@ -1,7 +1,18 @@
+import os
+import sys
 from functools import reduce
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from aoc import backend
+from aoc.grid import Grid
+
 
 def part_one(input: str):
+    """
+    The reference solution, kept from before the port to `Grid`. `solve()`
+    uses `part_one_grid()`, which `python -m aoc.variants` checks against it.
+    """
     grid = input.splitlines()
 
     # Turn the strings of numbers into lists of integers
@@ -69,10 +80,107 @@ def part_one(input: str):
             total += check_tree(i, j, tree, maximum_bottom)
             maximum_bottom = max(maximum_bottom, tree)
 
-    print(total)
+    return total
+
+
+def part_one_grid(input: str):
+    """
+    The same as `part_one()`, on a flat `Grid`, stopping each line of sight at
+    the tallest possible tree
+    """
+    # Parse the grid of tree heights. Each cell holds the character code of the
+    # digit, which compare in the same order as the heights themselves.
+    grid = Grid.parse(input)
+    cells = grid.cells
+
+    # Calculate the height and width of the grid
+    height, width = grid.height, grid.width
+
+    # All trees on the outer edge are visible by default
+    # Remove 4 to not double-count
+    outer_edge = 2 * (height + width) - 4
+    total = outer_edge
+
+    # Keep track of trees that have already been counted, one byte per cell
+    seen = bytearray(len(cells))
+
+    tallest = ord('9')
+
+    def scan(line: range) -> int:
+        """
+        Count the trees in a line of the grid that are visible from the start of
+        the line, and have not been counted before. The trees at either end of the
+        line are on the outer edge, so they have already been counted.
+        """
+        count = 0
+
+        # `maximum` keeps track of the largest tree we've seen so far
+        maximum = cells[line[0]]
+
+        for i in line[1:-1]:
+            tree = cells[i]
+
+            # If the tree is larger than the maximum we've seen so far, and we
+            # haven't counted it before, then we need to count it
+            if tree > maximum:
+                if not seen[i]:
+                    seen[i] = 1
+                    count += 1
+
+                maximum = tree
+
+                # No tree can be seen past the tallest possible tree
+                if maximum == tallest:
+                    break
+
+        return count
+
+    # Look along each row, forwards and backwards
+    # Ignore the outer edges as they have already been counted
+    for i in range(1, height - 1):
+        row = grid.row(i)
+        total += scan(row) + scan(row[::-1])
+
+    # Look along each column, downwards and upwards
+    for j in range(1, width - 1):
+        column = grid.column(j)
+        total += scan(column) + scan(column[::-1])
+
+    return total
+
+
+def part_one_numpy(input: str):
+    np = backend.numpy()
+
+    # The grid of tree heights, as the character codes of the digits
+    rows = input.split()
+    heights = np.frombuffer(''.join(rows).encode(), dtype=np.uint8).reshape(len(rows), -1)
+
+    visible = np.zeros(heights.shape, dtype=bool)
+
+    # Look along the rows from each side in turn, by rotating the grid so that
+    # side is on the left
+    for turns in range(4):
+        view = np.rot90(heights, turns)
+
+        # The tallest tree up to each tree in its row
+        tallest = np.maximum.accumulate(view, axis=1)
+
+        # A tree is visible if it is taller than every tree before it, and the
+        # trees on the edge are always visible
+        seen = np.ones(view.shape, dtype=bool)
+        seen[:, 1:] = view[:, 1:] > tallest[:, :-1]
+
+        visible |= np.rot90(seen, -turns)
+
+    return int(visible.sum())
 
 
 def part_two(input: str):
+    """
+    The reference solution, kept from before the port to `Grid`. `solve()`
+    uses `part_two_grid()`, which `python -m aoc.variants` checks against it.
+    """
     grid = input.splitlines()
 
     # Turn the strings of numbers into lists of integers
@@ -113,11 +221,68 @@ def part_two(input: str):
             # Update the maximum value if `score` is larger than the current `maximum`
             maximum = max(maximum, score)
 
-    print(maximum)
+    return maximum
+
+
+def part_two_grid(input: str):
+    """
+    The same as `part_two()`, on a flat `Grid` with a border taller than any
+    tree, so the edge of the grid needs no bounds checks
+    """
+    # Parse the grid of tree heights, surrounded by a border which is taller than
+    # any tree (':' comes after '9')
+    grid = Grid.parse(input, border=':')
+    cells = grid.cells
+
+    # Calculate the height of the grid
+    height = grid.height
+
+    maximum = 0
+
+    # Iterate through each tree
+    for i in range(1, height - 1):
+        for index in grid.row(i)[1:-1]:
+            tree = cells[index]
+            score = 1
+
+            # Iterate along each direction (x or y, forwards or backwards)
+            for step in grid.neighbours:
+                # Move along the axis until we reach a tree which is not smaller
+                # than the original tree. The border is taller than any tree, so
+                # we always stop at the edge of the grid.
+                next_index = index + step
+                distance = 1
+
+                while cells[next_index] < tree:
+                    next_index += step
+                    distance += 1
+
+                # If we stopped at the border, then the last tree we can see is
+                # the tree on the edge
+                if cells[next_index] == grid.border:
+                    distance -= 1
+
+                # Multiply the individual scores to obtain the overall score
+                score *= distance
+
+            # Update the maximum value if `score` is larger than the current `maximum`
+            maximum = max(maximum, score)
+
+    return maximum
+
+
+def solve(part: int, input: str):
+    if part == 1:
+        return part_one_numpy(input) if backend.use_numpy() else part_one_grid(input)
+    if part == 2:
+        return part_two_grid(input)
+
+    raise ValueError(f'Invalid part: {part}')
 
 
-with open('input.txt') as f:
-    input = f.read()
+if __name__ == '__main__':
+    with open('input.txt') as f:
+        input = f.read()
 
-part_one(input)
-part_two(input)
+    print(solve(1, input))
+    print(solve(2, input))
@@ -0,0 +1,13 @@
+import random
+
+# Roughly the number of moves in a real puzzle input
+SIZE = 2000
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """Generate `size` moves of the head of the rope"""
+    rng = random.Random(seed)
+
+    lines = [f'{rng.choice("UDLR")} {rng.randint(1, 20)}' for _ in range(size)]
+
+    return '\n'.join(lines) + '\n'
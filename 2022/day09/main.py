@@ -1,4 +1,14 @@
 import math
+import os
+import sys
+from typing import Iterable
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from aoc.inputs import Input, lines
+
+# `solve()` can be passed the memory-mapped input file
+MAPPED_INPUT = True
 
 
 def get_length(x: int, y: int) -> float:
@@ -54,7 +64,7 @@ def make_moves(positions: list[tuple[int, int]], direction: str) -> list[tuple[i
     return positions
 
 
-def calculate(moves: list[str], knots: int) -> int:
+def calculate(moves: Iterable[str], knots: int) -> int:
     # Each knot starts at (0, 0)
     positions: list[tuple[int, int]] = [(0, 0) for _ in range(knots)]
 
@@ -73,20 +83,30 @@ def calculate(moves: list[str], knots: int) -> int:
     return len(seen)
 
 
-def part_one(input: str):
-    moves = input.splitlines()
+def part_one(input: Input):
+    moves = lines(input)
     result = calculate(moves, 2)
-    print(result)
+    return result
 
 
-def part_two(input: str):
-    moves = input.splitlines()
+def part_two(input: Input):
+    moves = lines(input)
     result = calculate(moves, 10)
-    print(result)
+    return result
+
+
+def solve(part: int, input: Input):
+    if part == 1:
+        return part_one(input)
+    if part == 2:
+        return part_two(input)
+
+    raise ValueError(f'Invalid part: {part}')
 
 
-with open('input.txt') as f:
-    input = f.read()
+if __name__ == '__main__':
+    with open('input.txt') as f:
+        input = f.read()
 
-part_one(input)
-part_two(input)
+    print(part_one(input))
+    print(part_two(input))
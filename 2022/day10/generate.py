@@ -0,0 +1,38 @@
+import random
+
+# Roughly the number of instructions in a real puzzle input
+SIZE = 140
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate a program of roughly `size` instructions
+
+    Like the real input, the program runs for a whole number of rows of the
+    screen (40 cycles each), and `X` is kept close to the screen, so the
+    sprite is drawn on most rows.
+    """
+    rng = random.Random(seed)
+
+    lines: list[str] = []
+    X = 1
+    cycles = 0
+
+    while len(lines) < size or cycles % 40 != 0:
+        # Finish the last row with a noop if there is only one cycle left
+        if rng.random() < 0.3 or (len(lines) >= size and cycles % 40 == 39):
+            lines.append('noop')
+            cycles += 1
+            continue
+
+        value = rng.randint(-10, 10)
+
+        # Pull `X` back towards the screen if it drifts too far
+        if not -5 <= X + value <= 45:
+            value = -value
+
+        X += value
+        cycles += 2
+        lines.append(f'addx {value}')
+
+    return '\n'.join(lines) + '\n'
@@ -1,5 +1,16 @@
-def part_one(input: str):
-    moves = input.splitlines()
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from aoc.inputs import Input, lines
+
+# `solve()` can be passed the memory-mapped input file
+MAPPED_INPUT = True
+
+
+def part_one(input: Input):
+    moves = lines(input)
 
     # Initialise variables
     total = 0
@@ -27,22 +38,25 @@ def part_one(input: str):
             if cycle % 40 == 20:
                 total += cycle * X
 
-    print(total)
+    return total
 
 
-def part_two(input: str):
-    def crt_print(position: int, X: int) -> int:
+def part_two(input: Input):
+    # `pixels` is each pixel drawn on the screen so far
+    pixels: list[str] = []
+
+    def crt_draw(position: int, X: int) -> int:
         """
-        Function to print character on the screen depending on the position of
-        the sprite
+        Function to draw a pixel on the screen depending on the position of the
+        sprite
         """
 
         if X - 1 <= position <= X + 1:
             # If the position of the pixel is between the sprite, draw '#'
-            print('#', end='')
+            pixels.append('#')
         else:
             # Otherwise, draw '.'
-            print('.', end='')
+            pixels.append('.')
 
         # Move the pixel to the next position
         position += 1
@@ -50,11 +64,11 @@ def part_two(input: str):
         # If the pixel is out of bounds, reset to the start and draw a new line
         if position == 40:
             position = 0
-            print()
+            pixels.append('\n')
 
         return position
 
-    moves = input.splitlines()
+    moves = lines(input)
 
     X = 1
     position = 0
@@ -63,16 +77,29 @@ def part_two(input: str):
         line = move.split(' ')
         op = line[0]
 
-        position = crt_print(position, X)
+        position = crt_draw(position, X)
 
         if op == 'addx':
-            position = crt_print(position, X)
+            position = crt_draw(position, X)
             X += int(line[1])
 
+    # The screen is every line drawn, without the final new line
+    return ''.join(pixels).rstrip('\n')
+
+
+def solve(part: int, input: Input):
+    if part == 1:
+        return part_one(input)
+    if part == 2:
+        return part_two(input)
+
+    raise ValueError(f'Invalid part: {part}')
+
 
-with open('input.txt') as f:
-    input = f.read()
+if __name__ == '__main__':
+    with open('input.txt') as f:
+        input = f.read()
 
-part_one(input)
-print()
-part_two(input)
+    print(part_one(input))
+    print()
+    print(part_two(input))
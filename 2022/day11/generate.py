@@ -0,0 +1,48 @@
+import random
+
+# The number of monkeys in a real puzzle input
+SIZE = 8
+
+PRIMES = [2, 3, 5, 7, 11, 13, 17, 19, 23]
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate `size` monkeys, each starting with at least one item
+
+    Like the real input, only one monkey squares the worry level (otherwise the
+    worry levels in part 1 would grow far too quickly), and the tests use
+    different primes where possible.
+    """
+    rng = random.Random(seed)
+
+    # Each monkey needs two other monkeys to throw to
+    size = max(size, 3)
+    monkeys: list[str] = []
+
+    squaring = rng.randrange(size)
+    tests = rng.sample(PRIMES, size) if size <= len(PRIMES) else rng.choices(PRIMES, k=size)
+
+    for number in range(size):
+        items = ', '.join(str(rng.randint(50, 99)) for _ in range(rng.randint(1, 8)))
+
+        if number == squaring:
+            operation = 'old * old'
+        elif rng.random() < 0.4:
+            operation = f'old * {rng.randint(2, 19)}'
+        else:
+            operation = f'old + {rng.randint(1, 8)}'
+
+        # Each monkey throws to two other monkeys
+        true, false = rng.sample([i for i in range(size) if i != number], 2)
+
+        monkeys.append(
+            f'Monkey {number}:\n'
+            f'  Starting items: {items}\n'
+            f'  Operation: new = {operation}\n'
+            f'  Test: divisible by {tests[number]}\n'
+            f'    If true: throw to monkey {true}\n'
+            f'    If false: throw to monkey {false}'
+        )
+
+    return '\n\n'.join(monkeys) + '\n'
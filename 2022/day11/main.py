@@ -1,9 +1,17 @@
+import os
 import re
+import sys
 from functools import reduce
 from typing import Optional
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from aoc.model import model
+
 
 class Monkey:
+    __slots__ = ('inspects', 'number', 'items', 'operation', 'test', 'true', 'false')
+
     inspects: int
     number: int
     items: list[int]
@@ -12,39 +20,27 @@ class Monkey:
     true: int
     false: int
 
-    def __init__(self, text: str):
-        """Extract all values from the input, and set the instance variables"""
-        match = re.search(r'''^Monkey (\d+):
-  Starting items: (.*)
-  Operation: new = (.*)
-  Test: divisible by (\d+)
-    If true: throw to monkey (\d+)
-    If false: throw to monkey (\d+)$''', text, re.DOTALL)
-
-        assert match is not None
-
-        groups = match.groups()
-
+    def __init__(self, number: int, items: tuple[int, ...], operation: str, test: int, true: int, false: int):
         # The number of times the monkey has inspected an item
         self.inspects = 0
 
         # The index of the monkey
-        self.number = int(groups[0])
+        self.number = number
 
         # A list of the items the monkey currently has
-        self.items = list(map(int, groups[1].split(', ')))
+        self.items = list(items)
 
         # A string of the monkey operation
-        self.operation = groups[2]
+        self.operation = operation
 
         # The number to check if the worry is divisible by
-        self.test = int(groups[3])
+        self.test = test
 
         # The index of the monkey to pass to if the test passes
-        self.true = int(groups[4])
+        self.true = true
 
         # The index of the monkey to pass to if the test fails
-        self.false = int(groups[5])
+        self.false = false
 
     def add_item(self, item: int):
         """Add an item to the monkey's list of items"""
@@ -81,12 +77,44 @@ class Monkey:
         return (self.false, new_worry)
 
 
-def part_one(input: str):
+@model
+def parse(input: str) -> list[tuple[int, tuple[int, ...], str, int, int, int]]:
+    """
+    Extract all values for each monkey from the input, as a tuple of the
+    arguments to `Monkey()`
+    """
     # Split the input text at each double new line
     input_arr = input.strip('\n').split('\n\n')
 
+    monkeys: list[tuple[int, tuple[int, ...], str, int, int, int]] = []
+
+    for text in input_arr:
+        match = re.search(r'''^Monkey (\d+):
+  Starting items: (.*)
+  Operation: new = (.*)
+  Test: divisible by (\d+)
+    If true: throw to monkey (\d+)
+    If false: throw to monkey (\d+)$''', text, re.DOTALL)
+
+        assert match is not None
+
+        groups = match.groups()
+
+        monkeys.append((
+            int(groups[0]),
+            tuple(map(int, groups[1].split(', '))),
+            groups[2],
+            int(groups[3]),
+            int(groups[4]),
+            int(groups[5]),
+        ))
+
+    return monkeys
+
+
+def part_one(input: str):
     # Create the Monkey objects
-    monkeys = [Monkey(text) for text in input_arr]
+    monkeys = [Monkey(*monkey) for monkey in parse(input)]
 
     # Loop n times
     for _ in range(20):
@@ -112,15 +140,12 @@ def part_one(input: str):
     # Multiply the number of inspects of the first two monkeys
     result = sorted_monkeys[0].inspects * sorted_monkeys[1].inspects
 
-    print(result)
+    return result
 
 
 def part_two(input: str):
-    # Split the input text at each double new line
-    monkey_input = input.strip('\n').split('\n\n')
-
     # Create the Monkey objects
-    monkeys = [Monkey(monkey) for monkey in monkey_input]
+    monkeys = [Monkey(*monkey) for monkey in parse(input)]
 
     # To prevent the worry levels from becoming too large, we can find the
     # common denominator of all the monkeys' test values, by multiplying all
@@ -153,11 +178,21 @@ def part_two(input: str):
     # Multiply the number of inspects of the first two monkeys
     result = sorted_monkeys[0].inspects * sorted_monkeys[1].inspects
 
-    print(result)
+    return result
+
+
+def solve(part: int, input: str):
+    if part == 1:
+        return part_one(input)
+    if part == 2:
+        return part_two(input)
+
+    raise ValueError(f'Invalid part: {part}')
 
 
-with open('input.txt') as f:
-    input = f.read()
+if __name__ == '__main__':
+    with open('input.txt') as f:
+        input = f.read()
 
-part_one(input)
-part_two(input)
+    print(part_one(input))
+    print(part_two(input))
@@ -0,0 +1,40 @@
+import random
+import string
+
+# The number of rows in a real puzzle input
+SIZE = 41
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate a heightmap with `size` rows and four times as many columns
+
+    The height mostly rises from left to right, with some noise. The row
+    containing `S` and `E` climbs at most one level per step, so there is
+    always a path from the start to the end.
+    """
+    rng = random.Random(seed)
+
+    height = max(size, 1)
+    width = max(4 * height, 26)
+    path_row = rng.randrange(height)
+
+    rows: list[str] = []
+
+    for i in range(height):
+        row: list[str] = []
+
+        for j in range(width):
+            level = j * 26 // width
+
+            if i != path_row:
+                level = min(25, max(0, level + rng.choice((-2, -1, 0, 0, 1, 2))))
+
+            row.append(string.ascii_lowercase[level])
+
+        rows.append(row)
+
+    rows[path_row][0] = 'S'
+    rows[path_row][-1] = 'E'
+
+    return '\n'.join(''.join(row) for row in rows) + '\n'
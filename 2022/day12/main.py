@@ -1,3 +1,12 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from aoc.graph import UNREACHABLE, Graph, bfs
+from aoc.grid import Grid
+
+
 def find_letter(grid: list[list[str]], letter: str) -> tuple[int, int]:
     """
     Function to find the coordinates of a letter in the grid
@@ -11,6 +20,10 @@ def find_letter(grid: list[list[str]], letter: str) -> tuple[int, int]:
 
 
 def part_one(input: str):
+    """
+    The reference solution, kept from before the port to `Grid`. `solve()`
+    uses `part_one_grid()`, which `python -m aoc.variants` checks against it.
+    """
     # Parse the grid
     grid = [list(row) for row in input.splitlines()]
 
@@ -74,10 +87,14 @@ def part_one(input: str):
         # Otherwise, we have found the result
         break
 
-    print(result)
+    return result
 
 
 def part_two(input: str):
+    """
+    The reference solution, kept from before the port to `Grid`. `solve()`
+    uses `part_two_grid()`, which `python -m aoc.variants` checks against it.
+    """
     # Parse the grid
     grid = [list(row) for row in input.splitlines()]
 
@@ -141,11 +158,111 @@ def part_two(input: str):
         # Otherwise, we have found the result
         break
 
-    print(result)
+    return result
+
+
+def parse_grid(input: str, border: str) -> tuple[Grid, int, int]:
+    """
+    Parse the grid of heights, returning the grid and the indices of the start
+    and end squares, which are replaced by their heights
+    """
+    grid = Grid.parse(input, border)
+    cells = grid.cells
+
+    # Find the indices of the start and end points
+    start = grid.find('S')
+    end = grid.find('E')
+
+    # Replace the start and end points with their heights
+    cells[start] = ord('a')
+    cells[end] = ord('z')
+
+    return grid, start, end
+
+
+def build_graph(grid: Grid, downhill: bool) -> Graph:
+    """
+    Build a graph of the squares, numbered by their index in the grid, with an
+    arc to each adjacent square which can be climbed onto (at most one level
+    higher), or if `downhill`, which can be climbed down from (at most one
+    level lower). The border must never be reachable.
+    """
+    cells = grid.cells
+
+    offsets = [0]
+    targets: list[int] = []
+
+    # Add the arcs leaving each square in turn
+    for square, height in enumerate(cells):
+        if height != grid.border:
+            for step in grid.neighbours:
+                if downhill:
+                    if height - cells[square + step] <= 1:
+                        targets.append(square + step)
+                elif cells[square + step] - height <= 1:
+                    targets.append(square + step)
+
+        offsets.append(len(targets))
+
+    return Graph(offsets, targets)
+
+
+def part_one_grid(input: str):
+    """
+    The same as `part_one()`, as a breadth-first search over a graph of the
+    squares of a flat `Grid`
+    """
+    # Parse the grid, surrounded by a border which is too high to ever climb
+    # onto ('~' comes after 'z')
+    grid, start, end = parse_grid(input, border='~')
+    graph = build_graph(grid, downhill=False)
+
+    # Breadth-first search from the start square, until the end is reached
+    distances = bfs(graph, [start], end)
+
+    if distances[end] == UNREACHABLE:
+        return -1
+
+    return distances[end]
+
+
+def part_two_grid(input: str):
+    """
+    The same as `part_two()`, as a breadth-first search over a graph of the
+    squares of a flat `Grid`
+    """
+    # Parse the grid, surrounded by a border which is too low to ever climb
+    # down onto ('#' comes well before 'a')
+    grid, _, end = parse_grid(input, border='#')
+
+    # Breadth-first search backwards from the end square, to find the closest
+    # square at the lowest level
+    distances = bfs(build_graph(grid, downhill=True), [end])
+
+    lowest = ord('a')
+    result = min(
+        (distances[square] for square in grid.indices() if grid.cells[square] == lowest),
+        default=UNREACHABLE,
+    )
+
+    if result == UNREACHABLE:
+        return -1
+
+    return result
+
+
+def solve(part: int, input: str):
+    if part == 1:
+        return part_one_grid(input)
+    if part == 2:
+        return part_two_grid(input)
+
+    raise ValueError(f'Invalid part: {part}')
 
 
-with open('input.txt') as f:
-    input = f.read()
+if __name__ == '__main__':
+    with open('input.txt') as f:
+        input = f.read()
 
-part_one(input)
-part_two(input)
+    print(solve(1, input))
+    print(solve(2, input))
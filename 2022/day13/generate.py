@@ -0,0 +1,39 @@
+import random
+
+# The number of pairs in a real puzzle input
+SIZE = 150
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """Generate `size` pairs of packets"""
+    rng = random.Random(seed)
+
+    pairs: list[str] = []
+
+    for _ in range(size):
+        left, right = random_packet(rng, 0), random_packet(rng, 0)
+
+        # Sometimes make the packets share a prefix, so the comparison has to
+        # look further into them
+        if rng.random() < 0.5 and left:
+            right = left[: rng.randint(0, len(left))] + right
+
+        pairs.append(f'{to_string(left)}\n{to_string(right)}')
+
+    return '\n\n'.join(pairs) + '\n'
+
+
+def random_packet(rng: random.Random, depth: int) -> list:
+    packet: list = []
+
+    for _ in range(rng.randint(0, 5)):
+        if depth < 4 and rng.random() < 0.3:
+            packet.append(random_packet(rng, depth + 1))
+        else:
+            packet.append(rng.randint(0, 10))
+
+    return packet
+
+
+def to_string(packet: list) -> str:
+    return str(packet).replace(' ', '')
@@ -1,69 +1,114 @@
-import ast
+import os
+import re
+import sys
 from functools import cmp_to_key
 from typing import Union
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
-Packet = list[Union[int, 'Packet']]
-
+from aoc.model import model
 
-def compare(left_arr: Packet, right_arr: Packet) -> int:
-    """Comparator function to determine order of packets"""
-    i = 0
-
-    while i < len(left_arr) and i < len(right_arr):
-        # Iterate through both lists together
-        left, right = left_arr[i], right_arr[i]
-
-        # Iff both values are integers, compare them directly
-        if isinstance(left, int) and isinstance(right, int):
-            if left < right:
-                return -1
-            if right < left:
-                return 1
-            # If `left` and `right` are the same, move on to the next items
-        else:
-            # Convert any integer into a list (both may already be lists)
-            if isinstance(left, int):
-                left = [left]
-            if isinstance(right, int):
-                right = [right]
 
-            # Compare the two lists recursively
-            check = compare(left, right)
+Packet = list[Union[int, 'Packet']]
 
-            # If `check` is not 0, then the lists are not equal, therefore
-            # return this value
-            if check != 0:
-                return check
-            # If the lists are the same, move on to the next items
+# The tokens of a packet: brackets and integers (the commas only separate them)
+TOKEN = re.compile(r'\d+|[\[\]]')
+
+
+def parse_packet(line: str) -> Packet:
+    """
+    Parse a packet, e.g. '[1,[2,3]]'. The lists still being parsed are kept on a
+    stack, as `ast.literal_eval` cannot parse lists nested more than 200 deep
+    """
+    # The list containing the packet, then each unfinished list inside it
+    stack: list[Packet] = [[]]
+
+    for token in TOKEN.findall(line):
+        if token == '[':
+            # Start a new list inside the current one
+            packet: Packet = []
+            stack[-1].append(packet)
+            stack.append(packet)
+        elif token == ']':
+            # The current list is finished
+            stack.pop()
+        else:
+            stack[-1].append(int(token))
 
-        i += 1
+    return stack[0][0]  # type: ignore[return-value]
 
-    # If we have reached here, then we have fully iterated through one (or
-    # both) of the lists
-    if len(left_arr) == len(right_arr):
-        # If the lengths are the same, then the lists are equal
-        return 0
-    if i < len(right_arr):
-        # If we haven't iterated fully through the right array, then the left
-        # array is smaller and comes first
-        return -1
 
-    # Otherwise, the right array comes first
-    return 1
+def compare(left_arr: Packet, right_arr: Packet) -> int:
+    """
+    Comparator function to determine order of packets
+
+    Nested lists are compared using an explicit stack of the lists being
+    compared (and the index reached in each), rather than recursively, so
+    deeply nested packets don't hit the recursion limit
+    """
+    stack: list[tuple[Packet, Packet, int]] = [(left_arr, right_arr, 0)]
+
+    while stack:
+        left_arr, right_arr, i = stack.pop()
+
+        while i < len(left_arr) and i < len(right_arr):
+            # Iterate through both lists together
+            left, right = left_arr[i], right_arr[i]
+
+            # Iff both values are integers, compare them directly
+            if isinstance(left, int) and isinstance(right, int):
+                if left < right:
+                    return -1
+                if right < left:
+                    return 1
+                # If `left` and `right` are the same, move on to the next items
+            else:
+                # Convert any integer into a list (both may already be lists)
+                if isinstance(left, int):
+                    left = [left]
+                if isinstance(right, int):
+                    right = [right]
+
+                # Compare the two lists, coming back to the next items of these
+                # lists if they are the same
+                stack.append((left_arr, right_arr, i + 1))
+                left_arr, right_arr, i = left, right, 0
+                continue
+
+            i += 1
+
+        # If we have reached here, then we have fully iterated through one (or
+        # both) of the lists
+        if len(left_arr) == len(right_arr):
+            # If the lengths are the same, then the lists are equal, so carry on
+            # comparing the lists containing them
+            continue
+        if i < len(right_arr):
+            # If we haven't iterated fully through the right array, then the left
+            # array is smaller and comes first
+            return -1
+
+        # Otherwise, the right array comes first
+        return 1
+
+    # The packets are equal
+    return 0
+
+
+@model
+def parse(input: str) -> list[Packet]:
+    """Parse the packet on each line in the input (that isn't blank)"""
+    return [parse_packet(line) for line in input.splitlines() if line != '']
 
 
 def part_one(input: str):
-    arr = input.strip().split('\n\n')
+    packets = parse(input)
 
     result = 0
 
-    for i, pair in enumerate(arr):
-        left, right = pair.splitlines()
-
-        # Evalue the pair of packets as string literals
-        left_arr: Packet = ast.literal_eval(left)
-        right_arr: Packet = ast.literal_eval(right)
+    # The packets are in pairs
+    for i in range(len(packets) // 2):
+        left_arr, right_arr = packets[2 * i], packets[2 * i + 1]
 
         # If `left_arr` comes before `right_arr`, the `compare` function
         # will return -1
@@ -71,15 +116,12 @@ def part_one(input: str):
             # Add the index (1-based) to the result
             result += i + 1
 
-    print(result)
+    return result
 
 
 def part_two(input: str):
-    # Parse the string literal for each line in the input (that isn't blank)
-    packets: list[Packet] = [ast.literal_eval(line) for line in input.splitlines() if line != '']
-
-    # Add the divider packets
-    packets.extend([[[2]], [[6]]])
+    # Add the divider packets, to a new list as the model is shared with part one
+    packets = parse(input) + [[[2]], [[6]]]
 
     # Sort, using the custom `compare` function
     packets.sort(key=cmp_to_key(compare))
@@ -91,12 +133,21 @@ def part_two(input: str):
         if packet == [[2]] or packet == [[6]]:
             result *= (i + 1)
 
-    print(result)
+    return result
+
+
+def solve(part: int, input: str):
+    if part == 1:
+        return part_one(input)
+    if part == 2:
+        return part_two(input)
 
+    raise ValueError(f'Invalid part: {part}')
 
-with open('input.txt') as f:
-    input = f.read()
 
+if __name__ == '__main__':
+    with open('input.txt') as f:
+        input = f.read()
 
-part_one(input)
-part_two(input)
+    print(part_one(input))
+    print(part_two(input))
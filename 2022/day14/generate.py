@@ -0,0 +1,43 @@
+import random
+
+# Roughly the number of rock paths in a real puzzle input
+SIZE = 150
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate `size` paths of rock below the sand source at 500,0
+
+    Each path alternates between horizontal and vertical segments. Every
+    point stays within the triangle of sand that forms in part 2, so the
+    cave gets deeper as more paths are added.
+    """
+    rng = random.Random(seed)
+
+    depth = max(20, int(size**0.5 * 15))
+
+    lines: list[str] = []
+
+    for _ in range(size):
+        y = rng.randint(5, depth)
+        x = rng.randint(500 - y // 2, 500 + y // 2)
+
+        points = [(x, y)]
+
+        for k in range(rng.randint(1, 5)):
+            if k % 2 == 0:
+                # Horizontal segment
+                x = min(500 + y // 2, max(500 - y // 2, x + rng.choice((-1, 1)) * rng.randint(1, 8)))
+            else:
+                # Vertical segment, which may not rise above the sand triangle
+                y = min(depth, max(2 * abs(x - 500) + 1, 5, y + rng.choice((-1, 1)) * rng.randint(1, 8)))
+
+            if (x, y) != points[-1]:
+                points.append((x, y))
+
+        if len(points) == 1:
+            points.append((x, y + 1))
+
+        lines.append(' -> '.join(f'{x},{y}' for x, y in points))
+
+    return '\n'.join(lines) + '\n'
@@ -1,3 +1,15 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from aoc.grid import Grid
+
+AIR = ord('.')
+ROCK = ord('#')
+SAND = ord('o')
+
+
 def draw_grid(input: str, extra=0) -> tuple[list[list[str]], tuple[int, int]]:
     """Function to create initial grid of rocks and air"""
     input_array = input.splitlines()
@@ -48,6 +60,10 @@ def draw_grid(input: str, extra=0) -> tuple[list[list[str]], tuple[int, int]]:
 
 
 def part_one(input: str):
+    """
+    The reference solution, kept from before the port to `Grid`. `solve()`
+    uses `part_one_grid()`, which `python -m aoc.variants` checks against it.
+    """
     # Create the grid
     grid, start = draw_grid(input)
 
@@ -82,10 +98,14 @@ def part_one(input: str):
         # Increment the counter
         count += 1
 
-    print(result)
+    return result
 
 
 def part_two(input: str):
+    """
+    The reference solution, kept from before the port to `Grid`. `solve()`
+    uses `part_two_grid()`, which `python -m aoc.variants` checks against it.
+    """
     # Add two extra rows when drawing the grid
     grid, start = draw_grid(input, extra=2)
 
@@ -117,12 +137,161 @@ def part_two(input: str):
         # Increment the counter
         result += 1
 
-    print(result)
+    return result
+
+
+def draw_flat_grid(input: str, extra=0) -> tuple[Grid, int]:
+    """Function to create initial grid of rocks and air, as a flat `Grid`"""
+    input_array = input.splitlines()
+
+    height = 0
+
+    # Find the largest y coordinate of the rocks
+    for line in input_array:
+        points = line.split(' -> ')
+
+        for point in points:
+            y = int(point.split(',')[1])
+            height = max(height, y)
+
+    # Add on extra height (required for part 2)
+    height += extra
+
+    # The width will be at-most double the height
+    width = 2 * height
+
+    # Create the grid according to the height and width, full of air. Each row
+    # of the grid is a y coordinate, and each column an x coordinate.
+    grid = Grid.filled(width + 1, height + 1, '.')
+
+    # All coordinates will be shifted to the left by `offset`
+    offset = 500 - width // 2
+
+    # Add the rocks into the grid
+    for line in input_array:
+        points = line.split(' -> ')
+
+        for i in range(1, len(points)):
+            point1, point2 = points[i - 1], points[i]
+            x1, y1 = map(int, point1.split(','))
+            x2, y2 = map(int, point2.split(','))
+
+            # Add rocks from (x1, y1) to (x2, y1)
+            for j in range(min(x1, x2), max(x1, x2) + 1):
+                grid.cells[grid.index(y1, j - offset)] = ROCK
+
+            # Add rocks from (x1, y1) to (x1, y2)
+            for j in range(min(y1, y2), max(y1, y2) + 1):
+                grid.cells[grid.index(j, x1 - offset)] = ROCK
+
+    # Obtain the index of the sand entry point
+    start = grid.index(0, 500 - offset)
+
+    return (grid, start)
+
+
+def part_one_grid(input: str):
+    """
+    The same as `part_one()`, on a flat `Grid`, moving each sand grain by
+    adding offsets to its index
+    """
+    # Create the grid
+    grid, start = draw_flat_grid(input)
+    cells = grid.cells
+
+    # The three directions below the sand grain, in the order it tries them
+    below = (grid.down, grid.down + grid.left, grid.down + grid.right)
+
+    # Any sand grain with an index of at least `bottom` is on the bottom row
+    bottom = grid.index(grid.height - 1, 0)
+
+    count = 0
+    result = None
+
+    # Continue looping until we have a result
+    while result is None:
+        # `sand` is the index of the current sand grain
+        sand = start
+
+        while True:
+            # If the sand grain is at the bottom of the grid, then it would
+            # flow out of the bottom, therefore we have the result
+            if sand >= bottom:
+                result = count
+                break
+
+            # Check the three directions below the sand grain
+            for step in below:
+                # If the space below is empty, then move the sand grain into
+                # the space
+                if cells[sand + step] == AIR:
+                    sand += step
+                    break
+            else:
+                # If we have reached here, then the sand grain cannot move
+                # down, therefore it settles here
+                cells[sand] = SAND
+                break
+
+        # Increment the counter
+        count += 1
+
+    return result
+
+
+def part_two_grid(input: str):
+    """
+    The same as `part_two()`, on a flat `Grid`
+    """
+    # Add two extra rows when drawing the grid
+    grid, start = draw_flat_grid(input, extra=2)
+    cells = grid.cells
+
+    # Fill the bottom row with rocks
+    for i in grid.row(grid.height - 1):
+        cells[i] = ROCK
+
+    below = (grid.down, grid.down + grid.left, grid.down + grid.right)
+
+    result = 0
+
+    # Continue looping until a sand grain has settled at the entry point
+    while cells[start] != SAND:
+        # `sand` is the index of the current sand grain
+        sand = start
+
+        while True:
+            # Check the three directions below the sand grain
+            for step in below:
+                # If the space below is empty, then move the sand grain into
+                # the space
+                if cells[sand + step] == AIR:
+                    sand += step
+                    break
+            else:
+                # If we have reached here, then the sand grain cannot move
+                # down, therefore it settles here
+                cells[sand] = SAND
+                break
+
+        # Increment the counter
+        result += 1
+
+    return result
+
+
+def solve(part: int, input: str):
+    if part == 1:
+        return part_one_grid(input)
+    if part == 2:
+        return part_two_grid(input)
 
+    raise ValueError(f'Invalid part: {part}')
 
-with open('input.txt') as f:
-    input = f.read()
 
+if __name__ == '__main__':
+    with open('input.txt') as f:
+        input = f.read()
 
-part_one(input)
-part_two(input)
+    print(solve(1, input))
+    print(solve(2, input))
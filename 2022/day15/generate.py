@@ -0,0 +1,49 @@
+import random
+
+# Roughly the number of sensors in a real puzzle input
+SIZE = 30
+
+LIMIT = 4000000
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate `size` sensors, leaving exactly one free point within the
+    search area for part 2
+
+    Four sensors sit diagonally around the free point, each one just failing
+    to reach it, which together cover the rest of the search area. The
+    remaining sensors are decoys which also stop short of the free point.
+    """
+    rng = random.Random(seed)
+
+    px, py = rng.randint(0, LIMIT), rng.randint(0, LIMIT)
+
+    sensors: list[tuple[int, int, int]] = []
+
+    a = LIMIT
+    for dx, dy in ((1, 1), (-1, -1), (1, -1), (-1, 1)):
+        sensors.append((px + dx * a, py + dy * a, 2 * a - 1))
+
+    for _ in range(max(0, size - 4)):
+        while True:
+            x, y = rng.randint(0, LIMIT), rng.randint(0, LIMIT)
+            distance = abs(px - x) + abs(py - y)
+
+            if distance > 1:
+                break
+
+        sensors.append((x, y, rng.randint(1, min(distance - 1, LIMIT // 2))))
+
+    rng.shuffle(sensors)
+
+    lines: list[str] = []
+
+    for x, y, radius in sensors:
+        # Place the beacon somewhere on the sensor's circumference
+        dx = rng.randint(-radius, radius)
+        dy = (radius - abs(dx)) * rng.choice((-1, 1))
+
+        lines.append(f'Sensor at x={x}, y={y}: closest beacon is at x={x + dx}, y={y + dy}')
+
+    return '\n'.join(lines) + '\n'
@@ -1,23 +1,40 @@
+import os
 import re
+import sys
 from typing import Optional
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
-def part_one(input: str):
-    input_array = input.splitlines()
+from aoc.intervals import IntervalSet
+from aoc.model import model
 
-    HEIGHT = 2000000
 
-    intervals: list[tuple[int, int]] = []
+@model
+def parse(input: str) -> list[tuple[int, int, int, int]]:
+    """Parse the coordinates of each sensor, and of its closest beacon"""
+    coordinates: list[tuple[int, int, int, int]] = []
 
-    beacons: set[int] = set()
-
-    for line in input_array:
+    for line in input.splitlines():
         match = re.match(r'Sensor at x=(-?\d+), y=(-?\d+): closest beacon is at x=(-?\d+), y=(-?\d+)', line)
         assert match
 
-        # Obtain the coordinates of the sensor and the beacon
         x1, y1, x2, y2 = map(int, match.groups())
+        coordinates.append((x1, y1, x2, y2))
+
+    return coordinates
+
+
+def part_one(input: str):
+    HEIGHT = 2000000
 
+    # `covered` is the set of x positions on the `HEIGHT` line within the area
+    # of any sensor
+    covered = IntervalSet()
+
+    beacons: set[int] = set()
+
+    # Obtain the coordinates of each sensor and its beacon
+    for x1, y1, x2, y2 in parse(input):
         # Calculate the distance between the two
         distance = abs(x2 - x1) + abs(y2 - y1)
 
@@ -29,55 +46,27 @@ def part_one(input: str):
             a2 = x1 + distance - abs(HEIGHT - y1)
 
             # The interval is the space between the two points of intersection
-            intervals.append((a1, a2))
+            # (intervals do not include their end, hence the + 1)
+            covered.add(a1, a2 + 1)
 
             # Keep track of each beacon on the `HEIGHT` line
             if y2 == HEIGHT:
                 beacons.add(x2)
 
-    # Sort the intervals by the left point
-    intervals.sort(key=lambda x: x[0])
-
-    # `count` is the running total of the overlapping widths of all the
-    # intervals, starting with the width of the first interval
-    count = intervals[0][1] - intervals[0][0] + 1
-
-    # `last` is the right-most point we have seen so far
-    last = intervals[0][1]
-
-    # Loop through the intervals, starting from the second
-    for i in range(1, len(intervals)):
-        x1, x2 = intervals[i]
-
-        # If this interval end is to the right of the right-most we've seen...
-        if x2 > last:
-            # ...update the running total, depending on whether this interval
-            # overlaps with previous intervals...
-            count += x2 - max(x1 - 1, last)
-
-            # ...and update the right-most point
-            last = x2
-
-    # Subtract all the beacons on the `HEIGHT` line
-    count -= len(beacons)
+    # The positions covered by the overlapping intervals, minus all the
+    # beacons on the `HEIGHT` line
+    count = covered.size - len(beacons)
 
-    print(count)
+    return count
 
 
 def part_two(input: str):
-    input_array = input.splitlines()
-
     LIMIT = 4000000
 
     sensors: list[tuple[int, int, int]] = []
 
-    for line in input_array:
-        match = re.match(r'Sensor at x=(-?\d+), y=(-?\d+): closest beacon is at x=(-?\d+), y=(-?\d+)', line)
-        assert match
-
-        # Obtain the coordinates of the sensor and the beacon
-        x1, y1, x2, y2 = map(int, match.groups())
-
+    # Obtain the coordinates of each sensor and its beacon
+    for x1, y1, x2, y2 in parse(input):
         # Calculate the distance between the two
         distance = abs(x2 - x1) + abs(y2 - y1)
 
@@ -92,7 +81,7 @@ def part_two(input: str):
         if coordinates:
             break
 
-        intervals: list[tuple[int, int]] = []
+        covered = IntervalSet()
 
         # Loop through each sensor
         for x1, y1, distance in sensors:
@@ -105,35 +94,21 @@ def part_two(input: str):
 
                 # The interval is the space between the two points of
                 # intersection
-                intervals.append((a1, a2))
-
-        # Sort the intervals by the left point
-        intervals.sort(key=lambda x: x[0])
-
-        # `last` is the right-most point we have seen so far
-        last = intervals[0][1]
-
-        # Loop through the intervals, starting from the second
-        for i in range(1, len(intervals)):
-            x1, x2 = intervals[i]
+                covered.add(a1, a2 + 1)
 
-            # If the start of this interval does not overlap with any previous
-            # interval...
-            if x1 > last:
-                # ...then the free space must be one space to the left, at the
-                # same height (assuming there is only one free space)
-                coordinates = (x1 - 1, y)
-                break
+        # If any space between 0 and `LIMIT` is not covered, then this is the
+        # free space (assuming there is only one free space)
+        gaps = covered.gaps(0, LIMIT + 1)
 
-            # Otherwise, update the right-most point
-            last = max(last, x2)
+        if gaps:
+            coordinates = (gaps[0][0], y)
 
     assert coordinates
 
     # Calculate the tuning frequency
     result = coordinates[0] * 4000000 + coordinates[1]
 
-    print(result)
+    return result
 
 
 def part_two_optimised(input: str):
@@ -144,8 +119,6 @@ def part_two_optimised(input: str):
     of two perpendicular lines which is one space away from a (different)
     sensor's circumference in the four diagonal directions.
     """
-    input_array = input.splitlines()
-
     LIMIT = 4000000
 
     negatives_top: dict[int, list[tuple[tuple[int, int], tuple[int, int]]]] = {}
@@ -153,12 +126,7 @@ def part_two_optimised(input: str):
     negatives_bottom: dict[int, list[tuple[tuple[int, int], tuple[int, int]]]] = {}
     positives_bottom: dict[int, list[tuple[tuple[int, int], tuple[int, int]]]] = {}
 
-    for line in input_array:
-        match = re.match(r'Sensor at x=(-?\d+), y=(-?\d+): closest beacon is at x=(-?\d+), y=(-?\d+)', line)
-        assert match
-
-        x1, y1, x2, y2 = map(int, match.groups())
-
+    for x1, y1, x2, y2 in parse(input):
         distance = abs(x2 - x1) + abs(y2 - y1)
 
         l, r, t, b = (x1 - distance, y1), (x1 + distance, y1), (x1, y1 + distance), (x1, y1 - distance)
@@ -215,13 +183,22 @@ def part_two_optimised(input: str):
     assert coordinates
 
     result = coordinates[0] * 4000000 + coordinates[1]
-    print(result)
+    return result
+
+
+def solve(part: int, input: str):
+    if part == 1:
+        return part_one(input)
+    if part == 2:
+        return part_two_optimised(input)
 
+    raise ValueError(f'Invalid part: {part}')
 
-with open('input.txt') as f:
-    input = f.read()
 
+if __name__ == '__main__':
+    with open('input.txt') as f:
+        input = f.read()
 
-part_one(input)
-# part_two(input)
-part_two_optimised(input)
+    print(part_one(input))
+    # print(part_two(input))
+    print(part_two_optimised(input))
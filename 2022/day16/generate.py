@@ -0,0 +1,60 @@
+import random
+import string
+
+# Roughly the number of valves in a real puzzle input
+SIZE = 60
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate a cave of `size` valves, including the starting valve AA
+
+    The tunnels form a random spanning tree plus a few extra loops. Only a
+    quarter of the valves (at most 15, like the real input) have a flow rate,
+    since the solvers are exponential in the number of flowing valves.
+    """
+    rng = random.Random(seed)
+
+    size = max(2, size)
+
+    names = ['AA']
+    used = {'AA'}
+
+    while len(names) < size:
+        name = ''.join(rng.choices(string.ascii_uppercase, k=2))
+
+        if name not in used:
+            used.add(name)
+            names.append(name)
+
+    tunnels: dict[str, set[str]] = {name: set() for name in names}
+
+    # Random spanning tree
+    for i in range(1, size):
+        other = names[rng.randrange(i)]
+        tunnels[names[i]].add(other)
+        tunnels[other].add(names[i])
+
+    # Extra loops
+    for _ in range(size // 5):
+        a, b = rng.sample(names, 2)
+        tunnels[a].add(b)
+        tunnels[b].add(a)
+
+    flowing = set(rng.sample(names[1:], min(15, max(1, size // 4))))
+
+    order = names[:]
+    rng.shuffle(order)
+
+    lines: list[str] = []
+
+    for name in order:
+        rate = rng.randint(3, 25) if name in flowing else 0
+        neighbours = rng.sample(sorted(tunnels[name]), len(tunnels[name]))
+
+        if len(neighbours) == 1:
+            lines.append(f'Valve {name} has flow rate={rate}; tunnel leads to valve {neighbours[0]}')
+        else:
+            lines.append(f'Valve {name} has flow rate={rate}; tunnels lead to valves {", ".join(neighbours)}')
+
+    return '\n'.join(lines) + '\n'
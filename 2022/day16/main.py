@@ -1,62 +1,33 @@
-import heapq
+import os
 import re
-from functools import cache
+import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
-class Valve:
-    def __init__(self, name: str, rate: int, tunnels: list[str]) -> None:
-        self.name = name
-        self.rate = rate
-        self.tunnels = tunnels
+from aoc import counters
+from aoc.graph import UNREACHABLE, Graph, Interner, compress, dijkstra
+from aoc.model import model
 
 
-class Graph:
-    def __init__(self) -> None:
-        self.adjacencyList: dict[str, list[str]] = {}
-
-    def add_valve(self, valve: Valve):
-        self.adjacencyList[valve.name] = valve.tunnels
-
-    # Cache the results from this function so the distances do not need to be
-    # calculated multiple times
-    @cache
-    def dijkstra(self, valve: Valve) -> dict[str, int]:
-        # Dijkstra's algorithm to find the shortest distance from one valve to
-        # all the other valves
-        distances: dict[str, int] = {}
-        queue: list[tuple[int, str]] = []
-
-        for node in self.adjacencyList:
-            if node == valve.name:
-                distances[node] = 0
-                heapq.heappush(queue, (0, node))
-            else:
-                distances[node] = 1000000
-                heapq.heappush(queue, (1000000, node))
-
-        while queue:
-            _, vertex = heapq.heappop(queue)
-
-            for node in self.adjacencyList[vertex]:
-                # The distance between each valve is 1
-                new_distance = distances[vertex] + 1
-
-                if distances[node] > new_distance:
-                    distances[node] = new_distance
-                    heapq.heappush(queue, (new_distance, node))
-
-        # Delete the start valve from the results
-        del distances[valve.name]
-
-        return distances
-
-
-def calculate(input: str, time: int) -> dict[str, int]:
+@model
+def parse(input: str) -> tuple[dict[str, int], set[str], dict[str, dict[str, int]]]:
+    """
+    Parse the rate of each valve and the set of flowing valves from the input,
+    along with the shortest distance from the starting valve 'AA', and from each
+    flowing valve, to every other flowing valve
+    """
     input_array = input.splitlines()
 
-    all_valves: dict[str, Valve] = {}
+    # Number the valves, so the tunnels can be stored as a graph
+    valves = Interner()
+
+    rates: dict[str, int] = {}
     flowing_valves: set[str] = set()
 
+    # Each tunnel is listed from both ends, so store it with the smaller valve
+    # number first to only add it once
+    tunnels: set[tuple[int, int]] = set()
+
     for line in input_array:
         # Parse the values from the text
         match = re.search(r'Valve (\w+) has flow rate=(\d+); tunnels? leads? to valves? (.*)', line)
@@ -65,32 +36,61 @@ def calculate(input: str, time: int) -> dict[str, int]:
 
         name = groups[0]
         rate = int(groups[1])
-        tunnels = groups[2].split(', ')
 
         # Keep track of the valves that are flowing
         if rate > 0:
             flowing_valves.add(name)
 
-        valve = Valve(name, rate, tunnels)
+        rates[name] = rate
 
-        # `all_valves` is a dict containing all the valves
-        all_valves[name] = valve
+        for tunnel in groups[2].split(', '):
+            valve, other = valves.intern(name), valves.intern(tunnel)
+            tunnels.add((min(valve, other), max(valve, other)))
 
-    # Create the graph
-    graph = Graph()
+    graph = Graph.from_edges(len(valves), sorted(tunnels))
 
-    for valve in all_valves.values():
-        graph.add_valve(valve)
+    # The paths only ever start from 'AA' or from a flowing valve, and only
+    # ever end at a flowing valve
+    starts = ['AA', *sorted(flowing_valves)]
+
+    # Most valves are in long tunnels between the flowing valves, so replace
+    # the tunnels with a single edge, weighted by the time to walk through it
+    compressed, nodes = compress(graph, [valves[name] for name in starts])
+    names = [valves.names[node] for node in nodes]
+    ids = {name: id for id, name in enumerate(names)}
+
+    distances: dict[str, dict[str, int]] = {}
+
+    for name in starts:
+        results = dijkstra(compressed, [ids[name]])
+
+        distances[name] = {
+            valve: results[ids[valve]]
+            for valve in sorted(flowing_valves)
+            if valve != name and results[ids[valve]] != UNREACHABLE
+        }
+
+    return rates, flowing_valves, distances
+
+
+def calculate(input: str, time: int) -> dict[str, int]:
+    rates, flowing_valves, distances = parse(input)
 
     # `best` is a dict where the key is the valves visited and the value is
     # the maximum pressure released from that path
     best: dict[str, int] = {}
 
+    # Counts of the states and prunes, if counting is enabled
+    counts = counters.active()
+
     def recurse(start: str, remaining_valves: set[str], running_total: int, pressure: int, time_remaining: int):
         """
         Recursive function to iterate through all possible paths within the cave
         """
 
+        if counts is not None:
+            counts['states'] += 1
+
         # `visited_valves` is a set of the valves that have been turned off
         visited_valves = flowing_valves - remaining_valves
 
@@ -104,7 +104,7 @@ def calculate(input: str, time: int) -> dict[str, int]:
         best[hash] = max(best.get(hash, 0), total_pressure)
 
         # Find the shorted path to all other valves
-        nodes = graph.dijkstra(all_valves[start])
+        nodes = distances[start]
 
         # Filter the valves to only include the valves which haven't been
         # opened yet
@@ -121,11 +121,14 @@ def calculate(input: str, time: int) -> dict[str, int]:
 
             # If there is not enough time to visit the next valve, then continue
             if new_time_remaining <= 0:
+                if counts is not None:
+                    counts['prunes'] += 1
+
                 continue
 
             # Calculate the new total pressure released and new pressure rate
             new_running_total = running_total + pressure * (distance + 1)
-            new_pressure = pressure + all_valves[valve].rate
+            new_pressure = pressure + rates[valve]
 
             # Call function recursively
             recurse(valve, new_flowing_valves, new_running_total, new_pressure, new_time_remaining)
@@ -144,7 +147,7 @@ def part_one(input: str):
     # The solution is the maximum pressure released across all paths
     result = max(results.values())
 
-    print(result)
+    return result
 
 
 def part_two(input: str):
@@ -171,12 +174,21 @@ def part_two(input: str):
             if valves1.isdisjoint(valves2):
                 result = max(result, pressure1 + pressure2)
 
-    print(result)
+    return result
+
+
+def solve(part: int, input: str):
+    if part == 1:
+        return part_one(input)
+    if part == 2:
+        return part_two(input)
 
+    raise ValueError(f'Invalid part: {part}')
 
-with open('input.txt') as f:
-    input = f.read()
 
+if __name__ == '__main__':
+    with open('input.txt') as f:
+        input = f.read()
 
-part_one(input)
-part_two(input)
+    print(part_one(input))
+    print(part_two(input))
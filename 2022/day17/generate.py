@@ -0,0 +1,17 @@
+import random
+
+# Roughly the length of the jet pattern in a real puzzle input
+SIZE = 10000
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate a jet pattern of `size` pushes
+
+    Very short patterns can leave a column of the chamber empty forever, so
+    the shape of the top of the tower never repeats, and `calculate()` never
+    finds a cycle. At least 100 pushes are generated to avoid this.
+    """
+    rng = random.Random(seed)
+
+    return ''.join(rng.choice('<>') for _ in range(max(100, size))) + '\n'
@@ -1,136 +1,166 @@
-def calculate(input: str, number: int) -> int:
-    """
-    Function to calculate the height of the tower after a certain number of
-    rocks fall
+import os
+import sys
 
-    After a number of iterations, the height of the tower increases in a
-    predictable cycle. We can determine when we are in a cycle based upon the
-    current rock, wind, and the shape of the rocks in the tower.
-    """
-    input = input.strip()
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
-    # List of the rocks, where each rock is a list of (x, y) coordinates
-    rocks: list[list[tuple[int, int]]] = [
-        [(0, 0), (1, 0), (2, 0), (3, 0)],
-        [(0, 1), (1, 0), (1, 1), (1, 2), (2, 1)],
-        [(0, 0), (1, 0), (2, 0), (2, 1), (2, 2)],
-        [(0, 0), (0, 1), (0, 2), (0, 3)],
-        [(0, 0), (0, 1), (1, 0), (1, 1)]
-    ]
+from aoc.cycles import skip_ahead
 
-    tower: set[tuple[int, int]] = set()
+WIDTH = 7
 
-    height = 0
-    wind_index = 0
-    width = 7
+# List of the rocks, where each rock is a list of rows from the bottom up. Each
+# row is a bitmask of the columns it fills, where the left-most column is the
+# highest bit (1 << 6), and the rock starts two columns from the left.
+ROCKS: list[list[int]] = [
+    [0b0011110],
+    [0b0001000, 0b0011100, 0b0001000],
+    [0b0011100, 0b0000100, 0b0000100],
+    [0b0010000, 0b0010000, 0b0010000, 0b0010000],
+    [0b0011000, 0b0011000],
+]
 
-    # `columns` contains the largest rock piece in each column
-    columns = [0] * width
+# The tallest rock is 4 rows high, so a rock and the rows of the chamber around
+# it can be compared as 4-byte integers, with the bottom row in the lowest byte
+ROCK_INTS = [int.from_bytes(bytes(rock), 'little') for rock in ROCKS]
 
-    # `seen` contains the hash of each iteration and the height of the tower
-    # at that point
-    seen: dict[str, tuple[int, int]] = {}
+# The bits of every row in the left-most and right-most columns
+LEFT_WALL = int.from_bytes(bytes([1 << (WIDTH - 1)] * 4), 'little')
+RIGHT_WALL = int.from_bytes(bytes([1] * 4), 'little')
 
-    i = 0
-    extra = 0
-    cycle = False
 
-    while i < number:
-        minimum = min(columns)
+class Chamber:
+    """
+    The chamber that the rocks fall into, storing each row of the tower as a
+    bitmask of the columns it fills
+    """
 
-        # `profile` is a string of the relative heights of the columns in the
-        # tower
-        profile = ','.join([str(c - minimum) for c in columns])
+    def __init__(self, jets: str) -> None:
+        self.jets = jets
+        self.rows = bytearray()
+        self.height = 0
 
-        rock_index = i % len(rocks)
+        # The next rock to fall, and the next jet of gas to push it
+        self.rock_index = 0
+        self.jet_index = 0
 
-        # Create the string hash
-        hash = f'{profile}|{rock_index}|{wind_index}'
+        # The height of each column
+        self.columns = [0] * WIDTH
 
-        if hash in seen and not cycle:
-            # If we have seen this hash before, then we have a cycle
-            cycle = True
+    def drop(self) -> 'Chamber':
+        """Drop the next rock until it comes to rest"""
+        rock = ROCK_INTS[self.rock_index]
+        self.rock_index = (self.rock_index + 1) % len(ROCKS)
 
-            # Calculate the number of iterations and the change in the height
-            # of the tower since we saw this hash
-            prev_index, prev_height = seen[hash]
-            height_difference = height - prev_height
-            index_difference = i - prev_index
+        rows = self.rows
+        jets = self.jets
+        jet_index = self.jet_index
 
-            # Advance the index, and calculate the increase in height after
-            # advancing the index
-            x = (number - i) // index_difference
+        # Starting position of the bottom of the rock, which is above the tower
+        # so is not blocked by any rock pieces
+        y = self.height + 3
+        window = 0
 
-            i += index_difference * x
-            extra = height_difference * x
+        # Loop until the rock hits the floor or another rock
+        while True:
+            wind = jets[jet_index]
+            jet_index = (jet_index + 1) % len(jets)
 
-            continue
+            # Only move the rock if it is within the bounds of the tower and
+            # not occupied by another rock piece
+            if wind == '>':
+                if not rock & RIGHT_WALL and not (rock >> 1) & window:
+                    rock >>= 1
+            elif not rock & LEFT_WALL and not (rock << 1) & window:
+                rock <<= 1
 
-        # Save the index number and current height into the dict
-        seen[hash] = (i, height)
+            if y == 0:
+                break
 
-        rock = rocks[rock_index]
+            # If the rock would hit any of the rock pieces already in the tower,
+            # break
+            below = int.from_bytes(rows[y - 1 : y + 3], 'little')
 
-        # Starting position of the rock
-        start = (2, height + 3)
+            if rock & below:
+                break
 
-        # Obtain the starting coordinates of the rock
-        rock = [(x + start[0], y + start[1]) for x, y in rock]
+            # Otherwise, move the rock downwards
+            y -= 1
+            window = below
 
-        # Loop until the rock hits the floor or another rock
-        while True:
-            wind = input[wind_index]
+        self.jet_index = jet_index
 
-            wind_index = (wind_index + 1) % len(input)
+        # Add the rock pieces to the tower, row by row
+        for i, row in enumerate(rock.to_bytes(4, 'little')):
+            if not row:
+                break
 
-            # Obtain the coordinates of the rock after being moved by the wind
-            rock_moved = [(x + (1 if wind == '>' else -1), y) for x, y in rock]
+            if y + i == len(rows):
+                rows.append(0)
 
-            # Only move the rock if it is within the bounds of the tower and
-            # not occupied by another rock piece
-            if all((x, y) not in tower and 0 <= x < width for x, y in rock_moved):
-                rock = rock_moved
+            rows[y + i] |= row
 
-            # Obtain the coordinates of the rock after moving downwards
-            rock_moved = [(x, y - 1) for x, y in rock]
+            # Update the height of each column the row fills
+            for x in range(WIDTH):
+                if row & (1 << (WIDTH - 1 - x)):
+                    self.columns[x] = max(self.columns[x], y + i + 1)
 
-            # If any of the rock pieces are already present in the tower, break
-            if any((x, y) in tower or y < 0 for x, y in rock_moved):
-                break
+        # Update the height of the tower
+        self.height = len(rows)
 
-            # Otherwise, update the position of the rock
-            rock = rock_moved
+        return self
 
-        for x, y in rock:
-            # Add the rock pieces to the tower
-            tower.add((x, y))
+    def key(self) -> tuple[int, ...]:
+        """
+        The state of the chamber, for detecting cycles: the next rock and jet,
+        and the shape of the top of the tower (the relative heights of the
+        columns)
+        """
+        minimum = min(self.columns)
 
-            # Update the height of the tower
-            height = max(height, y + 1)
+        return (self.rock_index, self.jet_index, *(c - minimum for c in self.columns))
 
-            # Update the height of each column
-            columns[x] = max(columns[x], y + 1)
 
-        i += 1
+def calculate(input: str, number: int) -> int:
+    """
+    Function to calculate the height of the tower after a certain number of
+    rocks fall
 
-    return height + extra
+    After a number of iterations, the height of the tower increases in a
+    predictable cycle. We can determine when we are in a cycle based upon the
+    current rock, wind, and the shape of the rocks in the tower.
+    """
+    chamber = Chamber(input.strip())
+
+    # Skip ahead over the cycles, keeping track of how much the height of the
+    # tower would have increased over the skipped rocks
+    chamber, extra = skip_ahead(chamber, Chamber.drop, number, Chamber.key, lambda chamber: chamber.height)
+
+    return chamber.height + extra
 
 
 def part_one(input: str):
     result = calculate(input, 2022)
 
-    print(result)
+    return result
 
 
 def part_two(input: str):
     result = calculate(input, 1000000000000)
 
-    print(result)
+    return result
+
+
+def solve(part: int, input: str):
+    if part == 1:
+        return part_one(input)
+    if part == 2:
+        return part_two(input)
 
+    raise ValueError(f'Invalid part: {part}')
 
-with open('input.txt') as f:
-    input = f.read()
 
+if __name__ == '__main__':
+    with open('input.txt') as f:
+        input = f.read()
 
-part_one(input)
-part_two(input)
+    print(part_one(input))
+    print(part_two(input))
@@ -0,0 +1,47 @@
+import random
+from itertools import accumulate
+
+# Roughly the number of cubes in a real puzzle input
+SIZE = 2800
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate a lava droplet made of `size` distinct cubes
+
+    The cubes are scattered through a ball, densest at its centre, so the
+    droplet has plenty of internal air pockets for part 2.
+    """
+    rng = random.Random(seed)
+
+    # Radius of a ball containing roughly twice as many cells as cubes
+    radius = max(2, round((size * 2 / 4.2) ** (1 / 3)))
+    centre = radius + 1
+
+    cells = [
+        (x, y, z)
+        for x in range(1, 2 * radius + 2)
+        for y in range(1, 2 * radius + 2)
+        for z in range(1, 2 * radius + 2)
+        if (x - centre) ** 2 + (y - centre) ** 2 + (z - centre) ** 2 <= radius**2
+    ]
+
+    # Weight cells nearer the centre more heavily
+    cum_weights = list(
+        accumulate(
+            1 + radius**2 - ((x - centre) ** 2 + (y - centre) ** 2 + (z - centre) ** 2)
+            for x, y, z in cells
+        )
+    )
+
+    cubes: set[tuple[int, int, int]] = set()
+
+    count = min(size, len(cells))
+
+    while len(cubes) < count:
+        cubes.update(rng.choices(cells, cum_weights=cum_weights, k=count - len(cubes)))
+
+    order = sorted(cubes)
+    rng.shuffle(order)
+
+    return '\n'.join(f'{x},{y},{z}' for x, y, z in order) + '\n'
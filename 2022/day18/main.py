@@ -1,5 +1,18 @@
+import os
+import sys
 from collections import deque
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from aoc import backend
+from aoc.model import model
+
+
+@model
+def parse(input: str) -> list[tuple[int, int, int]]:
+    """Parse the coordinates of each cube in the lava droplet"""
+    return [tuple(map(int, line.split(','))) for line in input.splitlines()]  # type: ignore[misc]
+
 
 def part_one(input: str):
     shape: set[tuple[int, int, int]] = set()
@@ -7,12 +20,10 @@ def part_one(input: str):
     surface_area = 0
 
     # Iterate through the cubes in lava droplet
-    for line in input.splitlines():
+    for x, y, z in parse(input):
         # Add the surface area of the current cube
         surface_area += 6
 
-        x, y, z = map(int, line.split(','))
-
         # Check the six directions adjacent to the current cube
         for a, b, c in ((1, 0, 0), (-1, 0, 0), (0, 1, 0), (0, -1, 0), (0, 0, 1), (0, 0, -1)):
             X, Y, Z = x + a, y + b, z + c
@@ -25,7 +36,38 @@ def part_one(input: str):
         # Keep track of the cubes we have seen so far
         shape.add((x, y, z))
 
-    print(surface_area)
+    return surface_area
+
+
+def droplet_numpy(input: str):
+    """
+    The lava droplet as a 3D array of booleans, with an empty border at least
+    one cube wide around it
+    """
+    np = backend.numpy()
+
+    cubes = np.array(parse(input), dtype=np.int64).reshape(-1, 3)
+
+    # Move the droplet so the smallest coordinates are 1
+    cubes -= cubes.min(axis=0) - 1
+
+    droplet = np.zeros(tuple(cubes.max(axis=0) + 2), dtype=bool)
+    droplet[tuple(cubes.T)] = True
+
+    return droplet
+
+
+def part_one_numpy(input: str):
+    droplet = droplet_numpy(input)
+
+    # Each cube has 6 faces, minus the two faces of each pair of touching cubes,
+    # along each axis
+    touching = sum(
+        int((cubes[1:] & cubes[:-1]).sum())
+        for cubes in (droplet.swapaxes(0, axis) for axis in range(3))
+    )
+
+    return 6 * int(droplet.sum()) - 2 * touching
 
 
 def part_two(input: str):
@@ -37,9 +79,7 @@ def part_two(input: str):
     max_x = max_y = max_z = -10000
 
     # Iterate through the cubes in the lava droplet
-    for line in input.splitlines():
-        x, y, z = map(int, line.split(','))
-
+    for x, y, z in parse(input):
         # Find the outer boundaries
         min_x = min(min_x, x - 1)
         min_y = min(min_y, y - 1)
@@ -79,12 +119,57 @@ def part_two(input: str):
                     seen.add((X, Y, Z))
                     queue.append((X, Y, Z))
 
-    print(surface_area)
+    return surface_area
+
+
+def part_two_numpy(input: str):
+    np = backend.numpy()
+
+    droplet = droplet_numpy(input)
+
+    # Flood fill the space outside the droplet from a corner of the border, by
+    # growing it by one cube in every direction until it stops changing
+    outside = np.zeros(droplet.shape, dtype=bool)
+    outside[0, 0, 0] = True
+
+    while True:
+        grown = outside.copy()
+
+        for axis in range(3):
+            # Views of both arrays along the axis, so `grown` is updated in place
+            space, previous = grown.swapaxes(0, axis), outside.swapaxes(0, axis)
+            space[1:] |= previous[:-1]
+            space[:-1] |= previous[1:]
+
+        grown &= ~droplet
+
+        if (grown == outside).all():
+            break
+
+        outside = grown
+
+    # Count the faces of the droplet which touch the space outside it
+    surface_area = 0
+
+    for axis in range(3):
+        space, cubes = outside.swapaxes(0, axis), droplet.swapaxes(0, axis)
+        surface_area += int((space[1:] & cubes[:-1]).sum() + (space[:-1] & cubes[1:]).sum())
+
+    return surface_area
+
+
+def solve(part: int, input: str):
+    if part == 1:
+        return part_one_numpy(input) if backend.use_numpy() else part_one(input)
+    if part == 2:
+        return part_two_numpy(input) if backend.use_numpy() else part_two(input)
 
+    raise ValueError(f'Invalid part: {part}')
 
-with open('input.txt') as f:
-    input = f.read()
 
+if __name__ == '__main__':
+    with open('input.txt') as f:
+        input = f.read()
 
-part_one(input)
-part_two(input)
+    print(part_one(input))
+    print(part_two(input))
@@ -0,0 +1,30 @@
+import random
+
+# Roughly the number of blueprints in a real puzzle input
+SIZE = 30
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate `size` blueprints with robot costs in the same ranges as the real
+    input
+    """
+    rng = random.Random(seed)
+
+    lines: list[str] = []
+
+    for i in range(1, max(3, size) + 1):
+        ore = rng.randint(2, 4)
+        clay = rng.randint(2, 4)
+        obsidian = rng.randint(2, 4), rng.randint(5, 20)
+        geode = rng.randint(2, 4), rng.randint(7, 20)
+
+        lines.append(
+            f'Blueprint {i}: '
+            f'Each ore robot costs {ore} ore. '
+            f'Each clay robot costs {clay} ore. '
+            f'Each obsidian robot costs {obsidian[0]} ore and {obsidian[1]} clay. '
+            f'Each geode robot costs {geode[0]} ore and {geode[1]} obsidian.'
+        )
+
+    return '\n'.join(lines) + '\n'
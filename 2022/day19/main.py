@@ -1,14 +1,27 @@
-import json
 import math
+import os
 import re
+import sys
 from typing import Literal
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from aoc import counters
+from aoc.memo import Memo, pack
+
 Material = Literal['ore', 'clay', 'obsidian', 'geode']
 
 
 def calculate(line: str, time: int) -> int:
     maximum_geodes = 0
-    cache: dict[str, int] = {}
+
+    # The most time left when each state was seen. The searches of part two
+    # see up to about 4 million states, which all need to fit, as evicting a
+    # state means searching everything after it again
+    cache: Memo[int, int] = Memo(2**22)
+
+    # Counts of the states and prunes, if counting is enabled
+    counts = counters.active()
 
     def recurse(costs: dict[Material, tuple[int, int, int]], robots: dict[Material, int], resources: dict[Material, int], time_left: int):
         nonlocal maximum_geodes
@@ -16,16 +29,21 @@ def calculate(line: str, time: int) -> int:
         if time_left < 0:
             return
 
+        if counts is not None:
+            counts['states'] += 1
+
         # The current state can be determined by the current number of robots
-        # and resources
-        hash = json.dumps((robots, resources))
+        # and resources, packed into a single integer (no count reaches 2**16)
+        state = pack((*robots.values(), *resources.values()), 16)
 
         # If we have seen this state before, and there is less time remaining
         # than last time, then return early
-        if hash in cache and cache[hash] >= time_left:
+        best = cache.get(state)
+
+        if best is not None and best >= time_left:
             return
 
-        cache[hash] = time_left
+        cache[state] = time_left
 
         # Calculate the absolute maximum number of geodes if we created a new
         # geode robot each remaining minute
@@ -34,6 +52,9 @@ def calculate(line: str, time: int) -> int:
         # If the absolute maximum is smaller than the maximum we have seen so
         # far, return early
         if geodes_limit < maximum_geodes:
+            if counts is not None:
+                counts['prunes'] += 1
+
             return
 
         # Calculate the number of geodes we would create if we did not create
@@ -174,6 +195,8 @@ def calculate(line: str, time: int) -> int:
 
     recurse(costs, robots, resources, time)
 
+    cache.count()
+
     return maximum_geodes
 
 
@@ -186,7 +209,7 @@ def part_one(input: str):
         # The blueprint ID number is the line index plus one
         count += geodes * (i + 1)
 
-    print(count)
+    return count
 
 
 def part_two(input: str):
@@ -196,12 +219,21 @@ def part_two(input: str):
     for line in input.splitlines()[:3]:
         result *= calculate(line, 32)
 
-    print(result)
+    return result
+
+
+def solve(part: int, input: str):
+    if part == 1:
+        return part_one(input)
+    if part == 2:
+        return part_two(input)
 
+    raise ValueError(f'Invalid part: {part}')
 
-with open('input.txt') as f:
-    input = f.read()
 
+if __name__ == '__main__':
+    with open('input.txt') as f:
+        input = f.read()
 
-part_one(input)
-part_two(input)
+    print(part_one(input))
+    print(part_two(input))
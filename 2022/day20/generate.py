@@ -0,0 +1,16 @@
+import random
+
+# Roughly the number of values in a real puzzle input
+SIZE = 5000
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate `size` encrypted values, exactly one of which is 0
+    """
+    rng = random.Random(seed)
+
+    values = [rng.choice((-1, 1)) * rng.randint(1, 10000) for _ in range(max(2, size) - 1)]
+    values.insert(rng.randrange(len(values) + 1), 0)
+
+    return '\n'.join(map(str, values)) + '\n'
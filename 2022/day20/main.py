@@ -1,67 +1,73 @@
-# Node within doubly-linked list
-class Node():
-    left: 'Node'
-    right: 'Node'
+import os
+import sys
 
-    def __init__(self, val: int) -> None:
-        self.val = val
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
+from aoc.model import model
 
-def calculate(input: str, *, decryption_key=1, mixes=1):
-    # Parse input into a list of nodes
-    nodes = list(map(lambda x: Node(int(x) * decryption_key), input.splitlines()))
 
-    n = len(nodes)
+@model
+def parse(input: str) -> list[int]:
+    """Parse the input into the list of numbers"""
+    return [int(x) for x in input.splitlines()]
+
+
+def calculate(input: str, *, decryption_key=1, mixes=1):
+    # A list of values, where node `i` is the `i`th number
+    values = [x * decryption_key for x in parse(input)]
 
-    zero_index = -1
+    n = len(values)
 
-    # Create circular doubly-linked list of nodes
-    for i, node in enumerate(nodes):
-        node.left = nodes[i - 1]
-        node.right = nodes[(i + 1) % n]
+    # Circular doubly-linked list of nodes, as a struct of arrays: `left[i]` and
+    # `right[i]` are the nodes either side of node `i`. Two lists of indices
+    # take a fraction of the memory of an object per node, and are quicker to build
+    left = list(range(-1, n - 1))
+    right = list(range(1, n + 1))
+    left[0] = n - 1
+    right[-1] = 0
 
-        # Keep track of the index of the node with a value of 0
-        if node.val == 0:
-            zero_index = i
+    # Keep track of the index of the node with a value of 0
+    zero_index = values.index(0)
 
     for _ in range(mixes):
         # Loop through the nodes in the original order
-        for node in nodes:
+        for node, val in enumerate(values):
             # Remove the node from its current position
-            node.left.right = node.right
-            node.right.left = node.left
+            node_left, node_right = left[node], right[node]
+            right[node_left] = node_right
+            left[node_right] = node_left
 
             # Work out how many spaces the node needs to move forwards or backwards
-            moves = (abs(node.val) % (len(nodes) - 1)) * (node.val // abs(node.val)) if node.val != 0 else 0
+            moves = (abs(val) % (n - 1)) * (val // abs(val)) if val != 0 else 0
 
             # `anchor` will be the node to the left of where `node` will be re-inserted
-            anchor = node.left
+            anchor = node_left
 
-            while moves != 0:
-                if moves > 0:
-                    anchor = anchor.right
-                else:
-                    anchor = anchor.left
-
-                moves -= (1 if moves > 0 else -1)
+            if moves > 0:
+                for _ in range(moves):
+                    anchor = right[anchor]
+            else:
+                for _ in range(-moves):
+                    anchor = left[anchor]
 
             # Insert the node to the right of `anchor`
-            anchor.right.left = node
-            node.right = anchor.right
-            anchor.right = node
-            node.left = anchor
+            anchor_right = right[anchor]
+            left[anchor_right] = node
+            right[node] = anchor_right
+            right[anchor] = node
+            left[node] = anchor
 
     total = 0
 
     # Start from the node with a value of 0
-    node = nodes[zero_index]
+    node = zero_index
 
     for i in range(1, 3001):
-        node = node.right
+        node = right[node]
 
         # Add the grove coordinates
         if i % 1000 == 0:
-            total += node.val
+            total += values[node]
 
     return total
 
@@ -69,18 +75,27 @@ def calculate(input: str, *, decryption_key=1, mixes=1):
 def part_one(input: str):
     result = calculate(input)
 
-    print(result)
+    return result
 
 
 def part_two(input: str):
     result = calculate(input, decryption_key=811589153, mixes=10)
 
-    print(result)
+    return result
+
+
+def solve(part: int, input: str):
+    if part == 1:
+        return part_one(input)
+    if part == 2:
+        return part_two(input)
 
+    raise ValueError(f'Invalid part: {part}')
 
-with open('input.txt') as f:
-    input = f.read()
 
+if __name__ == '__main__':
+    with open('input.txt') as f:
+        input = f.read()
 
-part_one(input)
-part_two(input)
+    print(part_one(input))
+    print(part_two(input))
@@ -0,0 +1,135 @@
+import random
+import string
+
+# Roughly the number of monkeys in a real puzzle input
+SIZE = 2000
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate a tree of roughly `size` monkeys
+
+    The tree is built top-down along the path from `root` to `humn`, choosing
+    each operation so that the value `humn` must shout for part 2 is an exact
+    integer. Every other subtree is built bottom-up with exact divisions and
+    non-negative values.
+    """
+    rng = random.Random(seed)
+
+    size = max(5, size)
+
+    # Use longer names if the tree is too large for four letters
+    length = 4 if size < 100000 else 5
+
+    used = {'root', 'humn'}
+    jobs: dict[str, str] = {}
+
+    def new_name() -> str:
+        while True:
+            name = ''.join(rng.choices(string.ascii_lowercase, k=length))
+
+            if name not in used:
+                used.add(name)
+                return name
+
+    def subtree(nodes: int) -> tuple[str, int]:
+        """Create a subtree of (roughly) `nodes` monkeys, returning its name and value"""
+        name = new_name()
+
+        if nodes < 3:
+            value = rng.randint(1, 20)
+            jobs[name] = str(value)
+            return name, value
+
+        left_nodes = rng.randint(1, nodes - 2)
+        (left, a), (right, b) = subtree(left_nodes), subtree(nodes - 1 - left_nodes)
+
+        operators = ['+']
+
+        if a >= b:
+            operators.append('-')
+
+        if a * b <= 10000:
+            operators.append('*')
+
+        if b > 0 and a % b == 0:
+            operators.append('/')
+
+        operator = rng.choice(operators)
+        jobs[name] = f'{left} {operator} {right}'
+
+        match operator:
+            case '+':
+                return name, a + b
+            case '-':
+                return name, a - b
+            case '*':
+                return name, a * b
+            case _:
+                return name, a // b
+
+    path_length = max(1, size // 30)
+
+    # Split the remaining monkeys between the other side of the root and the
+    # sibling of each monkey on the path to `humn`
+    budget = max(path_length + 1, size - 2 - path_length)
+    cuts = sorted(rng.sample(range(1, budget), path_length)) if budget > path_length + 1 else list(range(1, path_length + 1))
+    sizes = [b - a for a, b in zip([0] + cuts, cuts + [budget])]
+
+    other, target = subtree(sizes[0])
+
+    # `name` is the monkey on the path whose value must equal `target`
+    name = new_name()
+
+    if rng.random() < 0.5:
+        jobs['root'] = f'{name} + {other}'
+    else:
+        jobs['root'] = f'{other} + {name}'
+
+    for k in range(path_length):
+        sibling, value = subtree(sizes[k + 1])
+
+        child = 'humn' if k == path_length - 1 else new_name()
+
+        # Keep `target` positive, so that the answer to part 2 is positive
+        operators = [('-', True)]
+
+        if value < target:
+            operators.append(('+', rng.random() < 0.5))
+
+        if value > target:
+            operators.append(('-', False))
+
+        if value > 1 and target % value == 0:
+            operators += [('*', rng.random() < 0.5)] * 4
+
+        if target < 10**12 and value > 0:
+            operators.append(('/', True))
+
+        operator, humn_left = rng.choice(operators)
+
+        match operator, humn_left:
+            case '+', _:
+                target -= value
+            case '-', True:
+                target += value
+            case '-', False:
+                target = value - target
+            case '*', _:
+                target //= value
+            case '/', _:
+                target *= value
+
+        if humn_left:
+            jobs[name] = f'{child} {operator} {sibling}'
+        else:
+            jobs[name] = f'{sibling} {operator} {child}'
+
+        name = child
+
+    jobs['humn'] = str(rng.randint(1, 5000))
+
+    order = list(jobs)
+    rng.shuffle(order)
+
+    return '\n'.join(f'{name}: {jobs[name]}' for name in order) + '\n'
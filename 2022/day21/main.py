@@ -1,6 +1,8 @@
 class Monkey:
     """Each monkey is a node in a binary tree"""
 
+    __slots__ = ('name', 'value', 'left', 'right')
+
     def __init__(self, name: str, value: str) -> None:
         self.name = name
 
@@ -14,49 +16,64 @@ class Monkey:
             self.right = right
 
 
-def part_one(input: str):
-    # dict containing each monkey, by name
-    monkeys: dict[str, Monkey] = {}
-
-    # Create a monkey object for each line in the file
-    for line in input.splitlines():
-        name, job = line.split(': ')
-        monkeys[name] = Monkey(name, job)
-
-    def recurse(name: str) -> int:
-        """Recursive function to calculate the binary tree"""
-
+def operate(operator: str, left: int, right: int) -> int:
+    match operator:
+        case '+':
+            return left + right
+        case '-':
+            return left - right
+        case '*':
+            return left * right
+        case '/':
+            return left // right
+        case _:
+            raise Exception(f'Invalid operator: {operator}')
+
+
+def calculate_values(monkeys: dict[str, Monkey]) -> tuple[dict[str, int], dict[str, str]]:
+    """
+    Calculate the value of every monkey in the binary tree, returning a dict of
+    the values and a dict of the parent of each monkey
+
+    The tree is evaluated with an explicit stack rather than recursively, so a
+    deep tree doesn't hit the recursion limit. A monkey stays on the stack
+    until the values of both of its children are known
+    """
+    values: dict[str, int] = {}
+    parents: dict[str, str] = {}
+
+    stack = ['root']
+
+    while stack:
+        name = stack[-1]
         monkey = monkeys[name]
 
-        # If leaf node, return the value
+        # If leaf node, the value is known
         if isinstance(monkey.value, int):
-            return monkey.value
+            values[name] = monkey.value
+            stack.pop()
+            continue
 
         assert monkey.left and monkey.right
 
-        # Otherwise, recurse on both sides and perform operation according to
-        # the operator
-        left, right, operator = monkey.left, monkey.right, monkey.value
+        left, right = monkey.left, monkey.right
 
-        match operator:
-            case '+':
-                return recurse(left) + recurse(right)
-            case '-':
-                return recurse(left) - recurse(right)
-            case '*':
-                return recurse(left) * recurse(right)
-            case '/':
-                return recurse(left) // recurse(right)
-            case _:
-                raise Exception(f'Invalid operator: {operator}')
+        # Once both sides are known, perform the operation according to the operator
+        if left in values and right in values:
+            values[name] = operate(monkey.value, values[left], values[right])
+            stack.pop()
+            continue
 
-    # Recurse from the root of the tree
-    result = recurse('root')
+        # Otherwise, calculate both sides first
+        for child in (left, right):
+            if child not in values:
+                parents[child] = name
+                stack.append(child)
 
-    print(result)
+    return values, parents
 
 
-def part_two(input: str):
+def part_one(input: str):
     # dict containing each monkey, by name
     monkeys: dict[str, Monkey] = {}
 
@@ -65,77 +82,60 @@ def part_two(input: str):
         name, job = line.split(': ')
         monkeys[name] = Monkey(name, job)
 
-    # `path_to_humn` will be a set containing all nodes on the way to the
-    # `humn` node
-    path_to_humn: set[str] = set()
-
-    # dict for each non-leaf node, where the value is a tuple of the left and
-    # right operands
-    values: dict[str, tuple[int, int]] = {}
+    # Calculate the tree from the root
+    values, _ = calculate_values(monkeys)
 
-    def calculate_values(name: str, path: set[str]) -> int:
-        """
-        Recursive function to:
-          calculate the operands of each non-leaf node
-          obtain the path from the root node to the `humn` node
-        """
-        nonlocal path_to_humn
-
-        monkey = monkeys[name]
+    result = values['root']
 
-        # Add the current node to the path
-        path.add(name)
+    return result
 
-        # If we are at the `humn` node, save the path
-        if monkey.name == 'humn':
-            path_to_humn = path
 
-        if isinstance(monkey.value, int):
-            return monkey.value
+def part_two(input: str):
+    # dict containing each monkey, by name
+    monkeys: dict[str, Monkey] = {}
 
-        assert monkey.left and monkey.right
+    # Create a monkey object for each line in the file
+    for line in input.splitlines():
+        name, job = line.split(': ')
+        monkeys[name] = Monkey(name, job)
 
-        left, right, operator = monkey.left, monkey.right, monkey.value
+    # Calculate the value of each monkey, which gives the operands of each
+    # non-leaf node
+    values, parents = calculate_values(monkeys)
 
-        # Obtain the left and right operands recursively
-        left_operand, right_operand = calculate_values(left, path.copy()), calculate_values(right, path.copy())
+    # `path_to_humn` will be a set containing all nodes on the way to the
+    # `humn` node, found by following the parents back up to the root
+    path_to_humn: set[str] = {'humn'}
+    name = 'humn'
 
-        # Save the operands in the `values` dict
-        values[name] = (left_operand, right_operand)
+    while name != 'root':
+        name = parents[name]
+        path_to_humn.add(name)
 
-        match operator:
-            case '+':
-                return left_operand + right_operand
-            case '-':
-                return left_operand - right_operand
-            case '*':
-                return left_operand * right_operand
-            case '/':
-                return left_operand // right_operand
-            case _:
-                raise Exception(f'Invalid operator: {operator}')
+    root_monkey = monkeys['root']
 
-    # Call the `calculate_values` function to initialise the `path_to_humn` and
-    # `values` variables correctly
-    calculate_values('root', set())
+    assert root_monkey.left and root_monkey.right
 
-    # `humn` will contain the correct value for the `humn` node
-    humn = 0
+    left_operand, right_operand = values[root_monkey.left], values[root_monkey.right]
 
-    def find_humn(name: str, result) -> None:
-        nonlocal humn
+    # If the left side of the tree contains `humn`, then the left side of the
+    # tree needs to equal the right side (solve for `humn` on the left)
+    if root_monkey.left in path_to_humn:
+        name, result = root_monkey.left, right_operand
+    else:
+        # Otherwise, the right side needs to equal the left side (solve for
+        # `humn` on the right)
+        name, result = root_monkey.right, left_operand
 
+    # Walk down the path to `humn`, working out the value each node on the path
+    # needs to have, until we have found the `humn` node
+    while name != 'humn':
         monkey = monkeys[name]
 
-        # If we have found the `humn` node, we can set `humn` and return
-        if name == 'humn':
-            humn = result
-            return
-
         assert isinstance(monkey.value, str) and monkey.left and monkey.right
 
         left, right, operator = monkey.left, monkey.right, monkey.value
-        left_operand, right_operand = values[name]
+        left_operand, right_operand = values[left], values[right]
 
         # The operand of the side of the current node which contains `humn`
         # needs to equal `result` in order for both sides of the full tree
@@ -144,51 +144,47 @@ def part_two(input: str):
             case '+':
                 # left_operand + right_operand = result
                 if left in path_to_humn:
-                    return find_humn(left, result - right_operand)
-
-                return find_humn(right, result - left_operand)
+                    name, result = left, result - right_operand
+                else:
+                    name, result = right, result - left_operand
             case '-':
                 # left_operand - right_operand = result
                 if left in path_to_humn:
-                    return find_humn(left, result + right_operand)
-
-                return find_humn(right, left_operand - result)
+                    name, result = left, result + right_operand
+                else:
+                    name, result = right, left_operand - result
             case '*':
                 # left_operand * right_operand = result
                 if left in path_to_humn:
-                    return find_humn(left, result // right_operand)
-
-                return find_humn(right, result // left_operand)
+                    name, result = left, result // right_operand
+                else:
+                    name, result = right, result // left_operand
             case '/':
                 # left_operand / right_operand = result
                 if left in path_to_humn:
-                    return find_humn(left, result * right_operand)
-
-                return find_humn(right, left_operand // result)
+                    name, result = left, result * right_operand
+                else:
+                    name, result = right, left_operand // result
             case _:
                 raise Exception(f'Invalid operator: {operator}')
 
-    root_monkey = monkeys['root']
-
-    assert root_monkey.left and root_monkey.right
+    humn = result
 
-    left_operand, right_operand = values['root']
+    return humn
 
-    # If the left side of the tree contains `humn`, then the left side of the
-    # tree needs to equal the right side (solve for `humn` on the left)
-    if root_monkey.left in path_to_humn:
-        find_humn(root_monkey.left, right_operand)
-    else:
-        # Otherwise, the right side needs to equal the left side (solve for
-        # `humn` on the right)
-        find_humn(root_monkey.right, left_operand)
 
-    print(humn)
+def solve(part: int, input: str):
+    if part == 1:
+        return part_one(input)
+    if part == 2:
+        return part_two(input)
 
+    raise ValueError(f'Invalid part: {part}')
 
-with open('input.txt') as f:
-    input = f.read()
 
+if __name__ == '__main__':
+    with open('input.txt') as f:
+        input = f.read()
 
-part_one(input)
-part_two(input)
+    print(part_one(input))
+    print(part_two(input))
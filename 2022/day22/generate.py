@@ -0,0 +1,38 @@
+import random
+
+# Roughly the number of moves in the path of a real puzzle input
+SIZE = 2000
+
+# The cube net used by the real puzzle input, as (first row, first column) of
+# each 50x50 face. `part_two()` hardcodes the edges of this layout.
+FACES = [(0, 50), (0, 100), (50, 50), (100, 0), (100, 50), (150, 0)]
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate a board with the same cube net as the real input, and a path of
+    `size` moves
+    """
+    rng = random.Random(seed)
+
+    board = [[' '] * 150 for _ in range(200)]
+
+    for top, left in FACES:
+        for x in range(top, top + 50):
+            for y in range(left, left + 50):
+                board[x][y] = '#' if rng.random() < 0.04 else '.'
+
+    # The starting position must be open
+    board[0][50] = '.'
+
+    path: list[str] = []
+
+    for i in range(max(1, size)):
+        if i > 0:
+            path.append(rng.choice('LR'))
+
+        path.append(str(rng.randint(1, 50)))
+
+    rows = '\n'.join(''.join(row).rstrip() for row in board)
+
+    return f'{rows}\n\n{"".join(path)}\n'
@@ -1,5 +1,16 @@
+import functools
 import os
 import re
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from aoc.model import model
+
+# The length of each edge of the cube, and the (row, column) of each face in
+# the net of the cube in the puzzle input, counted in faces rather than squares
+FACE = 50
+FACES = ((0, 1), (0, 2), (1, 1), (2, 0), (2, 1), (3, 0))
 
 
 def change_direction(direction: str, turn: str) -> str:
@@ -47,6 +58,101 @@ def get_direction_score(direction: str) -> int:
             raise Exception(f'Invalid direction: {direction}')
 
 
+def cross_edge(x: int, y: int, direction: str) -> tuple[int, int, str]:
+    """
+    The position and direction after walking across an edge of the cube, where
+    (x, y) is the square just past the edge
+    """
+    # The following is hard-coded logic to determing the position and
+    # direction after walking across an edge of the cube. This logic is
+    # specific to the puzzle input that was provided.
+    if x == -1 and 50 <= y < 100:
+        x, y, direction = y + 100, 0, 'R'
+    elif x == -1 and 100 <= y < 150:
+        x, y, direction = 199, y - 100, 'U'
+    elif 0 <= x < 50 and y == 150:
+        x, y, direction = 149 - x, 99, 'L'
+    elif x == 50 and 100 <= y < 150 and direction == 'D':
+        x, y, direction = y - 50, 99, 'L'
+    elif 50 <= x < 100 and y == 100 and direction == 'R':
+        x, y, direction = 49, x + 50, 'U'
+    elif 100 <= x < 150 and y == 100:
+        x, y, direction = 149 - x, 149, 'L'
+    elif x == 150 and 50 <= y < 100 and direction == 'D':
+        x, y, direction = y + 100, 49, 'L'
+    elif 150 <= x < 200 and y == 50 and direction == 'R':
+        x, y, direction = 149, x - 100, 'U'
+    elif x == 200 and 0 <= y < 50:
+        x, y, direction = 0, y + 100, 'D'
+    elif 150 <= x < 200 and y == -1:
+        x, y, direction = 0, x - 100, 'D'
+    elif 100 <= x < 150 and y == -1:
+        x, y, direction = 149 - x, 50, 'R'
+    elif x == 99 and 0 <= y < 50 and direction == 'U':
+        x, y, direction = y + 50, 50, 'R'
+    elif 50 <= x < 100 and y == 49 and direction == 'L':
+        x, y, direction = 100, x - 50, 'D'
+    elif 0 <= x < 50 and y == 49:
+        x, y, direction = 149 - x, 0, 'R'
+
+    return x, y, direction
+
+
+@functools.cache
+def wrap_table() -> dict[tuple[int, int, str], tuple[int, int, str]]:
+    """
+    The result of `cross_edge()` for every square just past an edge of the
+    cube, and the direction walked to reach it. The net is the same for every
+    input, so the table is built once, and shared by every input solved by the
+    process.
+    """
+    def on_net(x: int, y: int) -> bool:
+        return x >= 0 and y >= 0 and (x // FACE, y // FACE) in FACES
+
+    table: dict[tuple[int, int, str], tuple[int, int, str]] = {}
+
+    for row, column in FACES:
+        top, left = row * FACE, column * FACE
+        bottom, right = top + FACE - 1, left + FACE - 1
+
+        for i in range(FACE):
+            # The square on each edge of the face, and the direction which
+            # walks off that edge
+            for x, y, direction in (
+                (top + i, right, 'R'),
+                (bottom, left + i, 'D'),
+                (top + i, left, 'L'),
+                (top, left + i, 'U'),
+            ):
+                a, b = get_coordinates(direction)
+
+                if not on_net(x + a, y + b):
+                    table[(x + a, y + b, direction)] = cross_edge(x + a, y + b, direction)
+
+    return table
+
+
+@model
+def parse(input: str) -> tuple[list[list[str]], list[str]]:
+    """
+    Parse the input into the board, with every row padded to the same length,
+    and the list of instructions (numbers of steps, and rotations)
+    """
+    board_string, path = input.strip('\n').split('\n\n')
+
+    board = [list(line) for line in board_string.splitlines()]
+
+    width = max(len(row) for row in board)
+
+    # Ensure each row in the array is the same length, by filling with ' '
+    for row in board:
+        row += [' '] * (width - len(row))
+
+    instructions: list[str] = re.findall(r'(\d+|\w)', path)
+
+    return board, instructions
+
+
 def part_one(input: str):
     def move(position: tuple[int, int], board: list[list[str]], moves: int, direction: str) -> tuple[int, int]:
         """Function to make a number of moves in a certain direction"""
@@ -76,17 +182,7 @@ def part_one(input: str):
         # being blocked)
         return position
 
-    board_string, path = input.strip('\n').split('\n\n')
-
-    board = [list(line) for line in board_string.splitlines()]
-
-    width = max(len(row) for row in board)
-
-    # Ensure each row in the array is the same length, by filling with ' '
-    for row in board:
-        row += [' '] * (width - len(row))
-
-    instructions: list[str] = re.findall(r'(\d+|\w)', path)
+    board, instructions = parse(input)
 
     # The starting position is the first '.' in the first row of the board
     position = (0, board[0].index('.'))
@@ -109,10 +205,13 @@ def part_one(input: str):
     # Calculate the password
     password = (1000 * row) + (4 * column) + facing
 
-    print(password)
+    return password
 
 
 def part_two(input: str):
+    # The position and direction after walking across each edge of the cube
+    wraps = wrap_table()
+
     def move(position: tuple[int, int], board: list[list[str]], moves: int, direction: str) -> tuple[tuple[int, int], str]:
         """Function to make a number of moves in a certain direction"""
         for _ in range(moves):
@@ -123,37 +222,12 @@ def part_two(input: str):
 
             x, y = ((position[0] + coordinates[0]), (position[1] + coordinates[1]))
 
-            # The following is hard-coded logic to determing the position and
-            # direction after walking across an edge of the cube. This logic is
-            # specific to the puzzle input that was provided.
-            if x == -1 and 50 <= y < 100:
-                x, y, direction = y + 100, 0, 'R'
-            elif x == -1 and 100 <= y < 150:
-                x, y, direction = 199, y - 100, 'U'
-            elif 0 <= x < 50 and y == 150:
-                x, y, direction = 149 - x, 99, 'L'
-            elif x == 50 and 100 <= y < 150 and direction == 'D':
-                x, y, direction = y - 50, 99, 'L'
-            elif 50 <= x < 100 and y == 100 and direction == 'R':
-                x, y, direction = 49, x + 50, 'U'
-            elif 100 <= x < 150 and y == 100:
-                x, y, direction = 149 - x, 149, 'L'
-            elif x == 150 and 50 <= y < 100 and direction == 'D':
-                x, y, direction = y + 100, 49, 'L'
-            elif 150 <= x < 200 and y == 50 and direction == 'R':
-                x, y, direction = 149, x - 100, 'U'
-            elif x == 200 and 0 <= y < 50:
-                x, y, direction = 0, y + 100, 'D'
-            elif 150 <= x < 200 and y == -1:
-                x, y, direction = 0, x - 100, 'D'
-            elif 100 <= x < 150 and y == -1:
-                x, y, direction = 149 - x, 50, 'R'
-            elif x == 99 and 0 <= y < 50 and direction == 'U':
-                x, y, direction = y + 50, 50, 'R'
-            elif 50 <= x < 100 and y == 49 and direction == 'L':
-                x, y, direction = 100, x - 50, 'D'
-            elif 0 <= x < 50 and y == 49:
-                x, y, direction = 149 - x, 0, 'R'
+            # If we walked across an edge of the cube, look up where we are on
+            # the net, and which direction we are now facing
+            wrapped = wraps.get((x, y, direction))
+
+            if wrapped is not None:
+                x, y, direction = wrapped
 
             # If we are blocked then stop moving
             if board[x][y] == '#':
@@ -165,17 +239,7 @@ def part_two(input: str):
         # being blocked)
         return position, direction
 
-    board_string, path = input.strip('\n').split('\n\n')
-
-    board = [list(line) for line in board_string.splitlines()]
-
-    width = max(len(row) for row in board)
-
-    # Ensure each row in the array is the same length, by filling with ' '
-    for row in board:
-        row += [' '] * (width - len(row))
-
-    instructions: list[str] = re.findall(r'(\d+|\w)', path)
+    board, instructions = parse(input)
 
     # The starting position is the first '.' in the first row of the board
     position = (0, board[0].index('.'))
@@ -198,12 +262,21 @@ def part_two(input: str):
     # Calculate the password
     password = (1000 * row) + (4 * column) + facing
 
-    print(password)
+    return password
+
+
+def solve(part: int, input: str):
+    if part == 1:
+        return part_one(input)
+    if part == 2:
+        return part_two(input)
 
+    raise ValueError(f'Invalid part: {part}')
 
-with open('input.txt') as f:
-    input = f.read()
 
+if __name__ == '__main__':
+    with open('input.txt') as f:
+        input = f.read()
 
-part_one(input)
-part_two(input)
+    print(part_one(input))
+    print(part_two(input))
@@ -0,0 +1,18 @@
+import random
+
+# Roughly the width and height of the grove in a real puzzle input
+SIZE = 72
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate a `size` x `size` grove, with an elf on roughly half of the
+    squares
+    """
+    rng = random.Random(seed)
+
+    size = max(1, size)
+
+    rows = [''.join('#' if rng.random() < 0.5 else '.' for _ in range(size)) for _ in range(size)]
+
+    return '\n'.join(rows) + '\n'
@@ -85,7 +85,7 @@ def part_one(input: str):
     # Calculate the total number of unoccupied squares within the rectangle
     total = (max_x - min_x + 1) * (max_y - min_y + 1) - len(elves)
 
-    print(total)
+    return total
 
 
 def part_two(input: str):
@@ -157,12 +157,21 @@ def part_two(input: str):
         # Change the order of the directions
         all_directions = all_directions[1:] + all_directions[:1]
 
-    print(total)
+    return total
 
 
-with open('input.txt') as f:
-    input = f.read()
+def solve(part: int, input: str):
+    if part == 1:
+        return part_one(input)
+    if part == 2:
+        return part_two(input)
 
+    raise ValueError(f'Invalid part: {part}')
 
-part_one(input)
-part_two(input)
+
+if __name__ == '__main__':
+    with open('input.txt') as f:
+        input = f.read()
+
+    print(part_one(input))
+    print(part_two(input))
@@ -0,0 +1,35 @@
+import random
+
+# Roughly the width of the valley (excluding the walls) in a real puzzle input
+SIZE = 120
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate a valley `size` squares wide, with the same proportions and
+    blizzard density as the real input
+
+    Like the real input, there are no vertical blizzards in the columns of the
+    start and end points, so the expedition never gets hit while waiting there.
+    """
+    rng = random.Random(seed)
+
+    width = max(3, size)
+    height = max(3, width * 5 // 24)
+
+    rows = ['#.' + '#' * width]
+
+    for _ in range(height):
+        row = ['#']
+
+        for j in range(width):
+            if rng.random() < 0.3:
+                row.append(rng.choice('<>') if j in (0, width - 1) else rng.choice('<>^v'))
+            else:
+                row.append('.')
+
+        rows.append(''.join(row) + '#')
+
+    rows.append('#' * width + '.#')
+
+    return '\n'.join(rows) + '\n'
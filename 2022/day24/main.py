@@ -1,3 +1,12 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from aoc import counters
+from aoc.model import model
+
+
 def move_blizzards(blizzards: set[tuple[int, int, int, int]], height: int, width: int) -> tuple[set[tuple[int, int, int, int]], set[tuple[int, int]]]:
     new_blizzards: set[tuple[int, int, int, int]] = set()
     occupied: set[tuple[int, int]] = set()
@@ -9,7 +18,13 @@ def move_blizzards(blizzards: set[tuple[int, int, int, int]], height: int, width
     return new_blizzards, occupied
 
 
-def part_one(input: str):
+@model
+def parse(input: str) -> tuple[int, int, int, set[tuple[int, int, int, int]]]:
+    """
+    Parse the input into the height and width of the inner board, the number of
+    steps after which the blizzards cycle round, and the (row, column, row step,
+    column step) of each blizzard
+    """
     board = input.splitlines()
 
     # Get the height and width of the inner board (excluding the border)
@@ -49,6 +64,12 @@ def part_one(input: str):
         l[1] = (l[1] + 1) % width
         r[0] = (r[0] + 1) % height
 
+    return height, width, cycle, blizzards
+
+
+def part_one(input: str):
+    height, width, cycle, blizzards = parse(input)
+
     # The start point is (-1, 0)
     queue: list[tuple[int, int]] = [(-1, 0)]
 
@@ -58,6 +79,9 @@ def part_one(input: str):
 
     result = None
 
+    # Counts of the states and queue pushes, if counting is enabled
+    counts = counters.active()
+
     while not result and queue:
         steps += 1
 
@@ -68,6 +92,9 @@ def part_one(input: str):
         blizzards, occupied = move_blizzards(blizzards, height, width)
 
         for x, y in queue:
+            if counts is not None:
+                counts['states'] += 1
+
             # Check moving in all directions, including standing still
             for a, b in ((0, 0), (0, 1), (1, 0), (0, -1), (-1, 0)):
                 X, Y = x + a, y + b
@@ -90,6 +117,9 @@ def part_one(input: str):
                     # Add the space into the queue to iterate on the next loop
                     new_queue.append((X, Y))
 
+                    if counts is not None:
+                        counts['pushes'] += 1
+
             # If we have the result, break
             if result:
                 break
@@ -97,48 +127,11 @@ def part_one(input: str):
         # Reset the queue for the next loop
         queue = new_queue
 
-    print(result)
+    return result
 
 
 def part_two(input: str):
-    board = input.splitlines()
-
-    # Get the height and width of the inner board (excluding the border)
-    height, width = len(board) - 2, len(board[0]) - 2
-
-    blizzards: set[tuple[int, int, int, int]] = set()
-
-    for i in range(1, height + 1):
-        for j in range(1, width + 1):
-            square = board[i][j]
-
-            # Add the blizards into the set (shifting the origin of the grid)
-            # Also add the coordinates in which the blizzard moves
-            match square:
-                case '>':
-                    blizzards.add((i - 1, j - 1, 0, 1))
-                case '<':
-                    blizzards.add((i - 1, j - 1, 0, -1))
-                case '^':
-                    blizzards.add((i - 1, j - 1, -1, 0))
-                case 'v':
-                    blizzards.add((i - 1, j - 1, 1, 0))
-                case '.':
-                    pass
-                case _:
-                    raise Exception(f'Unexpected symbol: {square}')
-
-    # After a certain number of steps, the blizzards will cycle round
-    # We can calculate this by placing two blizzards at (0, 0), one moving
-    # down, the other moving right, and calculate the number of steps until
-    # the blizzards overlap again
-    l, r = [0, 1], [1, 0]
-    cycle = 1
-
-    while l != r:
-        cycle += 1
-        l[1] = (l[1] + 1) % width
-        r[0] = (r[0] + 1) % height
+    height, width, cycle, blizzards = parse(input)
 
     # The start point is (-1, 0)
     # We start on trip 1
@@ -150,6 +143,9 @@ def part_two(input: str):
 
     result = None
 
+    # Counts of the states and queue pushes, if counting is enabled
+    counts = counters.active()
+
     while not result and queue:
         steps += 1
 
@@ -160,6 +156,9 @@ def part_two(input: str):
         blizzards, occupied = move_blizzards(blizzards, height, width)
 
         for x, y, trip in queue:
+            if counts is not None:
+                counts['states'] += 1
+
             # Check moving in all directions, including standing still
             for a, b in ((0, 0), (0, 1), (1, 0), (0, -1), (-1, 0)):
                 X, Y = x + a, y + b
@@ -171,6 +170,10 @@ def part_two(input: str):
                     if trip == 1:
                         seen.add((X, Y, trip + 1, steps % cycle))
                         new_queue.append((X, Y, trip + 1))
+
+                        if counts is not None:
+                            counts['pushes'] += 1
+
                         continue
                     # If we are on the third trip, we have the result
                     if trip == 3:
@@ -182,6 +185,10 @@ def part_two(input: str):
                 if (X, Y) == (-1, 0) and trip == 2:
                     seen.add((X, Y, trip + 1, steps % cycle))
                     new_queue.append((X, Y, trip + 1))
+
+                    if counts is not None:
+                        counts['pushes'] += 1
+
                     continue
 
                 # Otherwise, to move into the new space, the following must be true:
@@ -193,6 +200,9 @@ def part_two(input: str):
                     seen.add((X, Y, trip, steps % cycle))
                     new_queue.append((X, Y, trip))
 
+                    if counts is not None:
+                        counts['pushes'] += 1
+
             # If we have the result, break
             if result:
                 break
@@ -200,12 +210,21 @@ def part_two(input: str):
         # Reset the queue for the next loop
         queue = new_queue
 
-    print(result)
+    return result
+
+
+def solve(part: int, input: str):
+    if part == 1:
+        return part_one(input)
+    if part == 2:
+        return part_two(input)
 
+    raise ValueError(f'Invalid part: {part}')
 
-with open('input.txt') as f:
-    input = f.read()
 
+if __name__ == '__main__':
+    with open('input.txt') as f:
+        input = f.read()
 
-part_one(input)
-part_two(input)
+    print(part_one(input))
+    print(part_two(input))
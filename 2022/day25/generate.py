@@ -0,0 +1,19 @@
+import random
+
+# Roughly the number of fuel requirements in a real puzzle input
+SIZE = 120
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate `size` fuel requirements as SNAFU numbers of up to 20 digits
+    """
+    rng = random.Random(seed)
+
+    lines: list[str] = []
+
+    for _ in range(max(1, size)):
+        digits = rng.randint(1, 20)
+        lines.append(rng.choice('12') + ''.join(rng.choices('=-012', k=digits - 1)))
+
+    return '\n'.join(lines) + '\n'
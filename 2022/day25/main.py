@@ -1,7 +1,18 @@
-def part_one(input: str):
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from aoc.inputs import Input, lines
+
+# `solve()` can be passed the memory-mapped input file
+MAPPED_INPUT = True
+
+
+def part_one(input: Input):
     total = 0
 
-    for line in input.splitlines():
+    for line in lines(input):
         for i, char in enumerate(line[::-1]):
             match char:
                 case '=':
@@ -13,41 +24,51 @@ def part_one(input: str):
 
             total += (5 ** i) * val
 
-    def recurse(total: int, snafu: str, i: int) -> str:
-        if i == 0:
-            return snafu
+    i = 1
 
+    while not -((5 ** i) // 2) <= total <= (5 ** i) // 2:
+        i += 1
+
+    snafu: list[str] = []
+
+    # Choose each digit from the most significant, leaving the rest of `total`
+    # for the digits after it
+    while i != 0:
         difference = (5 ** (i - 1)) // 2
 
         if -2 * (5 ** (i - 1)) - difference <= total <= -2 * (5 ** (i - 1)) + difference:
-            return recurse(total + 2 * (5 ** (i - 1)), f'{snafu}=', i - 1)
-        if -(5 ** (i - 1)) - difference <= total <= -(5 ** (i - 1)) + difference:
-            return recurse(total + (5 ** (i - 1)), f'{snafu}-', i - 1)
-        if -difference <= total <= difference:
-            return recurse(total, f'{snafu}0', i - 1)
-        if (5 ** (i - 1)) - difference <= total <= (5 ** (i - 1)) + difference:
-            return recurse(total - (5 ** (i - 1)), f'{snafu}1', i - 1)
-        if 2 * (5 ** (i - 1)) - difference <= total <= 2 * (5 ** (i - 1)) + difference:
-            return recurse(total - 2 * (5 ** (i - 1)), f'{snafu}2', i - 1)
-
-        raise Exception('Invalid calculation')
+            total += 2 * (5 ** (i - 1))
+            snafu.append('=')
+        elif -(5 ** (i - 1)) - difference <= total <= -(5 ** (i - 1)) + difference:
+            total += (5 ** (i - 1))
+            snafu.append('-')
+        elif -difference <= total <= difference:
+            snafu.append('0')
+        elif (5 ** (i - 1)) - difference <= total <= (5 ** (i - 1)) + difference:
+            total -= (5 ** (i - 1))
+            snafu.append('1')
+        elif 2 * (5 ** (i - 1)) - difference <= total <= 2 * (5 ** (i - 1)) + difference:
+            total -= 2 * (5 ** (i - 1))
+            snafu.append('2')
+        else:
+            raise Exception('Invalid calculation')
 
-    i = 1
+        i -= 1
 
-    while not -((5 ** i) // 2) <= total <= (5 ** i) // 2:
-        i += 1
+    result = ''.join(snafu)
 
-    result = recurse(total, '', i)
+    return result
 
-    print(result)
 
+def solve(part: int, input: Input):
+    if part == 1:
+        return part_one(input)
 
-def part_two(input: str):
-    pass
+    raise ValueError(f'Invalid part: {part}')
 
 
-with open('input.txt') as f:
-    input = f.read()
+if __name__ == '__main__':
+    with open('input.txt') as f:
+        input = f.read()
 
-part_one(input)
-part_two(input)
+    print(part_one(input))
@@ -0,0 +1,38 @@
+import random
+import string
+
+# Roughly the number of lines in a real puzzle input
+SIZE = 1000
+
+WORDS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate `size` lines of calibration values, mixing letters, digits and
+    spelled-out digits. Every line contains at least one digit, so part 1 can
+    also be solved.
+    """
+    rng = random.Random(seed)
+
+    lines: list[str] = []
+
+    for _ in range(size):
+        pieces: list[str] = [rng.choice("123456789")]
+
+        for _ in range(rng.randint(1, 8)):
+            r = rng.random()
+
+            if r < 0.3:
+                pieces.append(rng.choice("123456789"))
+            elif r < 0.6:
+                pieces.append(rng.choice(WORDS))
+            else:
+                pieces.append(
+                    "".join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 4)))
+                )
+
+        rng.shuffle(pieces)
+        lines.append("".join(pieces))
+
+    return "\n".join(lines) + "\n"
@@ -1,12 +1,18 @@
 import os
+import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
 
-def part_one(puzzle_input: str) -> None:
-    array = puzzle_input.strip().splitlines()
+from aoc.inputs import Input, lines
 
+# `solve()` can be passed the memory-mapped input file
+MAPPED_INPUT = True
+
+
+def part_one(puzzle_input: Input) -> int:
     result = 0
 
-    for line in array:
+    for line in lines(puzzle_input):
         num1 = num2 = None
 
         for char in line:
@@ -26,12 +32,10 @@ def part_one(puzzle_input: str) -> None:
 
         result += int(num1 + num2)
 
-    print(result)
-
+    return result
 
-def part_two(puzzle_input: str) -> None:
-    array = puzzle_input.strip().splitlines()
 
+def part_two(puzzle_input: Input) -> int:
     numbers = {
         "zero": "0",
         "one": "1",
@@ -47,7 +51,7 @@ def part_two(puzzle_input: str) -> None:
 
     result = 0
 
-    for line in array:
+    for line in lines(puzzle_input):
         num1 = num2 = None
 
         for i, char in enumerate(line):
@@ -98,11 +102,21 @@ def part_two(puzzle_input: str) -> None:
 
         result += int(num1 + num2)
 
-    print(result)
+    return result
+
+
+def solve(part: int, puzzle_input: Input) -> int:
+    if part == 1:
+        return part_one(puzzle_input)
+    if part == 2:
+        return part_two(puzzle_input)
+
+    raise ValueError(f"Invalid part: {part}")
 
 
-with open(os.path.join(os.path.dirname(__file__), "input.txt")) as f:
-    puzzle_input = f.read()
+if __name__ == "__main__":
+    with open(os.path.join(os.path.dirname(__file__), "input.txt")) as f:
+        puzzle_input = f.read()
 
-part_one(puzzle_input)
-part_two(puzzle_input)
+    print(part_one(puzzle_input))
+    print(part_two(puzzle_input))
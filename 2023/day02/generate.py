@@ -0,0 +1,25 @@
+import random
+
+# Roughly the number of games in a real puzzle input
+SIZE = 100
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate `size` games, each with a handful of draws of red, green and blue
+    cubes
+    """
+    rng = random.Random(seed)
+
+    lines: list[str] = []
+
+    for i in range(1, size + 1):
+        draws: list[str] = []
+
+        for _ in range(rng.randint(1, 6)):
+            colours = rng.sample(["red", "green", "blue"], rng.randint(1, 3))
+            draws.append(", ".join(f"{rng.randint(1, 20)} {colour}" for colour in colours))
+
+        lines.append(f"Game {i}: {'; '.join(draws)}")
+
+    return "\n".join(lines) + "\n"
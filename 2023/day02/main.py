@@ -1,10 +1,16 @@
 import os
 import re
+import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
 
-def part_one(puzzle_input: str) -> None:
-    array = puzzle_input.strip().splitlines()
+from aoc.inputs import Input, lines
 
+# `solve()` can be passed the memory-mapped input file
+MAPPED_INPUT = True
+
+
+def part_one(puzzle_input: Input) -> int:
     amounts = {
         "red": 12,
         "green": 13,
@@ -13,7 +19,7 @@ def part_one(puzzle_input: str) -> None:
 
     result = 0
 
-    for line in array:
+    for line in lines(puzzle_input):
         # Extract the game ID and the game results
         match = re.search(r"^Game (\d+): (.*)$", line)
         assert match is not None
@@ -40,15 +46,13 @@ def part_one(puzzle_input: str) -> None:
             # If we reach here, each draw was valid, therefore add the ID
             result += id
 
-    print(result)
-
+    return result
 
-def part_two(puzzle_input: str) -> None:
-    array = puzzle_input.strip().splitlines()
 
+def part_two(puzzle_input: Input) -> int:
     result = 0
 
-    for line in array:
+    for line in lines(puzzle_input):
         match = re.search(r"^Game (\d+): (.*)$", line)
         assert match is not None
 
@@ -75,11 +79,21 @@ def part_two(puzzle_input: str) -> None:
         # Add the power to the result
         result += power
 
-    print(result)
+    return result
+
+
+def solve(part: int, puzzle_input: Input) -> int:
+    if part == 1:
+        return part_one(puzzle_input)
+    if part == 2:
+        return part_two(puzzle_input)
+
+    raise ValueError(f"Invalid part: {part}")
 
 
-with open(os.path.join(os.path.dirname(__file__), "input.txt")) as f:
-    puzzle_input = f.read()
+if __name__ == "__main__":
+    with open(os.path.join(os.path.dirname(__file__), "input.txt")) as f:
+        puzzle_input = f.read()
 
-part_one(puzzle_input)
-part_two(puzzle_input)
+    print(part_one(puzzle_input))
+    print(part_two(puzzle_input))
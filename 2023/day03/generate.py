@@ -0,0 +1,33 @@
+import random
+
+# Roughly the width and height of the engine schematic in a real puzzle input
+SIZE = 140
+
+SYMBOLS = "*#+$/@=%&-"
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate a `size` x `size` engine schematic with numbers and symbols
+    scattered across it, including plenty of gears
+    """
+    rng = random.Random(seed)
+
+    grid = [["."] * size for _ in range(size)]
+
+    for row in grid:
+        j = rng.randint(0, 3)
+
+        while j < size:
+            if rng.random() < 0.5:
+                # Place a number, leaving at least one space before the next
+                number = str(rng.randint(1, 999))[: size - j]
+                row[j : j + len(number)] = number
+                j += len(number) + rng.randint(1, 4)
+            else:
+                if rng.random() < 0.3:
+                    row[j] = "*" if rng.random() < 0.4 else rng.choice(SYMBOLS)
+
+                j += rng.randint(2, 5)
+
+    return "\n".join("".join(row) for row in grid) + "\n"
@@ -1,7 +1,20 @@
 import os
+import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
 
-def part_one(puzzle_input: str) -> None:
+from aoc.grid import Grid
+
+DIGITS = b"0123456789"
+EMPTY = ord(".")
+GEAR = ord("*")
+
+
+def part_one(puzzle_input: str) -> int:
+    """
+    The reference solution, kept from before the port to `Grid`. `solve()`
+    uses `part_one_grid()`, which `python -m aoc.variants` checks against it.
+    """
     array = puzzle_input.strip().splitlines()
 
     # A list of directions adjacent to a square
@@ -62,10 +75,14 @@ def part_one(puzzle_input: str) -> None:
 
         i += 1
 
-    print(result)
+    return result
 
 
-def part_two(puzzle_input: str) -> None:
+def part_two(puzzle_input: str) -> int:
+    """
+    The reference solution, kept from before the port to `Grid`. `solve()`
+    uses `part_two_grid()`, which `python -m aoc.variants` checks against it.
+    """
     array = puzzle_input.strip().splitlines()
 
     directions: list[tuple[int, int]] = [
@@ -133,11 +150,130 @@ def part_two(puzzle_input: str) -> None:
         if len(numbers) == 2:
             result += numbers[0] * numbers[1]
 
-    print(result)
+    return result
+
+
+def part_one_grid(puzzle_input: str) -> int:
+    """
+    The same as `part_one()`, on a flat `Grid` with a border of empty
+    squares, so the neighbours of a number need no bounds checks
+    """
+    # Parse the puzzle input as a grid, surrounded by a border of empty squares,
+    # so we never need to check whether we are still within the grid
+    grid = Grid.parse(puzzle_input, border=".")
+    cells = grid.cells
+
+    result = 0
+
+    # Loop through every character in the grid, row by row
+    for i in range(grid.height):
+        j = grid.index(i, 0)
+        end_of_row = j + grid.width
+
+        while j < end_of_row:
+            # If the character is a number...
+            if cells[j] in DIGITS:
+                start = j
+
+                # Find the end character of the number (the border is never a number)
+                while cells[j] in DIGITS:
+                    j += 1
+
+                end = j
+
+                # Iterate through all characters in the number
+                for k in range(start, end):
+                    # Iterate in all directions around the character
+                    for step in grid.diagonal_neighbours:
+                        char = cells[k + step]
+
+                        # Check if the adjacent character is a symbol (not a number or a `.`)
+                        if char != EMPTY and char not in DIGITS:
+                            # Since we have found a symbol, add the value of the number to the final result, and break
+                            result += int(cells[start:end])
+                            break
+                    else:
+                        # Otherwise, continue to the next direction
+                        continue
+
+                    # If we reach here, we have found an adjacent symbol, therefore break
+                    break
+            else:
+                j += 1
+
+    return result
+
+
+def part_two_grid(puzzle_input: str) -> int:
+    """
+    The same as `part_two()`, on a flat `Grid` with a border of empty
+    squares
+    """
+    grid = Grid.parse(puzzle_input, border=".")
+    cells = grid.cells
+
+    result = 0
+
+    # Gears is a dict that will contain the index of each gear, and a list of
+    # numbers that are adjacent to each gear
+    gears: dict[int, list[int]] = {}
+
+    for i in range(grid.height):
+        j = grid.index(i, 0)
+        end_of_row = j + grid.width
+
+        while j < end_of_row:
+            if cells[j] in DIGITS:
+                start = j
+
+                while cells[j] in DIGITS:
+                    j += 1
+
+                end = j
+
+                for k in range(start, end):
+                    for step in grid.diagonal_neighbours:
+                        gear = k + step
+
+                        # Check to see if we are at a gear
+                        if cells[gear] == GEAR:
+                            number = int(cells[start:end])
+
+                            # Add the number to the `gears` dict
+                            if gear not in gears:
+                                gears[gear] = []
+                            gears[gear].append(number)
+
+                            break
+                    else:
+                        continue
+
+                    break
+            else:
+                j += 1
+
+    # Loop through each gear that was found
+    for numbers in gears.values():
+        # If there are exactly two numbers adjacent to this gear, add the
+        # gear ratio to the final result
+        if len(numbers) == 2:
+            result += numbers[0] * numbers[1]
+
+    return result
+
+
+def solve(part: int, puzzle_input: str) -> int:
+    if part == 1:
+        return part_one_grid(puzzle_input)
+    if part == 2:
+        return part_two_grid(puzzle_input)
+
+    raise ValueError(f"Invalid part: {part}")
 
 
-with open(os.path.join(os.path.dirname(__file__), "input.txt")) as f:
-    puzzle_input = f.read()
+if __name__ == "__main__":
+    with open(os.path.join(os.path.dirname(__file__), "input.txt")) as f:
+        puzzle_input = f.read()
 
-part_one(puzzle_input)
-part_two(puzzle_input)
+    print(solve(1, puzzle_input))
+    print(solve(2, puzzle_input))
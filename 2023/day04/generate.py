@@ -0,0 +1,37 @@
+import random
+
+# Roughly the number of cards in a real puzzle input
+SIZE = 200
+
+WINNING = 10
+NUMBERS = 25
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate `size` scratchcards, each with 10 winning numbers and 25 numbers
+    of our own. No card wins copies of cards beyond the end of the table.
+    """
+    rng = random.Random(seed)
+
+    width = len(str(size))
+
+    lines: list[str] = []
+
+    for i in range(1, size + 1):
+        winning = rng.sample(range(1, 100), WINNING)
+
+        matches = min(size - i, rng.choice([0, 0, 0, rng.randint(0, WINNING)]))
+
+        others = [n for n in range(1, 100) if n not in winning]
+        numbers = rng.sample(winning, matches) + rng.sample(others, NUMBERS - matches)
+        rng.shuffle(numbers)
+
+        lines.append(
+            f"Card {i:>{width}}: "
+            + " ".join(f"{n:>2}" for n in winning)
+            + " | "
+            + " ".join(f"{n:>2}" for n in numbers)
+        )
+
+    return "\n".join(lines) + "\n"
@@ -1,13 +1,19 @@
 import os
 import re
+import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
 
-def part_one(puzzle_input: str) -> None:
-    array = puzzle_input.strip().splitlines()
+from aoc.inputs import Input, lines
 
+# `solve()` can be passed the memory-mapped input file
+MAPPED_INPUT = True
+
+
+def part_one(puzzle_input: Input) -> int:
     result = 0
 
-    for line in array:
+    for line in lines(puzzle_input):
         match = re.search(r"^.*:(.*)\|(.*)$", line)
         assert match is not None
 
@@ -25,15 +31,17 @@ def part_one(puzzle_input: str) -> None:
 
         result += score
 
-    print(result)
-
+    return result
 
-def part_two(puzzle_input: str) -> None:
-    array = puzzle_input.strip().splitlines()
 
+def part_two(puzzle_input: Input) -> int:
+    # The number of copies won of each card which has not been reached yet, so
+    # only the next few cards are kept
     cards: dict[int, int] = {}
 
-    for line in array:
+    result = 0
+
+    for line in lines(puzzle_input):
         match = re.search(r"^.*?(\d+):(.*)\|(.*)$", line)
         assert match is not None
 
@@ -41,20 +49,34 @@ def part_two(puzzle_input: str) -> None:
         winning_numbers = set(match.group(2).split())
         my_numbers = list(match.group(3).split())
 
-        cards[id] = cards.get(id, 0) + 1
+        # The original card, plus any copies won from earlier cards
+        copies = cards.pop(id, 0) + 1
+        result += copies
 
         i = 1
 
         for number in my_numbers:
             if number in winning_numbers:
-                cards[id + i] = cards.get(id + i, 0) + cards[id]
+                cards[id + i] = cards.get(id + i, 0) + copies
                 i += 1
 
-    result = sum(cards.values())
-    print(result)
+    # Also count any copies of cards past the end of the table
+    result += sum(cards.values())
+    return result
+
+
+def solve(part: int, puzzle_input: Input) -> int:
+    if part == 1:
+        return part_one(puzzle_input)
+    if part == 2:
+        return part_two(puzzle_input)
+
+    raise ValueError(f"Invalid part: {part}")
+
 
-with open(os.path.join(os.path.dirname(__file__), "input.txt")) as f:
-    puzzle_input = f.read()
+if __name__ == "__main__":
+    with open(os.path.join(os.path.dirname(__file__), "input.txt")) as f:
+        puzzle_input = f.read()
 
-part_one(puzzle_input)
-part_two(puzzle_input)
+    print(part_one(puzzle_input))
+    print(part_two(puzzle_input))
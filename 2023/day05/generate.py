@@ -0,0 +1,63 @@
+import random
+
+# Roughly the number of lines in each almanac map of a real puzzle input
+SIZE = 30
+
+MAPS = [
+    "seed-to-soil",
+    "soil-to-fertilizer",
+    "fertilizer-to-water",
+    "water-to-light",
+    "light-to-temperature",
+    "temperature-to-humidity",
+    "humidity-to-location",
+]
+
+LIMIT = 2**32
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate an almanac with 10 seed ranges and seven maps of `size` lines
+
+    Within each map the source ranges do not overlap, and neither do the
+    destination ranges, like the real input.
+    """
+    rng = random.Random(seed)
+
+    # `part_one()` and `part_two()` expect the last map to have at least two
+    # lines
+    size = max(2, size)
+
+    def split(count: int) -> list[tuple[int, int]]:
+        """Split `[0, LIMIT)` into `count` random consecutive ranges"""
+        cuts = sorted(rng.sample(range(1, LIMIT), count - 1))
+        return list(zip([0] + cuts, cuts + [LIMIT]))
+
+    seeds: list[int] = []
+
+    for start, end in rng.sample(split(20), 10):
+        length = rng.randint(1, min(end - start, LIMIT // 20))
+        seeds += [rng.randint(start, end - length), length]
+
+    sections = [f"seeds: {' '.join(map(str, seeds))}"]
+
+    for name in MAPS:
+        sources = split(size + 1)
+        destinations = sources[:]
+        rng.shuffle(destinations)
+
+        lines: list[str] = []
+
+        # Pair up ranges of equal length by truncating the longer one, and
+        # leave one range unmapped
+        for (source, source_end), (destination, destination_end) in zip(
+            sources[:-1], destinations[1:]
+        ):
+            length = min(source_end - source, destination_end - destination)
+            lines.append(f"{destination} {source} {length}")
+
+        rng.shuffle(lines)
+        sections.append(f"{name} map:\n" + "\n".join(lines))
+
+    return "\n\n".join(sections) + "\n"
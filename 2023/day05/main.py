@@ -1,9 +1,21 @@
 import os
 import re
+import sys
 from textwrap import dedent
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from aoc.intervals import IntervalMap, IntervalSet
+from aoc.model import model
+
+
+@model
+def parse(puzzle_input: str) -> tuple[list[int], list[list[tuple[int, ...]]]]:
+    """
+    Parse the puzzle input into the list of seeds, and a list of almanac maps. Each
+    almanac map is a list of (destination, source, range length) tuples.
+    """
 
-def part_one(puzzle_input: str) -> None:
     # This regex is used to extract the seeds and the almanac maps from the puzzle input
     pattern_raw = dedent(
         r"""
@@ -42,139 +54,90 @@ def part_one(puzzle_input: str) -> None:
     groups: list[list[str]] = [group.split("\n") for group in match.groups()]
 
     # Take the seeds from the first group, as a list of integers
-    seeds = map(int, groups[0][0].split(" "))
+    seeds = list(map(int, groups[0][0].split(" ")))
 
-    # All other capture groups are the almanac maps
-    almanac_maps = groups[1:]
+    # All other capture groups are the almanac maps. Extract the destination, source
+    # and range from each line in each map
+    almanac_maps = [
+        [tuple(map(int, line.split(" "))) for line in almanac_map]
+        for almanac_map in groups[1:]
+    ]
 
-    result = float("inf")
+    return seeds, almanac_maps
 
-    for seed in seeds:
-        # `current_value` is the value as it is mapped through each almanac map
-        current_value = seed
 
-        # Loop through each almanac map
-        for almanac_map in almanac_maps:
-            for line in almanac_map:
-                # Extract the destination, source and range from each line in the map
-                destination, source, range_length = map(int, line.split(" "))
+def build_maps(almanac_maps: list[list[tuple[int, ...]]]) -> list[IntervalMap]:
+    """
+    Convert each almanac map into a piecewise-linear map, which adds
+    `destination - source` to the values in each source range. If the source
+    ranges overlap, the first line that matches a value is used.
+    """
+    return [
+        IntervalMap(
+            (source, source + range_length, destination - source)
+            for destination, source, range_length in almanac_map
+        )
+        for almanac_map in almanac_maps
+    ]
 
-                # If the current value falls within the range from the source, then map it to the destination
-                if source <= current_value < source + range_length:
-                    current_value = destination + (current_value - source)
-                    break
 
-                # Otherwise, move to the next line in the map
+def part_one(puzzle_input: str) -> int:
+    seeds, almanac_maps = parse(puzzle_input)
+    maps = build_maps(almanac_maps)
+
+    result = float("inf")
+
+    for seed in seeds:
+        # `current_value` is the value as it is mapped through each almanac map.
+        # Values which are not in any range of a map are not transformed.
+        current_value = seed
 
-            # If none of the lines in the almanac map matched the current value, then the
-            # value does not need to be transformed
+        for almanac_map in maps:
+            current_value = almanac_map[current_value]
 
         # Once the value has been transformed through each almanac map, keep track of the
         # lowest final value (location) so far
         result = min(result, current_value)
 
-    print(result)
+    return result
 
 
-def part_two(puzzle_input: str) -> None:
+def part_two(puzzle_input: str) -> int:
     """
-    The solution to Part 2 is similar to Part 1, with an added optimisation.
-
-    We do not need to calculate the final location for every single seed, as in the vast
-    majority of cases, increasing the seed number by 1 will also increase the final location
-    by 1.
-
-    We only need to re-calculate whenever we change the line we are using in one of the
-    almanac maps.
+    The solution to Part 2 maps whole ranges of seeds at once, rather than
+    individual seeds.
 
-    As we iterate through each almanac map for a particular seed, keep track of the number of
-    points by which we would have to increase the current value before we would have to change
-    the line we are using for that almanac map. The lowest of these values across all the maps
-    gives us the value by which we can increase the seed number by, knowing that the final
-    location of all the seeds we skipped will not be lower than the value we just calculated.
+    The seed ranges are stored as a set of intervals. Each almanac map splits
+    the intervals wherever they cross the start or end of one of its source
+    ranges, and shifts each piece to its destination. After the last map, the
+    lowest location is the start of the first interval.
     """
 
-    pattern_raw = dedent(
-        r"""
-        ^seeds: (.*)
-
-        seed-to-soil map:
-        ((?:.|\n)*)
-
-        soil-to-fertilizer map:
-        ((?:.|\n)*)
-
-        fertilizer-to-water map:
-        ((?:.|\n)*)
-
-        water-to-light map:
-        ((?:.|\n)*)
-
-        light-to-temperature map:
-        ((?:.|\n)*)
+    seeds, almanac_maps = parse(puzzle_input)
 
-        temperature-to-humidity map:
-        ((?:.|\n)*)
-
-        humidity-to-location map:
-        ((?:.|\n)*)$
-        """.strip(
-            "\n"
-        )
+    # Each pair of values is the start and number of seeds in a range
+    values = IntervalSet(
+        (seeds[i], seeds[i] + seeds[i + 1]) for i in range(0, len(seeds), 2)
     )
 
-    pattern = re.compile(pattern_raw, re.MULTILINE)
-    match = re.search(pattern, puzzle_input.strip())
-    assert match is not None
-
-    groups: list[list[str]] = [group.split("\n") for group in match.groups()]
-
-    seeds = list(map(int, groups[0][0].split(" ")))
-    almanac_maps = groups[1:]
-
-    result = float("inf")
-
-    # Iterate through each pair of values
-    for i in range(0, len(seeds), 2):
-        start, number_of_seeds = seeds[i], seeds[i + 1]
-        seed = start
-
-        while seed < start + number_of_seeds:
-            current_value = seed
-
-            # `lowest` will be the value by which we would have to increase `seed`
-            # by before we use a different line in one of the almanac maps
-            lowest = float("inf")
-
-            for almanac_map in almanac_maps:
-                for line in almanac_map:
-                    destination, source, range_length = map(int, line.split(" "))
-
-                    if source <= current_value < source + range_length:
-                        # Work out the difference between the end of the range and the
-                        # current value
-                        # Update `lowest` if it is smaller than what we have seen so far
-                        lowest = min(lowest, source + range_length - current_value)
-
-                        current_value = destination + (current_value - source)
-                        break
+    for almanac_map in build_maps(almanac_maps):
+        values = almanac_map.map(values)
 
-                    # If we do not use the line in the almanac map, work out how much
-                    # we would have to increase the current value by until we would
-                    # use that line
-                    # Update `latest` if it is smaller than what we have seen so far
-                    if source > current_value:
-                        lowest = min(lowest, source - current_value)
+    return values.start
 
-            result = min(result, current_value)
 
-            seed += lowest
+def solve(part: int, puzzle_input: str) -> int:
+    if part == 1:
+        return part_one(puzzle_input)
+    if part == 2:
+        return part_two(puzzle_input)
 
-    print(result)
+    raise ValueError(f"Invalid part: {part}")
 
 
-with open(os.path.join(os.path.dirname(__file__), "input.txt")) as f:
-    puzzle_input = f.read()
+if __name__ == "__main__":
+    with open(os.path.join(os.path.dirname(__file__), "input.txt")) as f:
+        puzzle_input = f.read()
 
-part_one(puzzle_input)
-part_two(puzzle_input)
+    print(part_one(puzzle_input))
+    print(part_two(puzzle_input))
@@ -0,0 +1,29 @@
+import random
+
+# Roughly the number of races in a real puzzle input
+SIZE = 4
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate `size` races which can each be won, and which can still be won
+    when the digits are joined together into one long race for part 2
+    """
+    rng = random.Random(seed)
+
+    while True:
+        times = [rng.randint(30, 99) for _ in range(size)]
+        distances = [rng.randint(times[i] * 2, times[i] ** 2 // 4 - 1) for i in range(size)]
+
+        time = int("".join(map(str, times)))
+        distance = int("".join(map(str, distances)))
+
+        if time**2 > 4 * distance:
+            break
+
+    width = max(len(str(n)) for n in times + distances) + 3
+
+    time_string = "".join(f"{n:>{width}}" for n in times)
+    distance_string = "".join(f"{n:>{width}}" for n in distances)
+
+    return f"Time:    {time_string}\nDistance:{distance_string}\n"
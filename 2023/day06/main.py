@@ -3,7 +3,7 @@ import os
 import re
 
 
-def part_one(puzzle_input: str) -> None:
+def part_one(puzzle_input: str) -> int:
     """
     We can write the distance travelled by the boat, d, as a function of the time
     the button is held for, t:
@@ -50,10 +50,10 @@ def part_one(puzzle_input: str) -> None:
             # Multiply the result by the number of solutions found
             result *= time2 - time1 + 1
 
-    print(result)
+    return result
 
 
-def part_two(puzzle_input: str) -> None:
+def part_two(puzzle_input: str) -> int:
     time_string, distance_string = puzzle_input.strip().split("\n")
 
     # This time, extract one single time and one single distance
@@ -65,11 +65,21 @@ def part_two(puzzle_input: str) -> None:
 
     result = time2 - time1 + 1
 
-    print(result)
+    return result
 
 
-with open(os.path.join(os.path.dirname(__file__), "input.txt")) as f:
-    puzzle_input = f.read()
+def solve(part: int, puzzle_input: str) -> int:
+    if part == 1:
+        return part_one(puzzle_input)
+    if part == 2:
+        return part_two(puzzle_input)
 
-part_one(puzzle_input)
-part_two(puzzle_input)
+    raise ValueError(f"Invalid part: {part}")
+
+
+if __name__ == "__main__":
+    with open(os.path.join(os.path.dirname(__file__), "input.txt")) as f:
+        puzzle_input = f.read()
+
+    print(part_one(puzzle_input))
+    print(part_two(puzzle_input))
@@ -0,0 +1,32 @@
+import random
+
+# Roughly the number of hands in a real puzzle input
+SIZE = 1000
+
+CARDS = "23456789TJQKA"
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate `size` distinct hands, each with a bid
+
+    Hands are drawn from a small pool of cards first, so that every hand type
+    (and plenty of jokers) turns up, like in the real input.
+    """
+    rng = random.Random(seed)
+
+    # There are only 13^5 possible hands
+    size = min(size, len(CARDS) ** 5)
+
+    hands: list[str] = []
+    seen: set[str] = set()
+
+    while len(hands) < size:
+        pool = rng.sample(CARDS, rng.randint(1, 5))
+        hand = "".join(rng.choice(pool) for _ in range(5))
+
+        if hand not in seen:
+            seen.add(hand)
+            hands.append(hand)
+
+    return "\n".join(f"{hand} {rng.randint(1, 1000)}" for hand in hands) + "\n"
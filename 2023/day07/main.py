@@ -1,10 +1,41 @@
 import heapq
 import os
-
-
-def part_one(puzzle_input: str) -> None:
-    array = puzzle_input.strip().splitlines()
-
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from aoc.inputs import Input, lines
+
+# `solve()` can be passed the memory-mapped input file
+MAPPED_INPUT = True
+
+# The type of each hand, from 1 (High card) up to 7 (Five of a kind), by the
+# number of times each card appears in the hand, with the highest value first.
+# These tables are built once, and shared by every input solved by the process.
+HAND_TYPES: dict[tuple[int, ...], int] = {
+    # Five of a kind
+    (5,): 7,
+    # Four of a kind
+    (4, 1): 6,
+    # Full house
+    (3, 2): 5,
+    # Three of a kind
+    (3, 1, 1): 4,
+    # Two pair
+    (2, 2, 1): 3,
+    # One pair
+    (2, 1, 1, 1): 2,
+    # High card
+    (1, 1, 1, 1, 1): 1,
+}
+
+# The letters which replace the non-numerical cards in each part, for
+# `str.translate()`
+STRENGTHS = str.maketrans("TJQKA", "VWXYZ")
+JOKER_STRENGTHS = str.maketrans("TJQKA", "V1XYZ")
+
+
+def part_one(puzzle_input: Input) -> int:
     def get_hand_type(hand: str) -> int:
         """
         This function is used to get the hand type for a particular hand.
@@ -23,32 +54,7 @@ def part_one(puzzle_input: str) -> None:
         # with the highest value first
         values = sorted(cards.values(), reverse=True)
 
-        # Five of a kind - [5]
-        if values[0] == 5:
-            return 7
-
-        # Four of a kind - [4, 1]
-        if values[0] == 4:
-            return 6
-
-        if values[0] == 3:
-            # Full house - [3, 2]
-            if values[1] == 2:
-                return 5
-
-            # Three of a kind - [3, 1, 1]
-            return 4
-
-        if values[0] == 2:
-            # Two pair - [2, 2, 1]
-            if len(values) == 3:
-                return 3
-
-            # One pair - [2, 1, 1, 1]
-            return 2
-
-        # High card - [1, 1, 1, 1, 1]
-        return 1
+        return HAND_TYPES[tuple(values)]
 
     def get_hand_strength(hand: str) -> str:
         """
@@ -60,13 +66,7 @@ def part_one(puzzle_input: str) -> None:
         ... < '9' < 'T' < 'J' < 'Q' < 'K' < 'A'
         """
 
-        return (
-            hand.replace("T", "V")
-            .replace("J", "W")
-            .replace("Q", "X")
-            .replace("K", "Y")
-            .replace("A", "Z")
-        )
+        return hand.translate(STRENGTHS)
 
     # We use a heap to order the hands. The hands are first ordered by their type from the
     # get_hand_type() function. If the types are equal, they will then be ordered by their
@@ -75,7 +75,7 @@ def part_one(puzzle_input: str) -> None:
     # This is not used for sorting, but to help in calculating the total winnings later.
     heap: list[tuple[int, str, int]] = []
 
-    for line in array:
+    for line in lines(puzzle_input):
         hand, bid = line.split(" ")
         hand_type = get_hand_type(hand)
         hand_strength = get_hand_strength(hand)
@@ -97,12 +97,10 @@ def part_one(puzzle_input: str) -> None:
         # Increment the rank
         rank += 1
 
-    print(result)
-
+    return result
 
-def part_two(puzzle_input: str) -> None:
-    array = puzzle_input.strip().splitlines()
 
+def part_two(puzzle_input: Input) -> int:
     def get_hand_type(hand: str) -> int:
         """
         This function is similar to Part 1, with added logic for the joker cards.
@@ -146,19 +144,7 @@ def part_two(puzzle_input: str) -> None:
 
         values = sorted(cards.values(), reverse=True)
 
-        if values[0] == 5:
-            return 7
-        if values[0] == 4:
-            return 6
-        if values[0] == 3:
-            if values[1] == 2:
-                return 5
-            return 4
-        if values[0] == 2:
-            if len(values) == 3:
-                return 3
-            return 2
-        return 1
+        return HAND_TYPES[tuple(values)]
 
     def get_hand_strength(hand: str) -> str:
         """
@@ -170,17 +156,11 @@ def part_two(puzzle_input: str) -> None:
          'J' < '2' < '3' < ... < '9' < 'T' < ...
         """
 
-        return (
-            hand.replace("T", "V")
-            .replace("J", "1")
-            .replace("Q", "X")
-            .replace("K", "Y")
-            .replace("A", "Z")
-        )
+        return hand.translate(JOKER_STRENGTHS)
 
     heap: list[tuple[int, str, int]] = []
 
-    for line in array:
+    for line in lines(puzzle_input):
         hand, bid = line.split(" ")
         hand_type = get_hand_type(hand)
         hand_strength = get_hand_strength(hand)
@@ -196,11 +176,21 @@ def part_two(puzzle_input: str) -> None:
         result += rank * bid
         rank += 1
 
-    print(result)
+    return result
+
+
+def solve(part: int, puzzle_input: Input) -> int:
+    if part == 1:
+        return part_one(puzzle_input)
+    if part == 2:
+        return part_two(puzzle_input)
+
+    raise ValueError(f"Invalid part: {part}")
 
 
-with open(os.path.join(os.path.dirname(__file__), "input.txt")) as f:
-    puzzle_input = f.read()
+if __name__ == "__main__":
+    with open(os.path.join(os.path.dirname(__file__), "input.txt")) as f:
+        puzzle_input = f.read()
 
-part_one(puzzle_input)
-part_two(puzzle_input)
+    print(part_one(puzzle_input))
+    print(part_two(puzzle_input))
@@ -0,0 +1,68 @@
+import random
+import string
+
+# Roughly the number of nodes in a real puzzle input
+SIZE = 750
+
+GHOSTS = 6
+
+LETTERS = string.ascii_uppercase
+
+# Letters for the end of a node name that is neither a start nor an end
+MIDDLE = LETTERS[1:-1]
+
+
+def is_prime(n: int) -> bool:
+    return n > 1 and all(n % d for d in range(2, int(n**0.5) + 1))
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate a network of roughly `size` nodes, walked by six ghosts
+
+    Each ghost starts on a node ending in "A" (one of which is "AAA"), and
+    walks along a chain of pairs of nodes. Whichever instruction is followed,
+    every step moves one pair further along, and the last pair leads to the
+    ghost's end node (ending in "Z"), which loops back to the start of the
+    chain. Each chain has a different prime length, so the number of steps
+    for each ghost to reach its end, and then reach it again, is the same.
+    """
+    rng = random.Random(seed)
+
+    # Chain lengths, as distinct primes of (roughly) equal size
+    target = max(3, (size // GHOSTS - 2) // 2)
+    primes = [n for n in range(2, 2 * target + 100) if is_prime(n)]
+    primes.sort(key=lambda n: abs(n - target))
+    lengths = primes[:GHOSTS]
+    rng.shuffle(lengths)
+
+    used = {"AAA", "ZZZ"}
+
+    def new_name(last: str | None = None) -> str:
+        while True:
+            name = "".join(rng.choices(LETTERS, k=2)) + (last or rng.choice(MIDDLE))
+
+            if name not in used:
+                used.add(name)
+                return name
+
+    lines: list[str] = []
+
+    for ghost, length in enumerate(lengths):
+        start = "AAA" if ghost == 0 else new_name("A")
+        end = "ZZZ" if ghost == 0 else new_name("Z")
+
+        chain = [(new_name(), new_name()) for _ in range(length - 1)] + [(end, end)]
+
+        for i, (a, b) in enumerate(chain[:-1]):
+            lines.append(f"{a} = ({chain[i + 1][0]}, {chain[i + 1][1]})")
+            lines.append(f"{b} = ({chain[i + 1][1]}, {chain[i + 1][0]})")
+
+        lines.append(f"{start} = ({chain[0][0]}, {chain[0][1]})")
+        lines.append(f"{end} = ({chain[0][1]}, {chain[0][0]})")
+
+    rng.shuffle(lines)
+
+    instructions = "".join(rng.choices("LR", k=rng.choice([263, 269, 271, 277, 281])))
+
+    return f"{instructions}\n\n" + "\n".join(lines) + "\n"
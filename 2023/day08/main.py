@@ -1,8 +1,18 @@
 import re
 import os
+import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
 
-def part_one(puzzle_input: str) -> None:
+from aoc.model import model
+
+
+@model
+def parse(puzzle_input: str) -> tuple[str, dict[str, dict[str, str]]]:
+    """
+    Parse the puzzle input into the instructions, and the left and right nodes of
+    each node
+    """
     # Extract the instructions and the set of nodes from the puzzle input
     instructions, nodes_string = puzzle_input.strip().split("\n\n")
 
@@ -23,6 +33,12 @@ def part_one(puzzle_input: str) -> None:
         nodes[node]["L"] = left
         nodes[node]["R"] = right
 
+    return instructions, nodes
+
+
+def part_one(puzzle_input: str) -> int:
+    instructions, nodes = parse(puzzle_input)
+
     # Start from node "AAA"
     node = "AAA"
     count = 0
@@ -40,27 +56,16 @@ def part_one(puzzle_input: str) -> None:
         count += 1
 
     # The final result is equal to the number of iterations spent in the loop
-    print(count)
+    return count
 
 
-def part_two(puzzle_input: str) -> None:
-    instructions, nodes_string = puzzle_input.strip().split("\n\n")
-
-    nodes: dict[str, dict[str, str]] = {}
+def part_two(puzzle_input: str) -> int:
+    instructions, nodes = parse(puzzle_input)
 
     # `starting_nodes` will be a list of all the starting nodes (those ending in "A")
     starting_nodes: list[str] = []
 
-    for line in nodes_string.splitlines():
-        match = re.match(r"(\w{3}) = \((\w{3}), (\w{3})\)", line)
-        assert match is not None
-
-        node, left, right = match.groups()
-
-        nodes[node] = {}
-        nodes[node]["L"] = left
-        nodes[node]["R"] = right
-
+    for node in nodes:
         if node.endswith("A"):
             # We have found a starting node, therefore add it to the list
             starting_nodes.append(node)
@@ -103,11 +108,21 @@ def part_two(puzzle_input: str) -> None:
 
     result = lcm(iterations)
 
-    print(result)
+    return result
+
+
+def solve(part: int, puzzle_input: str) -> int:
+    if part == 1:
+        return part_one(puzzle_input)
+    if part == 2:
+        return part_two(puzzle_input)
+
+    raise ValueError(f"Invalid part: {part}")
 
 
-with open(os.path.join(os.path.dirname(__file__), "input.txt")) as f:
-    puzzle_input = f.read()
+if __name__ == "__main__":
+    with open(os.path.join(os.path.dirname(__file__), "input.txt")) as f:
+        puzzle_input = f.read()
 
-part_one(puzzle_input)
-part_two(puzzle_input)
+    print(part_one(puzzle_input))
+    print(part_two(puzzle_input))
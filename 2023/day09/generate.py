@@ -0,0 +1,30 @@
+import random
+
+# Roughly the number of sequences in a real puzzle input
+SIZE = 200
+
+LENGTH = 21
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate `size` sequences of 21 values, each given by a polynomial of
+    degree less than 20, so that the differences always reach zero
+    """
+    rng = random.Random(seed)
+
+    lines: list[str] = []
+
+    for _ in range(size):
+        degree = rng.randint(1, 7)
+        coefficients = [rng.randint(-10, 10) for _ in range(degree + 1)]
+        offset = rng.randint(-10, 10)
+
+        values = [
+            sum(c * (x + offset) ** k for k, c in enumerate(coefficients))
+            for x in range(LENGTH)
+        ]
+
+        lines.append(" ".join(map(str, values)))
+
+    return "\n".join(lines) + "\n"
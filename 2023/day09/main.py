@@ -1,80 +1,150 @@
+import math
 import os
+import sys
+from collections import defaultdict
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
 
-def part_one(puzzle_input: str) -> None:
-    def recurse(numbers: list[int]) -> int:
-        """
-        Recursive function to return the next value for a particular row
-        """
+from aoc import backend
+from aoc.inputs import Input, lines
 
-        # Base case: The row is full of 0's therefore return 0
-        if all(num == 0 for num in numbers):
-            return 0
+# `solve()` can be passed the memory-mapped input file
+MAPPED_INPUT = True
 
-        next_numbers = []
 
-        # Calculate the difference between each number and the number before,
-        # add to `next_numbers` list
-        for i in range(1, len(numbers)):
-            next_numbers.append(numbers[i] - numbers[i - 1])
+def part_one(puzzle_input: Input) -> int:
+    def extrapolate(numbers: list[int]) -> int:
+        """
+        Function to return the next value for a particular row
 
-        # Call the function recursively with the next row of numbers
-        value = recurse(next_numbers)
+        The next value is the last value in the row, plus the next value of the
+        row of differences, and so on until the row is full of 0's. So rather
+        than recursing on each row of differences, add up the last value of each
+        row in a loop, keeping only the current row
+        """
+        value = 0
 
-        # The value we receive is the difference that should be added to the
-        # last value in the current row
-        return numbers[-1] + value
+        # Stop when the row is full of 0's, as the next value of that row is 0
+        while not all(num == 0 for num in numbers):
+            # The last value in the current row is added to the next value
+            value += numbers[-1]
 
-    array = puzzle_input.strip().splitlines()
+            # Calculate the difference between each number and the number before
+            numbers = [numbers[i] - numbers[i - 1] for i in range(1, len(numbers))]
+
+        return value
 
     result = 0
 
     # Iterate through the rows in the puzzle input
-    for line in array:
+    for line in lines(puzzle_input):
         # Transform the string into a list of integers
         numbers = list(map(int, line.split(" ")))
 
-        # Call the recursive function, add the return value to the final result
-        result += recurse(numbers)
+        # Add the next value of the row to the final result
+        result += extrapolate(numbers)
 
-    print(result)
+    return result
 
 
-def part_two(puzzle_input: str) -> None:
-    def recurse(numbers: list[int]) -> int:
+def part_two(puzzle_input: Input) -> int:
+    def extrapolate(numbers: list[int]) -> int:
         """
-        The function is the same as in Part 1, except the value from the recursive
-        function is now subtracted from the first value in the current row
+        The function is the same as in Part 1, except the previous value is the
+        first value in the row, minus the previous value of the row of
+        differences, so the first values are added and subtracted in turn
         """
+        value = 0
+        sign = 1
 
-        if all(num == 0 for num in numbers):
-            return 0
+        while not all(num == 0 for num in numbers):
+            value += sign * numbers[0]
+            sign = -sign
 
-        next_numbers = []
+            numbers = [numbers[i] - numbers[i - 1] for i in range(1, len(numbers))]
 
-        for i in range(1, len(numbers)):
-            next_numbers.append(numbers[i] - numbers[i - 1])
+        return value
 
-        value = recurse(next_numbers)
+    result = 0
 
-        # Subtract the recursive function's return value from the first value in
-        # the current row
-        return numbers[0] - value
+    for line in lines(puzzle_input):
+        numbers = list(map(int, line.split(" ")))
 
-    array = puzzle_input.strip().splitlines()
+        result += extrapolate(numbers)
 
-    result = 0
+    return result
+
+
+def extrapolate_numpy(puzzle_input: Input, backwards: bool) -> int:
+    """
+    The sum of the next (or, if `backwards`, the previous) value of every row
 
-    for line in array:
+    Taking the differences until they are all 0 and adding them back up is the
+    same as extrapolating the polynomial through the row, so each value is a
+    fixed weighted sum of the numbers in the row, e.g. the next value after
+    `a, b, c` is `a - 3b + 3c`. The rows of each length are then extrapolated
+    with a single matrix product.
+    """
+    np = backend.numpy()
+
+    rows: dict[int, list[list[int]]] = defaultdict(list)
+
+    for line in lines(puzzle_input):
         numbers = list(map(int, line.split(" ")))
+        rows[len(numbers)].append(numbers)
+
+    result = 0
+
+    for n, group in rows.items():
+        if backwards:
+            weights = [(-1) ** i * math.comb(n, i + 1) for i in range(n)]
+        else:
+            weights = [(-1) ** (n - 1 - i) * math.comb(n, i) for i in range(n)]
+
+        try:
+            numbers = np.array(group, dtype=np.int64)
+            largest = int(np.abs(numbers).max()) * sum(map(abs, weights)) * len(group)
+        except OverflowError:
+            largest = 2**63
+
+        if largest < 2**63:
+            result += int((numbers @ np.array(weights, dtype=np.int64)).sum())
+        else:
+            # The sum could overflow 64-bit integers, so use Python's integers
+            result += sum(
+                sum(weight * number for weight, number in zip(weights, row))
+                for row in group
+            )
+
+    return result
+
+
+def part_one_numpy(puzzle_input: Input) -> int:
+    return extrapolate_numpy(puzzle_input, backwards=False)
+
+
+def part_two_numpy(puzzle_input: Input) -> int:
+    return extrapolate_numpy(puzzle_input, backwards=True)
+
+
+def solve(part: int, puzzle_input: Input) -> int:
+    if part == 1:
+        if backend.use_numpy():
+            return part_one_numpy(puzzle_input)
+
+        return part_one(puzzle_input)
+    if part == 2:
+        if backend.use_numpy():
+            return part_two_numpy(puzzle_input)
 
-        result += recurse(numbers)
+        return part_two(puzzle_input)
 
-    print(result)
+    raise ValueError(f"Invalid part: {part}")
 
 
-with open(os.path.join(os.path.dirname(__file__), "input.txt")) as f:
-    puzzle_input = f.read()
+if __name__ == "__main__":
+    with open(os.path.join(os.path.dirname(__file__), "input.txt")) as f:
+        puzzle_input = f.read()
 
-part_one(puzzle_input)
-part_two(puzzle_input)
+    print(part_one(puzzle_input))
+    print(part_two(puzzle_input))
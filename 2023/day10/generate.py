@@ -0,0 +1,99 @@
+import random
+
+# Roughly the width and height of the grid of pipes in a real puzzle input
+SIZE = 140
+
+# How many tiles wide each part of the loop's outline is
+SCALE = 3
+
+PIPES = {
+    frozenset("UD"): "|",
+    frozenset("LR"): "-",
+    frozenset("UR"): "L",
+    frozenset("UL"): "J",
+    frozenset("DL"): "7",
+    frozenset("DR"): "F",
+}
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate a `size` x `size` grid containing one large loop of pipe, with
+    junk pipes everywhere else (including inside the loop)
+
+    The loop is the outline of a thickened random tree. A tree has no holes
+    and its branches never touch diagonally, so the outline never touches
+    itself, and the tiles inside the loop form one connected area.
+    """
+    rng = random.Random(seed)
+
+    # Number of tree vertices in each direction
+    n = max(2, (size - 1) // (2 * SCALE))
+
+    # Grow a random tree over most of an `n` x `n` grid. Each vertex is placed
+    # at an even point of a finer lattice, and each edge at the point between.
+    start = (rng.randrange(n), rng.randrange(n))
+    visited = {start}
+    points = {(2 * start[0], 2 * start[1])}
+    frontier = [(start, (start[0] + dx, start[1] + dy)) for dx, dy in ((0, 1), (1, 0), (0, -1), (-1, 0))]
+
+    while frontier and len(visited) < n * n * 0.7:
+        a, b = frontier.pop(rng.randrange(len(frontier)))
+
+        if b in visited or not (0 <= b[0] < n and 0 <= b[1] < n):
+            continue
+
+        visited.add(b)
+        points.add((2 * b[0], 2 * b[1]))
+        points.add((a[0] + b[0], a[1] + b[1]))
+
+        frontier += [(b, (b[0] + dx, b[1] + dy)) for dx, dy in ((0, 1), (1, 0), (0, -1), (-1, 0))]
+
+    # Thicken each point into a square of tiles, offset by one so that the
+    # outline fits within the grid
+    region = {
+        (SCALE * x + i + 1, SCALE * y + j + 1)
+        for x, y in points
+        for i in range(SCALE)
+        for j in range(SCALE)
+    }
+
+    height = width = SCALE * (2 * n - 1) + 1
+
+    # The outline follows the corners of the tiles in the region. Corner (x, y)
+    # is the top-left corner of tile (x, y), and becomes a pipe in the grid.
+    connections: dict[tuple[int, int], set[str]] = {}
+
+    for x, y in region:
+        if (x - 1, y) not in region:
+            connections.setdefault((x, y), set()).add("R")
+            connections.setdefault((x, y + 1), set()).add("L")
+        if (x + 1, y) not in region:
+            connections.setdefault((x + 1, y), set()).add("R")
+            connections.setdefault((x + 1, y + 1), set()).add("L")
+        if (x, y - 1) not in region:
+            connections.setdefault((x, y), set()).add("D")
+            connections.setdefault((x + 1, y), set()).add("U")
+        if (x, y + 1) not in region:
+            connections.setdefault((x, y + 1), set()).add("D")
+            connections.setdefault((x + 1, y + 1), set()).add("U")
+
+    grid = [
+        [rng.choice("|-LJ7F...") for _ in range(width + 1)] for _ in range(height + 1)
+    ]
+
+    for (x, y), directions in connections.items():
+        grid[x - 1][y - 1] = PIPES[frozenset(directions)]
+
+    # Place the start on the loop, and clear any neighbours which are not part of
+    # the loop, so that the start only connects to the loop
+    sx, sy = rng.choice(sorted(connections))
+    grid[sx - 1][sy - 1] = "S"
+
+    for direction, (dx, dy) in (("U", (-1, 0)), ("D", (1, 0)), ("L", (0, -1)), ("R", (0, 1))):
+        x, y = sx + dx - 1, sy + dy - 1
+
+        if direction not in connections[(sx, sy)] and 0 <= x <= height and 0 <= y <= width:
+            grid[x][y] = "."
+
+    return "\n".join("".join(row) for row in grid) + "\n"
@@ -1,7 +1,16 @@
 import os
+import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
 
-def part_one(puzzle_input: str) -> None:
+from aoc.grid import Grid
+
+
+def part_one(puzzle_input: str) -> int:
+    """
+    The reference solution, kept from before the port to `Grid`. `solve()`
+    uses `part_one_grid()`, which `python -m aoc.variants` checks against it.
+    """
     array = puzzle_input.strip().splitlines()
 
     start: tuple[int, int] | None = None
@@ -97,10 +106,14 @@ def part_one(puzzle_input: str) -> None:
         if positions[0][:2] == positions[1][:2]:
             result = positions[0][3]
 
-    print(result)
+    return result
 
 
-def part_two(puzzle_input: str) -> None:
+def part_two(puzzle_input: str) -> int:
+    """
+    The reference solution, kept from before the port to `Grid`. `solve()`
+    uses `part_two_grid()`, which `python -m aoc.variants` checks against it.
+    """
     array = puzzle_input.strip().splitlines()
 
     start: tuple[int, int] | None = None
@@ -298,12 +311,276 @@ def part_two(puzzle_input: str) -> None:
             y += 1
         x += 1
 
-    print(result)
+    return result
+
+
+def pipe_moves() -> dict[str, dict[int, str]]:
+    """
+    A dict, where the key is the direction currently being moved in, and the
+    value is another dict where the key is the next pipe encountered, and the
+    value is the direction that we are now moving in after passing through the
+    pipe. For example, if we are moving right, and encounter a "7" pipe, then we
+    will now be moving down.
+
+    The pipes are given by their character code, as stored in the grid.
+    """
+    moves = {
+        "right": {
+            "-": "right",
+            "7": "down",
+            "J": "up",
+        },
+        "left": {
+            "-": "left",
+            "L": "up",
+            "F": "down",
+        },
+        "up": {
+            "|": "up",
+            "7": "left",
+            "F": "right",
+        },
+        "down": {
+            "|": "down",
+            "J": "left",
+            "L": "right",
+        },
+    }
+
+    return {
+        dir: {ord(pipe): next_dir for pipe, next_dir in pipes.items()}
+        for dir, pipes in moves.items()
+    }
+
+
+def part_one_grid(puzzle_input: str) -> int:
+    """
+    The same as `part_one()`, following the loop by adding offsets to
+    its index in a flat `Grid`
+    """
+    # Parse the grid, surrounded by a border of ground, which is never part of
+    # the loop
+    grid = Grid.parse(puzzle_input, border=".")
+    cells = grid.cells
+
+    # Find the index of the starting point
+    start = grid.find("S")
+
+    # dict that contains the offsets to move in a particular direction
+    directions: dict[str, int] = {
+        "right": grid.right,
+        "left": grid.left,
+        "up": grid.up,
+        "down": grid.down,
+    }
+
+    moves = pipe_moves()
+
+    # Posistions is a list that will initially contain the two valid points adjacent
+    # to the starting point
+    positions: list[tuple[int, str, int]] = []
+
+    # Iterate in the four directions around the starting point
+    for dir, step in directions.items():
+        index = start + step
+
+        # If True, then the adjacent square is a valid move from the starting point
+        # For example, if we are moving to the right from the starting point, and we
+        # encounter "|", this would not be a valid move, but "J" would be
+        if cells[index] in moves[dir]:
+            # index is the index of the pipe
+            # dir is the direction we are currently moving in
+            # `1` is the number of moves we have made from the starting point
+            positions.append((index, dir, 1))
+
+    result = None
+
+    while result is None:
+        index, dir, num = positions.pop(0)
+
+        # We can use the `moves` dict to quickly determine the new direction we are,
+        # moving in, after going through the pipe
+        next_dir = moves[dir][cells[index]]
+
+        # Add the new position to the `positions` list, incrementing the number of
+        # moves taken
+        positions.append((index + directions[next_dir], next_dir, num + 1))
+
+        # When we have manoeuvered around the whole loop, the indices of the two
+        # points in the list will be identical (although different directions), as
+        # well as the number of moves taken, therefore we can take the final number
+        # of moves from either position
+        if positions[0][0] == positions[1][0]:
+            result = positions[0][2]
+
+    return result
+
+
+def part_two_grid(puzzle_input: str) -> int:
+    """
+    The same as `part_two()`, on a flat `Grid`
+    """
+    grid = Grid.parse(puzzle_input, border=".")
+    cells = grid.cells
+
+    start = grid.find("S")
+
+    directions: dict[str, int] = {
+        "right": grid.right,
+        "left": grid.left,
+        "up": grid.up,
+        "down": grid.down,
+    }
+
+    moves = pipe_moves()
+
+    # We no longer need to keep track of the number of moves taken
+    positions: list[tuple[int, str]] = []
+
+    for dir, step in directions.items():
+        index = start + step
+
+        if cells[index] in moves[dir]:
+            positions.append((index, dir))
+
+    # The pipes in the loop, one byte per square
+    loop = bytearray(len(cells))
+    loop[start] = 1
+
+    while True:
+        index, dir = positions.pop(0)
+
+        # Iterate until we come across a point we have already seen
+        if loop[index]:
+            break
+
+        loop[index] = 1
+
+        next_dir = moves[dir][cells[index]]
+        positions.append((index + directions[next_dir], next_dir))
+
+    # Before calculating the enclosed loop, we need to replace the starting character
+    # with an appropriate pipe symbol. The following function is used to determine
+    # whether a symbol next to the starting character could be valid.
+    # For example, connects(start, "left") returns True if the pipe to the left of
+    # the starting square is in the loop, and the pipe could be reached from the
+    # starting square. For example, "L" is valid, but "J" is not. The border is
+    # never in the loop.
+    def connects(index: int, dir: str) -> bool:
+        index += directions[dir]
+        return bool(loop[index]) and cells[index] in moves[dir]
+
+    # The following code is used to replace the starting character "S" with the
+    # appropriate pipe character. For example, if "S" has valid pipes to the right
+    # and below, then it should be replaced with "F"
+    if connects(start, "left"):
+        if connects(start, "up"):
+            cells[start] = ord("J")
+        elif connects(start, "right"):
+            cells[start] = ord("-")
+        else:
+            # We have checked all other directions, therefore it must be down
+            # (assuming the puzzle input is valid)
+            cells[start] = ord("7")
+    elif connects(start, "right"):
+        if connects(start, "up"):
+            cells[start] = ord("L")
+        else:
+            # We do not need to check left here, as it was checked previously
+            cells[start] = ord("F")
+    else:
+        # If we reach here, the valid pipes must be above and below
+        cells[start] = ord("|")
+
+    # To calculate the number of tiles in the inner loop, we will iterate from left
+    # to right across each row. For each tile inside the loop, we increment the final result.
+    # Note that whe moving from left to right, we can only first encounter "|", "L" or
+    # "F".
+    # "-", "J" and "7" can only be found after first encountering one of those three.
+    # If we encounter "|", then we have crossed from inside to outside, or vice versa.
+    # If we encounter "L" or "F", then whether we cross the boundary depends on the
+    # value of the next non-horizontal pipe ("-") we find. If we encounter a "L",
+    # followed by "J", then we have not crossed the boundary. However, if we
+    # encounter "L", followed by "7", then we will cross the boundary, and move from
+    # inside to outside, or vice versa. Similar can be said for "F", but reversed.
+    # For example:
+    #
+    #   |
+    # → L--7  In this scenario, we will cross the boundary when moving from left
+    #      |  to right along the arrow
+    #
+    #   |  |  In this scenario, we will not cross the boundary when moving from
+    # → L--J  left to right along the arrow, but remain either inside or outside
+
+    # `pairs` is a dict to help know if we are crossing the boundary when encountering
+    # either "L" or "F". For example, pairs["L"]["7"] is True, therefore if we
+    # encounter a "L" followed by a "7", then we will cross the boundary.
+    pairs = {
+        ord("L"): {
+            ord("J"): False,
+            ord("7"): True,
+        },
+        ord("F"): {
+            ord("J"): True,
+            ord("7"): False,
+        },
+    }
+
+    vertical = ord("|")
+    horizontal = ord("-")
+
+    # Boolean to know whether we are currently inside of the loop or not
+    inside = False
+
+    result = 0
+
+    # Loop through each tile in each row, one by one
+    for x in range(grid.height):
+        index = grid.index(x, 0)
+        end_of_row = index + grid.width
+
+        while index < end_of_row:
+            char = cells[index]
+
+            # Here, we are on the loop boundary
+            if loop[index]:
+                # If we encounter a "|", then we have crossed the boundary
+                if char == vertical:
+                    inside = not inside
+                # Here, we have encountered either "L" or "F"
+                elif char in pairs:
+                    index += 1
+                    # Continue moving to the right until we have passed the
+                    # horizontal pipes
+                    while cells[index] == horizontal:
+                        index += 1
+
+                    next_char = cells[index]
+
+                    # Use `pairs` to determine if we have crossed the boundary or not
+                    if pairs[char][next_char]:
+                        inside = not inside
+            elif inside:
+                # If we are inside the loop, then increment the final result
+                result += 1
+
+            index += 1
+
+    return result
+
+
+def solve(part: int, puzzle_input: str) -> int:
+    if part == 1:
+        return part_one_grid(puzzle_input)
+    if part == 2:
+        return part_two_grid(puzzle_input)
 
+    raise ValueError(f"Invalid part: {part}")
 
-with open(os.path.join(os.path.dirname(__file__), "input.txt")) as f:
-    puzzle_input = f.read()
 
+if __name__ == "__main__":
+    with open(os.path.join(os.path.dirname(__file__), "input.txt")) as f:
+        puzzle_input = f.read()
 
-part_one(puzzle_input)
-part_two(puzzle_input)
+    print(solve(1, puzzle_input))
+    print(solve(2, puzzle_input))
@@ -0,0 +1,26 @@
+import random
+
+# Roughly the width and height of the image in a real puzzle input
+SIZE = 140
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate a `size` x `size` image of galaxies, with a few empty rows and
+    columns that will expand
+    """
+    rng = random.Random(seed)
+
+    empty_rows = set(rng.sample(range(size), size // 14))
+    empty_columns = set(rng.sample(range(size), size // 14))
+
+    rows: list[str] = []
+
+    for i in range(size):
+        row = [
+            "#" if i not in empty_rows and j not in empty_columns and rng.random() < 0.025 else "."
+            for j in range(size)
+        ]
+        rows.append("".join(row))
+
+    return "\n".join(rows) + "\n"
@@ -1,12 +1,19 @@
 import os
+import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
 
-def part_one(puzzle_input: str) -> None:
-    array = puzzle_input.strip().splitlines()
+from aoc import backend
+from aoc.model import model
 
-    # `EXPANSION` is a constant that represents how much bigger the empty
-    # rows and columns need to be
-    EXPANSION = 2
+
+@model
+def parse(puzzle_input: str) -> tuple[set[int], set[int], list[tuple[int, int]]]:
+    """
+    Parse the image into the indexes of the empty rows and columns, and the
+    coordinates of every galaxy
+    """
+    array = puzzle_input.strip().splitlines()
 
     # These will contain the indexes of the empty rows and columns
     empty_rows: set[int] = set()
@@ -32,6 +39,16 @@ def part_one(puzzle_input: str) -> None:
             if array[i][j] == "#":
                 galaxies.append((i, j))
 
+    return empty_rows, empty_cols, galaxies
+
+
+def part_one(puzzle_input: str) -> int:
+    # `EXPANSION` is a constant that represents how much bigger the empty
+    # rows and columns need to be
+    EXPANSION = 2
+
+    empty_rows, empty_cols, galaxies = parse(puzzle_input)
+
     result = 0
 
     # The shortest path between any two galaxies will be the sum of the horizontal
@@ -70,34 +87,14 @@ def part_one(puzzle_input: str) -> None:
                 else:
                     result += 1
 
-    print(result)
-
+    return result
 
-def part_two(puzzle_input: str) -> None:
-    array = puzzle_input.strip().splitlines()
 
+def part_two(puzzle_input: str) -> int:
     # Solution is identical to Part 1, except `EXPANSION` is now 1,000,000
     EXPANSION = 1000000
 
-    empty_rows: set[int] = set()
-    empty_cols: set[int] = set()
-
-    for i, row in enumerate(array):
-        if all(char == "." for char in row):
-            empty_rows.add(i)
-
-    for i in range(len(array[0])):
-        col = [line[i] for line in array]
-
-        if all(char == "." for char in col):
-            empty_cols.add(i)
-
-    galaxies: list[tuple[int, int]] = []
-
-    for i in range(len(array)):
-        for j in range(len(array[0])):
-            if array[i][j] == "#":
-                galaxies.append((i, j))
+    empty_rows, empty_cols, galaxies = parse(puzzle_input)
 
     result = 0
 
@@ -126,12 +123,89 @@ def part_two(puzzle_input: str) -> None:
                 else:
                     result += 1
 
-    print(result)
+    return result
+
+
+def distances_numpy(puzzle_input: str, expansion: int) -> int:
+    """
+    The sum of the distances between every pair of galaxies, when each empty
+    row and column is `expansion` times bigger
+
+    The horizontal and vertical distances are summed separately. Once the
+    coordinates along an axis are sorted, the k-th of n coordinates is the
+    larger coordinate of k pairs and the smaller of the other n - 1 - k, so the
+    sum of the distances is the sum of each coordinate times 2k - (n - 1).
+    """
+    np = backend.numpy()
+
+    array = puzzle_input.strip().splitlines()
+
+    image = np.frombuffer("".join(array).encode(), dtype=np.uint8).reshape(
+        len(array), -1
+    )
+    galaxies = image == ord("#")
+
+    rows, cols = np.nonzero(galaxies)
+
+    result = 0
+
+    for coordinates, empty in (
+        (rows, ~galaxies.any(axis=1)),
+        (cols, ~galaxies.any(axis=0)),
+    ):
+        n = len(coordinates)
+
+        if n == 0:
+            continue
+
+        # Every position is less than expansion * len(empty), and each weight
+        # is at most n - 1, so this bounds every position and partial sum
+        if expansion * len(empty) * n * n < 2**63:
+            steps = np.cumsum(empty)
+            indexes = np.arange(len(empty))
+        else:
+            # They could overflow 64-bit integers, so use Python's integers
+            steps = np.cumsum(empty).astype(object)
+            indexes = np.arange(len(empty)).astype(object)
+
+        # Where each row (or column) ends up, once the empty ones before it
+        # have expanded
+        positions = indexes + (expansion - 1) * steps
+
+        expanded = np.sort(positions[coordinates])
+        weights = 2 * np.arange(n) - (n - 1)
+
+        result += int((expanded * weights).sum())
+
+    return result
+
+
+def part_one_numpy(puzzle_input: str) -> int:
+    return distances_numpy(puzzle_input, 2)
+
+
+def part_two_numpy(puzzle_input: str) -> int:
+    return distances_numpy(puzzle_input, 1000000)
+
+
+def solve(part: int, puzzle_input: str) -> int:
+    if part == 1:
+        if backend.use_numpy():
+            return part_one_numpy(puzzle_input)
+
+        return part_one(puzzle_input)
+    if part == 2:
+        if backend.use_numpy():
+            return part_two_numpy(puzzle_input)
+
+        return part_two(puzzle_input)
 
+    raise ValueError(f"Invalid part: {part}")
 
-with open(os.path.join(os.path.dirname(__file__), "input.txt")) as f:
-    puzzle_input = f.read()
 
+if __name__ == "__main__":
+    with open(os.path.join(os.path.dirname(__file__), "input.txt")) as f:
+        puzzle_input = f.read()
 
-part_one(puzzle_input)
-part_two(puzzle_input)
+    print(part_one(puzzle_input))
+    print(part_two(puzzle_input))
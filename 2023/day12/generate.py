@@ -0,0 +1,29 @@
+import random
+
+# Roughly the number of rows of springs in a real puzzle input
+SIZE = 1000
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate `size` rows of springs, by choosing a random arrangement of
+    damaged springs, describing it with groups, and then hiding some of the
+    springs' conditions behind "?"
+    """
+    rng = random.Random(seed)
+
+    lines: list[str] = []
+
+    for _ in range(size):
+        length = rng.randint(1, 20)
+
+        springs = [rng.choice("#.") for _ in range(length)]
+        springs[rng.randrange(length)] = "#"
+
+        groups = [len(group) for group in "".join(springs).split(".") if group]
+
+        row = "".join("?" if rng.random() < 0.5 else char for char in springs)
+
+        lines.append(f"{row} {','.join(map(str, groups))}")
+
+    return "\n".join(lines) + "\n"
@@ -1,170 +1,157 @@
 import os
+import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
 
-def part_one(puzzle_input: str) -> None:
-    def recurse(
-        row: str, groups: list[int], cache: dict[tuple[int, int], int] = {}
-    ) -> int:
-        """
-        Recursive function that is used to return the number of valid arrangements
-        of springs, given a character sequence of springs and list of groups.
-        The solution will contain overlapping subproblems, therefore use a
-        cache to reduce the number of computations
-        """
-
-        # The cache key will be a tuple of the number of remaining characters
-        # in the row, and the number of groups remaining
-        key = (len(row), len(groups))
-
-        # If we have seen this subproblem before, return the cached solution
-        if key in cache:
-            return cache[key]
-
-        # This will be the default return value, indicating that the sequence is invalid
-        total = 0
-
-        # Use a loop here, so we can quickly break out of the loop if the sequence
-        # is invalid
-        for _ in range(1):
-            # We have no more groups to find
-            if not groups:
-                # If there are no more damaged springs, then the sequence is valid
-                # Assume that any "?" will be "."
-                if all(char != "#" for char in row):
-                    total = 1
-                # Otherwise, it is invalid
-                break
+from aoc import counters
+from aoc.model import model
 
+
+def arrangements(row: str, groups: list[int]) -> int:
+    """
+    Return the number of valid arrangements of springs in `row`, given the
+    lengths of the groups of damaged springs
+
+    The subproblems are the number of arrangements of the rest of the row from
+    `start`, and the rest of the groups from `group`. Rather than recursing from
+    the start of the row (which is as deep as the row is long), the table of
+    subproblems is filled in from the end of the row and the last group, so
+    every subproblem a count depends on is already known. Only the counts of
+    the current group and the group after it are kept
+    """
+    n = len(row)
+
+    # `run[i]` is the length of the segment of "#" and "?" starting at `i`
+    run = [0] * (n + 1)
+
+    for i in range(n - 1, -1, -1):
+        if row[i] != ".":
+            run[i] = run[i + 1] + 1
+
+    # We have no more groups to find, so the sequence is valid if there are no
+    # more damaged springs, assuming that any "?" will be "."
+    last_damaged = row.rfind("#")
+    counts = [int(start > last_damaged) for start in range(n + 1)]
+
+    # The fewest characters taken by the groups before `group`, and by the
+    # groups from `group` onwards, each followed by at least one "."
+    before = sum(groups) + len(groups)
+    after = 0
+
+    for group in reversed(range(len(groups))):
+        # `counts` of the next group, and of this group, indexed by `start`
+        next_counts, counts = counts, [0] * (n + 1)
+
+        # `groups[group]` is the next group that needs to be found. If we have
+        # reached the end, yet still have groups to find, then it is invalid
+        group_length = groups[group]
+
+        before -= group_length + 1
+        after += group_length + 1
+
+        # The rest of the groups cannot fit after `n + 1 - after`, so the count
+        # stays 0, and the earlier groups cannot fit before `before`, so the
+        # count is never needed
+        for start in range(n + 1 - after, before - 1, -1):
             # Skip through any operational springs
-            i = 0
-            while i < len(row) and row[i] == ".":
-                i += 1
-
-            # We have reached the end, yet still have groups to find, therefore it is invalid
-            if i == len(row):
-                break
-
-            # `groups[0]` is the next group that needs to be found
-            group_length = groups[0]
-
-            # Create a substring of length `group_length`
-            segment = row[i : i + group_length]
-
-            # There isn't enough of the row remaining to make the required group length,
-            # therefore the sequence is invalid
-            if len(segment) != group_length:
-                break
-
-            # If True, then the segment is only comprised of "#" and "?", therefore it
-            # could be valid if all "?" are "#"
-            if "." not in segment:
-                # In this case, the end of the segment is also the end of the sequence
-                if i + group_length == len(row):
-                    # Recurse, advancing the sequence to after the segment (which is also
-                    # the end of the string), and removing a group from `groups`
-                    total += recurse(row[i + group_length :], groups[1:], cache)
+            if row[start] == ".":
+                counts[start] = counts[start + 1]
+                continue
+
+            total = 0
+            end = start + group_length
+
+            # If True, then the segment is only comprised of "#" and "?", therefore
+            # it could be valid if all "?" are "#"
+            if run[start] >= group_length:
+                # In this case, the end of the segment is also the end of the
+                # sequence, so move on to the next group from the end
+                if end == n:
+                    total += next_counts[n]
 
                 # In this case, the next character after the segment cannot be "#",
-                # otherwise the segment length would not be `group_length`. The subsequent
-                # character must be ".", or "?" which we assume to be "."
-                elif row[i + group_length] != "#":
-                    # Recurse, advancing the sequence to after the segment "plus 1", and
-                    # removing a group from `groups`
-                    total += recurse(row[i + group_length + 1 :], groups[1:], cache)
+                # otherwise the segment length would not be `group_length`. The
+                # subsequent character must be ".", or "?" which we assume to be ".",
+                # so move on to the next group from after the segment "plus 1"
+                elif row[end] != "#":
+                    total += next_counts[end + 1]
 
-            # If the next character in the sequence is "?", recurse to consider the case where
-            # "?" is changed to ".", and the number of groups is left unchanged
-            if row[i] == "?":
-                total += recurse(row[i + 1 :], groups, cache)
+            # If the next character in the sequence is "?", also consider the case
+            # where "?" is changed to ".", and the number of groups is left unchanged
+            if row[start] == "?":
+                total += counts[start + 1]
 
-        # Save the value to the cache before returning
-        cache[key] = total
+            counts[start] = total
 
-        return total
+    return counts[0]
 
-    array = puzzle_input.strip().splitlines()
 
-    result = 0
+@model
+def parse(puzzle_input: str) -> list[tuple[str, list[int]]]:
+    """Parse each row of springs, and the lengths of its groups of damaged springs"""
+    records: list[tuple[str, list[int]]] = []
 
-    for line in array:
+    for line in puzzle_input.strip().splitlines():
         # Obtain the row of characters and the groups from the puzzle input
         row, group_string = line.split(" ")
 
         # Transform the groups from a string to a list of integers
         groups = list(map(int, group_string.split(",")))
 
-        result += recurse(row, groups, {})
-
-    print(result)
-
-
-def part_two(puzzle_input: str) -> None:
-    def recurse(
-        row: str, groups: list[int], cache: dict[tuple[int, int], int] = {}
-    ) -> int:
-        """
-        The function is identical to Part 1
-        """
-
-        key = (len(row), len(groups))
-        if key in cache:
-            return cache[key]
-
-        total = 0
+        records.append((row, groups))
 
-        for _ in range(1):
-            if not groups:
-                if all(char != "#" for char in row):
-                    total = 1
-                break
+    return records
 
-            i = 0
-            while i < len(row) and row[i] == ".":
-                i += 1
 
-            if i == len(row):
-                break
+def part_one(puzzle_input: str) -> int:
 
-            group_length = groups[0]
-            segment = row[i : i + group_length]
+    result = 0
 
-            if len(segment) != group_length:
-                break
+    # Counts of the subproblems solved, if counting is enabled
+    counts = counters.active()
 
-            if "." not in segment:
-                if i + group_length == len(row):
-                    total += recurse(row[i + group_length :], groups[1:], cache)
-                elif row[i + group_length] != "#":
-                    total += recurse(row[i + group_length + 1 :], groups[1:], cache)
+    for row, groups in parse(puzzle_input):
+        result += arrangements(row, groups)
 
-            if row[i] == "?":
-                total += recurse(row[i + 1 :], groups, cache)
+        if counts is not None:
+            counts["states"] += (len(row) + 1) * (len(groups) + 1)
 
-        cache[key] = total
+    return result
 
-        return total
 
-    array = puzzle_input.strip().splitlines()
+def part_two(puzzle_input: str) -> int:
 
     result = 0
 
-    for line in array:
-        row, group_string = line.split(" ")
-        groups = list(map(int, group_string.split(",")))
+    counts = counters.active()
 
+    for row, groups in parse(puzzle_input):
         # Increase the row and groups by a factor of 5, according to the
-        # criteria given in the problem
+        # criteria given in the problem (into new lists, as the model is shared
+        # with part one)
         row = "?".join([row] * 5)
-        groups *= 5
+        groups = groups * 5
+
+        result += arrangements(row, groups)
+
+        if counts is not None:
+            counts["states"] += (len(row) + 1) * (len(groups) + 1)
+
+    return result
 
-        result += recurse(row, groups, {})
 
-    print(result)
+def solve(part: int, puzzle_input: str) -> int:
+    if part == 1:
+        return part_one(puzzle_input)
+    if part == 2:
+        return part_two(puzzle_input)
 
+    raise ValueError(f"Invalid part: {part}")
 
-with open(os.path.join(os.path.dirname(__file__), "input.txt")) as f:
-    puzzle_input = f.read()
 
+if __name__ == "__main__":
+    with open(os.path.join(os.path.dirname(__file__), "input.txt")) as f:
+        puzzle_input = f.read()
 
-part_one(puzzle_input)
-part_two(puzzle_input)
+    print(part_one(puzzle_input))
+    print(part_two(puzzle_input))
@@ -0,0 +1,81 @@
+import random
+
+# Roughly the number of patterns in a real puzzle input
+SIZE = 100
+
+
+def differences(grid: list[list[str]], i: int) -> int:
+    """Count the characters which differ when reflecting the rows about line `i`"""
+    total = 0
+    j, k = i - 1, i
+
+    while j >= 0 and k < len(grid):
+        total += sum(a != b for a, b in zip(grid[j], grid[k]))
+        j -= 1
+        k += 1
+
+    return total
+
+
+def lines(grid: list[list[str]], smudges: int) -> list[int]:
+    """Find every horizontal line of reflection with exactly `smudges` smudges"""
+    return [i for i in range(1, len(grid)) if differences(grid, i) == smudges]
+
+
+def transpose(grid: list[list[str]]) -> list[list[str]]:
+    return [list(column) for column in zip(*grid)]
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate `size` patterns, each with exactly one line of reflection, and
+    exactly one other line of reflection once a single smudge is fixed
+
+    Each pattern starts out symmetric about both a horizontal and a vertical
+    line. A single cell is then flipped, in a row not covered by the
+    horizontal reflection, leaving the vertical line as the smudged one.
+    Patterns with extra lines of reflection are thrown away.
+    """
+    rng = random.Random(seed)
+
+    patterns: list[str] = []
+
+    while len(patterns) < size:
+        height, width = rng.randint(7, 17), rng.randint(7, 17)
+
+        # The horizontal line cannot be in the middle, otherwise it would
+        # cover every row
+        row = rng.choice([i for i in range(1, height) if 2 * i != height])
+        column = rng.randint(1, width - 1)
+
+        grid = [[rng.choice("#.") for _ in range(width)] for _ in range(height)]
+
+        # Make the grid symmetric about the horizontal line...
+        for offset in range(min(row, height - row)):
+            grid[row + offset] = grid[row - 1 - offset][:]
+
+        # ...then about the vertical line, which keeps it symmetric about the
+        # horizontal line
+        for r in grid:
+            for offset in range(min(column, width - column)):
+                r[column + offset] = r[column - 1 - offset]
+
+        # Flip a cell in a row which is not reflected about the horizontal line,
+        # in a column which is reflected about the vertical line
+        covered = 2 * min(row, height - row)
+        x = rng.randrange(covered, height) if row < height - row else rng.randrange(0, height - covered)
+        y = rng.randrange(max(0, 2 * column - width), min(width, 2 * column))
+        grid[x][y] = "#" if grid[x][y] == "." else "."
+
+        columns = transpose(grid)
+
+        if lines(grid, 0) != [row] or lines(columns, 0) or lines(grid, 1) or lines(columns, 1) != [column]:
+            continue
+
+        # Swap rows and columns half the time
+        if rng.random() < 0.5:
+            grid = columns
+
+        patterns.append("\n".join("".join(r) for r in grid))
+
+    return "\n\n".join(patterns) + "\n"
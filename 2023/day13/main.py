@@ -1,9 +1,21 @@
 import os
+import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
 
-def part_one(puzzle_input: str) -> None:
+from aoc.model import model
+
+
+@model
+def parse(puzzle_input: str) -> list[list[str]]:
+    """Parse the puzzle input into the rows of each pattern"""
     array = puzzle_input.strip().split("\n\n")
-    grids = [grid.splitlines() for grid in array]
+
+    return [grid.splitlines() for grid in array]
+
+
+def part_one(puzzle_input: str) -> int:
+    grids = parse(puzzle_input)
 
     result = 0
 
@@ -55,12 +67,11 @@ def part_one(puzzle_input: str) -> None:
                     result += i
                     break
 
-    print(result)
+    return result
 
 
-def part_two(puzzle_input: str) -> None:
-    array = puzzle_input.strip().split("\n\n")
-    grids = [grid.splitlines() for grid in array]
+def part_two(puzzle_input: str) -> int:
+    grids = parse(puzzle_input)
 
     result = 0
 
@@ -148,11 +159,21 @@ def part_two(puzzle_input: str) -> None:
                         result += i
                         break
 
-    print(result)
+    return result
+
+
+def solve(part: int, puzzle_input: str) -> int:
+    if part == 1:
+        return part_one(puzzle_input)
+    if part == 2:
+        return part_two(puzzle_input)
+
+    raise ValueError(f"Invalid part: {part}")
 
 
-with open(os.path.join(os.path.dirname(__file__), "input.txt")) as f:
-    puzzle_input = f.read()
+if __name__ == "__main__":
+    with open(os.path.join(os.path.dirname(__file__), "input.txt")) as f:
+        puzzle_input = f.read()
 
-part_one(puzzle_input)
-part_two(puzzle_input)
+    print(part_one(puzzle_input))
+    print(part_two(puzzle_input))
@@ -0,0 +1,17 @@
+import random
+
+# Roughly the width and height of the platform in a real puzzle input
+SIZE = 100
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate a `size` x `size` platform of rounded rocks and cube-shaped rocks
+    """
+    rng = random.Random(seed)
+
+    rows = [
+        "".join(rng.choices("O#.", weights=(20, 15, 65), k=size)) for _ in range(size)
+    ]
+
+    return "\n".join(rows) + "\n"
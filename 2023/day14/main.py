@@ -1,7 +1,21 @@
 import os
+import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
 
-def part_one(puzzle_input: str) -> None:
+from aoc.cycles import skip_ahead
+from aoc.grid import Grid
+
+EMPTY = ord(".")
+ROUNDED = ord("O")
+CUBE = ord("#")
+
+
+def part_one(puzzle_input: str) -> int:
+    """
+    The reference solution, kept from before the port to `Grid`. `solve()`
+    uses `part_one_grid()`, which `python -m aoc.variants` checks against it.
+    """
     array = puzzle_input.strip().splitlines()
 
     # Parse the grid as a list of list of strings
@@ -51,10 +65,14 @@ def part_one(puzzle_input: str) -> None:
             if char == "O":
                 result += load
 
-    print(result)
+    return result
 
 
-def part_two(puzzle_input: str) -> None:
+def part_two(puzzle_input: str) -> int:
+    """
+    The reference solution, kept from before the port to `Grid`. `solve()`
+    uses `part_two_grid()`, which `python -m aoc.variants` checks against it.
+    """
     array = puzzle_input.strip().splitlines()
     grid = [list(line) for line in array]
     height, width = len(grid), len(grid[0])
@@ -147,11 +165,112 @@ def part_two(puzzle_input: str) -> None:
             if char == "O":
                 result += load
 
-    print(result)
+    return result
+
+
+def tilt(cells: bytearray, lines: list[range]) -> None:
+    """
+    Tilt the platform, so every rounded rock rolls towards the start of its line
+    (a row or column of indices, ordered in the direction the rocks roll) until
+    it reaches a cube-shaped rock, another rounded rock, or the edge
+    """
+    for line in lines:
+        # `free` will be the position in the line of the next free space
+        free = 0
+
+        for i, index in enumerate(line):
+            char = cells[index]
+
+            # Move a rounded rock to the next free space
+            if char == ROUNDED:
+                if i != free:
+                    cells[line[free]] = ROUNDED
+                    cells[index] = EMPTY
+
+                free += 1
+            # A cube-shaped rock cannot be moved, therefore the next free space
+            # can only be after the rock
+            elif char == CUBE:
+                free = i + 1
+
+
+def total_load(grid: Grid) -> int:
+    result = 0
+
+    # The load from each row is equal to the height minus the row index
+    for i in range(grid.height):
+        load = grid.height - i
+        row = grid.row(i)
+
+        # For every "O" in the row, add on the load of the rock
+        result += grid.cells[row.start : row.stop].count(ROUNDED) * load
+
+    return result
+
+
+def part_one_grid(puzzle_input: str) -> int:
+    """
+    The same as `part_one()`, tilting the rocks along precomputed lines
+    of indices in a flat `Grid`
+    """
+    # Parse the puzzle input as a flat grid
+    grid = Grid.parse(puzzle_input)
+
+    # Tilt the platform north, so the rocks roll from the bottom to the top of
+    # each column
+    tilt(grid.cells, [grid.column(i) for i in range(grid.width)])
+
+    return total_load(grid)
+
+
+def part_two_grid(puzzle_input: str) -> int:
+    """
+    The same as `part_two()`, tilting the rocks along precomputed lines
+    of indices in a flat `Grid`
+    """
+    grid = Grid.parse(puzzle_input)
+    cells = grid.cells
+
+    # The lines of the grid for tilting the platform in each direction of a spin
+    # cycle: north, west, south, then east
+    north = [grid.column(i) for i in range(grid.width)]
+    west = [grid.row(i) for i in range(grid.height)]
+    south = [column[::-1] for column in north]
+    east = [row[::-1] for row in west]
+
+    CYCLES = 1000000000
+
+    def spin(pattern: bytes) -> bytes:
+        """Run a spin cycle, tilting north, west, south, then east"""
+        cells[:] = pattern
+
+        for lines in north, west, south, east:
+            tilt(cells, lines)
+
+        return bytes(cells)
+
+    # After a certain number of cycles, the sequence of board patterns will
+    # repeat, so skip ahead over the repeats. The bytes of the board pattern
+    # are the state of the platform.
+    pattern, _ = skip_ahead(bytes(cells), spin, CYCLES)
+
+    cells[:] = pattern
+
+    return total_load(grid)
+
+
+def solve(part: int, puzzle_input: str) -> int:
+    if part == 1:
+        return part_one_grid(puzzle_input)
+    if part == 2:
+        return part_two_grid(puzzle_input)
+
+    raise ValueError(f"Invalid part: {part}")
 
 
-with open(os.path.join(os.path.dirname(__file__), "input.txt")) as f:
-    puzzle_input = f.read()
+if __name__ == "__main__":
+    with open(os.path.join(os.path.dirname(__file__), "input.txt")) as f:
+        puzzle_input = f.read()
 
-part_one(puzzle_input)
-part_two(puzzle_input)
+    print(solve(1, puzzle_input))
+    print(solve(2, puzzle_input))
@@ -0,0 +1,24 @@
+import random
+import string
+
+# Roughly the number of steps in a real puzzle input
+SIZE = 4000
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate `size` steps, adding and removing lenses from a pool of labels
+    """
+    rng = random.Random(seed)
+
+    labels = [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 6)))
+        for _ in range(max(1, size // 8))
+    ]
+
+    steps = [
+        f"{rng.choice(labels)}-" if rng.random() < 0.3 else f"{rng.choice(labels)}={rng.randint(1, 9)}"
+        for _ in range(size)
+    ]
+
+    return ",".join(steps) + "\n"
@@ -2,7 +2,7 @@ import os
 import re
 
 
-def part_one(puzzle_input: str) -> None:
+def part_one(puzzle_input: str) -> int:
     array = puzzle_input.strip().split(",")
 
     result = 0
@@ -20,10 +20,10 @@ def part_one(puzzle_input: str) -> None:
 
         result += total
 
-    print(result)
+    return result
 
 
-def part_two(puzzle_input: str) -> None:
+def part_two(puzzle_input: str) -> int:
     array = puzzle_input.strip().split(",")
 
     def hash(chars: str) -> int:
@@ -93,11 +93,21 @@ def part_two(puzzle_input: str) -> None:
             # Calculate the focusing power of each lens
             result += (number + 1) * (i + 1) * focal_length
 
-    print(result)
+    return result
 
 
-with open(os.path.join(os.path.dirname(__file__), "input.txt")) as f:
-    puzzle_input = f.read()
+def solve(part: int, puzzle_input: str) -> int:
+    if part == 1:
+        return part_one(puzzle_input)
+    if part == 2:
+        return part_two(puzzle_input)
 
-part_one(puzzle_input)
-part_two(puzzle_input)
+    raise ValueError(f"Invalid part: {part}")
+
+
+if __name__ == "__main__":
+    with open(os.path.join(os.path.dirname(__file__), "input.txt")) as f:
+        puzzle_input = f.read()
+
+    print(part_one(puzzle_input))
+    print(part_two(puzzle_input))
@@ -0,0 +1,19 @@
+import random
+
+# Roughly the width and height of the contraption in a real puzzle input
+SIZE = 110
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate a `size` x `size` contraption, with mirrors and splitters on
+    roughly one tile in ten
+    """
+    rng = random.Random(seed)
+
+    rows = [
+        "".join(rng.choice("/\\|-") if rng.random() < 0.1 else "." for _ in range(size))
+        for _ in range(size)
+    ]
+
+    return "\n".join(rows) + "\n"
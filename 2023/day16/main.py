@@ -1,8 +1,57 @@
 import os
+import sys
 from collections import deque
 
-
-def part_one(puzzle_input: str) -> None:
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from aoc.grid import Grid
+
+# The directions the beam can travel in, as indices into `Grid.neighbours`
+RIGHT, DOWN, LEFT, UP = range(4)
+
+# Dict to help determine the direction the light will travel in after hitting an
+# object. The key is the direction the beam is currently travelling in, and the
+# value is another dict where the key is the symbol of the object the beam hits,
+# and the value is a list of directions that the beam is now travelling in. For
+# example, if the beam is travelling right, and hits "\", it will now be
+# travelling down.
+MOVES: dict[int, dict[str, list[int]]] = {
+    RIGHT: {
+        ".": [RIGHT],
+        "-": [RIGHT],
+        "|": [UP, DOWN],
+        "/": [UP],
+        "\\": [DOWN],
+    },
+    LEFT: {
+        ".": [LEFT],
+        "-": [LEFT],
+        "|": [UP, DOWN],
+        "/": [DOWN],
+        "\\": [UP],
+    },
+    DOWN: {
+        ".": [DOWN],
+        "-": [LEFT, RIGHT],
+        "|": [DOWN],
+        "/": [LEFT],
+        "\\": [RIGHT],
+    },
+    UP: {
+        ".": [UP],
+        "-": [LEFT, RIGHT],
+        "|": [UP],
+        "/": [RIGHT],
+        "\\": [LEFT],
+    },
+}
+
+
+def part_one(puzzle_input: str) -> int:
+    """
+    The reference solution, kept from before the port to `Grid`. `solve()`
+    uses `part_one_grid()`, which `python -m aoc.variants` checks against it.
+    """
     grid = puzzle_input.strip().splitlines()
 
     # Dict where the key is the vector of the direction we are travelling in, and
@@ -99,10 +148,14 @@ def part_one(puzzle_input: str) -> None:
     # at least one direction)
     result = len(energized)
 
-    print(result)
+    return result
 
 
-def part_two(puzzle_input: str) -> None:
+def part_two(puzzle_input: str) -> int:
+    """
+    The reference solution, kept from before the port to `Grid`. `solve()`
+    uses `part_two_grid()`, which `python -m aoc.variants` checks against it.
+    """
     grid = puzzle_input.strip().splitlines()
 
     directions: dict[tuple[int, int], str] = {
@@ -186,11 +239,117 @@ def part_two(puzzle_input: str) -> None:
         # Update the final result if it is bigger than what we have seen so far
         result = max(result, len(energized))
 
-    print(result)
+    return result
+
+
+def beam_moves(grid: Grid) -> list[dict[int, list[tuple[int, int]]]]:
+    """
+    `MOVES` for a particular grid, as lists of (direction, offset) tuples, indexed
+    by direction and then by the character code of the symbol
+    """
+    return [
+        {
+            ord(char): [(new_dir, grid.neighbours[new_dir]) for new_dir in new_dirs]
+            for char, new_dirs in MOVES[dir].items()
+        }
+        for dir in range(4)
+    ]
+
+
+def energize(
+    grid: Grid, moves: list[dict[int, list[tuple[int, int]]]], start: int, dir: int
+) -> int:
+    """
+    Send a beam into the grid at the index `start`, travelling in the direction
+    `dir`, returning the number of squares that are energized
+    """
+    cells = grid.cells
+
+    # The directions the beam has travelled through each square in, as a bitmask
+    # with one bit per direction. A square is energized if its bitmask is not 0.
+    visited = bytearray(len(cells))
+    visited[start] = 1 << dir
+
+    # Queue which will be used to perform BFS through the grid
+    # Optional: Use a deque to efficiently pop from the front of the queue
+    queue: deque[tuple[int, int]] = deque([(start, dir)])
+
+    # Continue looping until the queue is empty
+    while queue:
+        index, dir = queue.popleft()
+
+        # Get the direction(s) the beam will now be moving in, after passing
+        # through the symbol on the current square
+        for new_dir, step in moves[dir][cells[index]]:
+            new_index = index + step
+            bit = 1 << new_dir
+
+            # Check that the beam is within the grid, and we have not already
+            # visited this square in the same direction
+            if cells[new_index] != grid.border and not visited[new_index] & bit:
+                # Add the new point to the end of the queue, keeping track of
+                # which squares we have visited, and in which direction
+                queue.append((new_index, new_dir))
+                visited[new_index] |= bit
+
+    # The final result is the number of squares that were energized (visited in
+    # at least one direction). The border is never visited.
+    return len(visited) - visited.count(0)
+
+
+def part_one_grid(puzzle_input: str) -> int:
+    """
+    The same as `part_one()`, moving the beam by adding offsets to its
+    index in a flat `Grid` with a border which stops it
+    """
+    # Parse the grid, surrounded by a border which stops the beam
+    grid = Grid.parse(puzzle_input, border="#")
+
+    # The starting point is in the top-left of the grid, travelling to the right
+    return energize(grid, beam_moves(grid), grid.index(0, 0), RIGHT)
+
+
+def part_two_grid(puzzle_input: str) -> int:
+    """
+    The same as `part_two()`, on a flat `Grid`
+    """
+    grid = Grid.parse(puzzle_input, border="#")
+
+    # The solution is the same as in Part 1, however we now perform the calculation
+    # for every starting point of the edge of the grid, in each direction
+    starting_points: list[tuple[int, int]] = []
+
+    for i in range(grid.height):
+        starting_points.append((grid.index(i, 0), RIGHT))
+        starting_points.append((grid.index(i, grid.width - 1), LEFT))
+
+    for i in range(grid.width):
+        starting_points.append((grid.index(0, i), DOWN))
+        starting_points.append((grid.index(grid.height - 1, i), UP))
+
+    moves = beam_moves(grid)
+
+    result = 0
+
+    for start, dir in starting_points:
+        # Update the final result if it is bigger than what we have seen so far
+        result = max(result, energize(grid, moves, start, dir))
+
+    return result
+
+
+def solve(part: int, puzzle_input: str) -> int:
+    if part == 1:
+        return part_one_grid(puzzle_input)
+    if part == 2:
+        return part_two_grid(puzzle_input)
+
+    raise ValueError(f"Invalid part: {part}")
 
 
-with open(os.path.join(os.path.dirname(__file__), "input.txt")) as f:
-    puzzle_input = f.read()
+if __name__ == "__main__":
+    with open(os.path.join(os.path.dirname(__file__), "input.txt")) as f:
+        puzzle_input = f.read()
 
-part_one(puzzle_input)
-part_two(puzzle_input)
+    print(solve(1, puzzle_input))
+    print(solve(2, puzzle_input))
@@ -0,0 +1,30 @@
+import random
+
+# Roughly the width and height of the city in a real puzzle input
+SIZE = 141
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate a `size` x `size` city of heat loss values, which are lower near
+    the middle of the city, like the real input
+    """
+    rng = random.Random(seed)
+
+    # An ultra crucible must move at least four blocks before it can stop
+    size = max(5, size)
+
+    rows: list[str] = []
+
+    for i in range(size):
+        row: list[str] = []
+
+        for j in range(size):
+            # Distance from the centre, from 0 (centre) to 1 (corner)
+            distance = max(abs(2 * i - size + 1), abs(2 * j - size + 1)) / max(1, size - 1)
+            low = 1 + round(4 * distance)
+            row.append(str(rng.randint(low, min(9, low + 4))))
+
+        rows.append("".join(row))
+
+    return "\n".join(rows) + "\n"
@@ -1,8 +1,20 @@
 import heapq
 import os
+import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
 
-def part_one(puzzle_input: str) -> None:
+from aoc.graph import Graph, dial
+from aoc.grid import Grid
+
+ZERO = ord("0")
+
+
+def part_one(puzzle_input: str) -> int:
+    """
+    The reference solution, kept from before the port to `Grid`. `solve()`
+    uses `part_one_grid()`, which `python -m aoc.variants` checks against it.
+    """
     # Parse the puzzle input as a list of list of integers
     grid = puzzle_input.strip().splitlines()
     grid = [list(map(int, list(line))) for line in grid]
@@ -88,10 +100,14 @@ def part_one(puzzle_input: str) -> None:
                     # any further steps
                     break
 
-    print(result)
+    return result
 
 
-def part_two(puzzle_input: str) -> None:
+def part_two(puzzle_input: str) -> int:
+    """
+    The reference solution, kept from before the port to `Grid`. `solve()`
+    uses `part_two_grid()`, which `python -m aoc.variants` checks against it.
+    """
     grid = puzzle_input.strip().splitlines()
     grid = [list(map(int, list(line))) for line in grid]
 
@@ -146,11 +162,121 @@ def part_two(puzzle_input: str) -> None:
                 else:
                     break
 
-    print(result)
+    return result
+
+
+def build_graph(grid: Grid, minimum: int, maximum: int, end: int) -> Graph:
+    """
+    Build a graph of the states of the crucible, weighted by the heat lost
+    moving between them. The crucible can move between `minimum` and `maximum`
+    steps in a straight line, then must turn left or right.
+
+    Each move ends with a turn, so the state of the crucible is the square it
+    is on and whether it must move horizontally (0) or vertically (1) next.
+    State `2 * index + axis` is on the square with that index in the grid.
+    There is one extra state after all of these, which is reached from both
+    states of the `end` square without losing any heat.
+    """
+    cells = grid.cells
+    border = grid.border
+
+    # The directions to move in for each axis
+    axes = ((grid.right, grid.left), (grid.down, grid.up))
+
+    offsets = [0]
+    targets: list[int] = []
+    weights: list[int] = []
+
+    sink = 2 * len(cells)
+
+    for index, cell in enumerate(cells):
+        for axis, steps in enumerate(axes):
+            if cell != border:
+                for step in steps:
+                    total = 0
+                    new_index = index
+
+                    # Instead of moving one step at a time, move between
+                    # `minimum` and `maximum` steps in one direction. The next
+                    # move will be along the other axis.
+                    for i in range(1, maximum + 1):
+                        new_index += step
+
+                        # If we are outside of the grid, there is no point
+                        # taking any further steps
+                        if cells[new_index] == border:
+                            break
+
+                        # Add on the heat loss from the new square
+                        total += cells[new_index] - ZERO
+
+                        # We can only stop on a square after taking at least
+                        # `minimum` steps
+                        if i >= minimum:
+                            targets.append(2 * new_index + 1 - axis)
+                            weights.append(total)
+
+                if index == end:
+                    targets.append(sink)
+                    weights.append(0)
+
+            offsets.append(len(targets))
+
+    # The final state has no moves
+    offsets.append(len(targets))
+
+    return Graph(offsets, targets, weights)
+
+
+def least_heat_loss(puzzle_input: str, minimum: int, maximum: int) -> int:
+    # Parse the puzzle input as a grid of digits, surrounded by a border which
+    # the crucible cannot move onto
+    grid = Grid.parse(puzzle_input, border="#")
+
+    start = grid.index(0, 0)
+    end = grid.index(grid.height - 1, grid.width - 1)
+
+    graph = build_graph(grid, minimum, maximum, end)
+    sink = len(graph) - 1
+
+    # The heat lost on each move is a single digit per step, so the weights are
+    # small enough to use Dial's bucket queue rather than a heap. The crucible
+    # starts in the top-left corner and can move along either axis.
+    distances = dial(graph, [2 * start, 2 * start + 1], sink)
+
+    return distances[sink]
+
+
+def part_one_grid(puzzle_input: str) -> int:
+    """
+    The same as `part_one()`, as a search with a bucket queue over a
+    graph of the states of the crucible on a flat `Grid`
+    """
+    # The crucible can move at most 3 steps before turning
+    return least_heat_loss(puzzle_input, 1, 3)
+
+
+def part_two_grid(puzzle_input: str) -> int:
+    """
+    The same as `part_two()`, as a search with a bucket queue over a
+    graph of the states of the crucible on a flat `Grid`
+    """
+    # We now take between 4 and 10 steps before turning
+    return least_heat_loss(puzzle_input, 4, 10)
+
+
+def solve(part: int, puzzle_input: str) -> int:
+    if part == 1:
+        return part_one_grid(puzzle_input)
+    if part == 2:
+        return part_two_grid(puzzle_input)
+
+    raise ValueError(f"Invalid part: {part}")
 
 
-with open(os.path.join(os.path.dirname(__file__), "input.txt")) as f:
-    puzzle_input = f.read()
+if __name__ == "__main__":
+    with open(os.path.join(os.path.dirname(__file__), "input.txt")) as f:
+        puzzle_input = f.read()
 
-part_one(puzzle_input)
-part_two(puzzle_input)
+    print(solve(1, puzzle_input))
+    print(solve(2, puzzle_input))
@@ -0,0 +1,110 @@
+import random
+
+# Roughly the number of instructions in a real puzzle input
+SIZE = 700
+
+DIRECTIONS = {(0, 1): "R", (1, 0): "D", (0, -1): "L", (-1, 0): "U"}
+
+
+def shape(columns: int, rng: random.Random) -> set[tuple[int, int]]:
+    """
+    Create a random shape of `columns` columns of squares. Each column is a
+    single run of squares which overlaps the previous column, so the shape has
+    no holes and no two squares touch only at a corner, and its outline is a
+    simple loop.
+    """
+    shape: set[tuple[int, int]] = set()
+
+    top, bottom = 0, rng.randint(0, 5)
+
+    for y in range(columns):
+        previous_top, previous_bottom = top, bottom
+
+        top = min(previous_bottom, top + rng.randint(-4, 4))
+        bottom = max(previous_top, top, bottom + rng.randint(-4, 4))
+
+        for x in range(top, bottom + 1):
+            shape.add((x, y))
+
+    return shape
+
+
+def outline(shape: set[tuple[int, int]]) -> list[tuple[tuple[int, int], int]]:
+    """
+    Trace the outline of the shape clockwise, as a list of directions and the
+    number of squares moved, starting from the top-left corner of its top-left
+    square
+    """
+    # The outline moves between the corners of squares, where corner (x, y) is
+    # the top-left corner of square (x, y). Keep the shape on the right.
+    edges: dict[tuple[int, int], tuple[int, int]] = {}
+
+    for x, y in shape:
+        if (x - 1, y) not in shape:
+            edges[(x, y)] = (0, 1)
+        if (x, y + 1) not in shape:
+            edges[(x, y + 1)] = (1, 0)
+        if (x + 1, y) not in shape:
+            edges[(x + 1, y + 1)] = (0, -1)
+        if (x, y - 1) not in shape:
+            edges[(x + 1, y)] = (-1, 0)
+
+    start = min(shape)
+    point = start
+    moves: list[tuple[tuple[int, int], int]] = []
+
+    while True:
+        direction = edges[point]
+
+        if moves and moves[-1][0] == direction:
+            moves[-1] = (direction, moves[-1][1] + 1)
+        else:
+            moves.append((direction, 1))
+
+        point = (point[0] + direction[0], point[1] + direction[1])
+
+        if point == start:
+            return moves
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate a dig plan of roughly `size` instructions
+
+    The outline of a random shape is used for both parts. For part 1, each
+    square of the shape is scaled up by a small amount, and for part 2 by a
+    much larger amount, and each row and column of squares is a different size
+    so that the lengths of the instructions vary.
+    """
+    rng = random.Random(seed)
+
+    moves = outline(shape(max(1, size // 4), rng))
+
+    instructions: list[str] = []
+
+    heights_one: dict[int, int] = {}
+    widths_one: dict[int, int] = {}
+    heights_two: dict[int, int] = {}
+    widths_two: dict[int, int] = {}
+
+    x = y = 0
+
+    for direction, length in moves:
+        if direction[0] == 0:
+            sizes_one, sizes_two, position = widths_one, widths_two, y
+        else:
+            sizes_one, sizes_two, position = heights_one, heights_two, x
+
+        step = direction[0] + direction[1]
+        squares = [position + step * k - (step < 0) for k in range(length)]
+
+        moves_one = sum(sizes_one.setdefault(square, rng.randint(1, 5)) for square in squares)
+        moves_two = sum(sizes_two.setdefault(square, rng.randint(1000, 20000)) for square in squares)
+
+        x, y = x + direction[0] * length, y + direction[1] * length
+
+        instructions.append(
+            f"{DIRECTIONS[direction]} {moves_one} (#{moves_two:05x}{list(DIRECTIONS).index(direction)})"
+        )
+
+    return "\n".join(instructions) + "\n"
@@ -1,7 +1,81 @@
 import os
+import sys
+from itertools import groupby
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
 
-def part_one(puzzle_input: str) -> None:
+from aoc.intervals import IntervalSet
+
+
+def area(loop: list[tuple[int, int]]) -> int:
+    """
+    Calculate the area dug out by a loop of trench, given the coordinates of
+    its vertices
+
+    To find the area of the shape, we move through the shape from left to
+    right, with a vertical line. The area of the shape will be the area that
+    the vertical line passes through as it moves through the shape.
+    Note: The x-axis is to the right, and the y-axis is up.
+
+    The vertical line crosses the inside of the shape in a set of intervals,
+    from one horizontal edge of the trench to another. Each time the line
+    reaches a vertical edge of the trench, the inside of the shape starts or
+    stops along that edge, so the edge is added to or removed from the set:
+
+    ______________          ______________
+                  |                    ___
+                  |                   |
+    ______________|                   |___
+
+                            ______________
+
+    The line covers every square from one edge to the other, so the squares
+    covered by an interval (a, b) are a to b, inclusive. On a column with
+    vertical edges, the line covers the squares inside the shape both before
+    and after the edges.
+    """
+
+    # Group the vertices into columns, with the y-coordinates of each column
+    # sorted. Each pair of y-coordinates is a vertical edge of the trench.
+    columns = [
+        (x, [y for _, y in points])
+        for x, points in groupby(sorted(loop), key=lambda point: point[0])
+    ]
+
+    def covered(intervals: IntervalSet) -> IntervalSet:
+        """The squares covered by the intervals, including both ends"""
+        return IntervalSet((a, b + 1) for a, b in intervals)
+
+    # `intervals` is the set of intervals of the shape crossed by the line, and
+    # `squares` is the squares they cover
+    intervals = squares = IntervalSet()
+
+    # Start from the x-coordinate furthest to the left
+    pointer = columns[0][0]
+
+    result = 0
+
+    for next_pointer, ys in columns:
+        # Add the area covered by the intervals between the previous column and
+        # this one, not including either column
+        result += squares.size * max(0, next_pointer - pointer - 1)
+
+        # Add or remove the vertical edges on this column
+        edges = IntervalSet(zip(ys[::2], ys[1::2]))
+        new_intervals = intervals ^ edges
+        new_squares = covered(new_intervals)
+
+        # Add the area covered on this column, inside the shape either before
+        # or after the edges
+        result += (squares | new_squares).size
+
+        intervals, squares = new_intervals, new_squares
+        pointer = next_pointer
+
+    return result
+
+
+def part_one(puzzle_input: str) -> int:
     array = puzzle_input.strip().splitlines()
 
     # Dict where the key is the direction to move in and the value is the
@@ -35,222 +109,10 @@ def part_one(puzzle_input: str) -> None:
         # Add the new point to the list
         loop.append(point)
 
-    # Sort the points in the loop, by x-coordinate, then y-coordinate
-    loop.sort()
-
-    def contains_interval(
-        intervals: set[tuple[int, int]],
-        next_interval: tuple[int, int],
-    ) -> bool:
-        """
-        If we are already tracking this interval, then remove it from the set
-        as it is the end of the interval within the shape.
-
-        ______________
-                      |
-                      |
-        ______________|
-        """
-
-        if next_interval in intervals:
-            intervals.remove(next_interval)
-            return True
-
-        return False
-
-    def in_between_interval(
-        intervals: set[tuple[int, int]],
-        next_interval: tuple[int, int],
-    ) -> bool:
-        """
-        If the next interval exists within an existing interval, then split
-        the interval into two smaller intervals.
-
-        _______________
-                    ___
-                   |
-                   |
-                   |
-                   |___
-
-        _______________
-        """
-
-        for a, b in intervals:
-            if a < next_interval[0] < next_interval[1] < b:
-                intervals.remove((a, b))
-                intervals.add((a, next_interval[0]))
-                intervals.add((next_interval[1], b))
-                return True
-
-        return False
-
-    def joined_to_two_intervals(
-        intervals: set[tuple[int, int]],
-        next_interval: tuple[int, int],
-    ) -> bool:
-        """
-        If the next interval is joined to two existing interavls, then combine
-        the two to make one larger interval. Add the length of the new
-        interval to the area.
-
-        ________________
-        ____________
-                    |
-                    |
-        ____________|
-
-        ________________
-        """
-
-        nonlocal result
-
-        interval1 = interval2 = None
-
-        for a, b in intervals:
-            if a == next_interval[1]:
-                interval1 = (a, b)
-                break
-
-        for a, b in intervals:
-            if b == next_interval[0]:
-                interval2 = (a, b)
-                break
-
-        if interval1 != interval2 and interval1 is not None and interval2 is not None:
-            result += next_interval[1] - next_interval[0] - 1
-            intervals.remove(interval1)
-            intervals.remove(interval2)
-            intervals.add((interval2[0], interval1[1]))
-            return True
-
-        return False
-
-    def joined_to_one_interval(
-        intervals: set[tuple[int, int]],
-        next_interval: tuple[int, int],
-    ) -> bool:
-        """
-        If the next interval is joined to one existing interavls, then adjust the
-        length of the existing interval. If the interval gets larger, add the new
-        length to the area.
-
-                     ____       ____________
-                    |                       |
-        ____________|       OR              |____
-
-        _________________       _________________
-        """
-
-        nonlocal result
-
-        for a, b in intervals:
-            if b == next_interval[0]:
-                result += next_interval[1] - next_interval[0]
-                intervals.add((a, next_interval[1]))
-                break
-            if b == next_interval[1]:
-                intervals.add((a, next_interval[0]))
-                break
-            if a == next_interval[1]:
-                result += next_interval[1] - next_interval[0]
-                intervals.add((next_interval[0], b))
-                break
-            if a == next_interval[0]:
-                intervals.add((next_interval[1], b))
-                break
-        else:
-            return False
-
-        intervals.remove((a, b))
-        return True
-
-    def add_interval(
-        intervals: set[tuple[int, int]],
-        next_interval: tuple[int, int],
-    ) -> None:
-        """
-        This is a new interval, therefore add it to the set of intervals, and
-        add its length to the area.
-
-        _____________
-
-        _____________
-
-                 ____
-                |
-                |____
-
-        """
-
-        nonlocal result
-
-        intervals.add(next_interval)
-        result += next_interval[1] - next_interval[0] + 1
-
-    pass
-
-    # To find the area of the shape, we move through the shape from left to right,
-    # with a vertical line. The area of the shape will be the area that the
-    # vertical line passes through as it moves through the shape.
-    # Note: The x-axis is to the right, and the y-axis is up.
-    #
-    # The vertical line will be a set of intervals within the shape. Each time
-    # the line reaches a vertex in the shape, the intervals will updated as
-    # appropriate.
-
-    # `intervals` is the set of intervals ww are tracking within the shape
-    intervals: set[tuple[int, int]] = set()
+    return area(loop)
 
-    # Start from the x-coordinate furthest to the left
-    pointer = loop[0][0]
 
-    result = 0
-
-    # We want to find the next intervals in the loop, therefore loop two points
-    # at a time. Both points will have the same x-coordinate but different
-    # y-coordinates, corresponding to the next interval in the shape.
-    # For two points, (x1, y1) and (x2, y2):
-    # x1 == x2
-    # y1 < y2 (because `loop` is sorted)
-    for i in range(0, len(loop), 2):
-        # `next_pointer` is the x-coordinate of the next point we want to move to,
-        # which is the x-coordinate of the next interval in the shape
-        next_pointer = loop[i][0]
-
-        # The y-coordinates of the next interval in the shape
-        next_interval = (loop[i][1], loop[i + 1][1])
-
-        # For each interval in the shape, calculate the area covered when moving
-        # from `pointer` to `next_pointer`. Add this to the final result.
-        for a, b in intervals:
-            result += (b - a + 1) * (next_pointer - pointer)
-
-        # Update the pointer
-        pointer = next_pointer
-
-        # We now need to update the intervals we are tracking in the shape
-        # Each function will update `intervals` and `result`, and return True
-        # if it modified the interval, meaning that subsequent code in the
-        # if-statement will not run. Each function explains what it is
-        # checking for.
-        if contains_interval(intervals, next_interval):
-            continue
-        elif in_between_interval(intervals, next_interval):
-            continue
-        elif joined_to_two_intervals(intervals, next_interval):
-            continue
-        elif joined_to_one_interval(intervals, next_interval):
-            continue
-        else:
-            # If none of the above are true, then this is a new interval
-            # that should now be tracked
-            add_interval(intervals, next_interval)
-
-    print(result)
-
-
-def part_two(puzzle_input: str) -> None:
+def part_two(puzzle_input: str) -> int:
     array = puzzle_input.strip().splitlines()
 
     # We now use numbers to correspond to the directions
@@ -279,123 +141,21 @@ def part_two(puzzle_input: str) -> None:
         point = (new_x, new_y)
         loop.append(point)
 
-    loop.sort()
-
-    def contains_interval(
-        intervals: set[tuple[int, int]],
-        next_interval: tuple[int, int],
-    ) -> bool:
-        if next_interval in intervals:
-            intervals.remove(next_interval)
-            return True
-
-        return False
-
-    def in_between_interval(
-        intervals: set[tuple[int, int]],
-        next_interval: tuple[int, int],
-    ) -> bool:
-        for a, b in intervals:
-            if a < next_interval[0] < next_interval[1] < b:
-                intervals.remove((a, b))
-                intervals.add((a, next_interval[0]))
-                intervals.add((next_interval[1], b))
-                return True
-
-        return False
-
-    def joined_to_two_intervals(
-        intervals: set[tuple[int, int]],
-        next_interval: tuple[int, int],
-    ) -> bool:
-        nonlocal result
-
-        interval1 = interval2 = None
-
-        for a, b in intervals:
-            if a == next_interval[1]:
-                interval1 = (a, b)
-                break
-
-        for a, b in intervals:
-            if b == next_interval[0]:
-                interval2 = (a, b)
-                break
-
-        if interval1 != interval2 and interval1 is not None and interval2 is not None:
-            result += next_interval[1] - next_interval[0] - 1
-            intervals.remove(interval1)
-            intervals.remove(interval2)
-            intervals.add((interval2[0], interval1[1]))
-            return True
-
-        return False
-
-    def joined_to_one_interval(
-        intervals: set[tuple[int, int]],
-        next_interval: tuple[int, int],
-    ) -> bool:
-        nonlocal result
-
-        for a, b in intervals:
-            if b == next_interval[0]:
-                result += next_interval[1] - next_interval[0]
-                intervals.add((a, next_interval[1]))
-                break
-            if b == next_interval[1]:
-                intervals.add((a, next_interval[0]))
-                break
-            if a == next_interval[1]:
-                result += next_interval[1] - next_interval[0]
-                intervals.add((next_interval[0], b))
-                break
-            if a == next_interval[0]:
-                intervals.add((next_interval[1], b))
-                break
-        else:
-            return False
-
-        intervals.remove((a, b))
-        return True
-
-    def add_interval(
-        intervals: set[tuple[int, int]],
-        next_interval: tuple[int, int],
-    ) -> None:
-        nonlocal result
-
-        intervals.add(next_interval)
-        result += next_interval[1] - next_interval[0] + 1
-
-    intervals: set[tuple[int, int]] = set()
-    pointer = loop[0][0]
-    result = 0
+    return area(loop)
 
-    for i in range(0, len(loop), 2):
-        next_pointer = loop[i][0]
-        next_interval = (loop[i][1], loop[i + 1][1])
-
-        for a, b in intervals:
-            result += (b - a + 1) * (next_pointer - pointer)
-
-        pointer = next_pointer
 
-        if contains_interval(intervals, next_interval):
-            continue
-        elif in_between_interval(intervals, next_interval):
-            continue
-        elif joined_to_two_intervals(intervals, next_interval):
-            continue
-        elif joined_to_one_interval(intervals, next_interval):
-            continue
-        else:
-            add_interval(intervals, next_interval)
+def solve(part: int, puzzle_input: str) -> int:
+    if part == 1:
+        return part_one(puzzle_input)
+    if part == 2:
+        return part_two(puzzle_input)
 
-    print(result)
+    raise ValueError(f"Invalid part: {part}")
 
 
-with open(os.path.join(os.path.dirname(__file__), "input.txt")) as f:
-    puzzle_input = f.read()
+if __name__ == "__main__":
+    with open(os.path.join(os.path.dirname(__file__), "input.txt")) as f:
+        puzzle_input = f.read()
 
-part_one(puzzle_input)
-part_two(puzzle_input)
+    print(part_one(puzzle_input))
+    print(part_two(puzzle_input))
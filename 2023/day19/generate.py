@@ -0,0 +1,65 @@
+import random
+import string
+
+# Roughly the number of workflows in a real puzzle input
+SIZE = 550
+
+RATINGS = 200
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate `size` workflows and 200 part ratings
+
+    The workflows form a tree rooted at "in", so that every part is either
+    accepted or rejected. Each workflow has at least one rule, and each rule
+    sends parts to another workflow, or straight to "A" or "R".
+    """
+    rng = random.Random(seed)
+
+    used = {"in"}
+
+    def new_name() -> str:
+        while True:
+            name = "".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 3)))
+
+            if name not in used:
+                used.add(name)
+                return name
+
+    names = ["in"] + [new_name() for _ in range(size - 1)]
+
+    # Each workflow (apart from "in") is sent parts by exactly one earlier
+    # workflow
+    targets: list[list[str]] = [[] for _ in names]
+
+    for i in range(1, len(names)):
+        targets[rng.randrange(i)].append(names[i])
+
+    workflows: list[str] = []
+
+    for name, children in zip(names, targets):
+        # Each workflow has between one and three rules, and one more target
+        # than it has rules
+        count = rng.randint(2, 4)
+
+        while len(children) < count:
+            children.append(rng.choice("AR"))
+
+        rng.shuffle(children)
+
+        rules = [
+            f"{rng.choice('xmas')}{rng.choice('<>')}{rng.randint(1, 4000)}:{child}"
+            for child in children[:-1]
+        ]
+
+        workflows.append(f"{name}{{{','.join(rules + children[-1:])}}}")
+
+    rng.shuffle(workflows)
+
+    ratings = [
+        "{" + ",".join(f"{category}={rng.randint(1, 4000)}" for category in "xmas") + "}"
+        for _ in range(RATINGS)
+    ]
+
+    return "\n".join(workflows) + "\n\n" + "\n".join(ratings) + "\n"
@@ -1,14 +1,25 @@
 import os
 import re
+import sys
 from typing import TypedDict
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from aoc.intervals import IntervalSet
+from aoc.model import model
+
 
 class Workflow(TypedDict):
     instructions: list[str]
     final: str
 
 
-def part_one(puzzle_input: str) -> None:
+@model
+def parse(puzzle_input: str) -> tuple[dict[str, Workflow], list[tuple[int, int, int, int]]]:
+    """
+    Parse the puzzle input into the workflows, by name, and the (x, m, a, s)
+    ratings of each part
+    """
     workflows_string, ratings_string = puzzle_input.strip().split("\n\n")
 
     workflows_list = workflows_string.splitlines()
@@ -40,9 +51,8 @@ def part_one(puzzle_input: str) -> None:
         #   }
         # }
 
-    result = 0
+    parts: list[tuple[int, int, int, int]] = []
 
-    # Loop through each rating in turn
     for line in ratings:
         # Remove the brackets
         categories = line[1:-1].split(",")
@@ -50,6 +60,18 @@ def part_one(puzzle_input: str) -> None:
         # Extract the numbers from the line (each line is always in 'xmas' order)
         x, m, a, s = (int(cat.split("=")[1]) for cat in categories)
 
+        parts.append((x, m, a, s))
+
+    return workflows, parts
+
+
+def part_one(puzzle_input: str) -> int:
+    workflows, parts = parse(puzzle_input)
+
+    result = 0
+
+    # Loop through each rating in turn
+    for x, m, a, s in parts:
         # The starting workflow
         name = "in"
 
@@ -75,60 +97,39 @@ def part_one(puzzle_input: str) -> None:
         if name == "A":
             result += x + m + a + s
 
-    print(result)
-
+    return result
 
-def part_two(puzzle_input: str) -> None:
-    workflows_string = puzzle_input.strip().split("\n\n")[0]
-    workflows_list = workflows_string.splitlines()
 
-    workflows: dict[str, Workflow] = {}
+def part_two(puzzle_input: str) -> int:
+    workflows, _ = parse(puzzle_input)
 
-    for line in workflows_list:
-        match = re.match(r"(\w+){(.+),(\w+)}", line)
-        assert match is not None
-
-        name, instructions, final = match.groups()
-
-        workflows[name] = {
-            "instructions": instructions.split(","),
-            "final": final,
-        }
-
-    def calculate(ratings: dict[str, tuple[int, int]]) -> int:
+    def calculate(ratings: dict[str, IntervalSet]) -> int:
         """
         Calculate the distinct combinations for this range of ratings
         """
 
         result = 1
 
-        for low, high in ratings.values():
-            result *= high - low + 1
+        for values in ratings.values():
+            result *= values.size
 
         return result
 
-    # We will use a queue to perform BFS
-    # Each item in the queue contains the range of values for each rating
-    # i.e. { "x": (1, 4000) } means that "x" could range from 1 to 4000
+    # We will use a queue to search through the workflows
+    # Each item in the queue contains the set of values for each rating
+    # i.e. { "x": IntervalSet([(1, 4001)]) } means that "x" could range from 1
+    # to 4000 (the intervals do not include their end)
     # Each item in the queue also contains the current workflow
-    # We start from "ie", with each rating ranging from 1 to 4000
+    # We start from "in", with each rating ranging from 1 to 4000
     # Each time we move to a new workflow, add a new item to the queue
-    queue: list[tuple[dict[str, tuple[int, int]], str]] = [
-        (
-            {
-                "x": (1, 4000),
-                "m": (1, 4000),
-                "a": (1, 4000),
-                "s": (1, 4000),
-            },
-            "in",
-        )
+    queue: list[tuple[dict[str, IntervalSet], str]] = [
+        ({rating: IntervalSet([(1, 4001)]) for rating in "xmas"}, "in")
     ]
 
     result = 0
 
     while queue:
-        ratings, name = queue.pop(0)
+        ratings, name = queue.pop()
 
         # If this is rejected, then continue
         if name == "R":
@@ -143,7 +144,7 @@ def part_two(puzzle_input: str) -> None:
         instructions = workflow["instructions"]
 
         # Evaluate the expression in relation to the range in the ratings
-        # For example, x: (1, 4000), and x > 3000
+        # For example, x: 1 to 4000, and x > 3000
         for instruction in instructions:
             test, next_name = instruction.split(":")
 
@@ -154,61 +155,51 @@ def part_two(puzzle_input: str) -> None:
             rating, op, threshold = match.groups()
             threshold = int(threshold)
 
-            lower, upper = ratings[rating]
-
+            # Split the values of the rating into the values for which the
+            # expression is true, and those for which it is false
+            # For example, if x: 1 to 4000, and x > 2000, then split into 2001
+            # to 4000 (true) and 1 to 2000 (false)
             if op == ">":
-                if lower > threshold:
-                    # The full range complies with the expression, therefore
-                    # move to the next workflow
-                    queue.append((ratings, next_name))
-                    break
-                elif upper < threshold:
-                    # The full range is outside of the expression, therefore
-                    # continue to the next instruction
-                    continue
-                else:
-                    # The expression splits the range of ratings, therefore
-                    # we need to split the ratings into two
-                    # For example, if x: (1, 4000), and x > 2000, then split
-                    # into (1, 2000) and (2001, 4000)
-                    new_ratings = ratings.copy()
-                    new_upper = threshold + 1
-
-                    # In this half, the expression is true, therefore move
-                    # to the next workflow
-                    new_ratings[rating] = (new_upper, upper)
-                    queue.append((new_ratings, next_name))
-
-                    # In this half, the expression is false, therefore move
-                    # to the next instruction
-                    ratings[rating] = (lower, threshold)
-
-            # This is the same as above, but the reverse (<)
+                false, true = ratings[rating].split(threshold + 1)
             else:
-                if upper < threshold:
-                    queue.append((ratings, next_name))
-                    break
-                elif lower > threshold:
-                    continue
-                else:
-                    new_ratings = ratings.copy()
-                    new_upper = threshold - 1
+                true, false = ratings[rating].split(threshold)
+
+            # The values for which the expression is true move to the next
+            # workflow
+            if true:
+                new_ratings = ratings.copy()
+                new_ratings[rating] = true
+                queue.append((new_ratings, next_name))
 
-                    new_ratings[rating] = (lower, new_upper)
-                    queue.append((new_ratings, next_name))
+            # If the expression is true for every value, then there is nothing
+            # left for the next instruction
+            if not false:
+                break
 
-                    ratings[rating] = (threshold, upper)
+            # Otherwise, the values for which the expression is false move to
+            # the next instruction
+            ratings[rating] = false
 
         else:
             # If we have gone through all the instructions, then move to the
             # final workflow
             queue.append((ratings, workflow["final"]))
 
-    print(result)
+    return result
+
+
+def solve(part: int, puzzle_input: str) -> int:
+    if part == 1:
+        return part_one(puzzle_input)
+    if part == 2:
+        return part_two(puzzle_input)
+
+    raise ValueError(f"Invalid part: {part}")
 
 
-with open(os.path.join(os.path.dirname(__file__), "input.txt")) as f:
-    puzzle_input = f.read()
+if __name__ == "__main__":
+    with open(os.path.join(os.path.dirname(__file__), "input.txt")) as f:
+        puzzle_input = f.read()
 
-part_one(puzzle_input)
-part_two(puzzle_input)
+    print(part_one(puzzle_input))
+    print(part_two(puzzle_input))
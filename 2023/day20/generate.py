@@ -0,0 +1,80 @@
+import random
+import string
+
+# Roughly the number of flip-flops in each counter of a real puzzle input
+SIZE = 12
+
+COUNTERS = 4
+
+# Part 2 presses the button roughly 2**size times, so larger counters could
+# never be solved
+MAX_SIZE = 30
+
+
+def is_prime(n: int) -> bool:
+    return n > 1 and all(n % d for d in range(2, int(n**0.5) + 1))
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate four binary counters of `size` flip-flops each, like the real input
+
+    The broadcaster feeds the lowest flip-flop of each counter. Each counter
+    has a conjunction module which sends a high pulse once the counter reaches
+    a prime number, resetting the counter. The four counters are then combined
+    through inverters and one final conjunction module, which feeds rx.
+    """
+    if size > MAX_SIZE:
+        raise ValueError(f"Size must be at most {MAX_SIZE}: {size}")
+
+    rng = random.Random(seed)
+
+    bits = max(5, size)
+
+    used = {"rx"}
+
+    def new_name() -> str:
+        while True:
+            name = "".join(rng.choices(string.ascii_lowercase, k=2 if bits <= 12 else 3))
+
+            if name not in used:
+                used.add(name)
+                return name
+
+    # The largest bit must be set, so the counter uses all of its flip-flops
+    numbers: list[int] = []
+
+    while len(numbers) < COUNTERS:
+        n = rng.randrange(2 ** (bits - 1) + 1, 2**bits, 2)
+
+        if is_prime(n) and n not in numbers:
+            numbers.append(n)
+
+    parent = new_name()
+    modules: dict[str, list[str]] = {"broadcaster": [], f"&{parent}": ["rx"]}
+
+    for number in numbers:
+        flip_flops = [new_name() for _ in range(bits)]
+        hub, inverter = new_name(), new_name()
+
+        modules["broadcaster"].append(flip_flops[0])
+        modules[f"&{hub}"] = [inverter, flip_flops[0]]
+        modules[f"&{inverter}"] = [parent]
+
+        for i, flip_flop in enumerate(flip_flops):
+            destinations = flip_flops[i + 1 : i + 2]
+
+            if number >> i & 1:
+                destinations.append(hub)
+            elif i > 0:
+                modules[f"&{hub}"].append(flip_flop)
+
+            rng.shuffle(destinations)
+            modules[f"%{flip_flop}"] = destinations
+
+        rng.shuffle(modules[f"&{hub}"])
+
+    lines = [f"{name} -> {', '.join(destinations)}" for name, destinations in modules.items()]
+    rng.shuffle(lines)
+
+    return "\n".join(lines) + "\n"
@@ -1,8 +1,22 @@
 import math
 import os
+import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
 
-def part_one(puzzle_input: str) -> None:
+from aoc.cycles import skip_ahead
+from aoc.model import model
+
+
+@model
+def parse(
+    puzzle_input: str,
+) -> tuple[list[str], dict[str, list[str]], dict[str, list[str]], dict[str, list[str]]]:
+    """
+    Parse the puzzle input into the destination modules of the broadcaster, of
+    each flip-flop module and of each conjunction module, and the input modules
+    of each conjunction module
+    """
     array = puzzle_input.strip().splitlines()
 
     # The list of destination modules from the broadcaster
@@ -13,15 +27,9 @@ def part_one(puzzle_input: str) -> None:
     flip_flops: dict[str, list[str]] = {}
     conjunctions: dict[str, list[str]] = {}
 
-    # Dict for flip-flop modules where the key is the module name and the value is
-    # the module's current state (False - off, True - on)
-    states: dict[str, bool] = {}
-
     # Dict for conjuction modules where the key is the module name and the value is
-    # a dict containing all input modules that point to this conjuction module. The key
-    # is the name of the module and the value is the last known state of the input
-    # module
-    memory: dict[str, dict[str, bool]] = {}
+    # a list of all input modules that point to this conjuction module
+    inputs: dict[str, list[str]] = {}
 
     for line in array:
         # Parse the module's name and destination modules from the puzzle input
@@ -38,9 +46,6 @@ def part_one(puzzle_input: str) -> None:
             if prefix == "%":
                 # Flip-flop module
                 flip_flops[name] = destinations
-
-                # All flip-flop modules start in the off state
-                states[name] = False
             elif prefix == "&":
                 # Conjuction module
                 conjunctions[name] = destinations
@@ -60,23 +65,41 @@ def part_one(puzzle_input: str) -> None:
         # conjuction module
         for destination in destinations:
             if destination in conjunctions:
-                # If so, save it to the dict for this conjuction module
-                memory[destination] = memory.get(destination, {})
-                memory[destination][name] = False
+                # If so, save it to the list for this conjuction module
+                inputs.setdefault(destination, []).append(name)
+
+    return broadcaster, flip_flops, conjunctions, inputs
 
-    # Initial number of low and high pulses
-    low = high = 0
 
-    # Loop 1000 times
-    for _ in range(1000):
+def part_one(puzzle_input: str) -> int:
+    broadcaster, flip_flops, conjunctions, inputs = parse(puzzle_input)
+
+    # Dict for flip-flop modules where the key is the module name and the value is
+    # the module's current state (False - off, True - on). All flip-flop modules
+    # start in the off state
+    states: dict[str, bool] = {name: False for name in flip_flops}
+
+    # Dict for conjuction modules where the key is the module name and the value is
+    # a dict containing all input modules that point to this conjuction module. The key
+    # is the name of the module and the value is the last known state of the input
+    # module
+    memory: dict[str, dict[str, bool]] = {
+        name: dict.fromkeys(sources, False) for name, sources in inputs.items()
+    }
+
+    def press(pulses: tuple[int, int]) -> tuple[int, int]:
+        """
+        Simulate a button press, given the number of low and high pulses sent
+        so far, and return the new numbers
+        """
+        low, high = pulses
+
         # We use BFS to simulate each button press, using a list of tuples
         # (start-module, pulse, destination-module)
         # For the pulse, False - low, True - high
         queue: list[tuple[str, bool, str]] = [("button", False, "broadcaster")]
 
-        while queue:
-            start, pulse, end = queue.pop(0)
-
+        for start, pulse, end in queue:
             # Update the counters for the different pulses, depending on whether
             # the pulse is high (True) or low (False)
             if pulse:
@@ -110,50 +133,39 @@ def part_one(puzzle_input: str) -> None:
                 for dest in conjunctions[end]:
                     queue.append((end, next_pulse, dest))
 
-    # The final result is the product of the total number of high and low pulses
-    result = low * high
-
-    print(result)
+        return low, high
 
+    def key(_: tuple[int, int]) -> bytes:
+        """
+        The state of every flip-flop and every conjunction module's memory, one
+        byte each
+        """
+        return bytes(states.values()) + b"".join(
+            bytes(inputs.values()) for inputs in memory.values()
+        )
 
-def part_two(puzzle_input: str) -> None:
-    array = puzzle_input.strip().splitlines()
-
-    broadcaster: list[str] = []
-    flip_flops: dict[str, list[str]] = {}
-    conjunctions: dict[str, list[str]] = {}
+    # Press the button 1000 times, starting with no pulses sent. If the modules
+    # return to an earlier state, then skip ahead over the repeats, adding on
+    # the pulses sent by the skipped presses.
+    pulses, skipped = skip_ahead((0, 0), press, 1000, key, lambda pulses: pulses)
 
-    states: dict[str, bool] = {}
-    memory: dict[str, dict[str, bool]] = {}
+    assert isinstance(skipped, tuple)
 
-    for line in array:
-        name, destinations = line.split(" -> ")
-        destinations = destinations.split(", ")
+    low, high = (count + extra for count, extra in zip(pulses, skipped))
 
-        if name == "broadcaster":
-            broadcaster = destinations
-        else:
-            prefix, name = name[0], name[1:]
+    # The final result is the product of the total number of high and low pulses
+    result = low * high
 
-            if prefix == "%":
-                flip_flops[name] = destinations
-                states[name] = False
-            elif prefix == "&":
-                conjunctions[name] = destinations
-            else:
-                raise Exception
+    return result
 
-    for line in array:
-        name, destinations = line.split(" -> ")
-        destinations = destinations.split(", ")
 
-        if name != "broadcaster":
-            name = name[1:]
+def part_two(puzzle_input: str) -> int:
+    broadcaster, flip_flops, conjunctions, inputs = parse(puzzle_input)
 
-        for destination in destinations:
-            if destination in conjunctions:
-                memory[destination] = memory.get(destination, {})
-                memory[destination][name] = False
+    states: dict[str, bool] = {name: False for name in flip_flops}
+    memory: dict[str, dict[str, bool]] = {
+        name: dict.fromkeys(sources, False) for name, sources in inputs.items()
+    }
 
     # Analysing the puzzle input, there is one conjuction module that feeds rx,
     # and four conjunction modules feed this. For rx to have a low pulse, the four
@@ -221,11 +233,21 @@ def part_two(puzzle_input: str) -> None:
     # The final result is the LCM of the four cycles
     result = math.lcm(*cycles)
 
-    print(result)
+    return result
+
+
+def solve(part: int, puzzle_input: str) -> int:
+    if part == 1:
+        return part_one(puzzle_input)
+    if part == 2:
+        return part_two(puzzle_input)
+
+    raise ValueError(f"Invalid part: {part}")
 
 
-with open(os.path.join(os.path.dirname(__file__), "input.txt")) as f:
-    puzzle_input = f.read()
+if __name__ == "__main__":
+    with open(os.path.join(os.path.dirname(__file__), "input.txt")) as f:
+        puzzle_input = f.read()
 
-part_one(puzzle_input)
-part_two(puzzle_input)
+    print(part_one(puzzle_input))
+    print(part_two(puzzle_input))
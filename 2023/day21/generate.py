@@ -0,0 +1,38 @@
+import random
+
+# Roughly the width and height of the garden in a real puzzle input
+SIZE = 131
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate a `size` x `size` garden, with the start in the middle
+
+    Like the real input, the middle row and column, the border, and a diamond
+    around the start are all clear of rocks, so the number of reachable plots
+    in the infinite garden grows quadratically.
+    """
+    rng = random.Random(seed)
+
+    # The garden must have a middle square
+    size = max(5, size | 1)
+    middle = size // 2
+
+    rows: list[str] = []
+
+    for i in range(size):
+        row: list[str] = []
+
+        for j in range(size):
+            distance = abs(i - middle) + abs(j - middle)
+
+            if (i, j) == (middle, middle):
+                row.append("S")
+            elif i in (0, middle, size - 1) or j in (0, middle, size - 1) or abs(distance - middle) <= 1:
+                row.append(".")
+            else:
+                row.append("#" if rng.random() < 0.15 else ".")
+
+        rows.append("".join(row))
+
+    return "\n".join(rows) + "\n"
@@ -1,7 +1,18 @@
 import os
+import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
 
-def part_one(puzzle_input: str) -> None:
+from aoc.grid import Grid
+
+ROCK = ord("#")
+
+
+def part_one(puzzle_input: str) -> int:
+    """
+    The reference solution, kept from before the port to `Grid`. `solve()`
+    uses `part_one_grid()`, which `python -m aoc.variants` checks against it.
+    """
     # Parse the input as a list of list of strings
     array = puzzle_input.strip().splitlines()
     grid = [list(line) for line in array]
@@ -65,10 +76,14 @@ def part_one(puzzle_input: str) -> None:
     # The final result will be the total number of squares we visited
     result = len(seen)
 
-    print(result)
+    return result
 
 
-def part_two(puzzle_input: str) -> None:
+def part_two(puzzle_input: str) -> int:
+    """
+    The reference solution, kept from before the port to `Grid`. `solve()`
+    uses `part_two_grid()`, which `python -m aoc.variants` checks against it.
+    """
     array = puzzle_input.strip().splitlines()
     grid = [list(line) for line in array]
 
@@ -172,11 +187,205 @@ def part_two(puzzle_input: str) -> None:
     constant = diff3[-1]
     result = int(diff1[-3] + (steps / 2) * (2 * diff2[-2] + (steps - 1) * constant))
 
-    print(result)
+    return result
+
+
+def part_one_grid(puzzle_input: str) -> int:
+    """
+    The same as `part_one()`, on a flat `Grid` with a border of rocks
+    """
+    # Parse the input as a grid, surrounded by a border of rocks, so every step
+    # stays within the grid
+    grid = Grid.parse(puzzle_input, border="#")
+    cells = grid.cells
+
+    # Find the start point
+    start = grid.find("S")
+
+    # The directions we can move in
+    moves = grid.neighbours
+
+    # The plots we have seen so far, one byte per square
+    seen = bytearray(len(cells))
+    seen[start] = 1
+    count = 1
+
+    # Queue of plots used for BFS
+    queue: list[int] = [start]
+
+    # Instead of moving one square at a time, we move two squares at once, and perform
+    # half as many loops. This way, we do not have to navigate to squares we have
+    # already visited.
+    for _ in range(64 // 2):
+        new_queue: list[int] = []
+
+        for index in queue:
+            for a in moves:
+                # Take one step from the current square, and check to see if
+                # we are on a garden plot
+                index1 = index + a
+
+                if cells[index1] != ROCK:
+                    # If so, take a second step and check to see if this step is
+                    # also valid
+                    for b in moves:
+                        index2 = index1 + b
+
+                        if cells[index2] != ROCK and not seen[index2]:
+                            # Add the new square to the queue
+                            seen[index2] = 1
+                            count += 1
+                            new_queue.append(index2)
+
+        queue = new_queue
+
+    # The final result will be the total number of squares we visited
+    result = count
+
+    return result
+
+
+def part_two_grid(puzzle_input: str) -> int:
+    """
+    The same as `part_two()`, on a flat `Grid`, whose border marks the
+    edge of each tile
+    """
+    # The grid now repeats infinitely. Each copy of the grid is a tile, and each
+    # square is identified by its tile and its index within the grid. The border
+    # is marked as "%", to know when we are moving onto the next tile.
+    grid = Grid.parse(puzzle_input, border="%")
+    cells = grid.cells
+    border = grid.border
+
+    start = grid.find("S")
+
+    moves = grid.neighbours
+
+    # A tile is numbered `row * TILES + column`, where (0, 0) is the tile that
+    # we start in, and a square is numbered `tile * size + index`
+    TILES = 1 << 20
+    size = len(cells)
+
+    # Stepping onto the border of the grid moves onto the square on the opposite
+    # edge of the neighbouring tile. `wrapped` is a dict where the key is the
+    # index of a square on the border, and the value is the index of that square
+    # in the neighbouring tile, and the change in tile number.
+    wrapped: dict[int, tuple[int, int]] = {}
+
+    for index in grid.indices():
+        for a in moves:
+            if cells[index + a] == border:
+                new_index, row, column = grid.wrap(index + a)
+                wrapped[index + a] = (new_index, row * TILES + column)
+
+    total = 26501365
+
+    # We would expect the sequence to loop on a cycle of len(grid) number of
+    # iterations (note that the puzzle input is a square). We multiply this by
+    # 2 because we are looping 2 iterations at a time.
+    step = grid.height * 2
+
+    # Once we find the cycle in the sequence, we can skip forwards to the result.
+    # To be able to skip forwards, we need to find the offset, so that:
+    # offset + (step * n) == total, where n is an integer
+    offset = total % step
+
+    # Note that because the total number of steps is an odd number, we need to
+    # perform one single step before looping in steps of 2
+    seen: set[int] = set()
+    queue: list[int] = []
+
+    iteration = 1
+
+    for a in moves:
+        index, tile = start + a, 0
+
+        if cells[index] == border:
+            index, tile = wrapped[index]
+
+        if cells[index] != ROCK:
+            seen.add(tile * size + index)
+            queue.append(tile * size + index)
+
+    # From analysing the solution, after x amount of iterations, the sequence of
+    # `step` iterations forms a quadratic sequence. `diff1` containa the difference
+    # between two consecutive numbers, `diff2` contains the difference between
+    # two consecutive numbers in `diff1`, and similar for `diff3`. For a
+    # quadratic sequence, we would expect `diff3` to contain the same number
+    # each time, therefore we iterate until two consecutive values in `diff3` are
+    # the same.
+    diff1 = []
+    diff2 = []
+    diff3 = []
+
+    while len(diff3) < 2 or diff3[-1] != diff3[-2]:
+        new_queue: list[int] = []
+
+        for point in queue:
+            tile, index = divmod(point, size)
+
+            for a in moves:
+                # Take one step, moving onto the next tile if we step onto the
+                # border
+                index1, tile1 = index + a, tile
+
+                if cells[index1] == border:
+                    index1, change = wrapped[index1]
+                    tile1 += change
+
+                if cells[index1] != ROCK:
+                    for b in moves:
+                        index2, tile2 = index1 + b, tile1
+
+                        if cells[index2] == border:
+                            index2, change = wrapped[index2]
+                            tile2 += change
+
+                        if cells[index2] != ROCK:
+                            new_point = tile2 * size + index2
+
+                            if new_point not in seen:
+                                seen.add(new_point)
+                                new_queue.append(new_point)
+
+        queue = new_queue
+
+        iteration += 2
+
+        # We save the values every `step` number of iterations, from `offset`
+        if (iteration - offset) % step == 0:
+            diff1.append(len(seen))
+
+            if len(diff1) > 1:
+                diff2.append(diff1[-1] - diff1[-2])
+
+            if len(diff2) > 1:
+                diff3.append(diff2[-1] - diff2[-2])
+
+    # `steps` is how much we need to move forwards from the number of iterations
+    # we performed to the final number of iterations, `total`
+    steps = ((total - iteration) // step) + 2
+
+    # Once we have reached here, we have enough values to find the final result,
+    # essentially by calculating the sum of an arithmetic sequence.
+    constant = diff3[-1]
+    result = int(diff1[-3] + (steps / 2) * (2 * diff2[-2] + (steps - 1) * constant))
+
+    return result
+
+
+def solve(part: int, puzzle_input: str) -> int:
+    if part == 1:
+        return part_one_grid(puzzle_input)
+    if part == 2:
+        return part_two_grid(puzzle_input)
+
+    raise ValueError(f"Invalid part: {part}")
 
 
-with open(os.path.join(os.path.dirname(__file__), "input.txt")) as f:
-    puzzle_input = f.read()
+if __name__ == "__main__":
+    with open(os.path.join(os.path.dirname(__file__), "input.txt")) as f:
+        puzzle_input = f.read()
 
-part_one(puzzle_input)
-part_two(puzzle_input)
+    print(solve(1, puzzle_input))
+    print(solve(2, puzzle_input))
@@ -0,0 +1,49 @@
+import random
+
+# Roughly the number of bricks in a real puzzle input
+SIZE = 1200
+
+WIDTH = 10
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate a snapshot of `size` falling bricks in a 10x10 column
+
+    Each brick is up to four cubes long in one direction. No two bricks
+    overlap, and every brick starts above the ground.
+    """
+    rng = random.Random(seed)
+
+    occupied: set[tuple[int, int, int]] = set()
+    bricks: list[str] = []
+
+    # Spread the bricks out over a tall column
+    height = max(10, size // 4)
+
+    while len(bricks) < size:
+        x, y, z = rng.randrange(WIDTH), rng.randrange(WIDTH), rng.randint(1, height)
+
+        length = rng.randint(0, 3)
+        axis = rng.randrange(3)
+
+        end = [x, y, z]
+        end[axis] += length
+
+        if end[0] >= WIDTH or end[1] >= WIDTH:
+            continue
+
+        cubes: set[tuple[int, int, int]] = set()
+
+        for k in range(length + 1):
+            cube = [x, y, z]
+            cube[axis] += k
+            cubes.add((cube[0], cube[1], cube[2]))
+
+        if cubes & occupied:
+            continue
+
+        occupied |= cubes
+        bricks.append(f"{x},{y},{z}~{end[0]},{end[1]},{end[2]}")
+
+    return "\n".join(bricks) + "\n"
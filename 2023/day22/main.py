@@ -1,8 +1,21 @@
 import heapq
 import os
+import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
 
-def part_one(puzzle_input: str) -> None:
+from aoc.model import model
+
+
+@model
+def parse(
+    puzzle_input: str,
+) -> tuple[dict[tuple[int, int, int], int], dict[int, list[tuple[int, int, int]]]]:
+    """
+    Let the bricks fall and settle, returning the `coordinates` dict, which maps
+    each occupied coordinate to the ID of its brick, and the `shapes` dict, which
+    maps each brick ID to the list of its coordinates.
+    """
     array = puzzle_input.strip().splitlines()
 
     # Parse the puzzle input as a list of bricks
@@ -83,6 +96,12 @@ def part_one(puzzle_input: str) -> None:
                     shapes[i] = shapes.get(i, [])
                     shapes[i].append((x, y, z))
 
+    return coordinates, shapes
+
+
+def part_one(puzzle_input: str) -> int:
+    coordinates, shapes = parse(puzzle_input)
+
     def connected(
         main: int,
         check: int,
@@ -135,59 +154,11 @@ def part_one(puzzle_input: str) -> None:
             # to the result
             result += 1
 
-    print(result)
+    return result
 
 
-def part_two(puzzle_input: str) -> None:
-    array = puzzle_input.strip().splitlines()
-
-    bricks = [
-        [tuple(map(int, brick.split(","))) for brick in line.split("~")]
-        for line in array
-    ]
-
-    for brick in bricks:
-        brick.sort(key=lambda x: x[2])
-
-    bricks.sort(key=lambda x: x[0][2])
-
-    def valid(
-        brick: list[tuple[int, ...]], coordinates: dict[tuple[int, int, int], int]
-    ) -> list[tuple[int, ...]] | None:
-        new_brick = [
-            (brick[0][0], brick[0][1], brick[0][2] - 1),
-            (brick[1][0], brick[1][1], brick[1][2] - 1),
-        ]
-
-        for x in range(new_brick[0][0], new_brick[1][0] + 1):
-            for y in range(new_brick[0][1], new_brick[1][1] + 1):
-                for z in range(new_brick[0][2], new_brick[1][2] + 1):
-                    if (x, y, z) in coordinates:
-                        return None
-
-        return new_brick
-
-    coordinates: dict[tuple[int, int, int], int] = {}
-    shapes: dict[int, list[tuple[int, int, int]]] = {}
-
-    for i, brick in enumerate(bricks):
-        start, end = brick
-        z = start[2]
-
-        while z > 1 and (new_brick := valid(brick, coordinates)):
-            brick = new_brick
-            bricks[i] = brick
-            z -= 1
-
-        start, end = brick
-
-        for x in range(start[0], end[0] + 1):
-            for y in range(start[1], end[1] + 1):
-                for z in range(start[2], end[2] + 1):
-                    coordinates[(x, y, z)] = i
-
-                    shapes[i] = shapes.get(i, [])
-                    shapes[i].append((x, y, z))
+def part_two(puzzle_input: str) -> int:
+    coordinates, shapes = parse(puzzle_input)
 
     # Dict where the key is the brick ID, and the value is a set of bricks
     # that are below
@@ -245,11 +216,21 @@ def part_two(puzzle_input: str) -> None:
         # the disintegrated brick itself
         result += len(fallen) - 1
 
-    print(result)
+    return result
+
+
+def solve(part: int, puzzle_input: str) -> int:
+    if part == 1:
+        return part_one(puzzle_input)
+    if part == 2:
+        return part_two(puzzle_input)
+
+    raise ValueError(f"Invalid part: {part}")
 
 
-with open(os.path.join(os.path.dirname(__file__), "input.txt")) as f:
-    puzzle_input = f.read()
+if __name__ == "__main__":
+    with open(os.path.join(os.path.dirname(__file__), "input.txt")) as f:
+        puzzle_input = f.read()
 
-part_one(puzzle_input)
-part_two(puzzle_input)
+    print(part_one(puzzle_input))
+    print(part_two(puzzle_input))
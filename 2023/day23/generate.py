@@ -0,0 +1,66 @@
+import random
+
+# Roughly the number of junctions along each side of the lattice of trails in
+# a real puzzle input
+SIZE = 6
+
+SPACING = 22
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate a map of hiking trails between a `size` x `size` lattice of
+    junctions, like the real input
+
+    Neighbouring junctions are joined by a trail, with a slope at each end
+    that only allows walking right or down. Horizontal trails take a random
+    detour up or down, so that trails differ in length. Each detour stays
+    within half of the gap between two rows of junctions, so trails never
+    touch.
+
+    The number of possible hikes grows exponentially with `size`.
+    """
+    rng = random.Random(seed)
+
+    junctions = max(2, size)
+    length = SPACING * (junctions - 1) + 3
+
+    grid = [["#"] * length for _ in range(length)]
+
+    # Junction (i, j) is at square (1 + SPACING * i, 1 + SPACING * j)
+    grid[0][1] = grid[length - 1][length - 2] = "."
+
+    for i in range(junctions):
+        for j in range(junctions):
+            x, y = 1 + SPACING * i, 1 + SPACING * j
+            grid[x][y] = "."
+
+            # Trail down to the next junction
+            if i < junctions - 1:
+                for k in range(1, SPACING):
+                    grid[x + k][y] = "."
+
+                grid[x + 1][y] = grid[x + SPACING - 1][y] = "v"
+
+            # Trail right to the next junction
+            if j < junctions - 1:
+                # Only detour into the gaps between rows of junctions
+                options = [0] + [d for d in (-1, 1) if 0 <= i + (d + 1) // 2 - 1 < junctions - 1]
+                direction = rng.choice(options)
+                depth = rng.randint(1, (SPACING - 2) // 2 - 1) if direction else 0
+                start = rng.randint(2, SPACING // 2 - 1)
+                end = rng.randint(SPACING // 2 + 1, SPACING - 2)
+
+                for k in range(1, SPACING):
+                    if start < k < end:
+                        grid[x + direction * depth][y + k] = "."
+                    else:
+                        grid[x][y + k] = "."
+
+                for d in range(depth + 1):
+                    grid[x + direction * d][y + start] = "."
+                    grid[x + direction * d][y + end] = "."
+
+                grid[x][y + 1] = grid[x][y + SPACING - 1] = ">"
+
+    return "\n".join("".join(row) for row in grid) + "\n"
@@ -1,8 +1,21 @@
 import os
+import sys
 from collections import deque
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
 
-def part_one(puzzle_input: str) -> None:
+from aoc import counters
+from aoc.grid import Grid
+
+PATH = ord(".")
+FOREST = ord("#")
+
+
+def part_one(puzzle_input: str) -> int:
+    """
+    The reference solution, kept from before the port to `Grid`. `solve()`
+    uses `part_one_grid()`, which `python -m aoc.variants` checks against it.
+    """
     directions: dict[str, tuple[int, int]] = {
         "up": (-1, 0),
         "down": (1, 0),
@@ -96,10 +109,14 @@ def part_one(puzzle_input: str) -> None:
 
             queue.append((*move[:2], seen_copy))
 
-    print(result)
+    return result
 
 
-def part_two(puzzle_input: str) -> None:
+def part_two(puzzle_input: str) -> int:
+    """
+    The reference solution, kept from before the port to `Grid`. `solve()`
+    uses `part_two_grid()`, which `python -m aoc.variants` checks against it.
+    """
     directions: dict[str, tuple[int, int]] = {
         "up": (-1, 0),
         "down": (1, 0),
@@ -246,11 +263,290 @@ def part_two(puzzle_input: str) -> None:
     # start node in the total distance travelled
     result = recurse(start, {start}, 0, graph) - 1
 
-    print(result)
+    return result
+
+
+def part_one_grid(puzzle_input: str) -> int:
+    """
+    The same as `part_one()`, on a flat `Grid` with a border of forest
+    """
+    # Parse the grid, surrounded by a border of forest, so every move stays
+    # within the grid
+    grid = Grid.parse(puzzle_input, border="#")
+    cells = grid.cells
+
+    directions: dict[str, int] = {
+        "up": grid.up,
+        "down": grid.down,
+        "left": grid.left,
+        "right": grid.right,
+    }
+
+    # Dict containing directions and the slopes we cannot go in for that direction
+    opposites: dict[str, int] = {
+        "up": ord("v"),
+        "down": ord("^"),
+        "left": ord(">"),
+        "right": ord("<"),
+    }
+
+    # Find the start and end points, the paths in the top and bottom rows
+    start = grid.find(".")
+    end = cells.index(PATH, grid.index(grid.height - 1, 0))
+
+    seen: set[int] = {start}
+    queue: deque[tuple[int, set[int]]] = deque([(start, seen)])
+
+    result = 0
+
+    # Counts of the states and queue operations, if counting is enabled
+    counts = counters.active()
+
+    while queue:
+        index, seen = queue.popleft()
+
+        if counts is not None:
+            counts["states"] += 1
+
+        # If we are at the end, then the length of the path will be the length
+        # of all the squares traversed
+        # Subtract 1 due to the start square which is not included in the length
+        if index == end:
+            result = max(result, len(seen) - 1)
+
+        # List of tuples containing the next square to move to
+        # (index, slope)
+        # `slope` is the index of a slope that we passed through
+        # If `slope` is None then we did not pass through a slope
+        next_moves: list[tuple[int, int | None]] = []
+
+        # Iterate in all directions
+        for dir, step in directions.items():
+            new_index = index + step
+
+            # Check if we have been on this square before
+            if new_index in seen:
+                continue
+
+            char = cells[new_index]
+
+            # Empty path, can move to square
+            if char == PATH:
+                next_moves.append((new_index, None))
+            # Forest (or the border), cannot move to square
+            elif char == FOREST:
+                continue
+            # Can only move to this square if we are not going up a slope
+            # Add both the index of the slope we passed through and the index
+            # of the square after the slope
+            elif opposites[dir] != char:
+                next_moves.append((new_index + step, new_index))
+
+        # Add each next move to the queue, copying the set containing visited squares
+        for new_index, slope in next_moves:
+            # If there is only one move to make, then can use the same set
+            if len(next_moves) == 1:
+                seen_copy = seen
+            else:
+                seen_copy = seen.copy()
+
+            seen_copy.add(new_index)
+
+            # Also add the index of the slope, if we passed through one
+            if slope:
+                seen_copy.add(slope)
+
+            queue.append((new_index, seen_copy))
+
+            if counts is not None:
+                counts["pushes"] += 1
+
+    return result
+
+
+def part_two_grid(puzzle_input: str) -> int:
+    """
+    The same as `part_two()`, on a flat `Grid`
+    """
+    grid = Grid.parse(puzzle_input, border="#")
+    cells = grid.cells
+
+    directions: dict[str, int] = {
+        "up": grid.up,
+        "down": grid.down,
+        "left": grid.left,
+        "right": grid.right,
+    }
+
+    opposites: dict[str, str] = {
+        "up": "down",
+        "down": "up",
+        "left": "right",
+        "right": "left",
+    }
+
+    start = grid.find(".")
+    end = cells.index(PATH, grid.index(grid.height - 1, 0))
+
+    def draw_graph(
+        start: int,
+        current: int,
+        dir: str,
+        graph: dict[int, dict[int, int]],
+    ):
+        """
+        Function to create a graph of nodes from the puzzle input.
+        A node is considered as a square in the graph where there is more than
+        one direction to move in, i.e. a junction
+
+        start - The node we are leaving, looking for adjacent nodes
+        current - The index directly next to the `start` node, which indicates
+            where we are moving away from the start node
+        dir - The current direction we are moving in
+        graph - The graph we are populating
+
+        The paths still to follow are kept on a stack, rather than recursing
+        into each path, so a maze with a long chain of junctions doesn't hit the
+        recursion limit. They are followed in the same order as a recursive
+        depth-first search
+        """
+        stack: list[tuple[int, int, str]] = [(start, current, dir)]
+
+        while stack:
+            start, current, dir = stack.pop()
+
+            # We start by assuming we have taken one step
+            steps = 1
+            point = current
+
+            # We mark each square with "#" as we move through the grid, therefore if
+            # we find a "#" then we have already been here and can move on
+            if cells[current] == FOREST:
+                continue
+
+            # Loop until we arrive at another node
+            while True:
+                next_moves: list[tuple[int, str]] = []
+
+                # Mark this square as visited
+                cells[point] = FOREST
+
+                # Iterate in all directions
+                for new_dir, step in directions.items():
+                    new_index = point + step
+
+                    # We cannot move in the direction back to where we came from
+                    if dir == opposites[new_dir]:
+                        continue
+
+                    # If the square is not a forest (or the border) then it is a valid
+                    # move, however it may be marked as "#" if it is actually a node we
+                    # have already visited. In this case, it will be in `graph`
+                    if cells[new_index] != FOREST or new_index in graph:
+                        next_moves.append((new_index, new_dir))
+
+                # If there is only one move to make, then make the move
+                if len(next_moves) == 1:
+                    point, dir = next_moves[0]
+                    steps += 1
+
+                    # If we are at a node (that we've already visited), then break
+                    if point in graph:
+                        break
+
+                # Otherwise, stop moving and break
+                else:
+                    break
+
+            # Add the distance between the two nodes to the graph, from both ends
+            graph[start] = graph.get(start, {})
+            graph[start][point] = steps
+
+            graph[point] = graph.get(point, {})
+            graph[point][start] = steps
+
+            # Follow the next possible moves, the first one first
+            for move in reversed(next_moves):
+                # `move` is the index of the next point we will start iterating from,
+                # which is directly next to `point`, and the direction to it
+                stack.append((point, *move))
+
+    def search(start: int, graph: dict[int, dict[int, int]]) -> int:
+        """
+        Function to perform DFS to find the maximum length path
+
+        The path is kept on a stack of each node on it, the distance to the
+        node, and an iterator over the connected nodes still to try from it,
+        rather than recursing into each node
+        """
+        result = 0
+
+        visited = {start}
+        stack = [(start, 0, iter(graph[start].items()))]
+
+        if counts is not None:
+            counts["states"] += 1
+
+        while stack:
+            node, total, connected = stack[-1]
+
+            # Find the next connected node which isn't on the path
+            for n, steps in connected:
+                if n not in visited:
+                    break
+                if counts is not None:
+                    counts["prunes"] += 1
+            else:
+                # Every connected node has been tried, so backtrack
+                stack.pop()
+                visited.discard(node)
+                continue
+
+            if counts is not None:
+                counts["states"] += 1
+
+            # If we are at the end, the total path is `total` plus the distance
+            # to the end
+            if n == end:
+                result = max(result, total + steps)
+                continue
+
+            # Add the connected node to the path, and carry on from there
+            visited.add(n)
+            stack.append((n, total + steps, iter(graph[n].items())))
+
+        return result
+
+    # Create the graph of each node and its connected nodes
+    # Each key is the index of a node, and the value is another dict of each
+    # connected node, and the distance to the node
+    # Note that `current` is `start`, instead of the index next to `start`,
+    # however this will be offset by removing 1 from the final result
+    graph: dict[int, dict[int, int]] = {}
+    draw_graph(start, start, "down", graph)
+
+    # Counts of the states and prunes, if counting is enabled
+    counts = counters.active()
+
+    # Need to subtract 1 from the result, as the algorithm will include the
+    # start node in the total distance travelled
+    result = search(start, graph) - 1
+
+    return result
+
+
+def solve(part: int, puzzle_input: str) -> int:
+    if part == 1:
+        return part_one_grid(puzzle_input)
+    if part == 2:
+        return part_two_grid(puzzle_input)
+
+    raise ValueError(f"Invalid part: {part}")
 
 
-with open(os.path.join(os.path.dirname(__file__), "input.txt")) as f:
-    puzzle_input = f.read()
+if __name__ == "__main__":
+    with open(os.path.join(os.path.dirname(__file__), "input.txt")) as f:
+        puzzle_input = f.read()
 
-part_one(puzzle_input)
-part_two(puzzle_input)
+    print(solve(1, puzzle_input))
+    print(solve(2, puzzle_input))
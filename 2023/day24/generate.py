@@ -0,0 +1,41 @@
+import random
+
+# Roughly the number of hailstones in a real puzzle input
+SIZE = 300
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate `size` hailstones, all of which are hit by a single rock thrown
+    from an integer position with an integer velocity
+
+    Each hailstone is hit at a different time, and its velocity differs from
+    the rock's by a small amount, which keeps all the positions within the
+    same range as the real input. No hailstone has a velocity of 0 in the x
+    direction.
+    """
+    rng = random.Random(seed)
+
+    rock = [rng.randint(2 * 10**14, 4 * 10**14) for _ in range(3)]
+    rock_velocity = [rng.randint(-300, 300) for _ in range(3)]
+
+    times = rng.sample(range(10**11, 10**12), size)
+
+    lines: list[str] = []
+
+    for time in times:
+        while True:
+            difference = [rng.randint(-150, 150) for _ in range(3)]
+            velocity = [a + b for a, b in zip(rock_velocity, difference)]
+
+            if velocity[0] != 0 and any(difference):
+                break
+
+        # The hailstone and the rock are in the same position at `time`
+        position = [p - d * time for p, d in zip(rock, difference)]
+
+        lines.append(
+            f"{', '.join(map(str, position))} @ {', '.join(map(str, velocity))}"
+        )
+
+    return "\n".join(lines) + "\n"
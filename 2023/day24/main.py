@@ -1,8 +1,16 @@
 import os
-import sympy as sym
+import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
 
-def part_one(puzzle_input: str) -> None:
+from aoc import backend
+
+# Modules which are slow to import and only used by part two, which the warm
+# server imports ahead of the first request
+PRELOAD = ("sympy",)
+
+
+def part_one(puzzle_input: str) -> int:
     array = puzzle_input.strip().splitlines()
 
     # List of the hailstones, [(x, y, z), (u, v, w)]
@@ -63,10 +71,56 @@ def part_one(puzzle_input: str) -> None:
             if 2e14 <= x <= 4e14 and 2e14 <= y <= 4e14:
                 result += 1
 
-    print(result)
+    return result
+
+
+def part_one_numpy(puzzle_input: str) -> int:
+    np = backend.numpy()
+
+    # Each row is a hailstone, x, y, z, u, v, w
+    hail = np.array(
+        [
+            list(map(int, line.replace(" @ ", ", ").split(", ")))
+            for line in puzzle_input.strip().splitlines()
+        ],
+        dtype=np.int64,
+    )
+
+    x, y, u, v = hail[:, 0], hail[:, 1], hail[:, 3], hail[:, 4]
+
+    result = 0
+
+    # Solve the same equations as `part_one()`, for each hailstone and every
+    # later hailstone at once
+    for i in range(len(hail) - 1):
+        x1, y1, u1, v1 = x[i], y[i], u[i], v[i]
+        x2, y2, u2, v2 = x[i + 1 :], y[i + 1 :], u[i + 1 :], v[i + 1 :]
+
+        # Parallel hailstones divide by 0, and are excluded below, as
+        # comparisons with the resulting infinities and NaNs are false
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t1 = (v2 * (x1 - x2) - u2 * (y1 - y2)) / (u2 * v1 - u1 * v2)
+
+            cross_x = x1 + t1 * u1
+            cross_y = y1 + t1 * v1
+            t2 = (cross_x - x2) / u2
+
+        crossed = (
+            (u1 * v2 != u2 * v1)
+            & (t1 >= 0)
+            & (t2 >= 0)
+            & (2e14 <= cross_x)
+            & (cross_x <= 4e14)
+            & (2e14 <= cross_y)
+            & (cross_y <= 4e14)
+        )
+
+        result += int(crossed.sum())
+
+    return result
 
 
-def part_two(puzzle_input: str) -> None:
+def part_two(puzzle_input: str) -> int:
     array = puzzle_input.strip().splitlines()
 
     hail: list[tuple[list[int], list[int]]] = []
@@ -96,7 +150,10 @@ def part_two(puzzle_input: str) -> None:
     ((x2, y2, z2), (u2, v2, w2)) = hail[1]
     ((x3, y3, z3), (u3, v3, w3)) = hail[2]
 
-    # Use sympy to solve the equations simultaneously
+    # Use sympy to solve the equations simultaneously. It is imported here, as
+    # it takes far longer to import than part one takes to run
+    import sympy as sym
+
     x, y, z, u, v, w, t1, t2, t3 = sym.symbols("x,y,z,u,v,w,t1,t2,t3")
 
     eq1 = sym.Eq(x + u * t1, x1 + u1 * t1)
@@ -116,11 +173,24 @@ def part_two(puzzle_input: str) -> None:
     # The first three values in `solution[0]` will be x, y and z, therefore add them
     result = sum(solution[0][:3])
 
-    print(result)
+    return result
+
+
+def solve(part: int, puzzle_input: str) -> int:
+    if part == 1:
+        if backend.use_numpy():
+            return part_one_numpy(puzzle_input)
+
+        return part_one(puzzle_input)
+    if part == 2:
+        return part_two(puzzle_input)
+
+    raise ValueError(f"Invalid part: {part}")
 
 
-with open(os.path.join(os.path.dirname(__file__), "input.txt")) as f:
-    puzzle_input = f.read()
+if __name__ == "__main__":
+    with open(os.path.join(os.path.dirname(__file__), "input.txt")) as f:
+        puzzle_input = f.read()
 
-part_one(puzzle_input)
-part_two(puzzle_input)
+    print(part_one(puzzle_input))
+    print(part_two(puzzle_input))
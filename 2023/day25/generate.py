@@ -0,0 +1,58 @@
+import random
+import string
+
+# Roughly the number of components in a real puzzle input
+SIZE = 1500
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate `size` components, split into two groups joined by exactly three
+    wires
+
+    Within each group, every new component is wired to four earlier ones, so
+    every component has at least four wires and the groups cannot be split
+    by cutting three wires anywhere else.
+    """
+    rng = random.Random(seed)
+
+    used: set[str] = set()
+
+    def new_name() -> str:
+        while True:
+            name = "".join(rng.choices(string.ascii_lowercase, k=3 if size < 10000 else 4))
+
+            if name not in used:
+                used.add(name)
+                return name
+
+    wires: list[tuple[str, str]] = []
+    groups: list[list[str]] = []
+
+    for count in (size // 2, size - size // 2):
+        # The first five components are all wired to each other
+        group = [new_name() for _ in range(max(5, count))]
+
+        for i, name in enumerate(group):
+            for other in group[:i] if i < 5 else rng.sample(group[:i], 4):
+                wires.append((name, other))
+
+        groups.append(group)
+
+    # Join the two groups with three wires, without sharing any components
+    for a, b in zip(rng.sample(groups[0], 3), rng.sample(groups[1], 3)):
+        wires.append((a, b))
+
+    # List each wire once, on the line of one of its components
+    connections: dict[str, list[str]] = {}
+
+    for a, b in wires:
+        if rng.random() < 0.5:
+            a, b = b, a
+
+        connections.setdefault(a, []).append(b)
+
+    lines = [f"{name}: {' '.join(others)}" for name, others in connections.items()]
+    rng.shuffle(lines)
+
+    return "\n".join(lines) + "\n"
@@ -1,155 +1,100 @@
 import os
+import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
 
-def part_one(puzzle_input: str) -> None:
+from aoc.graph import UNREACHABLE, Graph, Interner, bfs, shortest_path
+
+
+def part_one(puzzle_input: str) -> int:
     array = puzzle_input.strip().splitlines()
 
-    # Graph to represent the nodes, the key is the node and the value is a set
-    # containing the connected nodes
-    graph: dict[str, set[str]] = {}
+    # Number the nodes, and list the edges (as pairs of node numbers) in the
+    # order they appear in the puzzle input, so edge `i` is `pairs[i]`
+    nodes = Interner()
+    pairs: list[tuple[int, int]] = []
 
     for line in array:
         # Parse the node and adjacent nodes
         node, adjacents = line.split(": ")
-        adjacents = adjacents.split(" ")
-
-        if node not in graph:
-            graph[node] = set()
-
-        for adjacent in adjacents:
-            if adjacent not in graph:
-                graph[adjacent] = set()
-
-            # Add the nodes into the graph, from both ends
-            graph[node].add(adjacent)
-            graph[adjacent].add(node)
-
-    def bfs_find_path(
-        start: str, end: str, visited: set[tuple[str, ...]]
-    ) -> list[str] | None:
-        """
-        This function uses BFS to find a path between two nodes: `start` and `end`.
-        `visited` is a set that contains the edges that we cannot use, as they
-        have already been traversed.
-        """
-
-        # The queue will contain lists of nodes that we have traversed so far
-        queue: list[list[str]] = [[start]]
-
-        # Create a local copy within the function for BFS
-        visited = visited.copy()
-
-        while queue:
-            nodes = queue.pop(0)
-
-            # Take the last node from the list, which is the last node in the path
-            node = nodes[-1]
-
-            for adjacent in graph[node]:
-                # The edge is represented as a tuple from `node` to the adjacent
-                # node. The edge must be sorted so the order of the two nodes
-                # in the edge is always the same.
-                edge = tuple(sorted([node, adjacent]))
-
-                # Add the adjacent node into the path
-                new_nodes = nodes.copy()
-                new_nodes.append(adjacent)
 
-                # Only continue if we haven't used this edge yet
-                if edge not in visited:
-                    # If we are at the end node, then return the path (the list
-                    # of nodes)
-                    if adjacent == end:
-                        return new_nodes
+        for adjacent in adjacents.split(" "):
+            pairs.append((nodes.intern(node), nodes.intern(adjacent)))
 
-                    # Otherwise, add the edge into the visited set, and add the
-                    # new path to the queue
-                    visited.add(edge)
-                    queue.append(new_nodes)
-
-        # If we reach here, then it was not possible to make a path from `start`
-        # to `end`
-        return None
+    # Undirected graph of the nodes
+    graph = Graph.from_edges(len(nodes), pairs)
 
     # This list will contain the three edges we are looking to remove
-    edges: list[tuple[str, str]] = []
-
-    for line in array:
-        node, adjacents = line.split(": ")
-        adjacents = adjacents.split(" ")
-
-        # Loop through each edge in the graph
-        for adjacent in adjacents:
-            visited: set[tuple[str, ...]] = set()
-
-            result = 0
-
-            # We use the function to find out how many unique shortest-length
-            # paths we can make between the two nodes, without sharing any edges.
-            # This number will tell us how many edges, including this one, would
-            # have to be disconnected in order to create two separate groups of
-            # nodes. If we find only 3 unique paths, then this is one of the
-            # edges we are looking for.
-            while nodes := bfs_find_path(node, adjacent, visited):
-                # If we find a path, add the edges into the `visited` set, then
-                # loop again with the updated set of nodes.
-                for i in range(1, len(nodes)):
-                    edge = tuple(sorted([nodes[i], nodes[i - 1]]))
-                    visited.add(edge)
-
-                # Increment the number of paths found
-                result += 1
-
-                # If we've found more than 3 paths, then move on to the next edge
-                if result > 3:
-                    break
-            else:
-                # Otherwise, this is one of the edges to disconnect
-                edges.append((node, adjacent))
+    edges: list[int] = []
+
+    # Loop through each edge in the graph
+    for edge, (node, adjacent) in enumerate(pairs):
+        # `used` contains the edges that we cannot use, as they have already
+        # been traversed
+        used = bytearray(len(pairs))
+
+        result = 0
+
+        # We use BFS to find out how many unique shortest-length paths we can
+        # make between the two nodes, without sharing any edges. This number
+        # will tell us how many edges, including this one, would have to be
+        # disconnected in order to create two separate groups of nodes. If we
+        # find only 3 unique paths, then this is one of the edges we are
+        # looking for.
+        while path := shortest_path(graph, node, adjacent, used):
+            # If we find a path, mark its edges as used, then loop again
+            for arc in path:
+                used[graph.edges[arc]] = 1
+
+            # Increment the number of paths found
+            result += 1
+
+            # If we've found more than 3 paths, then move on to the next edge
+            if result > 3:
+                break
+        else:
+            # Otherwise, this is one of the edges to disconnect
+            edges.append(edge)
 
             # If we've found all three, we can break early
             if len(edges) == 3:
                 break
-        else:
-            continue
-
-        break
 
     assert len(edges) == 3
 
     # Remove the three edges from the graph. We should now have two disconnected,
     # separate graphs.
-    for node1, node2 in edges:
-        graph[node1].remove(node2)
-        graph[node2].remove(node1)
+    removed = bytearray(len(pairs))
+
+    for edge in edges:
+        removed[edge] = 1
 
-    def bfs(start: str) -> int:
+    def size(start: int) -> int:
         """
-        Function to perform BFS on a graph, and return the number of nodes
-        in the graph.
+        Perform BFS on the graph from a node, and return the number of nodes
+        in its group
         """
-        visited: set[str] = {start}
-        queue = [start]
-
-        while queue:
-            node = queue.pop(0)
-
-            for adjacent in graph[node]:
-                if adjacent not in visited:
-                    visited.add(adjacent)
-                    queue.append(adjacent)
+        distances = bfs(graph, [start], blocked=removed)
 
-        # The result is the number of nodes iterated through
-        return len(visited)
+        return sum(distance != UNREACHABLE for distance in distances)
 
     # Perform BFS on two nodes of one of the disconnected edges, and multiply
     # the values together to get the final result
-    result = bfs(edges[0][0]) * bfs(edges[0][1])
+    node1, node2 = pairs[edges[0]]
+    result = size(node1) * size(node2)
+
+    return result
+
+
+def solve(part: int, puzzle_input: str) -> int:
+    if part == 1:
+        return part_one(puzzle_input)
 
-    print(result)
+    raise ValueError(f"Invalid part: {part}")
 
 
-with open(os.path.join(os.path.dirname(__file__), "input.txt")) as f:
-    puzzle_input = f.read()
+if __name__ == "__main__":
+    with open(os.path.join(os.path.dirname(__file__), "input.txt")) as f:
+        puzzle_input = f.read()
 
-part_one(puzzle_input)
+    print(part_one(puzzle_input))
@@ -0,0 +1,9 @@
+"""
+Tools for running the solutions in this repository.
+
+Each day's `main.py` exposes `solve(part, puzzle_input)`, which returns the
+answer without reading any files or printing anything. `python -m aoc` solves
+any selection of days in parallel, for example:
+
+    python -m aoc 2022 2023/1-10 --jobs 4
+"""
@@ -0,0 +1,145 @@
+import argparse
+import os
+import time
+
+from aoc import backend
+from aoc.answers import CACHE_ENV
+from aoc.counters import COUNTERS_ENV
+from aoc.days import all_days, parse_selection
+from aoc.runner import Result, format_result, run, tasks
+
+
+def profile(days: list[tuple[int, int]], directory: str, top: int) -> None:
+    """
+    Profile every part of every day in this process, one at a time, so the
+    parts do not compete with each other
+    """
+    # cProfile and pstats are slow to import, so only import them if needed
+    from aoc.profiling import profile_part, write_profile
+
+    for year, day, part, path in tasks(days):
+        try:
+            report, stacks = profile_part(year, day, part, path, top)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            print(format_result(Result(year, day, part, error=error)), flush=True)
+            continue
+
+        json_path, stacks_path = write_profile(directory, report, stacks)
+
+        result = Result(
+            year,
+            day,
+            part,
+            report["answer"],
+            report["wall_time"],
+            counters=report["counters"],
+        )
+        print(format_result(result), flush=True)
+        print(
+            f"    peak {report['peak_memory'] / 2**20:.2f} MiB, profile {json_path}, stacks {stacks_path}",
+            flush=True,
+        )
+
+
+def imports(days: list[tuple[int, int]], top: int) -> None:
+    """Report the time taken to import each day, in a fresh interpreter"""
+    from aoc.imports import format_report, import_report
+
+    for year, day in days:
+        print(format_report(import_report(year, day), top), flush=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m aoc",
+        description="Solve any selection of days in parallel, reporting the answer and wall time of each part.",
+    )
+    parser.add_argument(
+        "days",
+        nargs="*",
+        help='days to solve, e.g. "2022", "2022/5" or "2023/1-10" (default: every day)',
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="number of worker processes (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--mmap",
+        action="store_true",
+        help="pass the days which support it their memory-mapped input file, rather than its text",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=backend.BACKENDS,
+        default=None,
+        help="use the NumPy variants of the days which have them, or the pure-Python solutions (default: python)",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="profiles",
+        metavar="DIR",
+        help="profile each part one at a time, writing a JSON report and collapsed stacks for each to DIR (default: profiles)",
+    )
+    parser.add_argument(
+        "--cache",
+        metavar="DIR",
+        default=None,
+        help="cache the answers in DIR, keyed by the input and the source of the solution, and reuse them when neither has changed",
+    )
+    parser.add_argument(
+        "--counters",
+        action="store_true",
+        help="count the states, queue operations, cache hits and prunes in the searches of each part",
+    )
+    parser.add_argument(
+        "--imports",
+        action="store_true",
+        help="instead of solving, report the time taken to import each day and the slowest modules it imports, like python -X importtime",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=20,
+        help="number of functions and allocation sites in each profile, or modules in each import report (default: 20)",
+    )
+    args = parser.parse_args()
+
+    days: list[tuple[int, int]] = []
+
+    try:
+        for selection in args.days:
+            days += [day for day in parse_selection(selection) if day not in days]
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.backend is not None and not backend.available(args.backend):
+        parser.error(f"The {args.backend} backend is not installed")
+
+    # Set in the environment, so the worker processes see them too
+    if args.backend is not None:
+        os.environ[backend.BACKEND_ENV] = args.backend
+    if args.cache is not None:
+        os.environ[CACHE_ENV] = args.cache
+    if args.counters:
+        os.environ[COUNTERS_ENV] = "1"
+
+    start = time.perf_counter()
+
+    if args.imports:
+        imports(days or all_days(), args.top)
+    elif args.profile is not None:
+        profile(days or all_days(), args.profile, args.top)
+    else:
+        for result in run(days or all_days(), args.jobs, args.mmap):
+            print(format_result(result), flush=True)
+
+    print(f"Total wall time: {time.perf_counter() - start:.4f}s")
+
+
+if __name__ == "__main__":
+    main()
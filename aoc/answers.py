@@ -0,0 +1,154 @@
+"""
+A cache of the answer to each part on disk, so solving a slow part again on an
+unchanged input returns its answer instantly
+
+If the `AOC_ANSWER_CACHE` environment variable is set to a directory (e.g. by
+`python -m aoc --cache DIR`), each answer is stored there as a small JSON file,
+named by a hash of the year, day and part, the input file, and the source of
+the day's solution and of every `aoc` module it uses. Changing the input or
+any of that source therefore invalidates the answer.
+
+Reading an answer updates the modification time of its file, so once the
+files take up more than `AOC_ANSWER_CACHE_SIZE` bytes (16 MiB by default), the
+least recently used answers are deleted. Only answers which are ints, strings
+or `None` are cached, so they are read back exactly as they were returned.
+"""
+
+import hashlib
+import json
+import os
+import sys
+from types import ModuleType
+from typing import Any
+
+# The environment variables containing the directory of the cache, and its
+# maximum size in bytes
+CACHE_ENV = "AOC_ANSWER_CACHE"
+SIZE_ENV = "AOC_ANSWER_CACHE_SIZE"
+
+DEFAULT_SIZE = 16 * 2**20
+
+
+def cache_directory() -> str | None:
+    return os.environ.get(CACHE_ENV) or None
+
+
+def cache_size() -> int:
+    return int(os.environ.get(SIZE_ENV) or DEFAULT_SIZE)
+
+
+def _aoc_modules(module: ModuleType) -> set[ModuleType]:
+    """The modules of the `aoc` package which a module uses (directly or not)"""
+    found: set[ModuleType] = set()
+    pending = [module]
+
+    while pending:
+        current = pending.pop()
+
+        for value in vars(current).values():
+            # Both `from aoc import graph` and `from aoc.graph import dial`
+            if isinstance(value, ModuleType):
+                name = value.__name__
+            else:
+                name = getattr(value, "__module__", None) or ""
+
+            used = sys.modules.get(name)
+
+            if name.startswith("aoc.") and used is not None and used not in found:
+                found.add(used)
+                pending.append(used)
+
+    return found
+
+
+def key(year: int, day: int, part: int, path: str, module: ModuleType) -> str:
+    """
+    A hash of the part, the input file at `path`, and the source of the day's
+    solution `module` and of the `aoc` modules it uses
+    """
+    sources = sorted(
+        [module.__file__ or "", *(used.__file__ or "" for used in _aoc_modules(module))]
+    )
+
+    digest = hashlib.sha256(f"{year}/{day}/{part}".encode())
+
+    for source in [*sources, path]:
+        with open(source, "rb") as f:
+            digest.update(hashlib.file_digest(f, "sha256").digest())
+
+    return digest.hexdigest()
+
+
+def _path(directory: str, key: str) -> str:
+    return os.path.join(directory, f"{key}.json")
+
+
+def lookup(directory: str, key: str) -> tuple[bool, Any]:
+    """Whether an answer is cached, and the answer"""
+    path = _path(directory, key)
+
+    try:
+        with open(path) as f:
+            answer = json.load(f)["answer"]
+
+        # Mark the answer as recently used
+        os.utime(path)
+    except (OSError, ValueError, KeyError, TypeError):
+        return False, None
+
+    return True, answer
+
+
+def store(directory: str, key: str, answer: Any) -> None:
+    """Cache an answer, then evict the least recently used answers if needed"""
+    if answer is not None and not isinstance(answer, (int, str)):
+        return
+
+    # Only imported when storing an answer, as it is slow to import
+    import tempfile
+
+    os.makedirs(directory, exist_ok=True)
+
+    # Write the file atomically, so parallel runs never see half a file
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump({"answer": answer}, f)
+
+        os.replace(temp_path, _path(directory, key))
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+    evict(directory, cache_size())
+
+
+def evict(directory: str, size: int) -> None:
+    """Delete the least recently used answers until the cache fits in `size` bytes"""
+    entries: list[tuple[float, int, str]] = []
+
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.name.endswith(".json"):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+    total = sum(entry_size for _, entry_size, _ in entries)
+
+    # Oldest first
+    for _, entry_size, path in sorted(entries):
+        if total <= size:
+            break
+
+        try:
+            os.unlink(path)
+        except OSError:
+            # Another process already deleted it
+            pass
+
+        total -= entry_size
@@ -0,0 +1,66 @@
+"""
+An optional NumPy backend for the days with data-parallel kernels
+
+The pure-Python solutions are the reference, and are used by default. Days
+with a NumPy variant of a part (e.g. `part_one_numpy()`) use it instead when
+the `AOC_BACKEND` environment variable is `numpy` (`python -m aoc --backend
+numpy` sets it) and NumPy is installed, and fall back to the pure-Python part
+otherwise. NumPy is only imported by the NumPy variants, so it costs nothing
+to start up without it.
+
+    def solve(part: int, input: str):
+        if part == 1:
+            return part_one_numpy(input) if backend.use_numpy() else part_one(input)
+"""
+
+import importlib.util
+import os
+from contextlib import contextmanager
+from types import ModuleType
+from typing import Iterator
+
+# The environment variable selecting the backend
+BACKEND_ENV = "AOC_BACKEND"
+
+BACKENDS = ("python", "numpy")
+
+
+def name() -> str:
+    """The selected backend, which may not be installed"""
+    selected = os.environ.get(BACKEND_ENV) or "python"
+
+    if selected not in BACKENDS:
+        raise ValueError(f"Invalid backend: {selected}")
+
+    return selected
+
+
+def available(backend: str) -> bool:
+    return backend == "python" or importlib.util.find_spec(backend) is not None
+
+
+def use_numpy() -> bool:
+    """Whether to use the NumPy variants, i.e. NumPy is selected and installed"""
+    return name() == "numpy" and available("numpy")
+
+
+def numpy() -> ModuleType:
+    """The `numpy` module, imported the first time it is used"""
+    import numpy
+
+    return numpy
+
+
+@contextmanager
+def using(backend: str) -> Iterator[None]:
+    """Select a backend for the duration of the `with` block"""
+    previous = os.environ.get(BACKEND_ENV)
+    os.environ[BACKEND_ENV] = backend
+
+    try:
+        yield
+    finally:
+        if previous is None:
+            del os.environ[BACKEND_ENV]
+        else:
+            os.environ[BACKEND_ENV] = previous
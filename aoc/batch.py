@@ -0,0 +1,308 @@
+"""
+Solving one day against a batch of inputs, e.g. to validate a solution against
+many users' puzzle inputs
+
+The inputs are the files in a directory (in order of name), or in a tar or zip
+archive (in the order they are stored). They are sent to a process pool in
+chunks, with only a few chunks queued per worker, so the inputs are read as
+they are needed rather than all up front. Each worker imports the day once, so
+anything the day builds at import or caches at module level (e.g. the hand
+types of 2023 day 7, or the cube's wrap table in 2022 day 22) is shared by
+every input the worker solves. Parts 1 and 2 of an input are solved in the same
+worker, so days with a `@model` only parse each input once.
+
+The answers are written as JSON lines, in the order of the inputs, as soon as
+each chunk is solved:
+
+    {"input": "alice.txt", "part": 1, "answer": 6440, "elapsed": 0.0012}
+    {"input": "bob.txt", "part": 1, "error": "ValueError: ..."}
+"""
+
+import argparse
+import json
+import os
+import sys
+import tarfile
+import time
+import zipfile
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import chain
+from types import ModuleType
+from typing import Any, Iterable, Iterator
+
+from aoc.days import available_parts, load_module, parse_selection
+from aoc.runner import json_answer
+
+# The day solved by this worker process, or the error importing it
+_module: ModuleType | None = None
+_error: str | None = None
+
+
+def read_inputs(source: str) -> Iterator[tuple[str, str]]:
+    """The (name, text) of each input in a directory, or a tar or zip archive"""
+    if os.path.isdir(source):
+        for name in sorted(os.listdir(source)):
+            path = os.path.join(source, name)
+
+            if os.path.isfile(path):
+                with open(path) as f:
+                    yield name, f.read()
+
+    elif tarfile.is_tarfile(source):
+        with tarfile.open(source) as archive:
+            for member in archive:
+                f = archive.extractfile(member) if member.isfile() else None
+
+                if f is not None:
+                    yield member.name, f.read().decode()
+
+    elif zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as archive:
+            for info in archive.infolist():
+                if not info.is_dir():
+                    yield info.filename, archive.read(info).decode()
+
+    else:
+        raise ValueError(f"Not a directory, or a tar or zip archive: {source}")
+
+
+def _chunks(
+    inputs: Iterable[tuple[str, str]], size: int
+) -> Iterator[list[tuple[str, str]]]:
+    chunk: list[tuple[str, str]] = []
+
+    for item in inputs:
+        chunk.append(item)
+
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+
+    if chunk:
+        yield chunk
+
+
+def _load(year: int, day: int) -> None:
+    """Import the day once in each worker process"""
+    global _module, _error
+
+    try:
+        _module = load_module(year, day)
+    except Exception as e:
+        # An initializer which raises breaks the pool, so report the error for
+        # each input instead
+        _error = f"{type(e).__name__}: {e}"
+
+
+def _solve_chunk(
+    chunk: list[tuple[str, str]], parts: list[int] | None
+) -> list[dict[str, Any]]:
+    """Solve each part of each input in a chunk, in the worker process"""
+    if _module is None:
+        return [
+            {"input": name, "part": part, "error": _error}
+            for name, _ in chunk
+            for part in parts or [1]
+        ]
+
+    records: list[dict[str, Any]] = []
+
+    for name, text in chunk:
+        for part in parts or available_parts(_module):
+            record: dict[str, Any] = {"input": name, "part": part}
+
+            try:
+                start = time.perf_counter()
+                answer = _module.solve(part, text)
+                record["answer"] = json_answer(answer)
+                record["elapsed"] = time.perf_counter() - start
+            except Exception as e:
+                record["error"] = f"{type(e).__name__}: {e}"
+
+            records.append(record)
+
+    return records
+
+
+def _pool(workers: int, year: int, day: int) -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(workers, initializer=_load, initargs=(year, day))
+
+
+def _solve_alone(
+    workers: int,
+    chunks: list[list[tuple[str, str]]],
+    year: int,
+    day: int,
+    parts: list[int] | None,
+) -> tuple[ProcessPoolExecutor, list[dict[str, Any]]]:
+    """
+    Solve the inputs of the chunks which were in a pool when a worker died,
+    one at a time in a new pool, so an input which kills its worker (e.g. by
+    crashing, or running out of memory) only fails itself. Returns the pool to
+    carry on with, as each death breaks the pool.
+    """
+    executor = _pool(workers, year, day)
+    records: list[dict[str, Any]] = []
+
+    for name, text in chain.from_iterable(chunks):
+        try:
+            records += executor.submit(_solve_chunk, [(name, text)], parts).result()
+        except BrokenProcessPool as e:
+            executor.shutdown()
+            executor = _pool(workers, year, day)
+
+            records += [
+                {"input": name, "part": part, "error": f"{type(e).__name__}: {e}"}
+                for part in parts or available_parts(load_module(year, day))
+            ]
+
+    return executor, records
+
+
+def batch(
+    year: int,
+    day: int,
+    inputs: Iterable[tuple[str, str]],
+    parts: list[int] | None = None,
+    jobs: int | None = None,
+    chunk_size: int = 16,
+) -> Iterator[dict[str, Any]]:
+    """
+    Solve each part (by default, every part) of a day for each (name, text)
+    input in a process pool, yielding a record of each answer in order of the
+    inputs
+    """
+    workers = jobs or os.cpu_count() or 1
+    executor = _pool(workers, year, day)
+
+    # The chunks in the pool, and their records
+    pending: deque[tuple[list[tuple[str, str]], Future[list[dict[str, Any]]]]]
+    pending = deque()
+
+    def submit(chunk: list[tuple[str, str]]) -> None:
+        try:
+            future = executor.submit(_solve_chunk, chunk, parts)
+        except BrokenProcessPool as e:
+            # A worker died since the last chunk was sent, so fail this chunk
+            # too, and `next_records()` solves it again
+            future = Future()
+            future.set_exception(e)
+
+        pending.append((chunk, future))
+
+    def next_records() -> list[dict[str, Any]]:
+        """The records of the oldest chunk (or of every chunk, if a worker died)"""
+        nonlocal executor
+
+        chunk, future = pending.popleft()
+
+        try:
+            return future.result()
+        except BrokenProcessPool:
+            # Every chunk still in the pool failed with it
+            chunks = [chunk] + [other for other, _ in pending]
+            pending.clear()
+
+            executor.shutdown()
+            executor, records = _solve_alone(workers, chunks, year, day, parts)
+
+            return records
+
+    try:
+        for chunk in _chunks(inputs, chunk_size):
+            submit(chunk)
+
+            # Keep two chunks queued per worker, so the workers never wait for
+            # the next input to be read
+            if len(pending) > 2 * workers:
+                yield from next_records()
+
+        while pending:
+            yield from next_records()
+    finally:
+        executor.shutdown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m aoc.batch",
+        description="Solve a day for every input in a directory, or a tar or zip archive, writing the answers as JSON lines.",
+    )
+    parser.add_argument("day", help='the day to solve, e.g. "2023/7"')
+    parser.add_argument("source", help="a directory, tar or zip archive of inputs")
+    parser.add_argument(
+        "-p",
+        "--part",
+        type=int,
+        choices=(1, 2),
+        action="append",
+        default=None,
+        help="part to solve, may be repeated (default: every part)",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="number of worker processes (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "-c",
+        "--chunk-size",
+        type=int,
+        default=16,
+        help="number of inputs sent to a worker at a time (default: 16)",
+    )
+    parser.add_argument(
+        "-o", "--output", default=None, help="file to write to (default: stdout)"
+    )
+    args = parser.parse_args()
+
+    try:
+        days = parse_selection(args.day)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if len(days) != 1:
+        parser.error(f"Expected a single day: {args.day}")
+
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be at least 1")
+
+    if not os.path.exists(args.source):
+        parser.error(f"No such directory or archive: {args.source}")
+
+    year, day = days[0]
+    output = sys.stdout if args.output is None else open(args.output, "w")
+
+    start = time.perf_counter()
+    count = errors = 0
+
+    try:
+        records = batch(
+            year, day, read_inputs(args.source), args.part, args.jobs, args.chunk_size
+        )
+
+        for record in records:
+            output.write(json.dumps(record) + "\n")
+            output.flush()
+
+            count += 1
+            errors += "error" in record
+    except ValueError as e:
+        # The source is not a directory or an archive
+        parser.error(str(e))
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    print(
+        f"Solved {count} part(s) with {errors} error(s) in {time.perf_counter() - start:.4f}s",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,487 @@
+import argparse
+import functools
+import gc
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from types import ModuleType
+from typing import Callable, NamedTuple
+
+from aoc import backend, model
+from aoc.days import ROOT, all_days, available_parts, load_module, parse_selection
+from aoc.imports import startup_times
+
+# Where `--save` writes the baseline, and where it is read from by default
+BASELINE_PATH = os.path.join(ROOT, "benchmarks", "baseline.json")
+
+# A median this much slower than the baseline's (as a fraction) is a regression
+THRESHOLD = 0.1
+
+# Scaling exponents at least this large are reported as superlinear
+SUPERLINEAR = 1.5
+
+
+class Timing(NamedTuple):
+    year: int
+    day: int
+    # Part 0 is starting an interpreter and importing the day
+    part: int
+    # The size passed to the day's `generate()`
+    size: int
+    median: float = 0.0
+    p95: float = 0.0
+    error: str | None = None
+    # The peak memory allocated by one call, in bytes, if measured
+    peak: int | None = None
+
+    @property
+    def key(self) -> str:
+        return f"{self.year}/{self.day:02}/{self.part}/{self.size}"
+
+
+def percentile(values: list[float], q: float) -> float:
+    """The `q`th percentile (0 < q <= 100) of `values`, using the nearest rank"""
+    values = sorted(values)
+
+    return values[max(0, math.ceil(q / 100 * len(values)) - 1)]
+
+
+def measure(
+    solve: Callable[[str], object],
+    text: str,
+    warmup: int,
+    repeat: int,
+    max_time: float = float("inf"),
+) -> list[float]:
+    """
+    Time `repeat` calls to `solve(text)` (e.g. a day's `solve()` for one part,
+    or one variant of a part), after `warmup` untimed calls. Every call
+    parses the input from scratch, and garbage is collected before each call, so
+    one call's garbage is not charged to the next.
+
+    Slow parts are only run until a call has taken longer than `max_time`
+    seconds, so they are warmed up at most once and timed at least once.
+    """
+    for _ in range(warmup):
+        model.clear()
+
+        start = time.perf_counter()
+        solve(text)
+
+        if time.perf_counter() - start > max_time:
+            break
+
+    times: list[float] = []
+
+    for _ in range(repeat):
+        model.clear()
+        gc.collect()
+
+        start = time.perf_counter()
+        solve(text)
+        times.append(time.perf_counter() - start)
+
+        if times[-1] > max_time:
+            break
+
+    return times
+
+
+def peak_memory(solve: Callable[[str], object], text: str) -> int:
+    """
+    The peak memory allocated by one call to `solve(text)`, in bytes, traced with
+    `tracemalloc` (which slows the call down, so it is not timed)
+    """
+    model.clear()
+    gc.collect()
+
+    tracemalloc.start()
+
+    try:
+        solve(text)
+
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def cross_check(module: ModuleType, part: int, text: str) -> None:
+    """
+    Raise an error if the NumPy variant of a part gives a different answer to
+    the pure-Python solution, which is the reference
+    """
+    model.clear()
+
+    with backend.using("python"):
+        expected = module.solve(part, text)
+
+    model.clear()
+
+    with backend.using("numpy"):
+        answer = module.solve(part, text)
+
+    if answer != expected:
+        raise ValueError(f"The numpy backend answered {answer}, not {expected}")
+
+
+def fit_exponent(points: list[tuple[int, float]]) -> float:
+    """
+    Fit time = c * n**k to a list of (n, time) points by least squares on a
+    log-log scale, returning k (e.g. roughly 2 for a quadratic algorithm)
+    """
+    xs = [math.log(n) for n, _ in points]
+    ys = [math.log(max(t, 1e-9)) for _, t in points]
+
+    mean_x = statistics.fmean(xs)
+    mean_y = statistics.fmean(ys)
+
+    variance = sum((x - mean_x) ** 2 for x in xs)
+
+    if variance == 0:
+        raise ValueError("At least two different sizes are needed")
+
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / variance
+
+
+def sizes(module: ModuleType, scales: list[float]) -> list[int]:
+    """The distinct sizes to generate for a day, smallest first"""
+    return sorted({max(1, round(module.SIZE * scale)) for scale in scales})
+
+
+def bench_day(
+    year: int,
+    day: int,
+    scales: list[float],
+    seed: int = 0,
+    warmup: int = 1,
+    repeat: int = 5,
+    max_time: float = 10.0,
+    memory: bool = False,
+) -> list[Timing]:
+    """
+    Benchmark each part of a day on generated inputs of each scale (as a
+    multiple of the generator's `SIZE`), also measuring the peak memory of
+    each part if `memory` is true
+
+    Larger sizes of a part are skipped once a single call has taken longer than
+    `max_time` seconds, or is expected to from the scaling so far, and such slow
+    calls are not repeated.
+    """
+    try:
+        module = load_module(year, day)
+        generator = load_module(year, day, "generate")
+    except Exception as e:
+        return [Timing(year, day, 1, 0, error=f"{type(e).__name__}: {e}")]
+
+    texts: dict[int, str] = {}
+    result: list[Timing] = []
+
+    for part in available_parts(module):
+        points: list[tuple[int, float]] = []
+
+        for size in sizes(generator, scales):
+            if points:
+                last_size, last_time = points[-1]
+
+                # Extrapolate from the last two sizes, assuming at least linear
+                # growth
+                exponent = fit_exponent(points[-2:]) if len(points) > 1 else 1.0
+                expected = last_time * (size / last_size) ** max(1.0, exponent)
+
+                if max(last_time, expected) > max_time:
+                    break
+
+            try:
+                if size not in texts:
+                    texts[size] = generator.generate(size, seed)
+
+                if backend.use_numpy():
+                    cross_check(module, part, texts[size])
+
+                solve = functools.partial(module.solve, part)
+
+                times = measure(solve, texts[size], warmup, repeat, max_time)
+                peak = peak_memory(solve, texts[size]) if memory else None
+            except Exception as e:
+                result.append(
+                    Timing(year, day, part, size, error=f"{type(e).__name__}: {e}")
+                )
+                break
+
+            timing = Timing(
+                year,
+                day,
+                part,
+                size,
+                statistics.median(times),
+                percentile(times, 95),
+                peak=peak,
+            )
+
+            result.append(timing)
+            points.append((size, max(times)))
+
+    return result
+
+
+def bench_startup(year: int, day: int, repeat: int = 5) -> Timing:
+    """
+    Time starting a fresh interpreter and importing a day, as when running its
+    `main.py`, after one untimed run to warm the OS's file cache
+    """
+    try:
+        times = startup_times(year, day, repeat + 1)[1:]
+    except RuntimeError as e:
+        return Timing(year, day, 0, 0, error=str(e))
+
+    return Timing(year, day, 0, 0, statistics.median(times), percentile(times, 95))
+
+
+def load_baseline(path: str) -> dict[str, dict[str, float]]:
+    if not os.path.exists(path):
+        return {}
+
+    with open(path) as f:
+        return json.load(f)["timings"]
+
+
+def save_baseline(path: str, timings: list[Timing]) -> None:
+    """
+    Save the timings to the baseline, replacing any earlier timings of the same
+    part and size but keeping the rest
+    """
+    baseline = load_baseline(path)
+
+    for timing in timings:
+        if timing.error is None:
+            baseline[timing.key] = {"median": timing.median, "p95": timing.p95}
+
+            if timing.peak is not None:
+                baseline[timing.key]["peak"] = timing.peak
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    with open(path, "w") as f:
+        json.dump(
+            {
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                # Sort numerically by year, day, part and size
+                "timings": dict(
+                    sorted(
+                        baseline.items(),
+                        key=lambda item: tuple(map(int, item[0].split("/"))),
+                    )
+                ),
+            },
+            f,
+            indent=2,
+        )
+        f.write("\n")
+
+
+def is_regression(
+    timing: Timing, baseline: dict[str, dict[str, float]], threshold: float
+) -> bool:
+    if timing.error is not None or timing.key not in baseline:
+        return False
+
+    return timing.median > baseline[timing.key]["median"] * (1 + threshold)
+
+
+def format_timing(
+    timing: Timing, baseline: dict[str, dict[str, float]], threshold: float
+) -> str:
+    if timing.part == 0:
+        label = f"{timing.year} day {timing.day:02} {'startup':<16}"
+    else:
+        label = f"{timing.year} day {timing.day:02} part {timing.part}  n={timing.size:<6}"
+
+    if timing.error is not None:
+        return f"{label}  {'error':>10}  {timing.error}"
+
+    line = f"{label}  median {timing.median:>9.4f}s  p95 {timing.p95:>9.4f}s"
+
+    if timing.peak is not None:
+        line += f"  peak {timing.peak / 2**20:>8.2f} MiB"
+
+    if timing.key in baseline:
+        change = timing.median / baseline[timing.key]["median"] - 1
+        line += f"  {change:>+7.1%} vs baseline"
+
+        if is_regression(timing, baseline, threshold):
+            line += "  REGRESSION"
+
+    return line
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m aoc.bench",
+        description="Benchmark each part of any selection of days on generated inputs, comparing against a saved baseline.",
+    )
+    parser.add_argument(
+        "days",
+        nargs="*",
+        help='days to benchmark, e.g. "2022", "2022/5" or "2023/1-10" (default: every day)',
+    )
+    parser.add_argument(
+        "--scales",
+        type=float,
+        nargs="+",
+        default=[1.0],
+        help="input sizes, as multiples of the size of a real puzzle input; with several, the scaling of each part is fitted (default: 1)",
+    )
+    parser.add_argument(
+        "-s", "--seed", type=int, default=0, help="random seed (default: 0)"
+    )
+    parser.add_argument(
+        "--warmup",
+        type=int,
+        default=1,
+        help="untimed runs before timing (default: 1)",
+    )
+    parser.add_argument(
+        "-r", "--repeat", type=int, default=5, help="timed runs (default: 5)"
+    )
+    parser.add_argument(
+        "--max-time",
+        type=float,
+        default=10.0,
+        help="stop repeating, and skip larger sizes, once a run takes longer than this, in seconds (default: 10)",
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="also measure the peak memory of each part, with one extra run under tracemalloc",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=backend.BACKENDS,
+        default="python",
+        help="time the NumPy variants of the days which have them, checking their answers against the pure-Python solutions (default: python)",
+    )
+    parser.add_argument(
+        "--startup",
+        action="store_true",
+        help="instead of timing the parts, time starting an interpreter and importing each day",
+    )
+    parser.add_argument(
+        "--baseline",
+        default=BASELINE_PATH,
+        help="baseline JSON file (default: benchmarks/baseline.json)",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=THRESHOLD,
+        help=f"slowdown of the median, as a fraction, reported as a regression (default: {THRESHOLD})",
+    )
+    parser.add_argument(
+        "--save",
+        action="store_true",
+        help="save the timings to the baseline file",
+    )
+    args = parser.parse_args()
+
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+
+    if not backend.available(args.backend):
+        parser.error(f"The {args.backend} backend is not installed")
+
+    # The baseline is of the pure-Python solutions, so the other backends are
+    # compared against them
+    if args.save and args.backend != "python":
+        parser.error("--save only saves timings of the python backend")
+
+    os.environ[backend.BACKEND_ENV] = args.backend
+
+    days: list[tuple[int, int]] = []
+
+    try:
+        for selection in args.days:
+            days += [day for day in parse_selection(selection) if day not in days]
+    except ValueError as e:
+        parser.error(str(e))
+
+    # Time the parsing too, rather than loading cached models
+    os.environ.pop(model.CACHE_ENV, None)
+
+    baseline = load_baseline(args.baseline)
+
+    timings: list[Timing] = []
+    exponents: dict[tuple[int, int, int], float] = {}
+
+    if args.startup:
+        interpreter = statistics.median(startup_times(0, None, args.repeat))
+        print(f"Interpreter startup  median {interpreter:>9.4f}s")
+
+    for year, day in days or all_days():
+        if args.startup:
+            timing = bench_startup(year, day, args.repeat)
+            print(format_timing(timing, baseline, args.threshold), flush=True)
+            timings.append(timing)
+            continue
+
+        day_timings = bench_day(
+            year,
+            day,
+            args.scales,
+            args.seed,
+            args.warmup,
+            args.repeat,
+            args.max_time,
+            args.memory,
+        )
+
+        for timing in day_timings:
+            print(format_timing(timing, baseline, args.threshold), flush=True)
+
+        for part in sorted({timing.part for timing in day_timings}):
+            points = [
+                (timing.size, timing.median)
+                for timing in day_timings
+                if timing.part == part and timing.error is None
+            ]
+
+            if len(points) > 1:
+                exponent = fit_exponent(points)
+                exponents[(year, day, part)] = exponent
+                print(f"{year} day {day:02} part {part}  scaling ~n^{exponent:.2f}")
+
+        timings += day_timings
+
+    superlinear = [
+        (key, exponent)
+        for key, exponent in exponents.items()
+        if exponent >= SUPERLINEAR
+    ]
+    regressions = [
+        timing for timing in timings if is_regression(timing, baseline, args.threshold)
+    ]
+
+    if superlinear:
+        print()
+        print(f"Superlinear (~n^{SUPERLINEAR} or worse):")
+
+        for (year, day, part), exponent in superlinear:
+            print(f"  {year} day {day:02} part {part}  ~n^{exponent:.2f}")
+
+    if args.save:
+        save_baseline(args.baseline, timings)
+        print(f"Saved baseline to {args.baseline}")
+
+    if regressions:
+        print()
+        print(f"{len(regressions)} regression(s) beyond {args.threshold:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
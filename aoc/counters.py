@@ -0,0 +1,56 @@
+"""
+Optional counters for the hot loops of the searches, e.g. the number of states
+expanded, heap pushes and pops, cache hits and misses, and pruned branches
+
+Comparing the counts of two runs tells whether a slowdown comes from visiting
+more states, or from each state taking longer. Counting is enabled by setting
+the `AOC_COUNTERS` environment variable (`python -m aoc --counters` sets it),
+and the runner collects the counts of each part separately.
+
+A search fetches the counter once, before its loop, and only counts when it is
+not `None`, so disabled counters cost a single comparison per event:
+
+    counts = counters.active()
+
+    while queue:
+        if counts is not None:
+            counts["pops"] += 1
+"""
+
+import os
+from collections import Counter
+
+# The environment variable which enables counting
+COUNTERS_ENV = "AOC_COUNTERS"
+
+# The counts of the part being solved, or `None` if counting is disabled
+_counts: Counter[str] | None = None
+
+
+def enabled() -> bool:
+    return bool(os.environ.get(COUNTERS_ENV))
+
+
+def active() -> Counter[str] | None:
+    """The counter of the part being solved, or `None` if counting is disabled"""
+    return _counts
+
+
+def start() -> None:
+    """Start counting a new part, if counting is enabled"""
+    global _counts
+
+    _counts = Counter() if enabled() else None
+
+
+def stop() -> dict[str, int] | None:
+    """Stop counting, returning the counts (or `None` if counting is disabled)"""
+    global _counts
+
+    counts, _counts = _counts, None
+
+    return None if counts is None else dict(counts)
+
+
+def format_counts(counts: dict[str, int]) -> str:
+    return ", ".join(f"{name} {count:,}" for name, count in sorted(counts.items()))
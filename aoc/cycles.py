@@ -0,0 +1,86 @@
+"""
+Skipping ahead through long simulations which eventually repeat
+
+`skip_ahead()` steps a simulation until the key of its state repeats, then
+skips over as many whole cycles as possible. Cycles are found with Brent's
+algorithm, which compares each key with a single saved key (replaced at every
+power of two steps) rather than keeping every key seen so far, so it uses
+constant memory however long the cycle is.
+
+Keys should be compact (e.g. `bytes` or a tuple of small ints), and must
+identify everything about the state which affects later steps.
+"""
+
+from typing import Callable, Hashable, TypeVar
+
+S = TypeVar("S")
+
+# A quantity which grows by the same amount every cycle, e.g. the height of a
+# tower, or a tuple of such quantities
+Value = int | tuple[int, ...]
+
+
+def _gain(before: Value, after: Value, cycles: int) -> Value:
+    """The amount gained over `cycles` cycles, gaining `after - before` each"""
+    if isinstance(before, tuple) and isinstance(after, tuple):
+        return tuple(cycles * (b - a) for a, b in zip(before, after))
+
+    assert isinstance(before, int) and isinstance(after, int)
+
+    return cycles * (after - before)
+
+
+def skip_ahead(
+    state: S,
+    step: Callable[[S], S],
+    n: int,
+    key: Callable[[S], Hashable] = lambda state: state,
+    value: Callable[[S], Value] | None = None,
+) -> tuple[S, Value]:
+    """
+    Apply `step` to `state` `n` times, skipping whole cycles once the key of
+    the state repeats. `step` may modify the state in place.
+
+    Returns the final state (equivalent to the state after `n` steps), and the
+    total amount `value` would have grown by over the skipped steps (0 if
+    `value` is not given). A quantity which is not part of the key, like the
+    height of a tower, is then `value(state)` plus this amount.
+    """
+    # The key which later keys are compared against, and the number of steps
+    # since it was saved
+    saved_key = key(state)
+    saved_value = value(state) if value is not None else 0
+    length = 0
+
+    # The saved key is replaced whenever `length` reaches `power`
+    power = 1
+
+    for i in range(1, n + 1):
+        state = step(state)
+        length += 1
+
+        current_key = key(state)
+
+        if current_key == saved_key:
+            # The states repeat every `length` steps, so skip as many whole
+            # cycles as possible, and take the remaining steps one at a time
+            cycles, remaining = divmod(n - i, length)
+
+            gained = 0
+
+            if value is not None:
+                gained = _gain(saved_value, value(state), cycles)
+
+            for _ in range(remaining):
+                state = step(state)
+
+            return state, gained
+
+        if length == power:
+            saved_key = current_key
+            saved_value = value(state) if value is not None else 0
+            length = 0
+            power *= 2
+
+    # No cycle was found, so nothing was skipped
+    return state, _gain(saved_value, saved_value, 0)
@@ -0,0 +1,102 @@
+import importlib.util
+import os
+import re
+import sys
+from types import ModuleType
+
+# The root of the repository, which contains a directory for each year
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+YEARS = (2022, 2023)
+DAYS = range(1, 26)
+
+
+def day_directory(year: int, day: int) -> str:
+    return os.path.join(ROOT, str(year), f"day{day:02}")
+
+
+def input_path(year: int, day: int) -> str:
+    return os.path.join(day_directory(year, day), "input.txt")
+
+
+def all_days() -> list[tuple[int, int]]:
+    """Every (year, day) which has a solution in the repository"""
+    return [
+        (year, day)
+        for year in YEARS
+        for day in DAYS
+        if os.path.exists(os.path.join(day_directory(year, day), "main.py"))
+    ]
+
+
+def parse_selection(selection: str) -> list[tuple[int, int]]:
+    """
+    Parse a selection of days, such as "2022", "2022/5" or "2023/1-10", into a
+    list of (year, day) tuples
+    """
+    match = re.fullmatch(r"(\d{4})(?:/(\d+)(?:-(\d+))?)?", selection)
+
+    if match is None:
+        raise ValueError(f"Invalid selection: {selection}")
+
+    year = int(match.group(1))
+
+    if year not in YEARS:
+        raise ValueError(f"Invalid year: {year}")
+
+    if match.group(2) is None:
+        days = DAYS
+    else:
+        start = int(match.group(2))
+        end = int(match.group(3) or start)
+        days = range(start, end + 1)
+
+    return [(y, d) for y, d in all_days() if y == year and d in days]
+
+
+def load_module(year: int, day: int, name: str = "main") -> ModuleType:
+    """
+    Import a module from a day's directory, such as its solution ("main") or
+    its input generator ("generate")
+    """
+    path = os.path.join(day_directory(year, day), f"{name}.py")
+
+    spec = importlib.util.spec_from_file_location(f"aoc_{year}_day{day:02}_{name}", path)
+    assert spec is not None and spec.loader is not None
+
+    module = importlib.util.module_from_spec(spec)
+
+    # Registered like any other module, so functions defined by the day can be
+    # pickled by name, e.g. to run them in a process pool
+    sys.modules[spec.name] = module
+
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[spec.name]
+        raise
+
+    return module
+
+
+def available_parts(module: ModuleType) -> list[int]:
+    """The parts that a day's solution can solve"""
+    return [
+        part
+        for part, function in ((1, "part_one"), (2, "part_two"))
+        if hasattr(module, function)
+    ]
+
+
+def variants(module: ModuleType, part: int) -> list[str]:
+    """
+    The names of the functions which solve a part: its reference solution
+    (e.g. `part_two`), followed by any variants of it (e.g. `part_two_heap`)
+    """
+    reference = ("part_one", "part_two")[part - 1]
+
+    return [reference] + sorted(
+        name
+        for name, value in vars(module).items()
+        if name.startswith(f"{reference}_") and callable(value)
+    )
@@ -0,0 +1,56 @@
+import argparse
+import sys
+
+from aoc.days import load_module, parse_selection
+
+
+def generate(year: int, day: int, size: int | None = None, seed: int = 0) -> str:
+    """
+    Generate an input for a day, using the `generate()` function in the day's
+    `generate.py`. `size` defaults to roughly the size of a real puzzle input.
+    """
+    module = load_module(year, day, "generate")
+
+    return module.generate(module.SIZE if size is None else size, seed)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m aoc.generate",
+        description="Generate a synthetic puzzle input for a day.",
+    )
+    parser.add_argument("day", help='the day to generate an input for, e.g. "2023/11"')
+    parser.add_argument(
+        "-n",
+        "--size",
+        type=int,
+        default=None,
+        help="size of the input (default: roughly the size of a real puzzle input)",
+    )
+    parser.add_argument(
+        "-s", "--seed", type=int, default=0, help="random seed (default: 0)"
+    )
+    parser.add_argument(
+        "-o", "--output", default=None, help="file to write to (default: stdout)"
+    )
+    args = parser.parse_args()
+
+    try:
+        days = parse_selection(args.day)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if len(days) != 1:
+        parser.error(f"Expected a single day: {args.day}")
+
+    text = generate(*days[0], args.size, args.seed)
+
+    if args.output is None:
+        sys.stdout.write(text)
+    else:
+        with open(args.output, "w") as f:
+            f.write(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,441 @@
+"""
+Graphs with integer node ids, stored as compressed sparse row (CSR) arrays
+
+Nodes are numbered from 0, and an `Interner` maps other node names (e.g. the
+valve names of 2022 day 16) to ids. The arcs leaving node `n` are the indices
+`graph.offsets[n]` to `graph.offsets[n + 1]` of `graph.targets` (the node each
+arc leads to) and `graph.weights` (the length of each arc). Both directions of
+an undirected edge are separate arcs, sharing an edge id in `graph.edges`, so
+an edge can be blocked in either direction at once.
+
+The searches return a list of distances indexed by node id, with
+`UNREACHABLE` for the nodes which were not reached. `dijkstra()` and `dial()`
+count the nodes they expand and their queue operations, if counting is enabled
+(see `aoc.counters`).
+"""
+
+import heapq
+import sys
+from typing import Hashable, Iterable, Sequence
+
+from aoc import counters
+
+# The distance to a node which cannot be reached (larger than any real distance)
+UNREACHABLE = sys.maxsize
+
+
+class Interner:
+    """Assigns ids 0, 1, 2, ... to node names, in the order they are first seen"""
+
+    __slots__ = ("ids", "names")
+
+    def __init__(self, names: Iterable[Hashable] = ()) -> None:
+        self.ids: dict[Hashable, int] = {}
+        self.names: list[Hashable] = []
+
+        for name in names:
+            self.intern(name)
+
+    def intern(self, name: Hashable) -> int:
+        """The id of a name, assigning it the next id if it is new"""
+        id = self.ids.get(name)
+
+        if id is None:
+            id = self.ids[name] = len(self.names)
+            self.names.append(name)
+
+        return id
+
+    def __getitem__(self, name: Hashable) -> int:
+        return self.ids[name]
+
+    def __contains__(self, name: Hashable) -> bool:
+        return name in self.ids
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+class Graph:
+    """
+    A graph in CSR form. Build one directly from the arrays, with the arcs of
+    each node stored together in order of node id, or from a list of edges with
+    `from_edges()`.
+    """
+
+    __slots__ = ("offsets", "targets", "weights", "edges")
+
+    def __init__(
+        self,
+        offsets: list[int],
+        targets: list[int],
+        weights: list[int] | None = None,
+        edges: list[int] | None = None,
+    ) -> None:
+        # The arcs are plain lists rather than `array`s, as indexing a list
+        # does not need to create a new int each time
+        self.offsets = offsets
+        self.targets = targets
+
+        # Unweighted graphs have arcs of length 1
+        self.weights = [1] * len(targets) if weights is None else weights
+
+        # The edge of each arc, by default a different edge for every arc
+        self.edges = list(range(len(targets))) if edges is None else edges
+
+    @classmethod
+    def from_edges(
+        cls,
+        node_count: int,
+        edges: Iterable[tuple[int, int] | tuple[int, int, int]],
+        directed: bool = False,
+    ) -> "Graph":
+        """
+        Build a graph of `node_count` nodes from (source, target) or (source,
+        target, weight) edges. Undirected edges become a pair of arcs.
+        """
+        sources: list[int] = []
+        targets: list[int] = []
+        weights: list[int] = []
+        edge_ids: list[int] = []
+
+        for id, (source, target, *weight) in enumerate(edges):
+            length = weight[0] if weight else 1
+
+            sources.append(source)
+            targets.append(target)
+            weights.append(length)
+            edge_ids.append(id)
+
+            if not directed:
+                sources.append(target)
+                targets.append(source)
+                weights.append(length)
+                edge_ids.append(id)
+
+        return cls._sorted(node_count, sources, targets, weights, edge_ids)
+
+    @classmethod
+    def _sorted(
+        cls,
+        node_count: int,
+        sources: list[int],
+        targets: list[int],
+        weights: list[int],
+        edge_ids: list[int],
+    ) -> "Graph":
+        """Build a graph from arcs in any order, by a counting sort on the source"""
+        offsets = [0] * (node_count + 1)
+
+        for source in sources:
+            offsets[source + 1] += 1
+
+        for node in range(node_count):
+            offsets[node + 1] += offsets[node]
+
+        # The next free position for each node's arcs
+        positions = offsets[:-1]
+
+        sorted_targets = [0] * len(targets)
+        sorted_weights = [0] * len(targets)
+        sorted_edges = [0] * len(targets)
+
+        for source, target, weight, edge in zip(sources, targets, weights, edge_ids):
+            position = positions[source]
+            positions[source] = position + 1
+
+            sorted_targets[position] = target
+            sorted_weights[position] = weight
+            sorted_edges[position] = edge
+
+        return cls(offsets, sorted_targets, sorted_weights, sorted_edges)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def arcs(self, node: int) -> range:
+        """The indices of the arcs leaving a node"""
+        return range(self.offsets[node], self.offsets[node + 1])
+
+    def neighbours(self, node: int) -> list[int]:
+        return self.targets[self.offsets[node] : self.offsets[node + 1]]
+
+    def degree(self, node: int) -> int:
+        return self.offsets[node + 1] - self.offsets[node]
+
+    def reversed(self) -> "Graph":
+        """The graph with the direction of every arc reversed"""
+        sources = [
+            node for node in range(len(self)) for _ in range(self.degree(node))
+        ]
+
+        return self._sorted(len(self), self.targets, sources, self.weights, self.edges)
+
+
+def bfs(
+    graph: Graph,
+    sources: Iterable[int],
+    end: int | None = None,
+    blocked: Sequence[int] | None = None,
+) -> list[int]:
+    """
+    The number of arcs on the shortest path from any of `sources` to each node,
+    ignoring the weights. Stops early once `end` is reached, if given. Arcs
+    whose edge id is truthy in `blocked` are not used.
+    """
+    offsets = graph.offsets
+    targets = graph.targets
+    edges = graph.edges
+
+    distances = [UNREACHABLE] * len(graph)
+    queue = list(sources)
+
+    for source in queue:
+        distances[source] = 0
+
+    distance = 0
+
+    while queue:
+        if end is not None and distances[end] != UNREACHABLE:
+            break
+
+        distance += 1
+        new_queue: list[int] = []
+
+        for node in queue:
+            if blocked is None:
+                for target in targets[offsets[node] : offsets[node + 1]]:
+                    if distances[target] == UNREACHABLE:
+                        distances[target] = distance
+                        new_queue.append(target)
+            else:
+                for arc in range(offsets[node], offsets[node + 1]):
+                    target = targets[arc]
+
+                    if distances[target] == UNREACHABLE and not blocked[edges[arc]]:
+                        distances[target] = distance
+                        new_queue.append(target)
+
+        queue = new_queue
+
+    return distances
+
+
+def shortest_path(
+    graph: Graph, start: int, end: int, blocked: Sequence[int] | None = None
+) -> list[int] | None:
+    """
+    The arcs of a path from `start` to `end` with the fewest arcs, or `None` if
+    there is no path. Arcs whose edge id is truthy in `blocked` are not used.
+    """
+    offsets = graph.offsets
+    targets = graph.targets
+    edges = graph.edges
+
+    # The arc used to reach each node, and the node it came from
+    via = [-1] * len(graph)
+    previous = [-1] * len(graph)
+    previous[start] = start
+
+    if start == end:
+        return []
+
+    queue = [start]
+
+    for node in queue:
+        for arc in range(offsets[node], offsets[node + 1]):
+            target = targets[arc]
+
+            if previous[target] != -1 or (blocked is not None and blocked[edges[arc]]):
+                continue
+
+            via[target] = arc
+            previous[target] = node
+
+            if target == end:
+                path: list[int] = []
+
+                while target != start:
+                    path.append(via[target])
+                    target = previous[target]
+
+                path.reverse()
+
+                return path
+
+            queue.append(target)
+
+    return None
+
+
+def dijkstra(graph: Graph, sources: Iterable[int], end: int | None = None) -> list[int]:
+    """
+    The length of the shortest path from any of `sources` to each node, using a
+    binary heap. Stops early once the distance to `end` is known, if given.
+    """
+    offsets = graph.offsets
+    targets = graph.targets
+    weights = graph.weights
+
+    counts = counters.active()
+
+    distances = [UNREACHABLE] * len(graph)
+    queue: list[tuple[int, int]] = []
+
+    for source in sources:
+        distances[source] = 0
+        queue.append((0, source))
+
+    while queue:
+        distance, node = heapq.heappop(queue)
+
+        if counts is not None:
+            counts["pops"] += 1
+
+        # Skip nodes which were pushed again with a shorter distance
+        if distance != distances[node]:
+            continue
+
+        if node == end:
+            break
+
+        if counts is not None:
+            counts["states"] += 1
+
+        for arc in range(offsets[node], offsets[node + 1]):
+            target = targets[arc]
+            new_distance = distance + weights[arc]
+
+            if new_distance < distances[target]:
+                distances[target] = new_distance
+                heapq.heappush(queue, (new_distance, target))
+
+                if counts is not None:
+                    counts["pushes"] += 1
+
+    return distances
+
+
+def dial(graph: Graph, sources: Iterable[int], end: int | None = None) -> list[int]:
+    """
+    The same as `dijkstra()`, using Dial's bucket queue instead of a heap, which
+    is faster when the weights are small non-negative integers
+
+    Every node in the queue is within the largest weight of the node being
+    visited, so a ring of `max_weight + 1` buckets holds the nodes at each
+    distance, and the buckets are visited in order of distance.
+    """
+    offsets = graph.offsets
+    targets = graph.targets
+    weights = graph.weights
+
+    counts = counters.active()
+
+    size = max(weights, default=0) + 1
+    buckets: list[list[int]] = [[] for _ in range(size)]
+
+    distances = [UNREACHABLE] * len(graph)
+
+    for source in sources:
+        distances[source] = 0
+        buckets[0].append(source)
+
+    # The number of nodes in all the buckets
+    pending = len(buckets[0])
+    distance = 0
+
+    while pending:
+        bucket = buckets[distance % size]
+
+        # Arcs of weight 0 add to the bucket being visited
+        while bucket:
+            node = bucket.pop()
+            pending -= 1
+
+            if counts is not None:
+                counts["pops"] += 1
+
+            if distances[node] != distance:
+                continue
+
+            if node == end:
+                return distances
+
+            if counts is not None:
+                counts["states"] += 1
+
+            for arc in range(offsets[node], offsets[node + 1]):
+                target = targets[arc]
+                new_distance = distance + weights[arc]
+
+                if new_distance < distances[target]:
+                    distances[target] = new_distance
+                    buckets[new_distance % size].append(target)
+                    pending += 1
+
+                    if counts is not None:
+                        counts["pushes"] += 1
+
+        distance += 1
+
+    return distances
+
+
+def compress(graph: Graph, keep: Iterable[int] = ()) -> tuple[Graph, list[int]]:
+    """
+    Compress the corridors of an undirected graph, replacing each chain of
+    nodes with exactly two neighbours by a single edge, weighted by the length
+    of the chain. Nodes in `keep` are never removed.
+
+    Returns the compressed graph, and the id in `graph` of each of its nodes.
+    """
+    keep = set(keep)
+
+    # The nodes of the compressed graph
+    nodes = [
+        node for node in range(len(graph)) if node in keep or graph.degree(node) != 2
+    ]
+    ids = {node: id for id, node in enumerate(nodes)}
+
+    offsets = graph.offsets
+    targets = graph.targets
+    weights = graph.weights
+    edges = graph.edges
+
+    # The shortest corridor between each pair of nodes
+    lengths: dict[tuple[int, int], int] = {}
+
+    for node in nodes:
+        for arc in graph.arcs(node):
+            length = weights[arc]
+            target = targets[arc]
+            edge = edges[arc]
+
+            # Follow the corridor, leaving each node by its other arc, until
+            # reaching a node which is kept
+            while target not in ids:
+                first = offsets[target]
+                arc = first if edges[first] != edge else first + 1
+
+                length += weights[arc]
+                target = targets[arc]
+                edge = edges[arc]
+
+            # Skip corridors which loop back to where they started
+            if target == node:
+                continue
+
+            pair = (ids[node], ids[target])
+            lengths[pair] = min(length, lengths.get(pair, UNREACHABLE))
+
+    # Each corridor was followed from both ends, so only keep one direction
+    compressed = Graph.from_edges(
+        len(nodes),
+        [
+            (source, target, length)
+            for (source, target), length in lengths.items()
+            if source < target
+        ],
+    )
+
+    return compressed, nodes
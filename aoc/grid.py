@@ -0,0 +1,152 @@
+from typing import Iterator
+
+
+class Grid:
+    """
+    A rectangular grid of characters, stored row by row in a single bytearray
+
+    The grid is surrounded by a border of `border` cells, one cell thick, so a
+    step in any direction from a cell in the grid lands either in the grid or on
+    the border. Searches can therefore stop at the border instead of checking
+    `0 <= x < height and 0 <= y < width` on every step.
+
+    Cells are referred to by their index in `cells`, and hold the byte value of
+    their character (e.g. `grid.cells[i] == ord("#")`). Taking a step adds one of
+    the offsets `right`, `down`, `left` or `up` to the index.
+    """
+
+    __slots__ = (
+        "width",
+        "height",
+        "stride",
+        "cells",
+        "border",
+        "right",
+        "down",
+        "left",
+        "up",
+        "neighbours",
+        "diagonal_neighbours",
+    )
+
+    def __init__(self, rows: list[str], border: str = "#") -> None:
+        if not rows or any(len(row) != len(rows[0]) for row in rows):
+            raise ValueError("The rows of a grid must all have the same length")
+
+        # The width and height of the grid, excluding the border
+        self.width = len(rows[0])
+        self.height = len(rows)
+
+        # The number of cells in a row, including the border at each end
+        self.stride = self.width + 2
+
+        self.border = ord(border)
+
+        edge = border * self.stride
+        self.cells = bytearray(
+            "".join([edge, *(border + row + border for row in rows), edge]), "latin-1"
+        )
+
+        # The offsets to add to an index to move to an adjacent cell
+        self.right = 1
+        self.down = self.stride
+        self.left = -1
+        self.up = -self.stride
+
+        # The four adjacent cells, clockwise from the right
+        self.neighbours = (self.right, self.down, self.left, self.up)
+
+        # The eight surrounding cells, clockwise from the right
+        self.diagonal_neighbours = (
+            self.right,
+            self.down + self.right,
+            self.down,
+            self.down + self.left,
+            self.left,
+            self.up + self.left,
+            self.up,
+            self.up + self.right,
+        )
+
+    @classmethod
+    def parse(cls, text: str, border: str = "#") -> "Grid":
+        """Create a grid from a puzzle input, one line per row"""
+        return cls(text.strip().splitlines(), border)
+
+    @classmethod
+    def filled(
+        cls, width: int, height: int, fill: str = ".", border: str = "#"
+    ) -> "Grid":
+        """Create a grid of `width` x `height` cells, all containing `fill`"""
+        return cls([fill * width] * height, border)
+
+    def index(self, row: int, column: int) -> int:
+        """The index of the cell at (row, column), where (0, 0) is the top-left"""
+        return (row + 1) * self.stride + column + 1
+
+    def position(self, index: int) -> tuple[int, int]:
+        """The (row, column) of a cell, the reverse of `index()`"""
+        row, column = divmod(index, self.stride)
+
+        return row - 1, column - 1
+
+    def row(self, row: int) -> range:
+        """The indices of the cells in a row, from left to right"""
+        start = self.index(row, 0)
+
+        return range(start, start + self.width)
+
+    def column(self, column: int) -> range:
+        """The indices of the cells in a column, from top to bottom"""
+        start = self.index(0, column)
+
+        return range(start, start + self.height * self.stride, self.stride)
+
+    def indices(self) -> Iterator[int]:
+        """The indices of every cell in the grid (not the border), row by row"""
+        for row in range(self.height):
+            yield from self.row(row)
+
+    def find(self, char: str) -> int:
+        """The index of the first cell containing `char` (which must not be the border)"""
+        index = self.cells.find(ord(char), self.stride)
+
+        if index == -1:
+            raise ValueError(f"{char} not found")
+
+        return index
+
+    def wrap(self, index: int) -> tuple[int, int, int]:
+        """
+        For a cell on the border (except the corners), the cell on the opposite
+        edge of the grid that it would be if the grid were tiled infinitely. Returns
+        the index of that cell, and the change in the (row, column) of the tile.
+        """
+        row, column = self.position(index)
+
+        if row == -1:
+            return self.index(self.height - 1, column), -1, 0
+        if row == self.height:
+            return self.index(0, column), 1, 0
+        if column == -1:
+            return self.index(row, self.width - 1), 0, -1
+        if column == self.width:
+            return self.index(row, 0), 0, 1
+
+        raise ValueError(f"Not on the border: {index}")
+
+    def copy(self) -> "Grid":
+        grid = Grid.__new__(Grid)
+
+        for name in Grid.__slots__:
+            setattr(grid, name, getattr(self, name))
+
+        grid.cells = self.cells.copy()
+
+        return grid
+
+    def __str__(self) -> str:
+        return "\n".join(
+            self.cells[self.row(row).start : self.row(row).stop].decode("latin-1")
+            for row in range(self.height)
+        )
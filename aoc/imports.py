@@ -0,0 +1,159 @@
+"""
+Measuring how long each day takes to import, in a fresh interpreter
+
+`import_report()` imports a day under `python -X importtime`, so it includes
+the cost of every module the day imports for the first time (e.g. sympy for
+2023 day 24), and `startup_times()` times a whole interpreter starting up and
+importing the day, as when running `python main.py`. Both run in a new process,
+since modules already imported by this one would otherwise cost nothing.
+"""
+
+import subprocess
+import sys
+import time
+from typing import NamedTuple
+
+from aoc.days import ROOT
+
+# Written to stderr just before the day is imported, so the modules imported
+# by `aoc.days` itself are not charged to the day
+_MARKER = "-- import day --"
+
+_SCRIPT = f"""
+import sys, time
+from aoc.days import load_module
+print({_MARKER!r}, file=sys.stderr, flush=True)
+start = time.perf_counter()
+load_module({{year}}, {{day}})
+print(time.perf_counter() - start)
+"""
+
+
+class ImportTime(NamedTuple):
+    # The time spent importing the module itself, and including the modules it
+    # imports, in seconds
+    self: float
+    cumulative: float
+    module: str
+    # How deeply the import is nested, where 0 is imported by the day directly
+    depth: int
+
+
+class ImportReport(NamedTuple):
+    year: int
+    day: int
+    # The wall time of importing the day, including its imports, in seconds
+    total: float = 0.0
+    # In the order `-X importtime` reports them, each after its own imports
+    imports: list[ImportTime] = []
+    error: str | None = None
+
+
+def _run(script: str, *options: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, *options, "-c", script],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+
+
+def _parse_importtime(lines: list[str]) -> list[ImportTime]:
+    """Parse the lines of `-X importtime` (in microseconds)"""
+    result: list[ImportTime] = []
+
+    for line in lines:
+        if not line.startswith("import time:"):
+            continue
+
+        fields = line.removeprefix("import time:").split("|")
+
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            # The header
+            continue
+
+        name = fields[2].rstrip()
+        module = name.lstrip()
+
+        result.append(
+            ImportTime(
+                int(fields[0]) / 1e6,
+                int(fields[1]) / 1e6,
+                module,
+                # Each level of nesting is indented by two spaces
+                (len(name) - len(module) - 1) // 2,
+            )
+        )
+
+    return result
+
+
+def import_report(year: int, day: int) -> ImportReport:
+    """The time taken to import a day, and each module it imports"""
+    process = _run(_SCRIPT.format(year=year, day=day), "-X", "importtime")
+    stderr = process.stderr.splitlines()
+
+    if process.returncode != 0:
+        error = stderr[-1] if stderr else f"Exit status {process.returncode}"
+        return ImportReport(year, day, error=error)
+
+    imports = _parse_importtime(stderr[stderr.index(_MARKER) + 1 :])
+
+    return ImportReport(year, day, float(process.stdout), imports)
+
+
+def startup_times(year: int, day: int | None, repeat: int) -> list[float]:
+    """
+    The wall times of starting an interpreter and importing a day, or only
+    starting an interpreter if `day` is `None`
+    """
+    script = "pass" if day is None else _SCRIPT.format(year=year, day=day)
+    times: list[float] = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        process = _run(script)
+        times.append(time.perf_counter() - start)
+
+        if process.returncode != 0:
+            lines = process.stderr.splitlines()
+            raise RuntimeError(lines[-1] if lines else process.returncode)
+
+    return times
+
+
+def format_report(report: ImportReport, top: int) -> str:
+    """
+    The import time of a day, and of the `top` slowest modules it imports
+    directly, with the modules they import in turn indented below them
+    """
+    label = f"{report.year} day {report.day:02} import"
+
+    if report.error is not None:
+        return f"{label}  {'error':>10}  {report.error}"
+
+    lines = [f"{label}  {report.total:>9.4f}s"]
+
+    # Group each module imported directly with its own imports, which are
+    # reported before it
+    groups: list[list[ImportTime]] = []
+    group: list[ImportTime] = []
+
+    for entry in report.imports:
+        group.append(entry)
+
+        if entry.depth == 0:
+            groups.append(group)
+            group = []
+
+    groups.sort(key=lambda group: group[-1].cumulative, reverse=True)
+
+    for group in groups[:top]:
+        # The slowest nested imports of each, in the usual parent-first order
+        for entry in reversed(group):
+            if entry.depth == 0 or entry.cumulative >= group[-1].cumulative / 10:
+                lines.append(
+                    f"    {entry.cumulative * 1000:>8.2f} ms  {entry.self * 1000:>8.2f} ms self  {'  ' * entry.depth}{entry.module}"
+                )
+
+    return "\n".join(lines)
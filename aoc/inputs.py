@@ -0,0 +1,103 @@
+"""
+Reading puzzle inputs without holding a copy of the whole file
+
+`map_input()` memory-maps an input file, and `lines()`, `records()`,
+`ints()` and `chunks()` iterate over either the mapped file or the usual
+`str`. A mapped file is decoded a chunk of lines at a time, so a day which
+only uses these iterators keeps at most `CHUNK_SIZE` bytes of the input in
+memory, rather than the text of the whole file plus a list of every line.
+
+Days which can be passed a mapped file set `MAPPED_INPUT = True`, and
+`python -m aoc --mmap` passes them the mapped file instead of the text.
+"""
+
+import mmap
+import os
+import re
+from contextlib import contextmanager
+from typing import Iterator
+
+# A puzzle input, as text or as the bytes of the file
+Input = str | bytes | mmap.mmap
+
+# The number of bytes of a mapped file decoded at a time
+CHUNK_SIZE = 1 << 20
+
+# Integers, where a `-` directly after a digit (e.g. "2-4") is not a sign
+INT_PATTERN = r"(?<!\d)-?\d+"
+
+_int_pattern = re.compile(INT_PATTERN)
+_bytes_int_pattern = re.compile(INT_PATTERN.encode())
+
+
+@contextmanager
+def map_input(path: str) -> Iterator[bytes | mmap.mmap]:
+    """Memory-map a file for reading, for the duration of the `with` block"""
+    with open(path, "rb") as f:
+        # Empty files cannot be mapped
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+
+def chunks(data: Input, start: int = 0, end: int | None = None) -> Iterator[str]:
+    """
+    The input (or `data[start:end]`) a chunk at a time, each of around
+    `CHUNK_SIZE` bytes (or characters) and ending at a line break, so no line
+    is split between chunks
+    """
+    newline = "\n" if isinstance(data, str) else b"\n"
+    size = len(data) if end is None else end
+
+    while start < size:
+        stop = start + CHUNK_SIZE
+
+        if stop >= size:
+            stop = size
+        else:
+            stop = data.rfind(newline, start, stop) + 1 or data.find(newline, stop, size) + 1 or size  # type: ignore[arg-type]
+
+        chunk = data[start:stop]
+
+        yield chunk if isinstance(chunk, str) else chunk.decode()
+
+        start = stop
+
+
+def _byte_lines(data: bytes | mmap.mmap) -> Iterator[str]:
+    for chunk in chunks(data):
+        yield from chunk.splitlines()
+
+
+def lines(data: Input) -> Iterator[str]:
+    """The lines of the input, without their line endings, like `splitlines()`"""
+    if isinstance(data, str):
+        return iter(data.splitlines())
+
+    return _byte_lines(data)
+
+
+def records(data: Input) -> Iterator[list[str]]:
+    """The lines of each record, where records are separated by blank lines"""
+    record: list[str] = []
+
+    for line in lines(data):
+        if line:
+            record.append(line)
+        elif record:
+            yield record
+            record = []
+
+    if record:
+        yield record
+
+
+def ints(data: Input) -> Iterator[int]:
+    """Every integer in the input, in order"""
+    if isinstance(data, str):
+        return (int(match[0]) for match in _int_pattern.finditer(data))
+
+    return (int(match[0]) for match in _bytes_int_pattern.finditer(data))
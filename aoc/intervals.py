@@ -0,0 +1,300 @@
+"""
+Sets of integers stored as sorted, disjoint intervals
+
+Intervals are half-open, so `(start, end)` contains `start` to `end - 1`. An
+`IntervalSet` keeps its intervals in a single sorted list of boundaries
+(`[start1, end1, start2, end2, ...]`), merging intervals which overlap or
+touch, so a value is in the set if an odd number of boundaries are at or below
+it. Lookups, splits and adding or removing one interval use binary search, and
+the set operations (`|`, `&`, `-` and `^`) merge the two lists of boundaries in
+a single pass. `count_overlapping()` counts the overlapping pairs of a list of
+intervals with a sorted sweep.
+"""
+
+from bisect import bisect_left, bisect_right
+from itertools import repeat
+from typing import Iterable, Iterator
+
+
+def contains(outer: tuple[int, int], inner: tuple[int, int]) -> bool:
+    """Whether the interval `inner` is entirely within `outer`"""
+    return outer[0] <= inner[0] and inner[1] <= outer[1]
+
+
+def overlaps(a: tuple[int, int], b: tuple[int, int]) -> bool:
+    """Whether two intervals have any values in common"""
+    return a[0] < b[1] and b[0] < a[1]
+
+
+def count_overlapping(starts: Iterable[int], ends: Iterable[int]) -> int:
+    """
+    The number of pairs of the (non-empty) intervals `(starts[i], ends[i])`
+    which overlap, in O(n log n) rather than checking every pair
+
+    Two intervals don't overlap when one ends at or before the start of the
+    other, and for each interval, the intervals ending by its start are found
+    by a binary search of the sorted ends. Every other pair overlaps.
+    """
+    ends = sorted(ends)
+    n = len(ends)
+
+    disjoint = sum(map(bisect_right, repeat(ends), starts))
+
+    return n * (n - 1) // 2 - disjoint
+
+
+class IntervalSet:
+    """A set of integers, built from (start, end) intervals"""
+
+    __slots__ = ("_bounds",)
+
+    def __init__(self, intervals: Iterable[tuple[int, int]] = ()) -> None:
+        bounds: list[int] = []
+
+        # Merge the intervals, in order of their start
+        for start, end in sorted(intervals):
+            if start >= end:
+                continue
+
+            if bounds and start <= bounds[-1]:
+                bounds[-1] = max(bounds[-1], end)
+            else:
+                bounds += (start, end)
+
+        self._bounds = bounds
+
+    @classmethod
+    def _from_bounds(cls, bounds: list[int]) -> "IntervalSet":
+        result = cls.__new__(cls)
+        result._bounds = bounds
+
+        return result
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        bounds = self._bounds
+
+        return zip(bounds[::2], bounds[1::2])
+
+    def __len__(self) -> int:
+        """The number of disjoint intervals"""
+        return len(self._bounds) // 2
+
+    def __bool__(self) -> bool:
+        return bool(self._bounds)
+
+    def __contains__(self, value: int) -> bool:
+        return bisect_right(self._bounds, value) % 2 == 1
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+
+        return self._bounds == other._bounds
+
+    def __repr__(self) -> str:
+        return f"IntervalSet({list(self)})"
+
+    @property
+    def size(self) -> int:
+        """The number of integers in the set"""
+        bounds = self._bounds
+
+        return sum(bounds[1::2]) - sum(bounds[::2])
+
+    @property
+    def start(self) -> int:
+        """The smallest integer in the set"""
+        if not self._bounds:
+            raise ValueError("The set is empty")
+
+        return self._bounds[0]
+
+    @property
+    def end(self) -> int:
+        """One more than the largest integer in the set"""
+        if not self._bounds:
+            raise ValueError("The set is empty")
+
+        return self._bounds[-1]
+
+    def copy(self) -> "IntervalSet":
+        return self._from_bounds(self._bounds.copy())
+
+    def add(self, start: int, end: int) -> None:
+        """Add the interval (start, end) to the set"""
+        if start >= end:
+            return
+
+        bounds = self._bounds
+
+        # The boundaries within (start, end), including any which touch it, are
+        # replaced by `start` and `end`, unless those are inside an interval
+        i = bisect_left(bounds, start)
+        j = bisect_right(bounds, end)
+
+        bounds[i:j] = [start] * (i % 2 == 0) + [end] * (j % 2 == 0)
+
+    def discard(self, start: int, end: int) -> None:
+        """Remove the interval (start, end) from the set"""
+        if start >= end:
+            return
+
+        bounds = self._bounds
+
+        # The boundaries within (start, end) are removed, and the intervals
+        # containing `start` and `end` (if any) are cut short
+        i = bisect_left(bounds, start)
+        j = bisect_right(bounds, end)
+
+        bounds[i:j] = [start] * (i % 2 == 1) + [end] * (j % 2 == 1)
+
+    def gaps(self, start: int, end: int) -> list[tuple[int, int]]:
+        """The intervals within (start, end) which are not in the set"""
+        bounds = self._bounds
+
+        i = bisect_right(bounds, start)
+        j = bisect_left(bounds, end)
+
+        # The boundaries between `start` and `end`, starting and ending with
+        # the boundaries of a gap
+        inner = [start] * (i % 2 == 0) + bounds[i:j] + [end] * (j % 2 == 0)
+
+        return [(a, b) for a, b in zip(inner[::2], inner[1::2]) if a < b]
+
+    def split(self, threshold: int) -> tuple["IntervalSet", "IntervalSet"]:
+        """Split the set into the values below `threshold`, and the rest"""
+        bounds = self._bounds
+
+        i = bisect_left(bounds, threshold)
+
+        # An interval ending at the threshold is entirely below it
+        if i % 2 == 1 and bounds[i] == threshold:
+            i += 1
+
+        if i % 2 == 0:
+            below, above = bounds[:i], bounds[i:]
+        else:
+            below, above = bounds[:i] + [threshold], [threshold] + bounds[i:]
+
+        return self._from_bounds(below), self._from_bounds(above)
+
+    def shift(self, offset: int) -> "IntervalSet":
+        """The set with `offset` added to every value"""
+        return self._from_bounds([bound + offset for bound in self._bounds])
+
+    def _combine(
+        self, other: "IntervalSet", table: tuple[bool, ...]
+    ) -> "IntervalSet":
+        """
+        Merge the boundaries of two sets, keeping the values for which
+        `table[2 * in_self + in_other]` is true
+        """
+        a = self._bounds
+        b = other._bounds
+
+        result: list[int] = []
+        inside = False
+
+        i = j = 0
+
+        while i < len(a) or j < len(b):
+            if j == len(b) or (i < len(a) and a[i] <= b[j]):
+                value = a[i]
+            else:
+                value = b[j]
+
+            # Step past this boundary in either or both sets
+            if i < len(a) and a[i] == value:
+                i += 1
+            if j < len(b) and b[j] == value:
+                j += 1
+
+            now = table[2 * (i % 2) + j % 2]
+
+            if now != inside:
+                result.append(value)
+                inside = now
+
+        return self._from_bounds(result)
+
+    def __or__(self, other: "IntervalSet") -> "IntervalSet":
+        return self._combine(other, (False, True, True, True))
+
+    def __and__(self, other: "IntervalSet") -> "IntervalSet":
+        return self._combine(other, (False, False, False, True))
+
+    def __sub__(self, other: "IntervalSet") -> "IntervalSet":
+        return self._combine(other, (False, False, True, False))
+
+    def __xor__(self, other: "IntervalSet") -> "IntervalSet":
+        return self._combine(other, (False, True, True, False))
+
+
+class IntervalMap:
+    """
+    A piecewise-linear map of integers, adding an offset to the values in each
+    of a list of intervals, and leaving the values outside them unchanged
+    """
+
+    __slots__ = ("_starts", "_ends", "_offsets")
+
+    def __init__(self, pieces: Iterable[tuple[int, int, int]] = ()) -> None:
+        """
+        Create the map from (start, end, offset) pieces. Where pieces overlap,
+        the earlier piece is used.
+        """
+        covered = IntervalSet()
+        trimmed: list[tuple[int, int, int]] = []
+
+        for start, end, offset in pieces:
+            for gap in covered.gaps(start, end):
+                trimmed.append((*gap, offset))
+
+            covered.add(start, end)
+
+        trimmed.sort()
+
+        self._starts = [start for start, _, _ in trimmed]
+        self._ends = [end for _, end, _ in trimmed]
+        self._offsets = [offset for _, _, offset in trimmed]
+
+    def __getitem__(self, value: int) -> int:
+        i = bisect_right(self._starts, value) - 1
+
+        if i >= 0 and value < self._ends[i]:
+            return value + self._offsets[i]
+
+        return value
+
+    def map(self, intervals: IntervalSet) -> IntervalSet:
+        """The image of a set of integers under the map"""
+        starts = self._starts
+        ends = self._ends
+        offsets = self._offsets
+
+        result: list[tuple[int, int]] = []
+
+        for start, end in intervals:
+            # The first piece which could overlap this interval
+            i = max(0, bisect_right(starts, start) - 1)
+
+            while start < end:
+                if i == len(starts) or end <= starts[i]:
+                    # The rest of the interval is not in any piece
+                    result.append((start, end))
+                    break
+
+                if start < starts[i]:
+                    # The gap before the next piece
+                    result.append((start, starts[i]))
+                    start = starts[i]
+
+                if start < ends[i]:
+                    # The part of the interval in this piece
+                    stop = min(end, ends[i])
+                    result.append((start + offsets[i], stop + offsets[i]))
+                    start = stop
+
+                i += 1
+
+        return IntervalSet(result)
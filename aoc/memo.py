@@ -0,0 +1,155 @@
+"""
+Bounded memo tables, which evict the least recently used entries once they
+hold too many, and keep statistics of their hits, misses and evictions
+
+`Memo` is a mapping for searches which manage their own table (e.g. a cache of
+the best time left seen in each state), and `@memoize` caches the results of a
+recursive function, keyed by its arguments or by a `key` function of them:
+
+    @memoize(2**16, key=lambda row, groups: (len(row), len(groups)))
+    def recurse(row: str, groups: list[int]) -> int:
+        ...
+
+Evicting an entry only ever means recomputing it, so a bound trades time for
+memory, and the statistics show how much time. A search which prunes states it
+has seen before re-explores everything after an evicted state, so its bound
+should fit every state of a real input. `pack()` encodes a state of
+small non-negative integers as a single integer, which is much smaller than a
+tuple or a string of them, so far more entries fit in the same memory.
+"""
+
+import functools
+from typing import Callable, Generic, Hashable, Iterable, TypeVar
+
+from aoc import counters
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+T = TypeVar("T")
+
+# The default maximum number of entries, which bounds a table of small keys
+# and values to around 200 MiB
+MAX_ENTRIES = 2**20
+
+_missing = object()
+
+
+def pack(values: Iterable[int], bits: int) -> int:
+    """
+    Encode non-negative integers, each less than `2**bits`, as a single integer
+    """
+    result = 0
+
+    for value in values:
+        result = (result << bits) | value
+
+    return result
+
+
+class Memo(Generic[K, V]):
+    """A table of at most `max_entries` entries, evicting the least recently used"""
+
+    def __init__(self, max_entries: int = MAX_ENTRIES) -> None:
+        if max_entries < 1:
+            raise ValueError(f"Invalid maximum number of entries: {max_entries}")
+
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # Dicts keep their insertion order, so the first key is the least
+        # recently used, as each entry is moved to the end when it is used
+        self._entries: dict[K, V] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        """The value of `key`, marking it as recently used, or `default`"""
+        entries = self._entries
+        value = entries.pop(key, _missing)
+
+        if value is _missing:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        entries[key] = value  # type: ignore[assignment]
+
+        return value  # type: ignore[return-value]
+
+    def __setitem__(self, key: K, value: V) -> None:
+        entries = self._entries
+
+        if key in entries:
+            del entries[key]
+        elif len(entries) >= self.max_entries:
+            del entries[next(iter(entries))]
+            self.evictions += 1
+
+        entries[key] = value
+
+    def clear(self) -> None:
+        """Remove every entry, keeping the statistics"""
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+        }
+
+    def count(self, name: str = "cache") -> None:
+        """Add the statistics to the counters of the part, if counting is enabled"""
+        counts = counters.active()
+
+        if counts is not None:
+            counts[f"{name}_hits"] += self.hits
+            counts[f"{name}_misses"] += self.misses
+            counts[f"{name}_evictions"] += self.evictions
+
+
+def memoize(
+    max_entries: int = MAX_ENTRIES, key: Callable[..., Hashable] | None = None
+) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """
+    Decorator caching the results of a function in a `Memo`, available as its
+    `memo` attribute, keyed by `key(*args)` or by the arguments themselves
+    """
+
+    def decorator(function: Callable[..., T]) -> Callable[..., T]:
+        memo: Memo[Hashable, T] = Memo(max_entries)
+        entries = memo._entries
+
+        # The same as `memo.get()` and setting the entry, inlined, as the
+        # wrapper is called as often as the function itself
+        @functools.wraps(function)
+        def wrapper(*args: Hashable) -> T:
+            cache_key = args if key is None else key(*args)
+            result = entries.pop(cache_key, _missing)
+
+            if result is not _missing:
+                memo.hits += 1
+                entries[cache_key] = result
+
+                return result  # type: ignore[return-value]
+
+            memo.misses += 1
+            result = function(*args)
+
+            if len(entries) >= memo.max_entries:
+                del entries[next(iter(entries))]
+                memo.evictions += 1
+
+            entries[cache_key] = result
+
+            return result
+
+        wrapper.memo = memo  # type: ignore[attr-defined]
+
+        return wrapper
+
+    return decorator
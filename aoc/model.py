@@ -0,0 +1,116 @@
+"""
+A parsed model of a puzzle input, built once and shared by both parts of a day
+
+A day's `parse()` function is decorated with `@model`, and `part_one()` and
+`part_two()` both call it. The most recent model is kept in memory, so solving
+both parts of the same input only parses it once. The model is shared, so the
+parts must not modify it.
+
+If the `AOC_MODEL_CACHE` environment variable is set to a directory, models
+are also pickled there, keyed by a hash of the puzzle input and of the source
+of the day's solution. Later runs on the same input then skip parsing (and any
+expensive preprocessing done by `parse()`). Models should only contain built-in
+types (e.g. tuples, lists, dicts and sets), so they can be unpickled no matter
+how the day was imported.
+
+The modules used by the on-disk cache are slow to import, and only imported
+when it is enabled, so days using `@model` start up quickly without it.
+"""
+
+import functools
+import os
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+# The environment variable containing the directory of the on-disk cache
+CACHE_ENV = "AOC_MODEL_CACHE"
+
+# The `cache_clear()` method of every `@model` function
+_cache_clears: list[Callable[[], None]] = []
+
+
+def cache_directory() -> str | None:
+    return os.environ.get(CACHE_ENV) or None
+
+
+def _key(parse: Callable[[str], object], puzzle_input: str) -> str:
+    """
+    A hash of the puzzle input and of the source file containing `parse()`, so
+    changing the solution invalidates its cached models
+    """
+    import hashlib
+    import inspect
+
+    with open(inspect.getfile(parse), "rb") as f:
+        source = f.read()
+
+    digest = hashlib.sha256()
+
+    for data in (source, parse.__qualname__.encode(), puzzle_input.encode()):
+        digest.update(hashlib.sha256(data).digest())
+
+    return digest.hexdigest()
+
+
+def _load(path: str) -> tuple[bool, Any]:
+    import pickle
+
+    try:
+        with open(path, "rb") as f:
+            return True, pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return False, None
+
+
+def _save(path: str, value: object) -> None:
+    """Write the pickle atomically, so parallel runs never see half a file"""
+    import pickle
+    import tempfile
+
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(value, f, pickle.HIGHEST_PROTOCOL)
+
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def model(parse: Callable[[str], T]) -> Callable[[str], T]:
+    """Decorator for a day's `parse()` function, caching the model it returns"""
+
+    @functools.lru_cache(maxsize=1)
+    @functools.wraps(parse)
+    def wrapper(puzzle_input: str) -> T:
+        directory = cache_directory()
+
+        if directory is None:
+            return parse(puzzle_input)
+
+        path = os.path.join(directory, f"{_key(parse, puzzle_input)}.pickle")
+        found, value = _load(path)
+
+        if found:
+            return value
+
+        value = parse(puzzle_input)
+        _save(path, value)
+
+        return value
+
+    _cache_clears.append(wrapper.cache_clear)
+
+    return wrapper
+
+
+def clear() -> None:
+    """Clear the in-memory cache of every model, e.g. between benchmark runs"""
+    for cache_clear in _cache_clears:
+        cache_clear()
@@ -0,0 +1,251 @@
+"""
+Profiling one part of one day, for `python -m aoc --profile`
+
+Each part is run three times, parsing the input from scratch each time, as
+the profilers would skew each other's results:
+
+- Once while sampling the call stack every millisecond of CPU time, giving the
+  wall time (with almost no overhead) and the collapsed stacks for flame graph
+  tools (e.g. `flamegraph.pl` or speedscope). Sampling needs `SIGPROF`, so is
+  skipped on Windows.
+- Once under `cProfile`, giving the functions with the largest cumulative time.
+- Once under `tracemalloc`, giving the peak traced memory, and the number and
+  size of the blocks still allocated by each line once the part has finished
+  (e.g. caches and parsed models).
+"""
+
+import cProfile
+import gc
+import json
+import os
+import pstats
+import signal
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from types import FrameType
+from typing import Any, Callable
+
+from aoc import counters, model
+from aoc.days import ROOT, load_module
+
+# The interval between samples of the call stack, in seconds of CPU time
+INTERVAL = 0.001
+
+
+def _location(filename: str) -> str:
+    """A file name relative to the repository, if it is inside it"""
+    path = os.path.abspath(filename)
+
+    if path.startswith(ROOT + os.sep):
+        return os.path.relpath(path, ROOT)
+
+    return filename
+
+
+def _frame_name(frame: FrameType) -> str:
+    code = frame.f_code
+
+    return f"{code.co_name}:{_location(code.co_filename)}:{code.co_firstlineno}"
+
+
+def _reset() -> None:
+    """
+    Clear any cached models and collect garbage, before (rather than while)
+    the next run is timed or profiled
+    """
+    model.clear()
+    gc.collect()
+
+
+def sample_stacks(call: Callable[[], Any]) -> tuple[Any, float, Counter[str]]:
+    """
+    Call `call`, sampling its call stack, and return the result, the wall time
+    and the number of samples of each stack (as `;`-separated frame names,
+    outermost first)
+    """
+    stacks: Counter[str] = Counter()
+
+    # Only the frames below this function's frame are part of the stack
+    outer = sys._getframe()
+
+    def handler(signum: int, frame: FrameType | None) -> None:
+        names: list[str] = []
+
+        while frame is not None and frame is not outer:
+            # Skip the wrappers around `solve()` in this file
+            if frame.f_code.co_filename != __file__:
+                names.append(_frame_name(frame))
+
+            frame = frame.f_back
+
+        # Ignore samples taken outside of `call()`
+        if frame is not None and names:
+            stacks[";".join(reversed(names))] += 1
+
+    if not hasattr(signal, "setitimer"):
+        start = time.perf_counter()
+        result = call()
+
+        return result, time.perf_counter() - start, stacks
+
+    previous = signal.signal(signal.SIGPROF, handler)
+    start = time.perf_counter()
+
+    try:
+        signal.setitimer(signal.ITIMER_PROF, INTERVAL, INTERVAL)
+        result = call()
+    finally:
+        signal.setitimer(signal.ITIMER_PROF, 0)
+        elapsed = time.perf_counter() - start
+        signal.signal(signal.SIGPROF, previous)
+
+    return result, elapsed, stacks
+
+
+def top_functions(call: Callable[[], Any], top: int) -> list[dict[str, Any]]:
+    """
+    Call `call` under `cProfile`, returning the functions with the largest
+    cumulative time
+    """
+    profiler = cProfile.Profile()
+    profiler.runcall(call)
+
+    stats = pstats.Stats(profiler).stats  # type: ignore[attr-defined]
+
+    # Leave out the wrappers around `solve()` in this file, and the profiler
+    rows = sorted(
+        (
+            item
+            for item in stats.items()
+            if item[0][0] != __file__ and "_lsprof.Profiler" not in item[0][2]
+        ),
+        key=lambda item: item[1][3],
+        reverse=True,
+    )
+
+    return [
+        {
+            "function": f"{name}:{_location(filename)}:{line}",
+            "calls": calls,
+            "primitive_calls": primitive_calls,
+            "total_time": total_time,
+            "cumulative_time": cumulative_time,
+        }
+        for (filename, line, name), (
+            primitive_calls,
+            calls,
+            total_time,
+            cumulative_time,
+            _,
+        ) in rows[:top]
+    ]
+
+
+def trace_memory(call: Callable[[], Any], top: int) -> dict[str, Any]:
+    """
+    Call `call` under `tracemalloc`, returning the peak traced memory, and the
+    blocks still allocated afterwards (in total, and the lines which allocated
+    the most memory)
+    """
+    tracemalloc.start()
+
+    try:
+        call()
+
+        _, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    # Ignore the memory used by tracemalloc itself
+    snapshot = snapshot.filter_traces(
+        [tracemalloc.Filter(False, tracemalloc.__file__)]
+    )
+    statistics = snapshot.statistics("lineno")
+
+    return {
+        "peak_memory": peak,
+        # tracemalloc only tracks the blocks which are still allocated, so these
+        # are what the part left behind, not how many allocations it made
+        "live_blocks": sum(stat.count for stat in statistics),
+        "live_memory": sum(stat.size for stat in statistics),
+        "top_allocations": [
+            {
+                "line": f"{_location(frame.filename)}:{frame.lineno}",
+                "blocks": stat.count,
+                "size": stat.size,
+            }
+            for stat in statistics[:top]
+            for frame in [stat.traceback[0]]
+        ],
+    }
+
+
+def profile_part(
+    year: int, day: int, part: int, path: str, top: int = 20
+) -> tuple[dict[str, Any], Counter[str]]:
+    """
+    Profile one part of a day, returning a JSON-serialisable report, and the
+    sampled call stacks
+    """
+    module = load_module(year, day)
+
+    with open(path) as f:
+        text = f.read()
+
+    def call() -> Any:
+        return module.solve(part, text)
+
+    _reset()
+    counters.start()
+
+    try:
+        answer, elapsed, stacks = sample_stacks(call)
+    finally:
+        counts = counters.stop()
+
+    _reset()
+    functions = top_functions(call, top)
+
+    _reset()
+    memory = trace_memory(call, top)
+
+    report: dict[str, Any] = {
+        "year": year,
+        "day": day,
+        "part": part,
+        "answer": str(answer),
+        "wall_time": elapsed,
+        "samples": sum(stacks.values()),
+        "counters": counts,
+        "top_functions": functions,
+        **memory,
+    }
+
+    return report, stacks
+
+
+def write_profile(
+    directory: str, report: dict[str, Any], stacks: Counter[str]
+) -> tuple[str, str]:
+    """
+    Write the report as JSON, and the stacks in the collapsed format (one
+    stack and its number of samples per line), returning the two paths
+    """
+    os.makedirs(directory, exist_ok=True)
+
+    name = f"{report['year']}-{report['day']:02}-{report['part']}"
+    json_path = os.path.join(directory, f"{name}.json")
+    stacks_path = os.path.join(directory, f"{name}.folded")
+
+    with open(json_path, "w") as f:
+        json.dump(report, f, indent=2)
+        f.write("\n")
+
+    with open(stacks_path, "w") as f:
+        for stack, count in stacks.most_common():
+            f.write(f"{stack} {count}\n")
+
+    return json_path, stacks_path
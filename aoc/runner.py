@@ -0,0 +1,196 @@
+import os
+import sys
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from types import ModuleType
+from typing import Any, Iterator, NamedTuple
+
+from aoc import answers, counters
+from aoc.days import available_parts, input_path, load_module
+from aoc.inputs import map_input
+
+
+class Result(NamedTuple):
+    year: int
+    day: int
+    part: int
+    answer: Any = None
+    # Wall time of the call to `solve()`, in seconds
+    elapsed: float = 0.0
+    error: str | None = None
+    # The hot-loop counts of the part, if counting is enabled
+    counters: dict[str, int] | None = None
+    # Whether the answer was read from the answer cache, rather than solved
+    cached: bool = False
+
+
+# Each worker process imports each day at most once
+_modules: dict[tuple[int, int], ModuleType] = {}
+
+
+def _module(year: int, day: int) -> ModuleType:
+    if (year, day) not in _modules:
+        _modules[(year, day)] = load_module(year, day)
+
+    return _modules[(year, day)]
+
+
+def _solve(module: ModuleType, part: int, puzzle_input: Any) -> tuple[Any, float]:
+    """Call `solve()`, returning the answer and the wall time of the call"""
+    start = time.perf_counter()
+    answer = module.solve(part, puzzle_input)
+
+    return answer, time.perf_counter() - start
+
+
+def run_part(
+    year: int, day: int, part: int, path: str, mapped: bool = False
+) -> Result:
+    """
+    Solve one part of one day, timing only the call to `solve()` (not the
+    import or reading the input). With `mapped`, days which set
+    `MAPPED_INPUT` are passed the memory-mapped input file instead of its text,
+    so the time includes reading the file.
+
+    If the answer cache is enabled, a cached answer is returned without
+    solving the part, and new answers are added to the cache.
+    """
+    try:
+        module = _module(year, day)
+
+        directory = answers.cache_directory()
+
+        if directory is not None:
+            key = answers.key(year, day, part, path, module)
+            found, answer = answers.lookup(directory, key)
+
+            if found:
+                return Result(year, day, part, answer, cached=True)
+
+        counters.start()
+
+        try:
+            if mapped and getattr(module, "MAPPED_INPUT", False):
+                with map_input(path) as data:
+                    answer, elapsed = _solve(module, part, data)
+            else:
+                with open(path) as f:
+                    text = f.read()
+
+                answer, elapsed = _solve(module, part, text)
+        finally:
+            counts = counters.stop()
+    except Exception as e:
+        return Result(year, day, part, error=f"{type(e).__name__}: {e}")
+
+    if directory is not None:
+        # The answer is still reported if it can't be cached (e.g. the disk is
+        # full)
+        try:
+            answers.store(directory, key, answer)
+        except Exception as e:
+            print(
+                f"Warning: {year} day {day:02} part {part} was not cached: "
+                f"{type(e).__name__}: {e}",
+                file=sys.stderr,
+            )
+
+    return Result(year, day, part, answer, elapsed, counters=counts)
+
+
+def run_day(
+    year: int, day: int, parts: list[int], path: str, mapped: bool = False
+) -> list[Result]:
+    """
+    Solve several parts of one day in turn, in the same process, so a model
+    parsed by the first part (see `aoc.model`) is still in memory for the next
+    """
+    return [run_part(year, day, part, path, mapped) for part in parts]
+
+
+def tasks(days: list[tuple[int, int]]) -> list[tuple[int, int, int, str]]:
+    """
+    The (year, day, part, input path) of each part to solve. Days without an
+    input file are skipped.
+    """
+    result: list[tuple[int, int, int, str]] = []
+
+    for year, day in days:
+        path = input_path(year, day)
+
+        if not os.path.exists(path):
+            continue
+
+        try:
+            parts = available_parts(_module(year, day))
+        except Exception:
+            # Let the worker report the import error
+            parts = [1]
+
+        result += [(year, day, part, path) for part in parts]
+
+    return result
+
+
+def run(
+    days: list[tuple[int, int]], jobs: int | None = None, mapped: bool = False
+) -> Iterator[Result]:
+    """
+    Solve every day in a process pool, yielding the results in order of year,
+    day and part as soon as each day is solved. The parts of a day are solved
+    together, by the same worker process, so they share the parsed model
+
+    A single day is solved in this process instead, so a day which splits a
+    large input between processes of its own (e.g. 2022 day 1) can do so,
+    which it cannot from a worker process
+    """
+    selected: dict[tuple[int, int, str], list[int]] = {}
+
+    for year, day, part, path in tasks(days):
+        selected.setdefault((year, day, path), []).append(part)
+
+    if len(selected) == 1:
+        for (year, day, path), parts in selected.items():
+            for part in parts:
+                yield run_part(year, day, part, path, mapped)
+
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures: list[Future[list[Result]]] = [
+            executor.submit(run_day, year, day, parts, path, mapped)
+            for (year, day, path), parts in selected.items()
+        ]
+
+        for future in futures:
+            yield from future.result()
+
+
+def json_answer(answer: Any) -> Any:
+    """An answer as a JSON value, keeping ints and strings as they are"""
+    if answer is None or isinstance(answer, (int, str)):
+        return answer
+
+    return str(answer)
+
+
+def format_result(result: Result) -> str:
+    label = f"{result.year} day {result.day:02} part {result.part}"
+
+    if result.error is not None:
+        return f"{label}  {'error':>10}  {result.error}"
+
+    elapsed = f"{'cached':>10}" if result.cached else f"{result.elapsed:>9.4f}s"
+
+    answer = str(result.answer)
+
+    # Answers drawn on multiple lines (e.g. a screen) start on a new line
+    if "\n" in answer:
+        answer = "\n" + answer
+
+    line = f"{label}  {elapsed}  {answer}"
+
+    if result.counters:
+        line += f"\n    {counters.format_counts(result.counters)}"
+
+    return line
@@ -0,0 +1,316 @@
+"""
+A long-running server which keeps every day imported, so a request only costs
+the time to solve the part, rather than starting Python and importing the day
+(and for 2023 day 24, sympy)
+
+The parts are solved in a pool of worker processes, each of which imports every
+day when it starts, and keeps anything the days cache between requests (e.g.
+the cube's wrap table in 2022 day 22). The server itself only handles the
+connections, with asyncio, so a slow part does not hold up other requests.
+
+By default, the server listens on a Unix socket, where each request is a JSON
+line, answered by a JSON line. A connection can send any number of requests.
+
+    {"day": "2023/24", "part": 2, "input": "19, 13, 30 @ -2, 1, -2\\n..."}
+    {"answer": 47, "elapsed": 0.0123}
+
+With `--port`, it speaks HTTP on localhost instead, where the input is the body
+of a POST request to `/YEAR/DAY/PART`:
+
+    curl --data-binary @input.txt http://localhost:8000/2023/24/2
+"""
+
+import argparse
+import asyncio
+import importlib
+import json
+import os
+import re
+import signal
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from types import ModuleType
+from typing import Any
+
+from aoc import backend
+from aoc.days import all_days, load_module, parse_selection
+from aoc.runner import json_answer
+
+# The default path of the Unix socket
+SOCKET = "aoc.sock"
+
+# The largest request accepted, in bytes
+LIMIT = 256 * 2**20
+
+# The days imported by this worker process
+_modules: dict[tuple[int, int], ModuleType] = {}
+
+
+def _warm(days: list[tuple[int, int]]) -> None:
+    """
+    Import every day once, when each worker process starts, along with the
+    modules it only imports when they are used (listed in its `PRELOAD`), and
+    NumPy if it is the selected backend
+    """
+    for year, day in days:
+        try:
+            module = load_module(year, day)
+            _modules[(year, day)] = module
+
+            for name in getattr(module, "PRELOAD", ()):
+                importlib.import_module(name)
+        except Exception:
+            # Report the error when the day is requested
+            pass
+
+    if backend.use_numpy():
+        backend.numpy()
+
+
+def _ready() -> None:
+    pass
+
+
+def _solve_part(year: int, day: int, part: int, text: str) -> dict[str, Any]:
+    """Solve a part in a worker process, returning the response"""
+    try:
+        if (year, day) not in _modules:
+            _modules[(year, day)] = load_module(year, day)
+
+        start = time.perf_counter()
+        answer = _modules[(year, day)].solve(part, text)
+        elapsed = time.perf_counter() - start
+    except Exception as e:
+        return {"error": f"{type(e).__name__}: {e}"}
+
+    return {"answer": json_answer(answer), "elapsed": elapsed}
+
+
+def _pool(days: list[tuple[int, int]], workers: int) -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(workers, initializer=_warm, initargs=(days,))
+
+
+class Server:
+    """
+    Solves the requests from every connection in a shared process pool, which
+    is replaced if one of its workers dies
+    """
+
+    def __init__(self, days: list[tuple[int, int]], workers: int) -> None:
+        self.days = days
+        self.workers = workers
+        self.executor = _pool(days, workers)
+
+    async def start(self) -> None:
+        """Start every worker (importing every day)"""
+        loop = asyncio.get_running_loop()
+
+        await asyncio.gather(
+            *(loop.run_in_executor(self.executor, _ready) for _ in range(self.workers))
+        )
+
+    def close(self) -> None:
+        self.executor.shutdown()
+
+    async def solve(self, day: str, part: int, text: str) -> dict[str, Any]:
+        try:
+            days = parse_selection(day)
+        except ValueError as e:
+            return {"error": str(e)}
+
+        if len(days) != 1:
+            return {"error": f"Expected a single day: {day}"}
+
+        loop = asyncio.get_running_loop()
+        executor = self.executor
+
+        try:
+            return await loop.run_in_executor(
+                executor, _solve_part, *days[0], part, text
+            )
+        except BrokenProcessPool as e:
+            # A worker died (e.g. it crashed, or ran out of memory), failing
+            # every request in the pool, so the first of them starts a new pool
+            # for the next requests
+            if self.executor is executor:
+                executor.shutdown(wait=False)
+                self.executor = _pool(self.days, self.workers)
+
+            return {"error": f"{type(e).__name__}: {e}"}
+
+    async def handle_lines(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Answer each JSON line sent over a Unix socket connection"""
+        try:
+            while line := await reader.readline():
+                try:
+                    request = json.loads(line)
+                    response = await self.solve(
+                        str(request["day"]), int(request["part"]), request["input"]
+                    )
+                except (ValueError, KeyError, TypeError) as e:
+                    response = {"error": f"Invalid request: {e}"}
+
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def handle_http(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Answer a single HTTP request, `POST /YEAR/DAY/PART` with the input"""
+        status, response = "400 Bad Request", {"error": "Invalid request"}
+
+        try:
+            request_line = (await reader.readline()).decode("latin-1").split()
+
+            headers: dict[str, str] = {}
+
+            while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+            match = None
+
+            if len(request_line) == 3 and request_line[0] == "POST":
+                match = re.fullmatch(r"/(\d{4})/(\d+)/(\d+)", request_line[1])
+
+            if match is None:
+                status = "404 Not Found"
+                response = {"error": "Expected POST /YEAR/DAY/PART"}
+            else:
+                length = int(headers.get("content-length", "0"))
+
+                if length > LIMIT:
+                    raise ValueError("Request too large")
+
+                text = (await reader.readexactly(length)).decode()
+                year, day, part = match.groups()
+
+                response = await self.solve(f"{year}/{day}", int(part), text)
+                status = "200 OK"
+        except (ConnectionError, asyncio.IncompleteReadError):
+            writer.close()
+            return
+        except ValueError as e:
+            response = {"error": f"Invalid request: {e}"}
+
+        body = json.dumps(response).encode() + b"\n"
+
+        writer.write(
+            (
+                f"HTTP/1.1 {status}\r\n"
+                "Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                "Connection: close\r\n"
+                "\r\n"
+            ).encode()
+            + body
+        )
+
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(
+    days: list[tuple[int, int]],
+    socket: str = SOCKET,
+    port: int | None = None,
+    jobs: int | None = None,
+) -> None:
+    """Run the server until it is interrupted"""
+    workers = jobs or os.cpu_count() or 1
+
+    handler = Server(days, workers)
+
+    try:
+        # Start every worker (importing every day) before accepting requests
+        await handler.start()
+
+        if port is None:
+            server = await asyncio.start_unix_server(
+                handler.handle_lines, socket, limit=LIMIT
+            )
+            address = socket
+        else:
+            server = await asyncio.start_server(
+                handler.handle_http, "127.0.0.1", port, limit=LIMIT
+            )
+            address = f"http://127.0.0.1:{port}"
+
+        print(f"Serving {len(days)} days on {address}, with {workers} workers")
+
+        # Stop cleanly (removing the socket) when interrupted or terminated
+        loop = asyncio.get_running_loop()
+        stop = asyncio.Event()
+
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, stop.set)
+
+        try:
+            async with server:
+                await stop.wait()
+        finally:
+            if port is None and os.path.exists(socket):
+                os.unlink(socket)
+    finally:
+        handler.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m aoc.server",
+        description="Serve requests to solve any part of any day, keeping every day imported between requests.",
+    )
+    parser.add_argument(
+        "days",
+        nargs="*",
+        help='days to import up front, e.g. "2022", "2022/5" or "2023/1-10" (default: every day)',
+    )
+    parser.add_argument(
+        "-s",
+        "--socket",
+        default=SOCKET,
+        help=f"path of the Unix socket to listen on (default: {SOCKET})",
+    )
+    parser.add_argument(
+        "-p",
+        "--port",
+        type=int,
+        default=None,
+        help="listen for HTTP requests on this port of localhost, instead of on a Unix socket",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="number of worker processes (default: number of CPUs)",
+    )
+    args = parser.parse_args()
+
+    days: list[tuple[int, int]] = []
+
+    try:
+        for selection in args.days:
+            days += [day for day in parse_selection(selection) if day not in days]
+    except ValueError as e:
+        parser.error(str(e))
+
+    try:
+        asyncio.run(serve(days or all_days(), args.socket, args.port, args.jobs))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,313 @@
+"""
+Checking the variants of a part against its reference solution, and comparing
+their speed and memory
+
+A day's `part_one()` and `part_two()` are the reference solutions, and any
+other function named after them (e.g. `part_two_heap()`, or
+`part_one_numpy()`) is a variant of that part, which must give the same answer.
+Each variant is run on generated inputs of each scale and seed, and any answer
+which differs from the reference's is reported (with exit status 1). The
+timings are reported relative to the reference, so a new variant can be added
+next to the reference and checked before `solve()` uses it.
+
+Each variant is run in its own worker process, so a variant which is far
+slower than the others (such as the reference for 2022 day 15 part 2) is
+stopped after `--timeout` seconds, and is skipped for larger inputs.
+"""
+
+import argparse
+import multiprocessing
+import statistics
+import sys
+from types import ModuleType
+from typing import Any, NamedTuple
+
+from aoc import model
+from aoc.bench import measure, peak_memory, sizes
+from aoc.days import all_days, available_parts, load_module, parse_selection, variants
+
+
+class Comparison(NamedTuple):
+    year: int
+    day: int
+    part: int
+    size: int
+    variant: str
+    # The median time of every run, over every seed
+    median: float = 0.0
+    peak: int | None = None
+    error: str | None = None
+    # Whether the error is an answer which differs from the reference's
+    mismatch: bool = False
+
+
+# The day run by this worker process
+_module: ModuleType | None = None
+
+
+def _load(year: int, day: int) -> None:
+    global _module
+
+    _module = load_module(year, day)
+
+
+def _run(
+    name: str, text: str, repeat: int, max_time: float, memory: bool
+) -> tuple[Any, list[float], int | None]:
+    """
+    Solve an input with a variant in the worker process, returning its answer,
+    the times of `repeat` more calls, and its peak memory if `memory` is true
+    """
+    assert _module is not None
+
+    function = getattr(_module, name)
+
+    # The first call, which checks the answer, also warms up the timed calls
+    model.clear()
+    answer = function(text)
+
+    times = measure(function, text, 0, repeat, max_time)
+    peak = peak_memory(function, text) if memory else None
+
+    return answer, times, peak
+
+
+def compare_part(
+    year: int,
+    day: int,
+    part: int,
+    names: list[str],
+    texts: dict[int, list[str]],
+    repeat: int = 5,
+    max_time: float = 10.0,
+    timeout: float = 60.0,
+    memory: bool = False,
+) -> list[Comparison]:
+    """
+    Run each variant of a part on every input of each size, checking their
+    answers against the first variant (the reference)
+    """
+    result: list[Comparison] = []
+    expected: dict[tuple[int, int], Any] = {}
+
+    for name in names:
+        pool = multiprocessing.Pool(1, initializer=_load, initargs=(year, day))
+
+        try:
+            for size, inputs in texts.items():
+                times: list[float] = []
+                peaks: list[int] = []
+                error = None
+                mismatch = False
+
+                for seed, text in enumerate(inputs):
+                    task = pool.apply_async(
+                        _run, (name, text, repeat, max_time, memory)
+                    )
+
+                    try:
+                        answer, run_times, peak = task.get(timeout)
+                    except multiprocessing.TimeoutError:
+                        error = f"Timed out after {timeout:g}s"
+                        break
+                    except Exception as e:
+                        error = f"{type(e).__name__}: {e}"
+                        break
+
+                    # Variants are checked against the reference, or the first
+                    # variant to answer if the reference did not
+                    if expected.setdefault((size, seed), answer) != answer:
+                        error = f"Answered {answer}, not {expected[(size, seed)]} (seed {seed})"
+                        mismatch = True
+                        break
+
+                    times += run_times
+
+                    if peak is not None:
+                        peaks.append(peak)
+
+                if error is not None:
+                    result.append(
+                        Comparison(
+                            year, day, part, size, name, error=error, mismatch=mismatch
+                        )
+                    )
+
+                    if not mismatch:
+                        # A worker stuck on a slow call is replaced, and the
+                        # variant is not run on larger inputs
+                        break
+                else:
+                    result.append(
+                        Comparison(
+                            year,
+                            day,
+                            part,
+                            size,
+                            name,
+                            statistics.median(times),
+                            max(peaks) if peaks else None,
+                        )
+                    )
+        finally:
+            pool.terminate()
+            pool.join()
+
+    return result
+
+
+def compare_day(
+    year: int,
+    day: int,
+    scales: list[float],
+    seeds: int = 3,
+    repeat: int = 5,
+    max_time: float = 10.0,
+    timeout: float = 60.0,
+    memory: bool = False,
+) -> list[Comparison]:
+    """Compare the variants of each part of a day which has any"""
+    try:
+        module = load_module(year, day)
+    except Exception:
+        # Days which cannot be imported are reported by `python -m aoc`
+        return []
+
+    parts = [
+        (part, variants(module, part))
+        for part in available_parts(module)
+        if len(variants(module, part)) > 1
+    ]
+
+    if not parts:
+        return []
+
+    generator = load_module(year, day, "generate")
+
+    texts = {
+        size: [generator.generate(size, seed) for seed in range(seeds)]
+        for size in sizes(generator, scales)
+    }
+
+    result: list[Comparison] = []
+
+    for part, names in parts:
+        result += compare_part(
+            year, day, part, names, texts, repeat, max_time, timeout, memory
+        )
+
+    return result
+
+
+def format_comparison(comparison: Comparison, reference: Comparison | None) -> str:
+    label = f"{comparison.year} day {comparison.day:02} part {comparison.part}  n={comparison.size:<6}  {comparison.variant:<20}"
+
+    if comparison.error is not None:
+        return f"{label}  {'MISMATCH' if comparison.mismatch else 'error':>10}  {comparison.error}"
+
+    line = f"{label}  median {comparison.median:>9.4f}s"
+
+    if reference is not None and reference.error is None and reference.median > 0:
+        line += f"  speedup {reference.median / comparison.median:>6.2f}x"
+
+    if comparison.peak is not None:
+        line += f"  peak {comparison.peak / 2**20:>8.2f} MiB"
+
+        if reference is not None and reference.peak:
+            line += f" ({comparison.peak / reference.peak:.2f}x)"
+
+    return line
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m aoc.variants",
+        description="Check that the variants of each part give the same answers as its reference solution on generated inputs, and compare their speed and memory.",
+    )
+    parser.add_argument(
+        "days",
+        nargs="*",
+        help='days to compare, e.g. "2022", "2022/5" or "2023/1-10" (default: every day with variants)',
+    )
+    parser.add_argument(
+        "--scales",
+        type=float,
+        nargs="+",
+        default=[1.0],
+        help="input sizes, as multiples of the size of a real puzzle input (default: 1)",
+    )
+    parser.add_argument(
+        "--seeds",
+        type=int,
+        default=3,
+        help="number of inputs generated for each size, from seeds 0, 1, ... (default: 3)",
+    )
+    parser.add_argument(
+        "-r", "--repeat", type=int, default=5, help="timed runs per input (default: 5)"
+    )
+    parser.add_argument(
+        "--max-time",
+        type=float,
+        default=10.0,
+        help="stop repeating once a run takes longer than this, in seconds (default: 10)",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=60.0,
+        help="give up on a variant once an input takes longer than this to check and time, in seconds (default: 60)",
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="also measure the peak memory of each variant, with one extra run under tracemalloc",
+    )
+    args = parser.parse_args()
+
+    if args.seeds < 1 or args.repeat < 1:
+        parser.error("--seeds and --repeat must be at least 1")
+
+    days: list[tuple[int, int]] = []
+
+    try:
+        for selection in args.days:
+            days += [day for day in parse_selection(selection) if day not in days]
+    except ValueError as e:
+        parser.error(str(e))
+
+    mismatches = 0
+
+    for year, day in days or all_days():
+        comparisons = compare_day(
+            year,
+            day,
+            args.scales,
+            args.seeds,
+            args.repeat,
+            args.max_time,
+            args.timeout,
+            args.memory,
+        )
+
+        references = {
+            (comparison.part, comparison.size): comparison
+            for comparison in comparisons
+            if comparison.variant == ("part_one", "part_two")[comparison.part - 1]
+        }
+
+        # Each variant next to the reference, for each size
+        for comparison in sorted(comparisons, key=lambda c: (c.part, c.size)):
+            reference = references.get((comparison.part, comparison.size))
+
+            print(format_comparison(comparison, reference), flush=True)
+
+            mismatches += comparison.mismatch
+
+    if mismatches:
+        print()
+        print(f"{mismatches} variant(s) gave different answers")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
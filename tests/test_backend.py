@@ -0,0 +1,60 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from aoc import backend
+from aoc.days import available_parts, load_module
+from aoc.generate import generate
+
+pytest.importorskip("numpy")
+
+# The days with NumPy variants
+DAYS = [
+    (2022, 3),
+    (2022, 4),
+    (2022, 8),
+    (2022, 18),
+    (2023, 9),
+    (2023, 11),
+    (2023, 24),
+]
+
+
+@pytest.mark.parametrize("year, day", DAYS)
+@pytest.mark.parametrize("seed", [0, 1])
+def test_backends_agree(year: int, day: int, seed: int) -> None:
+    module = load_module(year, day)
+    generator = load_module(year, day, "generate")
+
+    # Smaller than a real input, as some of the references are slow
+    text = generate(year, day, max(generator.SIZE // 4, 1), seed)
+
+    for part in available_parts(module):
+        with backend.using("python"):
+            expected = module.solve(part, text)
+
+        with backend.using("numpy"):
+            assert module.solve(part, text) == expected
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 4, 7])
+def test_2022_day03_badges(size: int) -> None:
+    module = load_module(2022, 3)
+    text = generate(2022, 3, 300, 0)
+
+    assert module.badges(text, size) == module.badges_numpy(text, size)
+
+
+@pytest.mark.parametrize("expansion", [2 * 10**18, 10**19, 10**30])
+def test_2023_day11_overflow(expansion: int) -> None:
+    module = load_module(2023, 11)
+
+    # Each galaxy is 2 * (expansion + 1) from the next, and the sum of the
+    # distances (or even the expanded positions) is more than a 64-bit integer
+    # can hold
+    text = "#......\n.......\n..#....\n.......\n....#..\n.......\n......#\n"
+
+    assert module.distances_numpy(text, expansion) == 20 * (expansion + 1)
@@ -0,0 +1,54 @@
+import os
+import sys
+from types import ModuleType
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from aoc import batch
+
+
+def crashing_day(year: int, day: int) -> ModuleType:
+    """A day whose worker dies when the input is "crash\""""
+    module = ModuleType("crashing_day")
+
+    def part_one(text: str) -> int:
+        if text == "crash":
+            os._exit(1)
+
+        return len(text)
+
+    module.part_one = part_one  # type: ignore[attr-defined]
+    module.solve = lambda part, text: part_one(text)  # type: ignore[attr-defined]
+
+    return module
+
+
+def broken_day(year: int, day: int) -> ModuleType:
+    raise SyntaxError("invalid syntax")
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2])
+def test_worker_crash(monkeypatch: pytest.MonkeyPatch, chunk_size: int) -> None:
+    # The workers are forked, so they load the same day
+    monkeypatch.setattr(batch, "load_module", crashing_day)
+
+    inputs = [("a", "x"), ("b", "crash"), ("c", "yy"), ("d", "zzz"), ("e", "crash")]
+    records = list(batch.batch(2022, 1, inputs, jobs=2, chunk_size=chunk_size))
+
+    assert [record["input"] for record in records] == ["a", "b", "c", "d", "e"]
+    assert [record.get("answer") for record in records] == [1, None, 2, 3, None]
+    assert records[1]["error"].startswith("BrokenProcessPool")
+    assert records[4]["error"].startswith("BrokenProcessPool")
+
+
+def test_import_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(batch, "load_module", broken_day)
+
+    records = list(batch.batch(2022, 1, [("a", "x"), ("b", "y")], jobs=2))
+
+    assert records == [
+        {"input": "a", "part": 1, "error": "SyntaxError: invalid syntax"},
+        {"input": "b", "part": 1, "error": "SyntaxError: invalid syntax"},
+    ]
@@ -0,0 +1,90 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from aoc.cycles import skip_ahead
+
+
+def next_value(x: int, modulus: int) -> int:
+    # Values repeat after a tail, as the map isn't a permutation
+    return (x * x + 3) % modulus
+
+
+def naive(state: tuple[int, int], modulus: int, n: int) -> tuple[int, int]:
+    """
+    Step one at a time, or for large `n`, skip the cycle found by remembering
+    every value seen
+    """
+    x, total = state
+    seen: dict[int, tuple[int, int]] = {}
+
+    i = 0
+
+    while i < n:
+        if x in seen and n > 10**6:
+            first, first_total = seen[x]
+            cycles, remaining = divmod(n - i, i - first)
+
+            total += cycles * (total - first_total)
+            n = i + remaining
+            seen.clear()
+
+        seen[x] = (i, total)
+
+        x = next_value(x, modulus)
+        total += x
+        i += 1
+
+    return x, total
+
+
+@pytest.mark.parametrize("modulus", [1, 7, 97, 1009])
+@pytest.mark.parametrize("n", [0, 1, 2, 5, 50, 1000, 10**15 + 7])
+def test_skip_ahead(modulus: int, n: int) -> None:
+    def step(state: tuple[int, int]) -> tuple[int, int]:
+        x = next_value(state[0], modulus)
+        return x, state[1] + x
+
+    state, gained = skip_ahead(
+        (2, 0), step, n, key=lambda state: state[0], value=lambda state: state[1]
+    )
+
+    assert (state[0], state[1] + gained) == naive((2, 0), modulus, n)
+
+
+def test_skip_ahead_in_place() -> None:
+    # The step modifies a list in place, and the value is a tuple
+    def step(state: list[int]) -> list[int]:
+        state[0] = (state[0] + 3) % 10
+        state[1] += state[0]
+        state[2] += 1
+
+        return state
+
+    n = 12345
+
+    expected = [4, 0, 0]
+
+    for _ in range(n):
+        step(expected)
+
+    state, gained = skip_ahead(
+        [4, 0, 0],
+        step,
+        n,
+        key=lambda state: state[0],
+        value=lambda state: (state[1], state[2]),
+    )
+
+    assert isinstance(gained, tuple)
+    assert state[0] == expected[0]
+    assert (state[1] + gained[0], state[2] + gained[1]) == (expected[1], expected[2])
+
+
+def test_no_cycle() -> None:
+    state, gained = skip_ahead(0, lambda x: x + 1, 100)
+
+    assert (state, gained) == (100, 0)
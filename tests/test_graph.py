@@ -0,0 +1,152 @@
+import os
+import random
+import sys
+from typing import Callable
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from aoc.graph import (
+    UNREACHABLE,
+    Graph,
+    Interner,
+    bfs,
+    compress,
+    dial,
+    dijkstra,
+    shortest_path,
+)
+
+# 0 - 1 - 2 - 3, with a triangle 3 - 4 - 5 - 3 at the end, and 6 on its own
+EDGES = [(0, 1, 1), (1, 2, 2), (2, 3, 3), (3, 4, 1), (3, 5, 1), (4, 5, 1)]
+GRAPH = Graph.from_edges(7, EDGES)
+
+
+def brute_force(graph: Graph, sources: list[int]) -> list[int]:
+    """The shortest distances, by relaxing every arc until nothing changes"""
+    distances = [UNREACHABLE] * len(graph)
+
+    for source in sources:
+        distances[source] = 0
+
+    changed = True
+
+    while changed:
+        changed = False
+
+        for node in range(len(graph)):
+            if distances[node] == UNREACHABLE:
+                continue
+
+            for arc in graph.arcs(node):
+                target = graph.targets[arc]
+
+                if distances[node] + graph.weights[arc] < distances[target]:
+                    distances[target] = distances[node] + graph.weights[arc]
+                    changed = True
+
+    return distances
+
+
+def test_from_edges() -> None:
+    assert len(GRAPH) == 7
+    assert sorted(GRAPH.neighbours(3)) == [2, 4, 5]
+    assert GRAPH.degree(6) == 0
+
+    # Both directions of an edge share its id
+    arcs = [arc for arc in GRAPH.arcs(1) if GRAPH.targets[arc] == 2]
+    back = [arc for arc in GRAPH.arcs(2) if GRAPH.targets[arc] == 1]
+
+    assert GRAPH.edges[arcs[0]] == GRAPH.edges[back[0]] == 1
+    assert GRAPH.weights[arcs[0]] == 2
+
+    directed = Graph.from_edges(3, [(0, 1), (1, 2)], directed=True)
+
+    assert directed.neighbours(1) == [2]
+    assert directed.reversed().neighbours(1) == [0]
+
+
+def test_bfs() -> None:
+    assert bfs(GRAPH, [0]) == [0, 1, 2, 3, 4, 4, UNREACHABLE]
+    assert bfs(GRAPH, [0, 5]) == [0, 1, 2, 1, 1, 0, UNREACHABLE]
+
+    # Without the edge 3 - 4, 4 is reached the long way round
+    blocked = [0] * len(EDGES)
+    blocked[3] = 1
+
+    assert bfs(GRAPH, [3], blocked=blocked)[4] == 2
+
+    # Stopping at the end leaves the further nodes unreached
+    distances = bfs(GRAPH, [0], end=2)
+
+    assert distances[2] == 2
+    assert distances[4] == UNREACHABLE
+
+
+def test_shortest_path() -> None:
+    path = shortest_path(GRAPH, 0, 4)
+
+    assert path is not None
+    assert [GRAPH.targets[arc] for arc in path] == [1, 2, 3, 4]
+    assert shortest_path(GRAPH, 2, 2) == []
+    assert shortest_path(GRAPH, 0, 6) is None
+
+    blocked = [0] * len(EDGES)
+    blocked[1] = 1
+
+    assert shortest_path(GRAPH, 0, 3, blocked) is None
+
+
+@pytest.mark.parametrize("search", [dijkstra, dial])
+def test_weighted(search: Callable[..., list[int]]) -> None:
+    assert search(GRAPH, [0]) == [0, 1, 3, 6, 7, 7, UNREACHABLE]
+    assert search(GRAPH, [4])[0] == 7
+    assert search(GRAPH, [0], end=3)[3] == 6
+
+
+@pytest.mark.parametrize("search", [dijkstra, dial])
+@pytest.mark.parametrize("seed", range(20))
+def test_weighted_random(search: Callable[..., list[int]], seed: int) -> None:
+    rng = random.Random(seed)
+
+    # Directed, with weights including 0, which dial() visits in the same bucket
+    edges = [
+        (rng.randrange(12), rng.randrange(12), rng.randrange(5)) for _ in range(30)
+    ]
+    graph = Graph.from_edges(12, edges, directed=True)
+
+    sources = [0, rng.randrange(12)]
+
+    assert search(graph, sources) == brute_force(graph, sources)
+
+
+def test_compress() -> None:
+    compressed, nodes = compress(GRAPH)
+
+    # The corridor 0 - 1 - 2 - 3 becomes one edge, and the triangle, which
+    # loops back to 3, is dropped
+    assert nodes == [0, 3, 6]
+    assert compressed.neighbours(0) == [1]
+    assert compressed.weights == [6, 6]
+
+    compressed, nodes = compress(GRAPH, keep=[4])
+
+    assert nodes == [0, 3, 4, 6]
+
+    # The shortest of the two corridors between 3 and 4 is kept
+    distances = dijkstra(compressed, [nodes.index(0)])
+
+    assert [distances[nodes.index(node)] for node in (0, 3, 4)] == [0, 6, 7]
+    assert compressed.degree(nodes.index(4)) == 1
+
+
+def test_interner() -> None:
+    names = Interner(["AA", "BB"])
+
+    assert names.intern("CC") == 2
+    assert names.intern("AA") == 0
+    assert names["BB"] == 1
+    assert "DD" not in names
+    assert len(names) == 3
+    assert names.names == ["AA", "BB", "CC"]
@@ -0,0 +1,81 @@
+import os
+import sys
+from itertools import groupby
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from aoc import inputs
+
+# Records of several lines, some longer than a chunk, with a blank line at the
+# start and several between records, and no line break at the end
+TEXT = (
+    "\n1000\n2000\n3000\n\n4000\n\n\n5000\n6000\n"
+    "a line longer than a chunk\n\n7000\n8000\n9000\n\n-10000 2-4"
+)
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(inputs, "CHUNK_SIZE", 7)
+
+
+@pytest.fixture(params=["str", "bytes", "mmap"])
+def data(request: pytest.FixtureRequest, tmp_path: Path) -> Iterator[inputs.Input]:
+    if request.param == "str":
+        yield TEXT
+    elif request.param == "bytes":
+        yield TEXT.encode()
+    else:
+        path = tmp_path / "input.txt"
+        path.write_text(TEXT)
+
+        with inputs.map_input(str(path)) as mapped:
+            yield mapped
+
+
+def test_chunks(data: inputs.Input) -> None:
+    chunks = list(inputs.chunks(data))
+
+    assert "".join(chunks) == TEXT
+    assert len(chunks) > 1
+
+    # Every chunk but the last ends at a line break, so no line is split
+    assert all(chunk.endswith("\n") for chunk in chunks[:-1])
+
+
+def test_chunks_range(data: inputs.Input) -> None:
+    start = TEXT.index("4000")
+    end = TEXT.index("7000")
+
+    assert "".join(inputs.chunks(data, start, end)) == TEXT[start:end]
+
+
+def test_lines(data: inputs.Input) -> None:
+    assert list(inputs.lines(data)) == TEXT.splitlines()
+
+
+def test_records(data: inputs.Input) -> None:
+    expected = [
+        list(record)
+        for nonempty, record in groupby(TEXT.splitlines(), key=bool)
+        if nonempty
+    ]
+
+    assert list(inputs.records(data)) == expected
+
+
+def test_ints(data: inputs.Input) -> None:
+    assert list(inputs.ints(data))[-3:] == [-10000, 2, 4]
+
+
+def test_empty_file(tmp_path: Path) -> None:
+    path = tmp_path / "input.txt"
+    path.write_text("")
+
+    with inputs.map_input(str(path)) as mapped:
+        assert list(inputs.lines(mapped)) == []
+        assert list(inputs.records(mapped)) == []
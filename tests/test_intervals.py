@@ -0,0 +1,158 @@
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from aoc.intervals import IntervalMap, IntervalSet, count_overlapping
+
+# Every value in the tests is within 0 to LIMIT
+LIMIT = 40
+
+
+def values(intervals: IntervalSet) -> set[int]:
+    return {value for start, end in intervals for value in range(start, end)}
+
+
+def from_values(values: set[int]) -> IntervalSet:
+    return IntervalSet((value, value + 1) for value in values)
+
+
+def random_intervals(rng: random.Random, count: int) -> list[tuple[int, int]]:
+    intervals = []
+
+    for _ in range(count):
+        start = rng.randrange(LIMIT)
+        intervals.append((start, start + rng.randrange(-2, 10)))
+
+    return intervals
+
+
+def check(intervals: IntervalSet, expected: set[int]) -> None:
+    """Check the set has the expected values, stored as merged intervals"""
+    assert values(intervals) == expected
+    assert intervals == from_values(expected)
+    assert intervals.size == len(expected)
+
+    for value in range(-1, LIMIT + 10):
+        assert (value in intervals) == (value in expected)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_add_discard(seed: int) -> None:
+    rng = random.Random(seed)
+
+    intervals = IntervalSet()
+    expected: set[int] = set()
+
+    for start, end in random_intervals(rng, 30):
+        if rng.random() < 0.6:
+            intervals.add(start, end)
+            expected |= set(range(start, end))
+        else:
+            intervals.discard(start, end)
+            expected -= set(range(start, end))
+
+        check(intervals, expected)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_gaps_split_shift(seed: int) -> None:
+    rng = random.Random(seed)
+
+    intervals = IntervalSet(random_intervals(rng, 6))
+    expected = values(intervals)
+
+    for start in range(-1, LIMIT + 2, 3):
+        for end in range(start, LIMIT + 4, 5):
+            gaps = intervals.gaps(start, end)
+
+            assert set().union(*(range(a, b) for a, b in gaps)) == (
+                set(range(start, end)) - expected
+            )
+            # The gaps are separate, so none of them touch
+            assert all(a[1] < b[0] for a, b in zip(gaps, gaps[1:]))
+
+    for threshold in range(-1, LIMIT + 12):
+        below, above = intervals.split(threshold)
+
+        check(below, {value for value in expected if value < threshold})
+        check(above, {value for value in expected if value >= threshold})
+
+    check(intervals.shift(-5), {value - 5 for value in expected})
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_operators(seed: int) -> None:
+    rng = random.Random(seed)
+
+    a = IntervalSet(random_intervals(rng, 5))
+    b = IntervalSet(random_intervals(rng, 5))
+
+    check(a | b, values(a) | values(b))
+    check(a & b, values(a) & values(b))
+    check(a - b, values(a) - values(b))
+    check(a ^ b, values(a) ^ values(b))
+
+
+def test_empty() -> None:
+    intervals = IntervalSet([(3, 3), (5, 4)])
+
+    assert not intervals
+    assert len(intervals) == 0
+    assert intervals.gaps(0, 4) == [(0, 4)]
+
+    with pytest.raises(ValueError):
+        intervals.start
+
+
+def test_merges_touching() -> None:
+    intervals = IntervalSet([(5, 8), (0, 3), (3, 5), (10, 12)])
+
+    assert list(intervals) == [(0, 8), (10, 12)]
+    assert (intervals.start, intervals.end) == (0, 12)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_interval_map(seed: int) -> None:
+    rng = random.Random(seed)
+
+    pieces = [
+        (start, end, rng.randrange(-20, 20))
+        for start, end in random_intervals(rng, 5)
+    ]
+    mapping = IntervalMap(pieces)
+
+    def brute_force(value: int) -> int:
+        # The earliest piece containing the value is used
+        for start, end, offset in pieces:
+            if start <= value < end:
+                return value + offset
+
+        return value
+
+    for value in range(-1, LIMIT + 10):
+        assert mapping[value] == brute_force(value)
+
+    intervals = IntervalSet(random_intervals(rng, 4))
+
+    check(mapping.map(intervals), {brute_force(value) for value in values(intervals)})
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_count_overlapping(seed: int) -> None:
+    rng = random.Random(seed)
+
+    intervals = [(start, end) for start, end in random_intervals(rng, 15) if start < end]
+    starts = [start for start, _ in intervals]
+    ends = [end for _, end in intervals]
+
+    expected = sum(
+        a[0] < b[1] and b[0] < a[1]
+        for i, a in enumerate(intervals)
+        for b in intervals[i + 1 :]
+    )
+
+    assert count_overlapping(starts, ends) == expected
@@ -0,0 +1,114 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from aoc import counters
+from aoc.memo import Memo, memoize, pack
+
+
+def test_evicts_least_recently_used() -> None:
+    memo: Memo[str, int] = Memo(2)
+
+    memo["a"] = 1
+    memo["b"] = 2
+
+    # Using "a" makes "b" the least recently used
+    assert memo.get("a") == 1
+
+    memo["c"] = 3
+
+    assert memo.get("b") is None
+    assert memo.get("a") == 1
+    assert memo.get("c") == 3
+    assert memo.stats() == {"hits": 3, "misses": 1, "evictions": 1, "entries": 2}
+
+
+def test_replacing_does_not_evict() -> None:
+    memo: Memo[str, int] = Memo(2)
+
+    memo["a"] = 1
+    memo["b"] = 2
+    memo["a"] = 3
+
+    assert memo.get("a") == 3
+    assert memo.get("b") == 2
+    assert memo.evictions == 0
+
+    # Replacing "a" made it the most recently used, before "b" was used
+    memo["c"] = 4
+
+    assert memo.get("a") is None
+    assert memo.get("missing", -1) == -1
+
+
+def test_clear_keeps_stats() -> None:
+    memo: Memo[int, int] = Memo()
+
+    memo[1] = 1
+    memo.get(1)
+    memo.clear()
+
+    assert len(memo) == 0
+    assert memo.stats() == {"hits": 1, "misses": 0, "evictions": 0, "entries": 0}
+
+
+def test_invalid_size() -> None:
+    with pytest.raises(ValueError):
+        Memo(0)
+
+
+def test_count(monkeypatch: pytest.MonkeyPatch) -> None:
+    memo: Memo[int, int] = Memo(1)
+
+    memo[1] = 1
+    memo[2] = 2
+    memo.get(1)
+    memo.get(2)
+
+    monkeypatch.setenv(counters.COUNTERS_ENV, "1")
+
+    counters.start()
+    memo.count("states")
+
+    assert counters.stop() == {"states_hits": 1, "states_misses": 1, "states_evictions": 1}
+
+
+def test_memoize() -> None:
+    calls: list[int] = []
+
+    @memoize(3)
+    def square(n: int) -> int:
+        calls.append(n)
+        return n * n
+
+    assert [square(n) for n in (1, 2, 1, 3, 4, 2, 1)] == [1, 4, 1, 9, 16, 4, 1]
+
+    # 4 evicted 2, as 1 was used more recently, and then 2 evicted 1
+    assert calls == [1, 2, 3, 4, 2, 1]
+    assert square.memo.stats() == {  # type: ignore[attr-defined]
+        "hits": 1,
+        "misses": 6,
+        "evictions": 3,
+        "entries": 3,
+    }
+
+
+def test_memoize_key() -> None:
+    @memoize(key=lambda values, extra: len(values))
+    def total(values: tuple[int, ...], extra: int) -> int:
+        return sum(values) + extra
+
+    assert total((1, 2), 0) == 3
+
+    # The same key gives the cached result, whatever the other arguments are
+    assert total((5, 5), 1) == 3
+    assert total((5, 5, 5), 1) == 16
+
+
+def test_pack() -> None:
+    assert pack([1, 2, 3], 4) == 0x123
+    assert pack([], 8) == 0
+    assert pack([3, 0, 255], 8) == 0x0300FF
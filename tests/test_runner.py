@@ -0,0 +1,49 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from aoc import answers, runner
+from aoc.days import load_module
+from aoc.generate import generate
+
+
+def expected(path: str) -> int:
+    return load_module(2022, 2).solve(1, Path(path).read_text())
+
+
+@pytest.fixture
+def input_file(tmp_path: Path) -> str:
+    path = tmp_path / "input.txt"
+    path.write_text(generate(2022, 2, 100, 0))
+
+    return str(path)
+
+
+def test_run_part(input_file: str) -> None:
+    result = runner.run_part(2022, 2, 1, input_file)
+
+    assert result.error is None
+    assert result.answer == expected(input_file)
+
+
+def test_cache_failure_keeps_answer(
+    input_file: str,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    def store(directory: str, key: str, answer: object) -> None:
+        raise OSError("No space left on device")
+
+    monkeypatch.setenv(answers.CACHE_ENV, str(tmp_path / "cache"))
+    monkeypatch.setattr(answers, "store", store)
+
+    result = runner.run_part(2022, 2, 1, input_file)
+
+    assert result.error is None
+    assert result.answer == expected(input_file)
+    assert "was not cached" in capsys.readouterr().err
@@ -0,0 +1,50 @@
+import asyncio
+import os
+import sys
+from types import ModuleType
+from typing import Any
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from aoc import server
+
+
+def crashing_day(year: int, day: int) -> ModuleType:
+    """A day whose worker dies when the input is "crash\""""
+    module = ModuleType("crashing_day")
+
+    def solve(part: int, text: str) -> int:
+        if text == "crash":
+            os._exit(1)
+
+        return len(text)
+
+    module.solve = solve  # type: ignore[attr-defined]
+
+    return module
+
+
+def test_worker_crash(monkeypatch: pytest.MonkeyPatch) -> None:
+    # The workers are forked, so they load the same day
+    monkeypatch.setattr(server, "load_module", crashing_day)
+
+    async def requests() -> list[dict[str, Any]]:
+        handler = server.Server([(2022, 1)], 1)
+
+        try:
+            await handler.start()
+
+            return [
+                await handler.solve("2022/1", 1, text)
+                for text in ("abc", "crash", "abcd", "crash", "ab")
+            ]
+        finally:
+            handler.close()
+
+    responses = asyncio.run(requests())
+
+    assert [response.get("answer") for response in responses] == [3, None, 4, None, 2]
+    assert responses[1]["error"].startswith("BrokenProcessPool")
+    assert responses[3]["error"].startswith("BrokenProcessPool")